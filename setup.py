@@ -124,6 +124,7 @@ setup(
                 'restview',
                 'Sphinx',
                 'sphinx-rtd-theme'],
+        'columnar': ['numpy'],
     },
 
     # external modules
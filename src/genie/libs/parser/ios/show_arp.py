@@ -36,7 +36,7 @@ class ShowIpArp(ShowArp_iosxe):
 
     cli_command = ['show ip arp','show ip arp vrf {vrf}','show ip arp vrf {vrf} {intf_or_ip}', 'show ip arp {intf_or_ip}']
 
-    def cli(self, vrf='', intf_or_ip='',output=None):
+    def cli(self, vrf='', intf_or_ip='',output=None, format=None):
         if vrf and not intf_or_ip :
             cmd = self.cli_command[1].format(vrf=vrf)
         if vrf and intf_or_ip:
@@ -46,7 +46,7 @@ class ShowIpArp(ShowArp_iosxe):
         if not vrf and not intf_or_ip:
             cmd = self.cli_command[0]
 
-        ret_dict = super().cli(self, cmd=cmd, output=output)
+        ret_dict = super().cli(self, cmd=cmd, output=output, format=format)
 
         return ret_dict
 
@@ -16,6 +16,7 @@ IOSXE parsers for the following show commands:
 # Python
 from ast import Or
 import re
+import functools
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -23,6 +24,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.buffer import finditer_lines
+from genie.libs.parser.utils.columnar import ColumnarTable, columnar_result
+from genie.libs.parser.utils.call_schema import CallSchema
 
 
 # =============================================
@@ -66,7 +70,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(CallSchema, ShowArpSchema):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -75,7 +79,38 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
-    def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
+    # columns of format='columnar', in the order of the _add_entry arguments
+    columns = ['protocol', 'address', 'age', 'mac', 'type', 'interface',
+               'private_vlan']
+
+    @staticmethod
+    def _add_entry(ret_dict, protocol, address, age, mac, type, interface,
+                   private_vlan):
+        if interface:
+            final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
+                interface, {}).setdefault('ipv4', {}).setdefault(
+                'neighbors', {}).setdefault(address, {})
+
+            final_dict['ip'] = address
+            final_dict['link_layer_address'] = mac
+            final_dict['type'] = type
+            if age == '-':
+                final_dict['origin'] = 'static'
+            else:
+                final_dict['origin'] = 'dynamic'
+            if private_vlan is not None:
+                final_dict['private_vlan'] = private_vlan
+        else:
+            final_dict = ret_dict.setdefault(
+                'global_static_table', {}).setdefault(address, {})
+            final_dict['ip_address'] = address
+            final_dict['mac_address'] = mac
+            final_dict['encap_type'] = type
+
+        final_dict['age'] = age
+        final_dict['protocol'] = protocol
+
+    def cli(self, vrf='', intf_or_ip='', cmd=None, output=None, format=None):
         if output is None:
             if not cmd:
                 cmd = self.cli_command[0]
@@ -97,46 +132,26 @@ class ShowArp(ShowArpSchema):
         p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
                          r'(?P<mac>[\w\.]+) +(?P<type>[\w\.]+)'
                          r'( +(?P<interface>[\w\.\/\-]+)(\s+pv\s+(?P<private_vlan>\d+))?)?$')
-        # initial variables
-        ret_dict = {}
-
-        for line in out.splitlines():
-            line = line.strip()
-
-            # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-            # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-            # Internet  192.168.111.111         0   aabb.0111.0111  802.1Q Vlan111
-            # Internet 192.168.1.203 3 0015.0100.0001 ARPA Vlan201 pv 203
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                address = group['address']
-                interface = group['interface']
-                if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
-                    if group['age'] == '-':
-                        final_dict['origin'] = 'static'
-                    else:
-                        final_dict['origin'] = 'dynamic'
-                    if group['private_vlan']:
-                        final_dict['private_vlan'] = int(group['private_vlan'])
-                else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
-
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
-                continue
 
+        # the entries go either to the dict of the schema or to the columns
+        if format == 'columnar':
+            table = ColumnarTable(self.columns, integers=['private_vlan'],
+                                  add_entry=self._add_entry)
+            add_entry = table.append
+        else:
+            # initial variables
+            ret_dict = {}
+            add_entry = functools.partial(self._add_entry, ret_dict)
+
+        for m in finditer_lines(p1, out):
+            protocol, address, age, mac, type, interface, private_vlan = \
+                m.group('protocol', 'address', 'age', 'mac', 'type',
+                        'interface', 'private_vlan')
+            add_entry(protocol, address, age, mac, type, interface,
+                      int(private_vlan) if private_vlan else None)
+
+        if format == 'columnar':
+            return columnar_result(self, table)
         return ret_dict
 
 # =====================================
@@ -146,7 +161,7 @@ class ShowIpArp(ShowArp):
     """Parser for 'show ip arp,  show ip arp vrf <vrf>"""
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
-    def cli(self, vrf='', output=None):
+    def cli(self, vrf='', output=None, format=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[1].format(vrf=vrf)
@@ -155,7 +170,7 @@ class ShowIpArp(ShowArp):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(output=out)
+        return super().cli(output=out, format=format)
 # =====================================
 # Schema for 'show ip arp summary'
 # =====================================
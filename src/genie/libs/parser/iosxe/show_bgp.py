@@ -69,6 +69,12 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.streaming import iter_lines, merge_record
+from genie.libs.parser.utils.blocks import BlockSplitter, parse_blocks, \
+    merge_parsed
+from genie.libs.parser.utils.predicate import Predicate
 
 
 # ============================================
@@ -162,40 +168,25 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
-    def cli(self, address_family='', vrf='', output=None):
-
-        # Init dictionary
-        route_dict = {}
-        af_dict = {}
-        if not vrf:
-            vrf = 'default'
-        if address_family:
-            original_address_family = address_family
-        index = 1
-        bgp_table_version = local_router_id = ''
-        metric = localpref = weight = ''
-        status_codes = ''
-        prefix = ""
-        origin_codes_info = origin_codes_data = ""
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
+        p1=r'^\s*For +address +family:'
+           r' +(?P<address_family>[\S\s]+)$',
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2=r'^\s*BGP +table +version +is'
+           r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           r' +ID +is +(?P<local_router_id>(\S+))$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
         #  *>   [3][3001:1][*][*][1.1.1.1]/14
         # *m   [2][2.2.2.2:1][0][48][000C293B2157][0][*]/20
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+             r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
+             r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -204,11 +195,15 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+             r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+             r'(?P<termination>[\s\S]+)$',
+
+        # 200 33299 51178 47751 {27016} e
+        p3_3=r'(?: *(?P<path>[0-9\{\}\s]+))?'
+             r' +(?P<origin_codes>(i|e|\?|\|))$',
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
@@ -218,40 +213,94 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+        p4=r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+           r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+           r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+           r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+           r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+           r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+           r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$',
+
+        # 200 33299 51178 47751 {27016} e
+        p4_1=r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
+             r' +(?P<origin_codes_inner>(i|e|\?|\|))$',
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+        p5=r'^\s*AF-Private +Import +to +Address-Family:'
+           r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+           r' +Pfx +Count/Limit:'
+           r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$',
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p6=r'^\s*Route +Distinguisher *: '
+           r'+(?P<route_distinguisher>(\S+))'
+           r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+           r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
+    )
 
-        for line in output.splitlines():
+    # the chain of cli, in order
+    dispatcher = LineDispatcher(patterns, (
+        'p1', 'p2', 'p3_1', 'p3_2', 'p4', 'p5', 'p6',
+    ))
+
+    def cli(self, address_family='', vrf='', output=None):
+
+        # Init dictionary
+        route_dict = {}
+        for keys, values in self.stream(output, address_family=address_family,
+                                        vrf=vrf):
+            merge_record(route_dict, keys, values)
+
+        return route_dict
+
+    def stream(self, lines, address_family='', vrf=''):
+        ''' Yield the paths and the address family attributes of an output
+            one at a time, in the order of the output. cli() is built from
+            these records.
+
+            Args:
+                lines: output, file object or iterable of lines
+                address_family (`str`): address family of the command
+                vrf (`str`): vrf of the command
+
+            Yields:
+                tuple: (keys, values), the values are merged into the
+                       structure of cli() under the keys, eg.
+                       (('vrf', 'default', 'address_family', 'ipv4 unicast',
+                         'routes', '10.1.1.0/24', 'index', 1),
+                        {'status_codes': '*>', 'next_hop': '0.0.0.0', ...})
+        '''
+
+        if not vrf:
+            vrf = 'default'
+        if address_family:
+            original_address_family = address_family
+        index = 1
+        bgp_table_version = local_router_id = ''
+        metric = localpref = weight = ''
+        status_codes = ''
+        prefix = ""
+        origin_codes_info = origin_codes_data = ""
+
+        p = self.patterns
+        dispatch = self.dispatcher
+
+        for line in iter_lines(lines):
             line = line.rstrip()
 
+            name, m = dispatch.match(line)
+            if not m:
+                continue
+
             # For address family: IPv4 Unicast
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
                 continue
@@ -259,8 +308,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #     Network          Next Hop            Metric LocPrf Weight Path
             # *>   [5][65535:1][0][24][10.1.1.0]/17
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p3_1.match(line)
-            if m:
+            if name == 'p3_1':
                 # Get keys
                 if m.groupdict()['status_codes']:
                     status_codes = m.groupdict()['status_codes']
@@ -282,8 +330,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #                      0.0.0.0                  0         32768 ?
             # *>                    0.0.0.0                 0         32768 ?
             # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p3_2.match(line)
-            if m:
+            if name == 'p3_2':
                 # Get keys
                 path_type = ""
                 path_info = ""
@@ -302,8 +349,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['termination']:
                     termination = m.groupdict()['termination']
-                    m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
-                                    r' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
+                    m3 = p.p3_3.match(termination)
                     if m3 and m3.groupdict()['path']:
                         path_info = m3.groupdict()['path']
                     if m3 and m3.groupdict()['origin_codes']:
@@ -317,49 +363,28 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     localpref = int(m.groupdict()['local_prf'])
 
                 index += 1
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
 
                 # Set keys
+                path_dict = {}
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+                    path_dict['status_codes'] = status_codes
 
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    path_dict['next_hop'] = next_hop
                 if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+                    path_dict['localpref'] = localpref
                 if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
+                    path_dict['weight'] = weight
                 if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
+                    path_dict['metric'] = metric
 
                 if path_info:
-                     af_dict['routes'][prefix]['index'][index]['path'] = path_info
+                    path_dict['path'] = path_info
                 if origin_codes_info:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
+                    path_dict['origin_codes'] = origin_codes_info
 
+                yield (('vrf', vrf, 'address_family', address_family,
+                        'routes', prefix, 'index', index), path_dict)
                 continue
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
@@ -368,8 +393,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 path_type = ""
                 path_data = ""
                 if m.groupdict()['prefix']:
@@ -389,8 +413,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['path']:
                     path_1 = m.groupdict()['path']
-                    m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
-                                    r' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
+                    m3 = p.p4_1.match(path_1)
                     if m3:
                         path_data = m3.groupdict()['path_inner']
                         origin_codes_data = m3.groupdict()['origin_codes_inner']
@@ -404,125 +427,68 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 if m.groupdict()['local_prf']:
                     localpref = int(m.groupdict()['local_prf'])
 
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-
                 # Set keys
+                path_dict = {}
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+                    path_dict['status_codes'] = status_codes
                 if path_data:
-                    af_dict['routes'][prefix]['index'][index]['path'] = path_data
+                    path_dict['path'] = path_data
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    path_dict['next_hop'] = next_hop
                 if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+                    path_dict['localpref'] = localpref
                 if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
+                    path_dict['weight'] = weight
                 if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
+                    path_dict['metric'] = metric
                 if origin_codes_data:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
+                    path_dict['origin_codes'] = origin_codes_data
+
+                yield (('vrf', vrf, 'address_family', address_family,
+                        'routes', prefix, 'index', index), path_dict)
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
                 pfx_count = int(m.groupdict()['pfx_count'])
                 pfx_limit = int(m.groupdict()['pfx_limit'])
 
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['af_private_import_to_address_family'] = af_private_import_to_address_family
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['pfx_count'] = pfx_count
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                        ['pfx_limit'] = pfx_limit
-
+                yield (('vrf', vrf, 'address_family', new_address_family), {
+                    'af_private_import_to_address_family':
+                        af_private_import_to_address_family,
+                    'pfx_count': pfx_count,
+                    'pfx_limit': pfx_limit})
                 continue
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
 
-                # Init dict
                 if m.groupdict()['default_vrf']:
                     vrf = m.groupdict()['default_vrf']
 
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
-
                 # Set keys
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['bgp_table_version'] = bgp_table_version
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_identifier'] = local_router_id
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_distinguisher'] = route_distinguisher
+                af_dict = {'bgp_table_version': bgp_table_version,
+                           'route_identifier': local_router_id,
+                           'route_distinguisher': route_distinguisher}
 
                 if vrf:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['default_vrf'] = \
-                    vrf
+                    af_dict['default_vrf'] = vrf
 
                 if m.groupdict()['vrf_router_id']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['vrf_route_identifier'] = \
+                    af_dict['vrf_route_identifier'] = \
                         str(m.groupdict()['vrf_router_id'])
 
+                yield (('vrf', vrf, 'address_family', new_address_family),
+                       af_dict)
 
-                # Reset address_family key and af_dict for use in other regex
+                # Reset address_family key for use in other regex
                 address_family = new_address_family
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-
-                # Init routes dict
-                if 'routes' not in af_dict:
-                    del af_dict
-
                 continue
 
-        return route_dict
-
 
 # ===================================
 # Parser for:
@@ -2822,41 +2788,69 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
-
-        # Init vars
-        ret_dict = {}
-        list_of_neighbors = []
-        af_name = None ; af_dict = {} ; nbr_dict = {}
-        message_statistics = False
-        prefix_activity = True
-        local_prefix = False
-        refresh_activity = False
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+        p1=r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$',
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         r' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$')
+        p2_1=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+             r' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$',
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           r' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           r' +(?P<link>[a-zA-Z]+) +link$')
+        p2_2=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+             r' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
+             r' +(?P<link>[a-zA-Z]+) +link$',
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
         # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
         # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           r'(?: +vrf +(?P<vrf>(\S+)),)?'
-                           r' +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           r'( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
-                           r'(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$')
+        p2_3=r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+             r'(?: +vrf +(?P<vrf>(\S+)),)?'
+             r' +remote +AS +(?P<remote_as>([\d\.]+)),'
+             r'( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
+             r'(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$',
+    )
+
+    # one block per neighbor, for cli(workers=...)
+    blocks = BlockSplitter(patterns, header=('p2_1', 'p2_2', 'p2_3'),
+                           context=('p1',))
+
+    # keys of cli(where=...), a neighbor without vrf is in the default vrf
+    where_keys = {'neighbor': None, 'vrf': lambda vrf: vrf or 'default'}
+
+    def cli(self, neighbor='', address_family='', vrf='', output=None,
+            workers=None, where=None):
+
+        if where is not None:
+            predicate = Predicate(where, self.where_keys)
+            return merge_parsed(
+                self.cli(output=text, neighbor=neighbor,
+                         address_family=address_family, vrf=vrf,
+                         workers=workers)
+                for text in self.blocks.select(output, predicate.match))
+
+        if workers:
+            return merge_parsed(parse_blocks(
+                self, output, workers, neighbor=neighbor,
+                address_family=address_family, vrf=vrf))
+
+        # Init vars
+        ret_dict = {}
+        list_of_neighbors = []
+        af_name = None ; af_dict = {} ; nbr_dict = {}
+        message_statistics = False
+        prefix_activity = True
+        local_prefix = False
+        refresh_activity = False
+
+        p1 = self.patterns.p1
+        p2_1 = self.patterns.p2_1
+        p2_2 = self.patterns.p2_2
+        p2_3 = self.patterns.p2_3
 
         # Description: router22222222
         p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
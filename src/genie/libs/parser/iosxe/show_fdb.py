@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.buffer import finditer_lines
 import re
 
 from genie.libs.parser.utils.common import Common
@@ -421,25 +422,18 @@ class ShowMacAddressMacVlan(ShowMacAddressMacVlanSchema):
         # initial variables
         ret_dict = {}
         
-        for line in out.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-
-            # 10    0017.0100.0001    DYNAMIC     Fo1/0/24
-            m = p1.match(line)
-            if m:
-                group    = m.groupdict()
-                vlanId  = group['vlanid']
-                macAddr = group['mac']
-                typ     = group['type']
-                intf    = group['port']
-
-                final_dict = ret_dict.setdefault('macAddress',{}).setdefault(macAddr,{})
-                final_dict['VlanID'] = vlanId
-                final_dict['Type']   = typ
-                final_dict['Ports']  = intf
-                continue
+        # 10    0017.0100.0001    DYNAMIC     Fo1/0/24
+        for m in finditer_lines(p1, out):
+            group    = m.groupdict()
+            vlanId  = group['vlanid']
+            macAddr = group['mac']
+            typ     = group['type']
+            intf    = group['port']
+
+            final_dict = ret_dict.setdefault('macAddress',{}).setdefault(macAddr,{})
+            final_dict['VlanID'] = vlanId
+            final_dict['Type']   = typ
+            final_dict['Ports']  = intf
 
         return ret_dict
 
@@ -41,7 +41,6 @@ import logging
 import pprint
 import re
 import unittest
-from genie import parsergen
 from collections import defaultdict
 
 from pyats.log.utils import banner
@@ -69,6 +68,16 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.tabular import ColumnTable
+from genie.libs.parser.utils.blocks import BlockSplitter, parse_blocks, \
+    parse_cached_blocks, merge_parsed
+from genie.libs.parser.utils.projection import Projection, projected_result
+from genie.libs.parser.utils.call_schema import CallSchema
+from genie.libs.parser.utils.predicate import Predicate, interface_name
+from genie.libs.parser.utils.pushdown import DeviceFilter, \
+    execute_filtered, interface_regex
 
 logger = logging.getLogger(__name__)
 
@@ -234,7 +243,7 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(CallSchema, ShowInterfacesSchema):
     """parser for show interfaces
                   show interfaces <interface>"""
 
@@ -253,80 +262,65 @@ class ShowInterfaces(ShowInterfacesSchema):
                'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
                'reliability', 'out_broadcast_pkts']
 
-    def cli(self, interface="", include="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            elif include:
-                cmd = self.cli_command[2].format(include=include)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = Patterns(
         # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
         # FastEthernet1 is down, line protocol is down (err-disabled)
         # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
-
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                          r' +(?P<enabled>[\w\s]+),'
-                          r' +line +protocol +is +(?P<line_protocol>\w+)'
-                          r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1=r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
+           r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+           r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+        p1_1=r'^(?P<interface>[\w\/\.\-\:]+) +is'
+             r' +(?P<enabled>[\w\s]+),'
+             r' +line +protocol +is +(?P<line_protocol>\w+)'
+             r'( *, *(?P<attribute>[\w\s]+))?$',
 
         # pseudowire1 is up
-        p1_2 = re.compile(r'^(?P<interface>pseudowire\d+) +is +(?P<enabled>\w+)$')
+        p1_2=r'^(?P<interface>pseudowire\d+) +is +(?P<enabled>\w+)$',
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+        p2=r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+           r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
 
         # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
         # Hardware is BUILT-IN-4x2_5GE, address is 8c1e.8068.9f6c (bia 8c1e.8068.9f6c)
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\\_+ ]+)(, +address +is +(?P<mac_address>[a-f0-9\.]+)( +\(bia +(?P<phys_address>.*)\))?)?')
+        p2_2=r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\\_+ ]+)(, +address +is +(?P<mac_address>[a-f0-9\.]+)( +\(bia +(?P<phys_address>.*)\))?)?',
 
         # Hardware is not present
-        p2_3 = re.compile(r'^Hardware +is +not +present$')
-
-        # Hardware is not present
-        p2_3 = re.compile(r'^Hardware +is +not +present$')
+        p2_3=r'^Hardware +is +not +present$',
 
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
+        p3=r'^Description: *(?P<description>.*)$',
 
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p4=r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p5=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
         # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
         # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
+        p6=r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+           r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+           r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+           r'DLY +(?P<delay>[0-9]+) +usec,$',
 
         # MTU 9198 bytes, BW not configured
-        p6_1 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes, +BW +(?P<bandwidth>[\w\s]+)$')
+        p6_1=r'^MTU +(?P<mtu>\d+) +bytes, +BW +(?P<bandwidth>[\w\s]+)$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
+        p7=r'^reliability +(?P<reliability>[\d\/]+),'
+           r' +txload +(?P<txload>[\d\/]+), +rxload'
+           r' +(?P<rxload>[\d\/]+)$',
 
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
@@ -335,12 +329,26 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                        r'(, +(?P<rest>.*))?$')
+        p8=r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+           r'(, +(?P<rest>.*))?$',
+
+        # Vlan ID 20, medium is p2p
+        p8_1=r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
+             r' *medium +is +(?P<medium>[a-z0-9]+)$',
+        p8_2=r'loopback +(?P<loopback>[\w\s]+)$',
+
+        #  outer ID  10, inner ID 20
+        p8_3=r'outer +ID +(?P<first>[0-9]+), +'
+             r'inner +ID (?P<second>[0-9]+)$',
+
+        # Vlan ID  1., loopback not set
+        # Vlan ID  105.
+        p8_4=r'Vlan +ID +(?P<first_dot1q>\d+).'
+             r'|(?:,(?P<rest>[\s\w]+))$',
 
         # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                         r' +sec\)$')
+        p10=r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+            r' +sec\)$',
 
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
@@ -354,181 +362,181 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
         # Full-duplex, 10Gb/s, media type is 100/1000/2.5G/5G/10GBaseTX
         # Full-duplex, 10Gb/s, link type is auto, media type is CVR QSFP SFP10G(SFP-10GBase-SR)
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$')
+        p11=r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+            r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+            r'(S|s)peed)(?:(?:\, +link +type +is '
+            r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+            r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$',
 
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
-                         r'(?P<second>output|input) +flow-control +is +(?P<send>\w+)$')
+        p12=r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
+            r'(?P<second>output|input) +flow-control +is +(?P<send>\w+)$',
 
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                         r'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p13=r'^ARP +type: +(?P<arp_type>\w+), +'
+            r'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                         r'output +(?P<last_output>[\w\.\:]+), '
-                         r'output +hang +(?P<output_hang>[\w\.\:]+)$')
+        p14=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            r'output +(?P<last_output>[\w\.\:]+), '
+            r'output +hang +(?P<output_hang>[\w\.\:]+)$',
 
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
+        p15=r'^Members +in +this +channel: +'
+            r'(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
 
         # No. of active members in this channel: 12
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                           r'channel: +(?P<active_members>\d+)$')
+        p15_1=r'^No\. +of +active +members +in +this +'
+              r'channel: +(?P<active_members>\d+)$',
 
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                           r' +\S+, +\S+$')
+        p15_2=r'^Member +\d+ +: +(?P<interface>\S+) +,'
+              r' +\S+, +\S+$',
 
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                           r'in +this +channel +: +(?P<number>\d+)$')
+        p15_3=r'^No\. +of +PF_JUMBO +supported +members +'
+              r'in +this +channel +: +(?P<number>\d+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                         r'(?P<last_clear>[\w\:\.]+)$')
+        p16=r'^Last +clearing +of +\"show +interface\" +counters +'
+            r'(?P<last_clear>[\w\:\.]+)$',
 
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                         r'(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                         r'\(size\/max\/drops\/flushes\); +'
-                         r'Total +output +drops: +(?P<output_drop>\d+)$')
+        p17=r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+            r'(?P<drops>\d+)\/(?P<flushes>\d+) +'
+            r'\(size\/max\/drops\/flushes\); +'
+            r'Total +output +drops: +(?P<output_drop>\d+)$',
 
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+        p18=r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
 
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                         r'(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                         r'+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+        p19=r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+            r'(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+            r'+\(size\/max(?: +total\/threshold\/drops\))?.*$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p20=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+            r' *(?P<in_rate>[0-9]+) *bits/sec,'
+            r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output *rate'
-                         r' *(?P<out_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *output *rate'
+            r' *(?P<out_rate>[0-9]+) *bits/sec,'
+            r' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
 
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                         r'+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+        p22=r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+            r'+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                         r'\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p23=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+            r'\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                         r' *(?P<in_giants>[0-9]+) *giants,'
-                         r' *(?P<in_throttles>[0-9]+) *throttles$')
+        p24=r'^(?P<in_runts>[0-9]+) *runts,'
+            r' *(?P<in_giants>[0-9]+) *giants,'
+            r' *(?P<in_throttles>[0-9]+) *throttles$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                         r'(?P<in_crc_errors>[0-9]+) +CRC, +'
-                         r'(?P<in_frame>[0-9]+) +frame, +'
-                         r'(?P<in_overrun>[0-9]+) +overrun, +'
-                         r'(?P<in_ignored>[0-9]+) +ignored'
-                         r'(, *(?P<in_abort>[0-9]+) +abort)?$')
+        p25=r'^(?P<in_errors>[0-9]+) +input +errors, +'
+            r'(?P<in_crc_errors>[0-9]+) +CRC, +'
+            r'(?P<in_frame>[0-9]+) +frame, +'
+            r'(?P<in_overrun>[0-9]+) +overrun, +'
+            r'(?P<in_ignored>[0-9]+) +ignored'
+            r'(, *(?P<in_abort>[0-9]+) +abort)?$',
 
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                         r'(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                         r'(?P<in_pause_input>[0-9]+) +pause +input$')
+        p26=r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+            r'(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+            r'(?P<in_pause_input>[0-9]+) +pause +input$',
 
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                         r'dribble +condition +detected$')
+        p27=r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+            r'dribble +condition +detected$',
 
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                         r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+        p28=r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+            r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
 
         # Output 0 broadcasts (55 multicasts)
-        p29 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                         r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p29=r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+            r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                         r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                         r'(?P<out_interface_resets>[0-9]+) +interface +resets$')
+        p30=r'^(?P<out_errors>[0-9]+) +output +errors,'
+            r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
+            r'(?P<out_interface_resets>[0-9]+) +interface +resets$',
 
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                         r'unknown +protocol +drops$')
+        p31=r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+            r'unknown +protocol +drops$',
 
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                         r'(?P<out_late_collision>[0-9]+) +late +collision, +'
-                         r'(?P<out_deferred>[0-9]+) +deferred$')
+        p32=r'^(?P<out_babble>[0-9]+) +babbles, +'
+            r'(?P<out_late_collision>[0-9]+) +late +collision, +'
+            r'(?P<out_deferred>[0-9]+) +deferred$',
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                         r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                         r'pause +output)?$')
+        p33=r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+            r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+            r'pause +output)?$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                         r'(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+        p34=r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+            r'(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
 
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                         r'(?P<unnumbered_intf>[\w\/\.]+) +'
-                         r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+        p35=r'^Interface +is +unnumbered. +Using +address +of +'
+            r'(?P<unnumbered_intf>[\w\/\.]+) +'
+            r'\((?P<unnumbered_ip>[\w\.\:]+)\)$',
 
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                         r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
+        p36=r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+            r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
 
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
+        p37=r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
 
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                         r'seconds$')
+        p38=r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+            r'seconds$',
 
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
+        p39=r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
 
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
+        p40=r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
 
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
+        p41=r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
 
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
+        p42=r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
 
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
+        p43=r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
 
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                         r'loopback\s+(?P<loopback>[\S\s]+)$')
+        p44=r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+            r'loopback\s+(?P<loopback>[\S\s]+)$',
 
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                         r'seconds +on +reset$')
+        p45=r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+            r'seconds +on +reset$',
 
         # Tunnel source 1.1.10.11
         # Tunnel source 1.1.1.1 (Loopback1)
@@ -536,56 +544,334 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
         # Tunnel source UNKNOWN, destination 1.2.3.4
         #
-        p46 = re.compile(r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
-                         r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
-                         r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)')
+        p46=r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
+            r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
+            r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)',
 
         # Tunnel protocol/transport AURP
-        p47 = re.compile(r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)')
+        p47=r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)',
 
         # Tunnel TTL 255
-        p48 = re.compile(r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)')
+        p48=r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)',
 
         # Tunnel transport MTU 1480 bytes
-        p49 = re.compile(r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)')
+        p49=r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)',
 
         # Tunnel transmit bandwidth 10000000 (kbps)
-        p50 = re.compile(r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)')
+        p50=r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)',
 
         # Tunnel receive bandwidth 10000000 (kbps)
-        p51 = re.compile(r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)')
+        p51=r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)',
 
         # Tunnel Protection profile
-        p52 = re.compile(r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)')
+        p52=r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)',
 
         # 3 carrier transitions
-        p53 = re.compile(r'^(?P<carrier_transitions>\d+)\s+carrier transitions$')
+        p53=r'^(?P<carrier_transitions>\d+)\s+carrier transitions$',
 
         # Carrier delay is 10 sec
-        p54 = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
+        p54=r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
 
         # Asymmetric Carrier-Delay Up Timer is 2 sec
         # Asymmetric Carrier-Delay Down Timer is 10 sec
-        p55 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                            r' +Timer +is +(?P<carrier_delay>\d+).*$')
+        p55=r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+               r' +Timer +is +(?P<carrier_delay>\d+).*$',
 
         # Peer IP 192.0.2.3, VC ID 1
-        p56 = re.compile(r'^Peer IP (?P<peer_ip>[\d\.]+), VC ID (?P<vc_id>\d+)$')
+        p56=r'^Peer IP (?P<peer_ip>[\d\.]+), VC ID (?P<vc_id>\d+)$',
 
         # RX
         # TX
-        p57 = re.compile(r'^(?P<rx_tx>RX|TX)$')
+        p57=r'^(?P<rx_tx>RX|TX)$',
 
         # 0 packets 0 bytes 0 drops
-        p58 = re.compile(r'^(?P<pkts>\d+) packets (?P<octets>\d+) bytes (?P<drops>\d+) drops$')
+        p58=r'^(?P<pkts>\d+) packets (?P<octets>\d+) bytes (?P<drops>\d+) drops$',
+    )
+
+    # the chain of cli, in order
+    dispatcher = LineDispatcher(patterns, (
+        'p1', 'p1_1', 'p1_2', 'p2_3', 'p2', 'p2_2', 'p3', 'p4', 'p5',
+        'p6', 'p6_1', 'p7', 'p8', 'p10', 'p11', 'p12', 'p54', 'p55',
+        'p13', 'p14', 'p15', 'p15_1', 'p15_2', 'p15_3', 'p16', 'p17',
+        'p18', 'p19', 'p20', 'p21', 'p22', 'p23', 'p24', 'p25', 'p26',
+        'p27', 'p28', 'p29', 'p30', 'p31', 'p32', 'p33', 'p34', 'p35',
+        'p36', 'p37', 'p38', 'p39', 'p40', 'p41', 'p42', 'p43', 'p44',
+        'p45', 'p46', 'p47', 'p48', 'p49', 'p50', 'p51', 'p52', 'p53',
+        'p56', 'p57', 'p58',
+    ))
+
+    # one block per interface, for cli(workers=...)
+    blocks = BlockSplitter(patterns, header=('p1', 'p1_1', 'p1_2'))
+
+    # keys populated by each pattern, for cli(fields=...). The first line of
+    # the interface is always parsed
+    pattern_fields = {
+        'p2_3': ['*.is_present'],
+        'p2': ['*.type', '*.mac_address', '*.phys_address'],
+        'p2_2': ['*.type', '*.mac_address', '*.phys_address'],
+        'p3': ['*.description'],
+        # the addresses of the interfaces are borrowed by the unnumbered ones
+        'p4': ['*.ipv4'],
+        'p5': ['*.ipv4'],
+        'p6': ['*.delay', '*.mtu', '*.sub_mtu', '*.bandwidth'],
+        'p6_1': ['*.delay', '*.mtu', '*.sub_mtu', '*.bandwidth'],
+        'p7': ['*.reliability', '*.txload', '*.rxload'],
+        'p8': ['*.encapsulations', '*.medium'],
+        'p10': ['*.keepalive'],
+        'p11': ['*.duplex_mode', '*.port_speed', '*.link_type',
+                '*.auto_negotiate', '*.media_type'],
+        'p12': ['*.flow_control'],
+        'p54': ['*.carrier_delay'],
+        'p55': ['*.carrier_delay_up', '*.carrier_delay_down'],
+        'p13': ['*.arp_type', '*.arp_timeout'],
+        'p14': ['*.last_input', '*.last_output', '*.output_hang'],
+        'p15': ['*.port_channel'],
+        'p15_1': ['*.port_channel'],
+        'p15_2': ['*.port_channel'],
+        'p15_3': ['*.port_channel'],
+        'p16': ['*.counters.last_clear'],
+        'p17': ['*.queues'],
+        'p18': ['*.queues'],
+        'p19': ['*.queues'],
+        'p20': ['*.counters.rate', '*.counters.last_clear'],
+        'p21': ['*.counters.rate'],
+        # the counters of the next lines are added to the dict it creates
+        'p22': ['*.counters'],
+        'p23': ['*.counters.in_multicast_pkts',
+                '*.counters.in_broadcast_pkts'],
+        'p24': ['*.counters.in_runts', '*.counters.in_giants',
+                '*.counters.in_throttles'],
+        'p25': ['*.counters.in_errors', '*.counters.in_crc_errors',
+                '*.counters.in_frame', '*.counters.in_overrun',
+                '*.counters.in_ignored', '*.counters.in_abort'],
+        'p26': ['*.counters.in_watchdog', '*.counters.in_multicast_pkts',
+                '*.counters.in_mac_pause_frames'],
+        'p27': ['*.counters.in_with_dribble'],
+        'p28': ['*.counters.out_pkts', '*.counters.out_octets',
+                '*.counters.out_underruns'],
+        'p29': ['*.counters.out_broadcast_pkts',
+                '*.counters.out_multicast_pkts'],
+        'p30': ['*.counters.out_errors', '*.counters.out_interface_resets',
+                '*.counters.out_collision'],
+        'p31': ['*.counters.out_unknown_protocl_drops'],
+        'p32': ['*.counters.out_babble', '*.counters.out_late_collision',
+                '*.counters.out_deferred'],
+        'p33': ['*.counters.out_lost_carrier', '*.counters.out_no_carrier',
+                '*.counters.out_mac_pause_frames'],
+        'p34': ['*.counters.out_buffer_failure',
+                '*.counters.out_buffers_swapped'],
+        'p35': ['*.ipv4'],
+        'p36': ['*.maximum_active_vcs', '*.vcs_per_vp', '*.current_vccs'],
+        'p37': ['*.vc_auto_creation'],
+        'p38': ['*.vc_idle_disconnect_time'],
+        'p39': ['*.aal5_crc_errors'],
+        'p40': ['*.aal5_oversized_sdus'],
+        'p41': ['*.aal5_sar_timeouts'],
+        'p42': ['*.lcp_state', '*.lcp_loopack'],
+        'p43': ['*.base_pppoatm'],
+        'p44': ['*.vaccess_status', '*.vaccess_loopback'],
+        'p45': ['*.dtr_pulsed'],
+        'p46': ['*.tunnel_source_ip', '*.tunnel_source_interface',
+                '*.tunnel_destination_ip'],
+        'p47': ['*.tunnel_protocol'],
+        'p48': ['*.tunnel_ttl'],
+        'p49': ['*.tunnel_transport_mtu'],
+        'p50': ['*.tunnel_transmit_bandwidth'],
+        'p51': ['*.tunnel_receive_bandwidth'],
+        'p52': ['*.tunnel_protection', '*.tunnel_profile'],
+        'p53': ['*.carrier_transitions'],
+        'p56': ['*.peer_ip', '*.vc_id'],
+        # the direction of the counters of the next line
+        'p57': ['*.counters.in_pkts', '*.counters.in_octets',
+                '*.counters.in_drops', '*.counters.out_pkts',
+                '*.counters.out_octets', '*.counters.out_drops'],
+        'p58': ['*.counters.in_pkts', '*.counters.in_octets',
+                '*.counters.in_drops', '*.counters.out_pkts',
+                '*.counters.out_octets', '*.counters.out_drops'],
+    }
+
+    # keys of cli(where=...)
+    where_keys = {'interface': interface_name}
+
+    # filters of the device keeping the lines of the patterns selected by
+    # cli(fields=...), or the blocks of cli(where=...) and of the
+    # port-channels. Some lines of an interface are not indented below its
+    # first line, eg. `Last clearing of "show interface" counters` on some
+    # platforms, which `section` drops: the blocks are kept with `begin`,
+    # from the first one on, and filtered by the parser
+    device_filter = DeviceFilter(patterns, lines={
+        'p1': 'line +protocol',
+        'p1_1': 'line +protocol',
+        'p1_2': '^ *pseudowire[0-9]+ +is',
+        'p11': 'uplex,',
+        'p12': 'flow-control +is',
+        'p20': 'input *rate',
+        'p21': 'output *rate',
+        'p22': 'packets +input,',
+        'p24': 'runts,',
+        'p25': 'input +errors,',
+        'p26': 'watchdog,',
+        'p27': 'dribble +condition',
+        'p28': 'packets +output,',
+        'p30': 'output +errors,',
+        'p31': 'unknown +protocol +drops',
+        'p32': 'babbles,',
+        'p33': 'lost +carrier,',
+        'p34': 'output +buffer +failures,',
+        'p36': 'maximum +active +VCs,',
+        'p39': 'CRC +errors +:',
+        'p40': 'SAR +Timeouts +:',
+        'p41': 'Oversized +SDUs +:',
+        'p53': 'carrier transitions',
+        'p57': '^ *[RT]X *$',
+        'p58': 'bytes [0-9]+ drops',
+    }, blocks={'interface': lambda pattern: '^ *{} +is'.format(
+        interface_regex(pattern))}, context=('^ *Port-channel',),
+        block_filter='begin')
+
+    def cli(self, interface="", include="", output=None, workers=None,
+            block_cache=None, fields=None, where=None):
+        # the patterns populating the fields, the others are skipped
+        kwargs = {}
+        if fields is not None:
+            projection = Projection(fields)
+            kwargs['names'] = projection.select(self.dispatcher.names,
+                                                self.pattern_fields)
+        if where is not None:
+            predicate = Predicate(where, self.where_keys)
+
+        if output is None:
+            pipe = None
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            elif include:
+                cmd = self.cli_command[2].format(include=include)
+            else:
+                cmd = self.cli_command[0]
+                # the device sends the blocks kept, or the lines parsed
+                if where is not None:
+                    pipe = self.device_filter.select(predicate)
+                if pipe is None:
+                    pipe = self.device_filter.include(kwargs.get('names'))
+            out = execute_filtered(self.device, cmd, pipe)
+        else:
+            out = output
+
+        # the blocks of the interfaces kept, and of the port-channels which
+        # give their members their port-channel, parsed as a single output
+        kept = out
+        if where is not None:
+
+            def keep(groups):
+                return predicate.match(groups) or interface_name(
+                    groups['interface']).startswith('Port-channel')
+            kept = '\n'.join(self.blocks.select(out, keep))
+
+        results = self._parse_output(kept, workers, block_cache, **kwargs)
+        interface_dict, unnumbered_dict = self._merge_results(results)
+
+        if where is not None:
+            # the interfaces skipped whose address an unnumbered interface
+            # borrows, a port-channel may have added them as its members
+            borrowed = {unnumbered['unnumbered_intf'] for unnumbered
+                        in unnumbered_dict.values()}
+            borrowed = {intf for intf in borrowed
+                        if not keep({'interface': intf})}
+            if borrowed:
+                lent = set()
+
+                def lends(groups):
+                    intf = interface_name(groups['interface'])
+                    if intf in borrowed:
+                        lent.add(intf)
+                        return True
+                    return False
+                lender = self.blocks.select(out, lends)
+                if output is None:
+                    # the device did not send them, filtering the blocks
+                    lender.extend(
+                        self.device.execute(
+                            self.cli_command[1].format(interface=intf))
+                        for intf in sorted(borrowed - lent))
+                lender = '\n'.join(lender)
+                results.extend(self._parse_output(lender, workers,
+                                                  block_cache, **kwargs))
+                interface_dict, _ = self._merge_results(results)
+
+        # create strucutre for unnumbered interface
+        for intf in unnumbered_dict:
+            unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
+            unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
+            if unnumbered_intf in interface_dict:
+                if 'ipv4' in interface_dict[unnumbered_intf]:
+                    for ip in interface_dict[unnumbered_intf]['ipv4']:
+                        if unnumbered_ip in ip:
+                            if 'ipv4' not in interface_dict[intf]:
+                                interface_dict[intf]['ipv4'] = {}
+                            if ip not in interface_dict[intf]['ipv4']:
+                                interface_dict[intf]['ipv4'][ip] = {}
+                            m = re.search(r'([\w\.\:]+)\/(\d+)', ip)
+                            interface_dict[intf]['ipv4'][ip]['ip'] = m.groups()[0]
+                            interface_dict[intf]['ipv4'][ip]['prefix_length'] = m.groups()[1]
+                            interface_dict[intf]['ipv4']['unnumbered'] = {}
+                            interface_dict[intf]['ipv4']['unnumbered']\
+                                ['interface_ref'] = unnumbered_intf
+
+        if where is not None:
+            interface_dict = {intf: value
+                              for intf, value in interface_dict.items()
+                              if predicate.match({'interface': intf})}
+        if fields is not None:
+            return projected_result(self, interface_dict, projection)
+        return (interface_dict)
+
+    def _parse_output(self, output, workers, block_cache, **kwargs):
+        """the results of _parse_interfaces() for the blocks of the output,
+        in order"""
+        if block_cache is not None:
+            return parse_cached_blocks(self, output, block_cache,
+                                       method='_parse_interfaces', **kwargs)
+        return parse_blocks(self, output, workers,
+                            method='_parse_interfaces', **kwargs)
+
+    def _merge_results(self, results):
+        """merge the results of _parse_interfaces() for the blocks of an
+        output, as if the output had been parsed at once"""
+        interface_dict = merge_parsed(result[0] for result in results)
+        unnumbered_dict = merge_parsed(result[1] for result in results)
+
+        # the block of a member listed by a port-channel before it does not
+        # know it is a member, the membership is applied over it
+        for result in results:
+            for intf, port_channel in result[2].items():
+                member = interface_dict.setdefault(intf, {})\
+                    .setdefault('port_channel', {})
+                member['port_channel_member'] = True
+                member['port_channel_int'] = port_channel
+        return interface_dict, unnumbered_dict
+
+    def _parse_interfaces(self, output, names=None):
+        """the interfaces of the output, the addresses their unnumbered
+        interfaces borrow and the port-channel of the members listed, with
+        the patterns of `names` only when given"""
+        out = output
+        p = self.patterns
+        dispatch = self.dispatcher
+        if names is not None:
+            dispatch = dispatch.select(names)
 
         interface_dict = {}
         unnumbered_dict = {}
+        members = {}
         section_name = None
 
         for line in out.splitlines():
             line = line.strip()
 
+            name, m = dispatch.match(line)
+            if not m:
+                continue
+
             # GigabitEthernet1 is up, line protocol is up
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
@@ -593,11 +879,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # FastEthernet1 is down, line protocol is down (err-disabled)
             # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m2 = p1_2.match(line)
-            m = m if m else m1 if m1 else m2
-            if m:
+            if name in ('p1', 'p1_1', 'p1_2'):
                 interface = m.groupdict()['interface']
                 interface = Common.convert_intf_name(interface)
                 enabled = m.groupdict()['enabled']
@@ -640,19 +922,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
                 continue
 
-            m = p2_3.match(line)
-            if m:
+            if name == 'p2_3':
                 interface_dict[interface]['is_present'] = False
                 continue
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
-
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p2', 'p2_2'):
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -664,16 +941,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
                 address_sec = m.groupdict()['ipv4']
@@ -692,8 +967,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
                 address = m.groupdict()['ipv4']
@@ -712,10 +986,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
             # MTU 9198 bytes, BW not configured
-            m = p6.match(line)
-            m1 = p6_1.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p6', 'p6_1'):
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
                 bandwidth = m.groupdict()['bandwidth']
@@ -733,8 +1004,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -749,8 +1019,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -763,20 +1032,11 @@ class ShowInterfaces(ShowInterfacesSchema):
                 rest = m.groupdict()['rest']
                 if not rest:
                     continue
-                # Vlan ID 20, medium is p2p
-                m1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
-                                 r' *medium +is +(?P<medium>[a-z0-9]+)$').match(rest)
+                m1 = p.p8_1.match(rest)
                 # will update key when output is valid
-                m2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$').match(rest)
-
-                #  outer ID  10, inner ID 20
-                m3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
-                                 r'inner +ID (?P<second>[0-9]+)$').match(rest)
-
-                # Vlan ID  1., loopback not set
-                # Vlan ID  105.
-                m4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
-                                 r'|(?:,(?P<rest>[\s\w]+))$').match(rest)
+                m2 = p.p8_2.match(rest)
+                m3 = p.p8_3.match(rest)
+                m4 = p.p8_4.match(rest)
 
                 if m1:
                     first_dot1q = m1.groupdict()['first_dot1q']
@@ -800,8 +1060,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
                     interface_dict[interface]['keepalive'] = int(keepalive)
@@ -818,8 +1077,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
             # Full-duplex, 10Gb/s, link type is auto, media type is CVR QSFP SFP10G(SFP-10GBase-SR)
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
                 link_type = m.groupdict()['link_type']
@@ -842,8 +1100,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 groups = m.groupdict()
                 receive = groups['receive'].lower() if groups['first'] == 'input' else groups['send'].lower()
                 send = groups['send'].lower() if groups['second'] == 'output' else groups['receive'].lower()
@@ -861,8 +1118,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            m = p54.match(line)
-            if m:
+            if name == 'p54':
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
@@ -870,8 +1126,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            m = p55.match(line)
-            if m:
+            if name == 'p55':
                 group = m.groupdict()
                 tp = group['type'].lower()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -882,8 +1137,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 interface_dict[interface]['arp_type'] = arp_type
@@ -891,8 +1145,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 output_hang = m.groupdict()['output_hang']
@@ -903,8 +1156,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
                 intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
@@ -920,11 +1172,11 @@ class ShowInterfaces(ShowInterfacesSchema):
                         interface_dict[intf]['port_channel'] = {}
                     interface_dict[intf]['port_channel']['port_channel_member'] = True
                     interface_dict[intf]['port_channel']['port_channel_int'] = interface
+                    members[intf] = interface
                 continue
 
             # No. of active members in this channel: 12
-            m = p15_1.match(line)
-            if m:
+            if name == 'p15_1':
                 group = m.groupdict()
                 active_members = int(group['active_members'])
                 interface_dict[interface]['port_channel']\
@@ -934,8 +1186,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
-            if m:
+            if name == 'p15_2':
                 group = m.groupdict()
                 intf = group['interface']
                 if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
@@ -948,8 +1199,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
-            if m:
+            if name == 'p15_3':
                 group = m.groupdict()
                 number = int(group['number'])
                 interface_dict[interface]['port_channel']\
@@ -957,14 +1207,12 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
 
@@ -982,8 +1230,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['queue_strategy'] = \
@@ -992,8 +1239,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['output_queue_size'] = \
@@ -1008,8 +1254,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
                 in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
@@ -1042,8 +1287,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
                     interface_dict[interface]['counters']['rate'] = {}
@@ -1058,8 +1302,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
@@ -1074,8 +1317,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_multicast_pkts'])
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = \
@@ -1083,8 +1325,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_giants'] = \
@@ -1095,8 +1336,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_crc_errors'] = \
@@ -1113,8 +1353,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
@@ -1124,15 +1363,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
                 interface_dict[interface]['counters']['out_octets'] = \
@@ -1143,8 +1380,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcasts (55 multicasts)
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
                 interface_dict[interface]['counters']['out_multicast_pkts'] = \
@@ -1153,8 +1389,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_interface_resets'] = \
@@ -1165,15 +1400,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
                 interface_dict[interface]['counters']['out_late_collision'] = \
@@ -1183,8 +1416,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = \
@@ -1196,8 +1428,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
                 interface_dict[interface]['counters']['out_buffers_swapped'] = \
@@ -1206,16 +1437,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
                 vcs_per_vp = group['vcs_per_vp']
@@ -1226,45 +1455,39 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # VC Auto Creation Disabled.
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
                 interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
                 interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
-            if m:
+            if name == 'p39':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
 
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
-            if m:
+            if name == 'p40':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
-            if m:
+            if name == 'p41':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
-            if m:
+            if name == 'p42':
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
                 loopback = group.get('loopback', None)
@@ -1273,23 +1496,20 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
-            if m:
+            if name == 'p43':
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
-            if m:
+            if name == 'p44':
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
                 interface_dict[interface].update({'vaccess_loopback': group['loopback']})
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
-            if m:
+            if name == 'p45':
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
@@ -1299,8 +1519,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Tunnel source 1.1.10.11, destination 1.1.10.10
             # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
             # Tunnel source UNKNOWN, destination 1.2.3.4
-            m = p46.match(line)
-            if m:
+            if name == 'p46':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_source_ip': group['tunnel_source_ip']})
                 if group['tunnel_source_interface']:
@@ -1310,42 +1529,36 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Tunnel protocol/transport AURP
-            m = p47.match(line)
-            if m:
+            if name == 'p47':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_protocol': group['tunnel_protocol']})
                 continue
 
             # Tunnel TTL 255
-            m = p48.match(line)
-            if m:
+            if name == 'p48':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_ttl': int(group['tunnel_ttl'])})
                 continue
 
             # Tunnel transport MTU 1480 bytes
-            m = p49.match(line)
-            if m:
+            if name == 'p49':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_transport_mtu': int(group['tunnel_transport_mtu'])})
                 continue
 
             # Tunnel transmit bandwidth 10000000 (kbps)
-            m = p50.match(line)
-            if m:
+            if name == 'p50':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_transmit_bandwidth': int(group['tunnel_transmit_bandwidth'])})
                 continue
 
             # Tunnel receive bandwidth 10000000 (kbps)
-            m = p51.match(line)
-            if m:
+            if name == 'p51':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_receive_bandwidth': int(group['tunnel_receive_bandwidth'])})
                 continue
 
-            m = p52.match(line)
-            if m:
+            if name == 'p52':
                 group = m.groupdict()
                 if group['tunnel_protection']:
                     interface_dict[interface].update({'tunnel_protection': group['tunnel_protection']})
@@ -1354,15 +1567,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 3 carrier transitions
-            m = p53.match(line)
-            if m:
+            if name == 'p53':
                 group = m.groupdict()
                 interface_dict[interface]['carrier_transitions'] = int(group['carrier_transitions'])
                 continue
 
             # Peer IP 192.0.2.3, VC ID 1
-            m = p56.match(line)
-            if m:
+            if name == 'p56':
                 group = m.groupdict()
                 interface_dict[interface]['peer_ip'] = group['peer_ip']
                 interface_dict[interface]['vc_id'] = int(group['vc_id'])
@@ -1370,16 +1581,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # RX
             # TX
-            m = p57.match(line)
-            if m:
+            if name == 'p57':
                 group = m.groupdict()
                 section_name = group['rx_tx'].lower()
                 continue
 
             # 0 packets 0 bytes 0 drops
             # re.compile(r'^(?P<pkts>\d+) packets (?P<octets>\d+) bytes (?P<drops>\d+) drops$')
-            m = p58.match(line)
-            if m:
+            if name == 'p58':
                 group = m.groupdict()
                 coutners_dict = interface_dict[interface].setdefault('counters', {})
                 direction = 'in' if section_name == 'rx' else 'out'
@@ -1388,33 +1597,9 @@ class ShowInterfaces(ShowInterfacesSchema):
                 coutners_dict[f'{direction}_drops'] = int(group['drops'])
                 continue
 
-        # create strucutre for unnumbered interface
-        if not unnumbered_dict:
-            return (interface_dict)
-
-        for intf in unnumbered_dict:
-            unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
-            unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
-            if unnumbered_intf in interface_dict:
-                if 'ipv4' in interface_dict[unnumbered_intf]:
-                    for ip in interface_dict[unnumbered_intf]['ipv4']:
-                        if unnumbered_ip in ip:
-                            if 'ipv4' not in interface_dict[intf]:
-                                interface_dict[intf]['ipv4'] = {}
-                            if ip not in interface_dict[intf]['ipv4']:
-                                interface_dict[intf]['ipv4'][ip] = {}
-                            m = re.search(r'([\w\.\:]+)\/(\d+)', ip)
-                            interface_dict[intf]['ipv4'][ip]['ip'] = m.groups()[0]
-                            interface_dict[intf]['ipv4'][ip]['prefix_length'] = m.groups()[1]
-                            interface_dict[intf]['ipv4']['unnumbered'] = {}
-                            interface_dict[intf]['ipv4']['unnumbered']\
-                                ['interface_ref'] = unnumbered_intf
-
-        return (interface_dict)
+        return interface_dict, unnumbered_dict, members
 
 
-# parser using parsergen
-# ----------------------
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Parser for show ip interface brief"""
     schema = {'interface':
@@ -1455,6 +1640,17 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
 
     cli_command = ['show ip interface brief {interface}','show ip interface brief']
 
+    table = ColumnTable(
+        header=['Interface', 'IP-Address', r'OK\?', 'Method', 'Status',
+                'Protocol'],
+        labels=['interface', 'ip_address', 'interface_is_ok', 'method',
+                'status', 'protocol'],
+        # an interface name longer than its column shifts the row
+        fallback=r'^(?P<interface>\S+) +'
+                 r'(?P<ip_address>\d+\.\d+\.\d+\.\d+|unassigned) +'
+                 r'(?P<interface_is_ok>YES|NO) +(?P<method>\S+) +'
+                 r'(?P<status>.+?) +(?P<protocol>\S+)$')
+
     def cli(self, interface='',output=None):
         """parsing mechanism: cli
 
@@ -1474,32 +1670,12 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
         else:
             out = output
 
-        if out:
-            res = parsergen.oper_fill_tabular(device_output=out,
-                                              device_os='iosxe',
-                                              table_terminal_pattern=r"^\n",
-                                              header_fields=
-                                               [ "Interface",
-                                                 "IP-Address",
-                                                 r"OK\?",
-                                                 "Method",
-                                                 "Status",
-                                                 "Protocol" ],
-                                              label_fields=
-                                               [ "Interface",
-                                                 "ip_address",
-                                                 "interface_is_ok",
-                                                 "method",
-                                                 "status",
-                                                 "protocol" ],
-                                              index=[0])
-
-            # Building the schema out of the parsergen output
-            if res.entries:
-                for intf, intf_dict in res.entries.items():
-                    intf = Common.convert_intf_name(intf)
-                    del intf_dict['Interface']
-                    parsed_dict.setdefault('interface', {}).update({intf: intf_dict})
+        # Interface              IP-Address      OK? Method Status                Protocol
+        # GigabitEthernet0/0/0   10.105.44.23    YES other  up                    up
+        # ucse1/0/0              10.19.14.1      YES other  administratively down down
+        for row in self.table.rows(out):
+            intf = Common.convert_intf_name(row.pop('interface'))
+            parsed_dict.setdefault('interface', {}).update({intf: row})
 
         return (parsed_dict)
 
@@ -2286,7 +2462,184 @@ class ShowIpInterface(ShowIpInterfaceSchema):
     ]
     exclude = ['unnumbered', 'address_determined_by', '(Tunnel.*)', 'joins', 'leaves']
 
-    def cli(self, interface="", include=None, output=None):
+    patterns = Patterns(
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet2 is administratively down, line protocol is down
+        p1=r'^(?P<interface>[\w\/\.\-\:]+) +is'
+          r' +(?P<enabled>[\w\s]+),'
+          r' +line +protocol +is +(?P<oper_status>\w+)$',
+
+        # Internet address is 192.168.76.1/24
+        p2=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
+        p2_0=r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
+             r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$',
+
+        # Secondary address 10.2.2.2/24
+        p2_1=r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+             r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Internet address will be negotiated using DHCP
+        # Internet address will be negotiated using IPCP
+        p2_2=r'^Internet +[A|a]ddress +will +be +negotiated '
+             r'+using +(?P<negotiated>DHCP|IPCP)$',
+
+        # Broadcast address is 255.255.255.255
+        p3=r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$',
+
+        # MTU is 1500 bytes
+        p4=r'^MTU +is +(?P<mtu>\d+) +bytes$',
+
+        # Helper address is not set
+        p5=r'^Helper +address +is +not +set$',
+
+        # Helper address is 10.1.1.1
+        p5_0=r'^Helper +address +is +(?P<address>[\d\.]+)$',
+
+        # Helper addresses are 10.1.1.1
+        p5_1=r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$',
+
+        # 10.2.2.2
+        p5_2=r'^(?P<address>[\d\.]+)$',
+
+        # Directed broadcast forwarding is disabled
+        p6=r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$',
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41=r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$',
+        p41_1=r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)',
+
+        # Outgoing Common access list is not set
+        p7=r'^Outgoing +Common +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Outgoing access list is not set
+        p8=r'^Outgoing +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Inbound Common access list is not set
+        p9=r'^Inbound +Common +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Inbound  access list is not set
+        p10=r'^Inbound +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Proxy ARP is enabled
+        p11=r'^Proxy +ARP +is +'
+           r'(?P<status>\w+)$',
+
+        # Local Proxy ARP is disabled
+        p12=r'^Local +Proxy +ARP +is +'
+           r'(?P<status>\w+)$',
+
+        # Security level is default
+        p13=r'^Security +level +is +'
+           r'(?P<level>\w+)$',
+
+        # Split horizon is enabled
+        p14=r'^Split +horizon +is +'
+           r'(?P<status>\w+)$',
+
+        # ICMP redirects are always sent
+        p15=r'^ICMP +redirects +are +'
+           r'(?P<sent>[\w\s]+)$',
+
+        # ICMP unreachables are always sent
+        p16=r'^ICMP +unreachables +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # ICMP mask replies are never sent
+        p17=r'^ICMP +mask +replies +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # IP fast switching is enabled
+        p18=r'^IP +fast +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP Flow switching is disabled
+        p19=r'^IP +Flow +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching is enabled
+        p20=r'^IP +CEF +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching turbo vector
+        p21=r'^IP +CEF +switching +turbo +vector$',
+
+        # IP Null turbo vector
+        p22=r'^IP +Null +turbo +vector$',
+
+        # VPN Routing/Forwarding "Mgmt-vrf"
+        p23=r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$',
+
+        # Associated unicast routing topologies:
+        #     Topology "base", operation state is UP
+        p24=r'^Associated +unicast +routing +topologies:$',
+        p24_1=r'^Topology +\"(?P<topo>\w+)\", +'
+           r'operation +state +is +(?P<topo_status>\w+)$',
+
+        # IP route-cache flags are Fast, CEF
+        p26=r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$',
+
+        # Router Discovery is disabled
+        p27=r'^Router +Discovery +is +'
+            r'(?P<status>\w+)$',
+
+        # IP output packet accounting is disabled
+        p28=r'^IP +output +packet +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # IP access violation accounting is disabled
+        p29=r'^IP +access +violation +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # TCP/IP header compression is disabled
+        p30=r'^TCP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # RTP/IP header compression is disabled
+        p31=r'^RTP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # Probe proxy name replies are disabled
+        p32=r'^Probe +proxy +name +replies +are +'
+            r'(?P<status>\w+)$',
+
+        # Policy routing is disabled
+        p33=r'^Policy +routing +is +'
+            r'(?P<status>\w+)$',
+
+        # Network address translation is disabled
+        p34=r'^Network +address +translation +is +'
+            r'(?P<status>\w+)$',
+
+        # BGP Policy Mapping is disabled
+        p35=r'^BGP +Policy +Mapping +is +'
+            r'(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect outbound is disable
+        p37=r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect inbound is disabled
+        p38=r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect exclude is disabled
+        p39=r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$',
+
+        # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+        p40=r'^Interface +is +unnumbered. +Using +address +of +'
+            r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
+            r'\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+    )
+
+    # one block per interface, for cli(block_cache=...)
+    blocks = BlockSplitter(patterns, header=('p1',))
+
+    def cli(self, interface="", include=None, output=None, block_cache=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -2298,19 +2651,54 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         else:
             out = output
 
+        if block_cache is not None:
+            results = parse_cached_blocks(self, out, block_cache,
+                                          method='_parse_interfaces')
+        else:
+            results = [self._parse_interfaces(output=out)]
+        interface_dict = merge_parsed(result[0] for result in results)
+        unnumbered_dict = merge_parsed(result[1] for result in results)
+
+        # an unnumbered interface uses the address of an interface listed
+        # before it
+        order = {intf: index for index, intf in enumerate(interface_dict)}
+        for interface, unnumbered in unnumbered_dict.items():
+            unnumbered_intf = unnumbered['unnumbered_intf']
+            unnumbered_ip = unnumbered['unnumbered_ip']
+            if order.get(unnumbered_intf, len(order)) <= order[interface]:
+                if 'ipv4' in interface_dict[unnumbered_intf]:
+                    for address in interface_dict[unnumbered_intf]['ipv4']:
+                        if unnumbered_ip in address:
+                            ip_dict = interface_dict[interface].\
+                                setdefault('ipv4', {}).setdefault(address, {})
+                            m = re.search(r'([\w\.\:]+)\/(\d+)', address)
+                            ip_dict['ip'] = m.groups()[0]
+                            ip_dict['prefix_length'] = m.groups()[1]
+                            ip_dict['secondary'] = False
+                            break
+            else:
+                address = unnumbered_ip
+                if 'ipv4' not in interface_dict[interface]:
+                    interface_dict[interface]['ipv4'] = {}
+                if address not in interface_dict[interface]['ipv4']:
+                    interface_dict[interface]['ipv4'][address] = {}
+                interface_dict[interface]['ipv4'][address]['ip'] = address
+
+        return interface_dict
+
+    def _parse_interfaces(self, output):
+        """the interfaces of the output, and the interfaces their unnumbered
+        interfaces use the address of"""
+        out = output
         read_multicast_reserved_lines = False
         multicast_groups = []
         interface_dict = {}
         unnumbered_dict = {}
+        p = self.patterns
         for line in out.splitlines():
             line = line.strip()
 
-            # Vlan211 is up, line protocol is up
-            # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                            r' +(?P<enabled>[\w\s]+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -2325,10 +2713,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
                 continue
 
-            # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                            r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2347,10 +2732,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
-            p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
-                              r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
-            m = p2_0.match(line)
+            m = p.p2_0.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 address = m.groupdict()['ipv4']
@@ -2366,10 +2748,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                              r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2387,11 +2766,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['ipv4'][address]\
                     ['secondary'] = True
                 continue
-            # Internet address will be negotiated using DHCP
-            # Internet address will be negotiated using IPCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
-                              r'+using +(?P<negotiated>DHCP|IPCP)$')
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 negotiated_holder = m.groupdict()
                 if 'DHCP' in negotiated_holder.get('negotiated'):
@@ -2403,9 +2778,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 ipv4_dict[address]['ip'] = address
                 continue
 
-            # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if 'ipv4' in interface_dict[interface]:
                     if address in interface_dict[interface]['ipv4']:
@@ -2422,31 +2795,23 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     m.groupdict()['file']
                 continue
 
-            # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 interface_dict[interface]['mtu'] = \
                     int(m.groupdict()['mtu'])
                 continue
 
-            # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +not +set$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 continue
 
-            # Helper address is 10.1.1.1
-            p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
-            m = p5_0.match(line)
+            m = p.p5_0.match(line)
             if m:
                 interface_dict[interface]['helper_address'] = \
                     [m.groupdict()['address']]
                 continue
 
-            # Helper addresses are 10.1.1.1
-            p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 helper_flag = True
                 if 'not set' not in m.groupdict()['address']:
@@ -2456,9 +2821,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         helper_list
                 continue
 
-            # 10.2.2.2
-            p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 if helper_flag:
                     helper_list.append(m.groupdict()['address'])
@@ -2466,9 +2829,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             else:
                 helper_flag = False
 
-            # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['directed_broadcast_forwarding'] = False
@@ -2476,9 +2837,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['directed_broadcast_forwarding'] = True
                 continue
 
-            # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
 
@@ -2493,8 +2852,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             #       224.0.0.5  <----- this extra line
             if read_multicast_reserved_lines:
                 if not re.match(r"[^\d. ]", line):
-                    p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
-                    m = p41_1.findall(line)
+                    m = p.p41_1.findall(line)
                     multicast_groups.extend(m)
                     continue
                 else:
@@ -2502,50 +2860,35 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         = sorted(interface_dict[interface]['multicast_groups'])
                     read_multicast_reserved_lines = False
 
-            # Outgoing Common access list is not set
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['outbound_common_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['outbound_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_common_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound  access list is not set
-            p10 = re.compile(r'^Inbound +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['proxy_arp'] = False
@@ -2553,10 +2896,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['proxy_arp'] = True
                 continue
 
-            # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['local_proxy_arp'] = False
@@ -2564,18 +2904,12 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['local_proxy_arp'] = True
                 continue
 
-            # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                            r'(?P<level>\w+)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 interface_dict[interface]['security_level'] = m.groupdict()['level']
                 continue
 
-            # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                            r'(?P<status>\w+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['split_horizon'] = False
@@ -2583,10 +2917,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['split_horizon'] = True
                 continue
 
-            # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                            r'(?P<sent>[\w\s]+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2595,10 +2926,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2607,10 +2935,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2619,10 +2944,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_fast_switching'] = False
@@ -2630,10 +2952,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_fast_switching'] = True
                 continue
 
-            # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_flow_switching'] = False
@@ -2641,10 +2960,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_flow_switching'] = True
                 continue
 
-            # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_cef_switching'] = False
@@ -2652,39 +2968,28 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_cef_switching'] = True
                 continue
 
-            # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
-            # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
-            # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
                 continue
 
-            # Associated unicast routing topologies:
-            #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                            r'operation +state +is +(?P<topo_status>\w+)$')
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
                     if 'topology' not in interface_dict[interface]\
@@ -2721,19 +3026,14 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_multicast_distributed_fast_switching'] = True
                 continue
 
-            # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 ret = m.groupdict()['flags'].split(',')
                 ret = [i.strip() for i in ret]
                 interface_dict[interface]['ip_route_cache_flags'] = sorted(ret)
                 continue
 
-            # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             r'(?P<status>\w+)$')
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['router_discovery'] = False
@@ -2741,10 +3041,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['router_discovery'] = True
                 continue
 
-            # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_output_packet_accounting'] = False
@@ -2752,10 +3049,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_output_packet_accounting'] = True
                 continue
 
-            # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_access_violation_accounting'] = False
@@ -2763,10 +3057,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_access_violation_accounting'] = True
                 continue
 
-            # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['tcp_ip_header_compression'] = False
@@ -2774,10 +3065,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['tcp_ip_header_compression'] = True
                 continue
 
-            # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['rtp_ip_header_compression'] = False
@@ -2785,10 +3073,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['rtp_ip_header_compression'] = True
                 continue
 
-            # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             r'(?P<status>\w+)$')
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['probe_proxy_name_replies'] = False
@@ -2796,10 +3081,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['probe_proxy_name_replies'] = True
                 continue
 
-            # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             r'(?P<status>\w+)$')
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['policy_routing'] = False
@@ -2807,10 +3089,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['policy_routing'] = True
                 continue
 
-            # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             r'(?P<status>\w+)$')
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['network_address_translation'] = False
@@ -2818,10 +3097,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['network_address_translation'] = True
                 continue
 
-            # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             r'(?P<status>\w+)$')
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['bgp_policy_mapping'] = False
@@ -2839,9 +3115,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['input_features'] = sorted(features)
                 continue
 
-            # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2853,9 +3127,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_outbound'] = True
                 continue
 
-            # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2866,9 +3138,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_inbound'] = True
 
-            # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2879,39 +3149,16 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_exclude'] = True
 
-            # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                             r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                             r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
                 unnumbered_ip = m.groupdict()['unnumbered_ip']
                 unnumbered_dict[interface]['unnumbered_intf'] = unnumbered_intf
                 unnumbered_dict[interface]['unnumbered_ip'] = unnumbered_ip
-
-                if unnumbered_intf in interface_dict:
-                    if 'ipv4' in interface_dict[unnumbered_intf]:
-                        for address in interface_dict[unnumbered_intf]['ipv4']:
-                            if unnumbered_ip in address:
-                                ip_dict = interface_dict[interface].\
-                                    setdefault('ipv4', {}).setdefault(address, {})
-                                m = re.search(r'([\w\.\:]+)\/(\d+)', address)
-                                ip_dict['ip'] = m.groups()[0]
-                                ip_dict['prefix_length'] = m.groups()[1]
-                                ip_dict['secondary'] = False
-                                break
-                else:
-                    address = unnumbered_ip
-                    if 'ipv4' not in interface_dict[interface]:
-                        interface_dict[interface]['ipv4'] = {}
-                    if address not in interface_dict[interface]['ipv4']:
-                        interface_dict[interface]['ipv4'][address] = {}
-                    interface_dict[interface]['ipv4'][address]['ip'] = address
                 continue
 
-        return interface_dict
+        return interface_dict, unnumbered_dict
 
 
 class ShowIpv6InterfaceSchema(MetaParser):
@@ -3887,6 +4134,25 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
     cli_command = ['show interfaces status',
                    'show interfaces {interface} status']
 
+    # Port      Name               Status       Vlan       Duplex  Speed Type
+    # Gi1/2     TelenlqPOIU        notconnect   125          full    100 10/100/1000-TX
+    # Gi1/3     SE                 connected    132        a-full a-1000 10/100/1000-TX
+    # Gi1/7                        notconnect   99           auto   auto 10/100/1000-TX
+    # Gi1/10    To cft123          connected    trunk      a-full a-1000 10/100/1000-TX
+    # Gi1/1/0/1 FAST-HELLO         connected    4094       a-full a-1000 10/100/1000BaseTX
+    # Te1/1/2   VSL                connected    trunk        full  a-10G 10GBase-SR
+    # Te2/1/20                     disabled     1            full   auto No XCVR
+    # Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
+    # Po10      VSL LINK2          connected    trunk      a-full  a-10G
+    table = ColumnTable(
+        header=['Port', 'Name', 'Status', 'Vlan', 'Duplex', 'Speed', 'Type'],
+        labels=['interfaces', 'name', 'status', 'vlan', 'duplex_code',
+                'port_speed', 'type'],
+        # rows which do not line up with the header
+        fallback=r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
+                 r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+                 r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -3897,44 +4163,24 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
 
         result_dict = {}
 
-        # Port      Name               Status       Vlan       Duplex  Speed Type
-        # Gi1/2     TelenlqPOIU        notconnect   125          full    100 10/100/1000-TX
-        # Gi1/3     SE                 connected    132        a-full a-1000 10/100/1000-TX
-        # Gi1/7                        notconnect   99           auto   auto 10/100/1000-TX
-        # Gi1/10    To cft123          connected    trunk      a-full a-1000 10/100/1000-TX
-        # Gi1/1/0/1 FAST-HELLO         connected    4094       a-full a-1000 10/100/1000BaseTX
-        # Te1/1/2   VSL                connected    trunk        full  a-10G 10GBase-SR
-        # Te2/1/20                     disabled     1            full   auto No XCVR
-        # Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
-        # Po10      VSL LINK2          connected    trunk      a-full  a-10G
-
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
-                        r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                        r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
-
-        for line in output.splitlines():
-            line = line.strip()
-
-            m = p1.match(line)
-            if m:
-
-                group = m.groupdict()
+        for row in self.table.rows(output):
+            # a line under the table, eg. the prompt
+            if not row['status'] or not row['port_speed']:
+                continue
 
-                intf_dict = result_dict.setdefault('interfaces', {}).\
-                                        setdefault(Common.convert_intf_name(group['interfaces']), {})
+            intf_dict = result_dict.setdefault('interfaces', {}).\
+                                    setdefault(Common.convert_intf_name(row['interfaces']), {})
 
-                name_val = group['name'].strip()
-                if len(name_val)>0 :
-                    intf_dict['name'] = name_val
+            if row['name']:
+                intf_dict['name'] = row['name']
 
-                keys = ['status',
-                        'vlan', 'duplex_code', 'port_speed',
-                        'type']
+            keys = ['status',
+                    'vlan', 'duplex_code', 'port_speed',
+                    'type']
 
-                for k in keys:
-                    if group[k]:
-                        intf_dict[k] = group[k].strip()
-                continue
+            for k in keys:
+                if row[k]:
+                    intf_dict[k] = row[k]
 
         return result_dict
 
@@ -550,7 +550,8 @@ class ShowIpBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
                 'total', 'total_data' , 'value', 'with_data', 'delrcvwnd', 'rcvnxt', 'rcvwnd'
                 'receive_idletime', 'sent_idletime', 'sndnxt', 'snduna', 'uptime']
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
+    def cli(self, neighbor='', address_family='', vrf='', output=None,
+            workers=None, where=None):
 
         # Restricted address families
         restricted_list = ['ipv4 unicast', 'ipv6 unicast', 'link-state link-state','l2vpn evpn']
@@ -596,7 +597,8 @@ class ShowIpBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor, vrf=vrf,
-                           address_family=address_family)
+                           address_family=address_family, workers=workers,
+                           where=where)
 
 
 #-------------------------------------------------------------------------------
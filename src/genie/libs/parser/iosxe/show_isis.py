@@ -40,6 +40,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, ListOf
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.blocks import BlockSplitter, parse_blocks, \
+    merge_parsed
 
 
 class ShowIsisNeighborsDetailSchema(MetaParser):
@@ -998,37 +1001,47 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
     cli_command = "show isis database detail"
     exclude = ["lsp_holdtime", "lsp_checksum", "lsp_sequence_num"]
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial return dictionary
-        result_dict = {}
-        tag = ""
-        prev_lspid = ""
+    patterns = Patterns(
         #  Tag VRF1:
-        p1 = re.compile(r"^Tag +(?P<tag>\w+):$")
+        p1=r"^Tag +(?P<tag>\w+):$",
 
         # IS-IS Level-1 Link State Database:
         # IS-IS Level-1 LSP r1.00-00
-        p2 = re.compile(
-            r"^IS\-IS +Level\-(?P<level>\d+)\s+"
-            r"(Link +State +Database(:)?)?(LSP\s+(?P<host_name>\S+))?$"
-        )
+        p2=r"^IS\-IS +Level\-(?P<level>\d+)\s+"
+           r"(Link +State +Database(:)?)?(LSP\s+(?P<host_name>\S+))?$",
 
         # LSPID                 LSP Seq Num  LSP Checksum  LSP Holdtime/Rcvd      ATT/P/OL
         # R2.00-00            * 0x00000007   0x8A6D                 403/*         1/0/0
-        p3 = re.compile(
-            r"^(?P<lspid>[\w\-\.]+)(\s*(?P<star>\*))?\s+(?P<lsp_seq_num>\w+)\s+"
-            r"(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>[\d\*]+)"
-            r"(/(?P<lsp_rcvd>[\d\*]+))?\s+(?P<att>\d+)/(?P<p>\d+)/(?P<ol>\d+)\s*"
-            r"(\((?P<lsp_index>\d+)\))?$"
-        )
+        p3=r"^(?P<lspid>[\w\-\.]+)(\s*(?P<star>\*))?\s+(?P<lsp_seq_num>\w+)\s+"
+           r"(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>[\d\*]+)"
+           r"(/(?P<lsp_rcvd>[\d\*]+))?\s+(?P<att>\d+)/(?P<p>\d+)/(?P<ol>\d+)\s*"
+           r"(\((?P<lsp_index>\d+)\))?$",
 
         # pireg-ultra3-13.00-00 \
-        p3_1 = re.compile(r"^(?P<lspid>[\w\-\\_\.]+)(\s*\\)" r"(\s*(?P<star>\*))?$")
+        p3_1=r"^(?P<lspid>[\w\-\\_\.]+)(\s*\\)" r"(\s*(?P<star>\*))?$",
+    )
+
+    # one block per LSP, in the context of its tag and level, for
+    # cli(workers=...)
+    blocks = BlockSplitter(patterns, header=("p3", "p3_1"), context=("p1", "p2"))
+
+    def cli(self, output=None, workers=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        if workers:
+            return merge_parsed(parse_blocks(self, out, workers))
+
+        # initial return dictionary
+        result_dict = {}
+        tag = ""
+        prev_lspid = ""
+        p1 = self.patterns.p1
+        p2 = self.patterns.p2
+        p3 = self.patterns.p3
+        p3_1 = self.patterns.p3_1
 
         #   0x0000000E   0x5318                 990/1200      0/0/0
         p3_2 = re.compile(
@@ -1952,11 +1965,11 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseSuperParser, ShowIsisDatabaseSchema
 
     cli_command = "show isis database detail"
 
-    def cli(self, output=None):
+    def cli(self, output=None, workers=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(output=output)
+        return super().cli(output=output, workers=workers)
 
 
 class ShowRunSectionIsisSchema(MetaParser):
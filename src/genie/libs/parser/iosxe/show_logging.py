@@ -22,6 +22,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
 
+# parser utils
+from genie.libs.parser.utils.streaming import iter_lines
+
 
 class ShowLoggingSchema(MetaParser):
     '''Schema for:
@@ -208,8 +211,25 @@ class ShowLogging(ShowLoggingSchema):
         else:
             out = output
 
-        # Init vars
-        log_lines = []
+        ret_dict = {}
+        log_lines = list(self.stream(out, summary=ret_dict))
+        if log_lines:
+            ret_dict['logs'] = log_lines
+
+        return ret_dict
+
+    def stream(self, lines, summary=None):
+        '''Yield the log lines of an output one at a time, in the order of
+        the output. cli() is built from these records.
+
+            Args:
+                lines: output, file object or iterable of lines
+                summary (`dict`): filled with the logging configuration
+                                  part of the output, as in cli()
+
+            Yields:
+                str: a log line
+        '''
 
         # Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
         p1 = re.compile(r'^Syslog +logging: +(?P<enable_disable>\S+) +\(+(?P<messages_dropped>\d+) '
@@ -308,12 +328,12 @@ class ShowLogging(ShowLoggingSchema):
         # Log Buffer (32000 bytes):
         p24 = re.compile(r'^Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
 
-        ret_dict = {}
+        ret_dict = {} if summary is None else summary
         logging_dict = {}
         outer_logging_dict = {}
         outer_logging_sources_dict = {}
         trap_dict = {}
-        for line in out.splitlines():
+        for line in iter_lines(lines):
 
             line = line.strip()
 
@@ -613,9 +633,7 @@ class ShowLogging(ShowLoggingSchema):
                 and not line.lower().startswith('no inactive')
                 and not line.lower().startswith('show logging')
             ):
-                log_lines.append(line)
-                ret_dict['logs'] = log_lines
-        return ret_dict
+                yield line
 
 
 class ShowLoggingOnboardRpActiveUptimeSchema(MetaParser):
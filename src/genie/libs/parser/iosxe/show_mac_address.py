@@ -7,6 +7,7 @@ IOSXE parsers for the following show commands:
 '''
 # Python
 import re
+import functools
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -20,6 +21,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.buffer import finditer_lines
+from genie.libs.parser.utils.columnar import ColumnarTable, columnar_result
+from genie.libs.parser.utils.call_schema import CallSchema
 from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable as ShowMacAddressTable_iosxe
 
 
@@ -43,13 +47,26 @@ class ShowMacAddressTableDynamicSchema(MetaParser):
     }
 
 
-class ShowMacAddressTableDynamic(ShowMacAddressTableDynamicSchema):
+class ShowMacAddressTableDynamic(CallSchema, ShowMacAddressTableDynamicSchema):
     """Parser for show mac address-table dynamic address {mac_address}
                   show mac address-table dynamic vlan {vlan_id}
     """
 
     cli_command = ['show mac address-table dynamic address {mac_address}', 'show mac address-table dynamic vlan {vlan_id}']
-    def cli(self, mac_address=None, vlan_id=None, output=None):
+
+    # columns of format='columnar', in the order of the _add_entry arguments
+    columns = ['vlan_id', 'mac', 'type', 'port']
+
+    @staticmethod
+    def _add_entry(vlan_dict, vlan_id, mac, type, port):
+        ports = vlan_dict.setdefault('ports', {})
+        port_dict = ports.setdefault(len(ports) + 1, {})
+        port_dict['vlan-id'] = vlan_id
+        port_dict['mac-address'] = mac
+        port_dict['type'] = type
+        port_dict['port'] = port
+
+    def cli(self, mac_address=None, vlan_id=None, output=None, format=None):
         if mac_address:
             cmd = self.cli_command[0].format(mac_address=mac_address)
         else:
@@ -60,26 +77,26 @@ class ShowMacAddressTableDynamic(ShowMacAddressTableDynamicSchema):
             out = self.device.execute(cmd)
         else:
             out = output
-        # initial return dictionary
-        vlan_dict = {}
+        # the entries go either to the dict of the schema or to the columns
+        if format == 'columnar':
+            table = ColumnarTable(self.columns, integers=['vlan_id'],
+                                  add_entry=self._add_entry)
+            add_entry = table.append
+        else:
+            # initial return dictionary
+            vlan_dict = {}
+            add_entry = functools.partial(self._add_entry, vlan_dict)
         p1 = re.compile(r'(?P<vlan_id>\d+) +'
                     r'(?P<mac>([a-zA-Z0-9]+\.){2}[a-zA-Z0-9]+) +'
                     r'(?P<type>\w+) +'
                     r'(?P<port>\S+)')
 
-        port_count = 1
-        for line in out.splitlines():
-            line = line.strip()
-            m1 = p1.match(line)
-            if m1:
-                group = m1.groupdict()
-                ports = vlan_dict.setdefault('ports', {})
-                port_dict = ports.setdefault(port_count, {})
-                port_dict['vlan-id'] = int(group['vlan_id'])
-                port_dict['mac-address'] = group['mac']
-                port_dict['type'] = group['type']
-                port_dict['port'] = group['port']
-                port_count+=1
+        for m1 in finditer_lines(p1, out):
+            vlan, mac, type, port = m1.group('vlan_id', 'mac', 'type', 'port')
+            add_entry(int(vlan), mac, type, port)
+
+        if format == 'columnar':
+            return columnar_result(self, table)
         return(vlan_dict)
 # =============================================
 # Schema for 'show mac address-table count summary'
@@ -21,6 +21,10 @@ from netaddr import IPAddress, IPNetwork, INET_ATON
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.blocks import BlockSplitter, parse_blocks, \
+    merge_parsed
 
 # ===========================
 # Schema for:
@@ -246,245 +250,228 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         * 'show ip ospf database opaque-area self-originate''
     '''
 
-    def cli(self, db_type, out=None):
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+               r' +\(Process +ID +(?P<instance>(\d+))'
+               r'(?:, +VRF +(?P<vrf>(\S+)))?\)$',
+        p2=r'^(?P<lsa_type_name>(.*)) +Link +States'
+               r'(?: +\(Area +(?P<area>(\S+))\))?$',
+        p3_1=r'^Routing +Bit +Set +on +this +LSA$',
+        p3_2=r'^LS +age: +(?P<age>(\d+))$',
+        p3_2_1=r'^LS +age: +\w+\((?P<age>(\d+))\)$',
+        p4=r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+           r'(?: *\((?P<option_desc>(.*))\))?$',
+        p5_1=r'^LS +Type: +(?P<lsa_type>(.*))$',
+        p5_2=r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+               r'(?: +\(.*\))?$',
+        p6=r'^Advertising +Router: +(?P<adv_router>(\S+))$',
+        p7=r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$',
+        p8=r'^Checksum: +(?P<checksum>(\S+))$',
+        p9=r'^Length *: +(?P<length>(\d+))$',
+        p10=r'^Network +Mask: +\/(?P<net_mask>(\S+))$',
+        p11_1=r'^Metric +Type: +2 +\(.*\)$',
+        p11_2=r'^Metric +Type: +1 +\(.*\)$',
+        p12=r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+               r' +(?P<metric>(\d+)))?$',
+        p13=r'^Metric: +(?P<metric>(\d+))$',
+        p14=r'^Forward +Address: +(?P<addr>(\S+))$',
+        p15=r'^External +Route +Tag: +(?P<tag>(\d+))$',
+        p16=r'^Attached +Router: +(?P<att_router>(\S+))$',
+        p17=r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$',
+        p18=r'^Link +connected +to: +a +(?P<type>(.*))$',
+        p18_1=r'^Link\s+connected +to\s*: +(?P<type>(.*))$',
+        p19_1=r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+               r' +(?P<link_id>(\S+))$',
+        p19_2=r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+               r' +(a|A)ddress: +(?P<link_id>(\S+))$',
+        p19_3=r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+               r' +(I|d)D: +(?P<link_id>(\S+))$',
+        p20_1=r'^\(Link +Data\) +Network +Mask:'
+               r' +(?P<link_data>(\S+))$',
+        p20_2=r'^\(Link +Data\) +Router +Interface +address:'
+               r' +(?P<link_data>(\S+))$',
 
-        assert db_type in ['external', 'network', 'summary', 'router',
-                           'opaque']
-
-        # Init vars
-        ret_dict = {}
-        address_family = 'ipv4'
-        default_mt_id = 0
-        capabilities_flag = False
-        tlv_type_flag = False
-        sub_tlv_type_flag = False
-        sub_tlv_temp = []
-
-        # Router
-        # Network Link
-        # Summary Network
-        # Opaque Area
-        # Type-5 AS External
-        lsa_type_mapping = {
-            'router': 1,
-            'network': 2,
-            'summary': 3,
-            'external': 5,
-            'opaque': 10,
-            }
-
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            r' +\(Process +ID +(?P<instance>(\d+))'
-                            r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-       
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            r'(?: +\(Area +(?P<area>(\S+))\))?$')
-       
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
-       
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
-       
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
-       
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        r'(?: *\((?P<option_desc>(.*))\))?$')
-       
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-       
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            r'(?: +\(.*\))?$')
-       
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-       
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-       
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-       
-        p9 = re.compile(r'^Length *: +(?P<length>(\d+))$')
-       
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-       
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-       
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
-       
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            r' +(?P<metric>(\d+)))?$')
-       
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-       
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-       
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
-       
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-       
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
-       
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-       
-        p18_1 = re.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
-       
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            r' +(?P<link_id>(\S+))$')
-       
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            r' +(a|A)ddress: +(?P<link_id>(\S+))$')
-       
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            r' +(I|d)D: +(?P<link_id>(\S+))$')
-       
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            r' +(?P<link_data>(\S+))$')
-       
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            r' +(?P<link_data>(\S+))$')
-       
         # MTID 32 Metrics: 1
         # MTID   : 0
-        p21 = re.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
-       
-        p21_1 = re.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
-       
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
-       
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-       
-        p24 = re.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
-       
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-       
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
-       
-        p26_2 = re.compile(r'^Area +Border +Router$')
-       
-        p27 = re.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
-       
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
-       
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-       
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-       
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            r' +(?P<max_band>(\d+))$')
-       
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            r'(?: +global)? *: +(?P<max_res_band>(\d+))$')
-       
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-       
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
-       
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
-       
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            r' *: +(?P<band2>(\d+)))?$')
-       
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            r' +Length += +(?P<length>(\d+))'
-                            r' +Value += +(?P<value>(.*))$')
-       
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            r' +(?P<eag_length>(\d+))$')
-       
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+        p21=r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?',
+        p21_1=r'^Number +of +MTID +metrics: +(?P<num>(\d+))$',
+        p22=r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$',
+        p23=r'^Opaque +ID: +(?P<id>(\d+))$',
+        p24=r'^Fragment +number *: +(?P<num>(\d+))$',
+        p25=r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$',
+        p26_1=r'^AS +Boundary +Router$',
+        p26_2=r'^Area +Border +Router$',
+        p27=r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$',
+        p28=r'^Link +ID *: +(?P<id>(\S+))$',
+        p29=r'^Interface +Address *: +(?P<addr>(\S+))$',
+        p30=r'^Admin +Metric *: +(?P<te_metric>(\d+))$',
+        p31=r'^Maximum +(B|b)andwidth *:'
+               r' +(?P<max_band>(\d+))$',
+        p32=r'^Maximum +(R|r)eservable +(B|b)andwidth'
+               r'(?: +global)? *: +(?P<max_res_band>(\d+))$',
+        p33=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
+        p33_1=r'^IGP +Metric *: +(?P<igp_metric>(\d+))$',
+        p33_2=r'^Number +of +Priority *: +(?P<num>(\d+))$',
+        p34=r'^Priority +(?P<num1>(\d+)) *:'
+               r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+               r' *: +(?P<band2>(\d+)))?$',
+        p35=r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+               r' +Length += +(?P<length>(\d+))'
+               r' +Value += +(?P<value>(.*))$',
+        p36=r'^Extended +Administrative +Group *: +Length *:'
+               r' +(?P<eag_length>(\d+))$',
+        p37=r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$',
 
         # Neighbor Address : 192.168.220.2
-        p38 = re.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+        p38=r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)',
 
         # TLV Type: Router Information
         # TLV Type: Segment Routing Algorithm
-        p39 = re.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+        p39=r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)',
 
         # Router Information
-        p39_1 = re.compile(r'(R|r)outer\s+(I|i)nformation')
+        p39_1=r'(R|r)outer\s+(I|i)nformation',
 
         # Segment Routing Algorithm
-        p39_2 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+        p39_2=r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm',
 
         # Segment Routing Range
-        p39_3 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+        p39_3=r'(S|s)egment\s+(R|r)outing\s+(R|r)ange',
 
         # Segment Routing Node MSD
-        p39_4 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+        p39_4=r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD',
 
         # Segment Routing Local Block
-        p39_5 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+        p39_5=r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock',
 
         # Extended Prefix
-        p39_6 = re.compile(r'(E|e)xtended\s+(P|p)refix')
+        p39_6=r'(E|e)xtended\s+(P|p)refix',
 
         # Extended Link
-        p39_7 = re.compile(r'(E|e)xtended\s+(L|l)ink')
+        p39_7=r'(E|e)xtended\s+(L|l)ink',
 
         # Algorithm: SPF
         # Algorithm: Strict SPF
-        p40 = re.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+        p40=r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)',
 
         # Range Size: 1000
-        p41 = re.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+        p41=r'Range\s+Size\s*:\s*(?P<range_size>\d+)',
 
         # Flags  : L-Bit, V-bit
-        p42 = re.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
+        p42=r'Flags\s*\:\s*(?P<flags>.+)',
 
         # Weight : 0
-        p44 = re.compile(r'Weight\s*:\s*(?P<weight>\d+)')
+        p44=r'Weight\s*:\s*(?P<weight>\d+)',
 
         # Label  : 19
-        p45 = re.compile(r'Label\s*:\s*(?P<label>\d+)')       
-        
+        p45=r'Label\s*:\s*(?P<label>\d+)',
+
         # (Link Data) Interface IP address: 192.168.220.1
-        p46 = re.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+        p46=r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)',
 
         # Prefix    : 10.4.1.1/32
-        p47 = re.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
+        p47=r'Prefix\s*:\s*(?P<prefix>\S+)',
 
         # AF        : 0
-        p48 = re.compile(r'AF\s*:\s*(?P<af>\S+)')
+        p48=r'AF\s*:\s*(?P<af>\S+)',
 
         # Route-type: Intra
-        p49 = re.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
+        p49=r'Route\-type\s*:\s*(?P<route_type>.+)',
 
         # Sub-TLV Type: Remote Intf Addr
         # Sub-TLV Type: Local / Remote Intf ID
-        p50 = re.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+        p50=r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)',
 
         # Remote Interface Address   : 192.168.0.1
-        p51 = re.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+        p51=r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)',
 
         # Local Interface ID   : 20
-        p52 = re.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+        p52=r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)',
 
         # Remote Interface ID   : 20
-        p53 = re.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+        p53=r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)',
 
         # SID   : 1
-        p54 = re.compile(r'SID\s*:\s*(?P<sid>\S+)')
+        p54=r'SID\s*:\s*(?P<sid>\S+)',
 
-        # Graceful Restart Helper                
-        p55 = re.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+        # Graceful Restart Helper
+        p55=r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper',
 
         # Stub Router Support
-        p56 = re.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+        p56=r'(S|s)tub\s+(R|r)outer\s+(S|s)upport',
 
         # SPF
-        p57 = re.compile(r'SPF')
+        p57=r'SPF',
 
         # Strict SPF
-        p58 = re.compile(r'Strict\s+SPF')
+        p58=r'Strict\s+SPF',
 
         # Sub-type: Node Max Sid Depth, Value: 13
-        p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+        p59=r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)',
+
+        # Number of TOS metrics: 0
+        p21_2=r'^Number +of +TOS +metrics: +(?P<num>(\d+))$',
+    )
+
+    # the chain of cli, in order
+    dispatcher = LineDispatcher(patterns, (
+        'p1', 'p2', 'p3_1', 'p3_2', 'p3_2_1', 'p4', 'p5_1', 'p5_2',
+        'p6', 'p7', 'p8', 'p9', 'p10', 'p11_1', 'p11_2', 'p12', 'p13',
+        'p14', 'p15', 'p16', 'p17', 'p18', 'p18_1', 'p19_1', 'p19_2',
+        'p19_3', 'p20_1', 'p20_2', 'p21', 'p21_1', 'p21_2', 'p22',
+        'p23', 'p24', 'p25', 'p26_1', 'p26_2', 'p27', 'p28', 'p29',
+        'p30', 'p31', 'p32', 'p33', 'p33_1', 'p33_2', 'p34', 'p35',
+        'p36', 'p37', 'p38', 'p39', 'p40', 'p41', 'p42', 'p44', 'p45',
+        'p46', 'p47', 'p48', 'p49', 'p50', 'p51', 'p52', 'p53', 'p54',
+        'p59',
+    ))
+
+    # one block per LSA, in the context of its process and area, for
+    # cli(workers=...)
+    blocks = BlockSplitter(patterns, header=('p3_1', 'p3_2', 'p3_2_1'),
+                           context=('p1', 'p2'))
+
+    def cli(self, db_type, out=None, workers=None):
+
+        assert db_type in ['external', 'network', 'summary', 'router',
+                           'opaque']
+
+        if workers:
+            return merge_parsed(parse_blocks(self, out, workers))
+
+        # Init vars
+        ret_dict = {}
+        address_family = 'ipv4'
+        default_mt_id = 0
+        capabilities_flag = False
+        tlv_type_flag = False
+        sub_tlv_type_flag = False
+        sub_tlv_temp = []
+
+        # Router
+        # Network Link
+        # Summary Network
+        # Opaque Area
+        # Type-5 AS External
+        lsa_type_mapping = {
+            'router': 1,
+            'network': 2,
+            'summary': 3,
+            'external': 5,
+            'opaque': 10,
+            }
+
+        p = self.patterns
+        dispatch = self.dispatcher
 
         for line in out.splitlines():
             line = line.strip()
 
+            name, m = dispatch.match(line)
+
             # OSPF Router with ID (10.36.3.3) (Process ID 1)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
                 if m.groupdict()['vrf']:
@@ -512,8 +499,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Summary Net Link States (Area 0.0.0.0)
             # Type-5 AS External Link States
             # Type-10 Opaque Link Area Link States (Area 0)
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 lsa_type = lsa_type_mapping[db_type]
                 
                 # Set area
@@ -560,22 +546,19 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Routing Bit Set on this LSA
-            m = p3_1.match(line)
-            if m:
+            if name == 'p3_1':
                 routing_bit_enable = True
                 continue
 
             # LS age: 1565
-            m = p3_2.match(line)
-            if m:
+            if name == 'p3_2':
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
                 age = int(m.groupdict()['age'])
                 continue
 
             # LS age: MAXAGE(3601)
-            m = p3_2_1.match(line)
-            if m:
+            if name == 'p3_2_1':
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
                 age = int(m.groupdict()['age'])
@@ -583,15 +566,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Options: 0x20 (No TOS-capability, DC)
             # Options: (No TOS-capability, DC)
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 option = str(m.groupdict()['option'])
                 option_desc = str(m.groupdict()['option_desc'])
                 continue
 
             # LS Type: Type-5 AS-External
-            m = p5_1.match(line)
-            if m:
+            if name == 'p5_1':
                 lsa_type = lsa_type_mapping[db_type]
                 continue
 
@@ -599,14 +580,12 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Link State ID: 10.94.44.44 (Network address)
             # Link State ID: 10.1.2.1 (Designated Router address)
             # Link State ID: 10.1.2.1 (address of Designated Router)
-            m = p5_2.match(line)
-            if m:
+            if name == 'p5_2':
                 lsa_id = str(m.groupdict()['lsa_id'])
                 continue
 
             # Advertising Router: 10.64.4.4
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 adv_router = str(m.groupdict()['adv_router'])
                 lsa = '{} {}'.format(lsa_id, adv_router)
                 
@@ -698,21 +677,18 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     pass
 
             # LS Seq Number: 0x80000002
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
                 continue
 
             # Checksum: 0x7d61
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 header_dict['checksum'] = str(m.groupdict()['checksum'])
                 continue
 
             # Length: 36
             # Length : 36
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 length = int(m.groupdict()['length'])
                 if sub_tlv_type_flag:
                     sub_tlv_types_dict['length'] = length
@@ -723,30 +699,26 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Network Mask: /32
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
                 db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
                 continue
 
             # Metric Type: 2 (Larger than any link state path)
             # Metric Type: 2 (Larger than any link state path)
-            m = p11_1.match(line)
-            if m:
+            if name == 'p11_1':
                 db_topo_dict['flags'] = "E"
                 db_topo_dict['metric_type'] = 2
                 continue
 
             # Metric Type: 1 (Comparable directly to link state metric)
-            m = p11_2.match(line)
-            if m:
+            if name == 'p11_2':
                 db_topo_dict['metric_type'] = 1
                 continue
 
             # TOS: 0
             # TOS: 0 Metric: 1
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 if db_type == 'router':
                     if m.groupdict()['tos']:
                         db_dict['links'][link_id]['topologies'][default_mt_id]\
@@ -762,26 +734,22 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                         continue
 
             # Metric: 20
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Forward Address: 0.0.0.0
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
                 continue
 
             # External Route Tag: 0
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
                 continue
 
             # Attached Router: 10.84.66.66
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 attached_router = str(m.groupdict()['att_router'])
                 if 'attached_routers' not in db_dict:
                     db_dict['attached_routers'] = {}
@@ -791,20 +759,17 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Number of links: 3
             # Number of Links: 3
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 db_dict['num_of_links'] = int(m.groupdict()['num'])
                 continue
 
             # Link connected to: a Stub Network
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # Link connected to: another Router (point-to-point)
-            m = p18_1.match(line)
-            if m:
+            if name == 'p18_1':
                 if tlv_type_flag:                    
                     sub_link_type = str(m.groupdict()['type']).lower()
                     if 'another router' in sub_link_type:
@@ -817,8 +782,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Network/subnet number: 10.4.1.1
-            m = p19_1.match(line)
-            if m:
+            if name == 'p19_1':
                 link_id = str(m.groupdict()['link_id'])
 
                 # Create dict structures
@@ -843,8 +807,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
-            if m:
+            if name == 'p19_2':
                 link_id = str(m.groupdict()['link_id'])
 
                 # If 'TLV Type' found in output this flag is set to true
@@ -874,8 +837,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Neighboring Router ID: 10.151.22.22
-            m = p19_3.match(line)
-            if m:
+            if name == 'p19_3':
                 link_id = str(m.groupdict()['link_id'])
 
                 if tlv_type_flag:
@@ -904,23 +866,20 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
-            if m:
+            if name == 'p20_1':
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
-            if m:
+            if name == 'p20_2':
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # MTID 32 Metrics: 1
             # MTID   : 0
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 mtid = int(m.groupdict()['mtid'])
 
                 if sub_tlv_type_flag:
@@ -944,59 +903,48 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Number of MTID metrics: 0
-            m = p21_1.match(line)
-            if m:
+            if name == 'p21_1':
                 db_dict['links'][link_id]['num_mtid_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
                 
-            # Number of TOS metrics: 0
-            p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-            m = p21_2.match(line)
-            if m:
+            if name == 'p21_2':
                 db_dict['links'][link_id]['num_tos_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
 
             # Opaque Type: 1
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 opaque_type = int(m.groupdict()['type'])
                 continue
             
             # Opaque ID: 38
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 opaque_id = int(m.groupdict()['id'])
                 continue
 
             # Fragment number: 0
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 header_dict['fragment_number'] = int(m.groupdict()['num'])
                 continue
 
             # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 db_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
                 continue
 
             # AS Boundary Router
-            m = p26_1.match(line)
-            if m:
+            if name == 'p26_1':
                 header_dict['as_boundary_router'] = True
                 continue
 
             # Area Border Router
-            m = p26_2.match(line)
-            if m:
+            if name == 'p26_2':
                 header_dict['area_border_router'] = True
                 continue
 
             # Link connected to Broadcast network
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 link_tlv_counter += 1
                 if 'link_tlvs' not in db_dict:
                     db_dict['link_tlvs'] = {}
@@ -1025,15 +973,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Link ID : 10.1.4.4
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
                     str(m.groupdict()['id'])
                 continue
 
             # Interface Address : 10.1.4.1
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 addr = str(m.groupdict()['addr'])
                 if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
                         [link_tlv_counter]:
@@ -1046,53 +992,46 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Admin Metric : 1
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
                     int(m.groupdict()['te_metric'])
                 continue
 
             # Maximum Bandwidth : 125000000
             # Maximum bandwidth : 125000000
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
                     int(m.groupdict()['max_band'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
             # Maximum reservable bandwidth global: 93750000
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 db_dict['link_tlvs'][link_tlv_counter]\
                     ['max_reservable_bandwidth'] = \
                     int(m.groupdict()['max_res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
                     str(m.groupdict()['admin_group'])
                 continue
 
             # IGP Metric : 1
-            m = p33_1.match(line)
-            if m:
+            if name == 'p33_1':
                 db_dict['link_tlvs'][link_tlv_counter]['igp_metric'] = \
                     int(m.groupdict()['igp_metric'])
                 continue
 
             # Number of Priority : 8
-            m = p33_2.match(line)
-            if m:
+            if name == 'p33_2':
                 db_dict['link_tlvs'][link_tlv_counter]['total_priority'] = \
                     int(m.groupdict()['num'])
                 continue
             
             # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
                 if 'unreserved_bandwidths' not in db_dict['link_tlvs']\
@@ -1122,8 +1061,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 unknown_tlvs_counter += 1
                 if 'unknown_tlvs' not in db_dict['link_tlvs'][link_tlv_counter]:
                     db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs'] = {}
@@ -1140,8 +1078,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Extended Administrative Group : Length: 8
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 if 'extended_admin_group' not in db_dict['link_tlvs']\
                         [link_tlv_counter]:
                     db_dict['link_tlvs'][link_tlv_counter]\
@@ -1151,8 +1088,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # EAG[0]: 0
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group_num = int(m.groupdict()['group_num'])
                 if 'groups' not in db_dict['link_tlvs'][link_tlv_counter]\
                         ['extended_admin_group']:
@@ -1167,16 +1103,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Neighbor Address : 192.168.220.2
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 db_dict['link_tlvs'][link_tlv_counter]['remote_if_ipv4_addrs'] = {m.groupdict()['neighbor_address']: {}}
                 
                 continue
 
             # TLV Type: Extended Link
             # TLV Type: Segment Routing Node MSD
-            m = p39.match(line)
-            if m:
+            if name == 'p39':
                 tlv_type_flag = True
                 sub_tlv_type_flag = False
 
@@ -1184,31 +1118,31 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 tlv_type = group['tlv_type']
                 
                 # Router Information
-                if p39_1.match(tlv_type):
+                if p.p39_1.match(tlv_type):
                     tlv_type_field = 'router_capabilities_tlv'
 
                 # Segment Routing Algorithm
-                elif p39_2.match(tlv_type):
+                elif p.p39_2.match(tlv_type):
                     tlv_type_field = 'sr_algorithm_tlv'
 
                 # Segment Routing Range
-                elif p39_3.match(tlv_type):
+                elif p.p39_3.match(tlv_type):
                     tlv_type_field = 'sid_range_tlvs'
 
                 # Segment Routing Node MSD
-                elif p39_4.match(tlv_type):
+                elif p.p39_4.match(tlv_type):
                     tlv_type_field = 'node_msd_tlvs'
 
                 # Segment Routing Local Block
-                elif p39_5.match(tlv_type):
+                elif p.p39_5.match(tlv_type):
                     tlv_type_field = 'local_block_tlvs'
 
                 # Extended Prefix
-                elif p39_6.match(tlv_type):
+                elif p.p39_6.match(tlv_type):
                     tlv_type_field = 'extended_prefix_tlvs'
 
                 # Extended Link
-                elif p39_7.match(tlv_type):
+                elif p.p39_7.match(tlv_type):
                     tlv_type_field = 'extended_link_tlvs'
                 
                 tlv_types_index = db_dict.get(tlv_type_field, {}).keys()
@@ -1238,11 +1172,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 capability_field = None
 
                 # Graceful Restart Helper
-                if p55.match(line):
+                if p.p55.match(line):
                     capability_field = 'graceful_restart_helper'
 
                 # Stub Router Support
-                elif p56.match(line):
+                elif p.p56.match(line):
                     capability_field = 'stub_router'
 
                 if not capability_field:
@@ -1257,8 +1191,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Algorithm: SPF
             # Algorithm: Strict SPF
-            m = p40.match(line)
-            if m:
+            if name == 'p40':
                 group = m.groupdict()
                 algorithm = group['algorithm']
                 algorithm = algorithm.strip()
@@ -1270,11 +1203,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 algo_field = None
 
                 # SPF
-                if p57.match(algorithm):
+                if p.p57.match(algorithm):
                     algo_field = 'spf'
 
                 # Strict SPF
-                if p58.match(algorithm):
+                if p.p58.match(algorithm):
                     algo_field = 'strict_spf'
 
                 if not algo_field:
@@ -1286,8 +1219,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Range Size: 1000
-            m = p41.match(line)
-            if m:
+            if name == 'p41':
                 group = m.groupdict()
                 range_size = group['range_size']
                 tlv_type_dict['range_size'] = int(range_size)
@@ -1295,8 +1227,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Flags  : L-Bit, V-bit
-            m = p42.match(line)
-            if m:
+            if name == 'p42':
                 group = m.groupdict()
                 flags = group['flags']
 
@@ -1309,8 +1240,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Weight : 0
-            m = p44.match(line)
-            if m:                
+            if name == 'p44':
                 group = m.groupdict()
                 weight = int(group['weight'])
 
@@ -1323,8 +1253,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Label  : 19
-            m = p45.match(line)
-            if m:
+            if name == 'p45':
                 group = m.groupdict()
                 label = group['label']
 
@@ -1333,16 +1262,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Interface IP address: 192.168.220.1
-            m = p46.match(line)
-            if m:
+            if name == 'p46':
                 group = m.groupdict()
                 tlv_type_dict['link_data'] = group['link_data']
 
                 continue
 
             # Prefix    : 10.4.1.1/32
-            m = p47.match(line)
-            if m:
+            if name == 'p47':
                 group = m.groupdict()
                 prefix = group['prefix']
 
@@ -1351,8 +1278,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # AF        : 0
-            m = p48.match(line)
-            if m:
+            if name == 'p48':
                 group = m.groupdict()
                 af = int(group['af'])
 
@@ -1361,8 +1287,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Route-type: Intra
-            m = p49.match(line)
-            if m:
+            if name == 'p49':
                 group = m.groupdict()
                 route_type = group['route_type']            
 
@@ -1372,8 +1297,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Sub-TLV Type: Remote Intf Addr
             # Sub-TLV Type: Local / Remote Intf ID
-            m = p50.match(line)
-            if m:
+            if name == 'p50':
                 tlv_type_flag = False
                 sub_tlv_type_flag = True
                 group = m.groupdict()
@@ -1394,16 +1318,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Remote Interface Address   : 192.168.0.1
-            m = p51.match(line)
-            if m:
+            if name == 'p51':
                 group = m.groupdict()
                 remote_interface_address = group['remote_interface_address']
                 sub_tlv_types_dict['remote_interface_address'] = remote_interface_address
                 continue
 
             # Local Interface ID   : 20
-            m = p52.match(line)
-            if m:
+            if name == 'p52':
                 group = m.groupdict()
                 local_interface_id = int(group['local_interface_id'])
                 try:
@@ -1414,8 +1336,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue            
 
             # Remote Interface ID   : 20
-            m = p53.match(line)
-            if m:
+            if name == 'p53':
                 group = m.groupdict()
                 remote_interface_id = int(group['remote_interface_id'])
                 try:
@@ -1426,8 +1347,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # SID   : 1
-            m = p54.match(line)                        
-            if m:
+            if name == 'p54':
                 group = m.groupdict()
                 sid = int(group['sid'])
 
@@ -1435,8 +1355,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Sub-type: Node Max Sid Depth, Value: 13
-            m = p59.match(line)
-            if m:
+            if name == 'p59':
                 group = m.groupdict()
                 sub_type_value = int(group['value'])
 
@@ -1543,11 +1462,11 @@ class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabas
     exclude = ['age', 'seq_num', 'checksum', 'links']
 
 
-    def cli(self, output=None):
+    def cli(self, output=None, workers=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='router', out=output)
+        return super().cli(db_type='router', out=output, workers=workers)
 
 
 # ====================================
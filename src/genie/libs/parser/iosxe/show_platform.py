@@ -50,6 +50,7 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 from genie.parsergen import oper_fill_tabular
 # genie.parsergen
 try:
@@ -358,46 +359,28 @@ class ShowVersion(ShowVersionSchema):
     cli_command = 'show version'
     exclude = ['system_restarted_at', 'uptime_this_cp', 'uptime']
 
-    def cli(self, output=None):
-        """parsing mechanism: cli
-
-        Function cli() defines the cli type output parsing mechanism which
-        typically contains 3 steps: exe
-        cuting, transforming, returning
-        """
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        version_dict = {}
-        active_dict = {}
-        rtr_type = ''
-        suite_flag = False
-        license_flag = False
-
+    patterns = Patterns(
         # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-        p0 = re.compile(
-            r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$')
+        p0=r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$',
 
         # version
         # Cisco IOS Software [Everest], ISR Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.5, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
-                        r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
-                        r'+(?P<version>\S+) +.*$')
+        p1=r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
+           r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
+           r'+(?P<version>\S+) +.*$',
 
         # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
         # IOS (tm) C2600 Software (C2600-I-M), Version 12.2(2)XA1, EARLY DEPLOYMENT RELEASE SOFTWARE (fc1)
-        # IOS (tm) 3000 Bootstrap Software (IGS-BOOT-R), Version 11.0(10c)XB1, PLATFORM SPECIFIC RELEASE SOFTWARE (fc1) 
+        # IOS (tm) 3000 Bootstrap Software (IGS-BOOT-R), Version 11.0(10c)XB1, PLATFORM SPECIFIC RELEASE SOFTWARE (fc1)
         # IOS (tm) 2500 Software (C2500-J-L), Version 11.2(5)P, SHARED PLATFORM, RELEASE SOFTWARE (fc1)
-        p1_1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                          r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                          r' +(?P<version>\S+), +(EARLY DEPLOYMENT |PLATFORM SPECIFIC |SHARED PLATFORM, )?RELEASE SOFTWARE .*$')
+        p1_1=r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+             r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+             r' +(?P<version>\S+), +(EARLY DEPLOYMENT |PLATFORM SPECIFIC |SHARED PLATFORM, )?RELEASE SOFTWARE .*$',
 
         # 16.6.5
-        p2 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p2=r'^(?P<ver_short>\d+\.\d+).*',
 
         # Cisco IOS Software [Fuji], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.7.1prd4, RELEASE SOFTWARE (fc1)
         # Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Experimental Version 16.8.20170924:182909 [polaris_dev-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20170924_191550 132]
@@ -405,82 +388,82 @@ class ShowVersion(ShowVersionSchema):
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
         # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
         # Cisco IOS Software [IOSXE], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 17.15.20240326:010319 [BLD_POLARIS_DEV_LATEST_20240326_003112:/nobackup/mcpre/s2c-build-ws 101]
-        p3 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[\w.:()]+) *,? *'
-                        r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$')
+        p3=r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
+           r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+           r'+Experimental)? +[Vv]ersion '
+           r'+(?P<version>[\w.:()]+) *,? *'
+           r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$',
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p4 = re.compile(r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$')
+        p4=r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$',
 
         # Technical Support: http://www.cisco.com/techsupport
-        p5 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p5=r'^Technical +Support: +http\:\/\/www'
+           r'\.cisco\.com\/techsupport',
 
         # rom
         # ROM: IOS-XE ROMMONBOOTLDR: System Bootstrap, Version 17.6.1r[FC2], DEVELOPMENT SOFTWARE
-        p6 = re.compile(r'^ROM\:( +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$)?')
+        p6=r'^ROM\:( +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$)?',
 
         # ROM: Bootstrap program is IOSv
-        p7 = re.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
+        p7=r'^Bootstrap +program +is +(?P<os>.+)$',
 
         # bootldr
-        p8 = re.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
+        p8=r'^BOOTLDR\: +(?P<bootldr>.+)$',
 
         # hostname & uptime
-        p9 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p9=r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$',
 
         # uptime_this_cp
-        p10 = re.compile(r'^[Uu]ptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p10=r'^[Uu]ptime +for +this +control +processor '
+            r'+is +(?P<uptime_this_cp>.+)$',
 
         # system_restarted_at
-        p11 = re.compile(r'^[Ss]ystem +restarted +at '
-                         r'+(?P<system_restarted_at>.+)$')
+        p11=r'^[Ss]ystem +restarted +at '
+            r'+(?P<system_restarted_at>.+)$',
 
         # system_image
         # System image file is "tftp://10.1.6.241//auto/genie-ftp/Edison/cat3k_caa-universalk9.BLD__20170410_174845.SSA.bin"
         # System image file is "harddisk:test-image-PE1-13113029"
-        p12 = re.compile(r'^[Ss]ystem +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p12=r'^[Ss]ystem +image +file +is '
+            r'+\"(?P<system_image>.+)\"',
 
         # last_reload_reason
-        p13 = re.compile(r'^[Ll]ast +reload +reason\: '
-                         r'+(?P<last_reload_reason>.+)$')
+        p13=r'^[Ll]ast +reload +reason\: '
+            r'+(?P<last_reload_reason>.+)$',
 
         # last_reload_reason
         # Last reset from power-on
-        p14 = re.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
+        p14=r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$',
 
         # license_type
-        p15 = re.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
+        p15=r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$',
 
         # license_level
-        p16 = re.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
+        p16=r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$',
 
         # entservices   Type: Permanent
-        p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$')
+        p16_1=r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$',
 
         # AIR License Level: AIR DNA Advantage
-        p16_2 = re.compile(r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$')
+        p16_2=r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$',
 
         ## Technology Package License Information:
         ## Technology-package                                     Technology-package
         # Current                        Type                       Next reboot
-        p16_3 = re.compile(r'^Current  +Type  +Next reboot')
+        p16_3=r'^Current  +Type  +Next reboot',
 
         # network-advantage     Smart License                    network-advantage
         # dna-advantage         Subscription Smart License       dna-advantage
-        p16_4 = re.compile(r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$')
+        p16_4=r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$',
 
         # next_reload_license_level
-        p17 = re.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
-                         r'+(?P<next_reload_license_level>.+)$')
+        p17=r'^[Nn]ext +(reload|reboot) +license +Level\: '
+            r'+(?P<next_reload_license_level>.+)$',
 
         # Next reload AIR license Level: AIR DNA Advantage
-        p17_1 = re.compile(r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
-                           r'+(?P<next_reload_air_license_level>.+)$')
+        p17_1=r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
+              r'+(?P<next_reload_air_license_level>.+)$',
 
         # chassis, processor_type, main_mem and rtr_type
         # cisco WS-C3650-24PD (MIPS) processor (revision H0) with 829481K/6147K bytes of memory.
@@ -491,204 +474,224 @@ class ShowVersion(ShowVersionSchema):
         # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
         # cisco WS-C4507R+E (MPC8572) processor (revision 10) with 2097152K/20480K bytes of memory.
         # Cisco CISCO1941/K9 (revision 1.0) with 491520K/32768K bytes of memory.
-        p18 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+            r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+            r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-        p18_2 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
-                           r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_2=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
+              r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # Allen-Bradley 1783-CMS10DP (ARM) processor (revision V00) with 634958K/6147K bytes of memory.
-        p18_3 = re.compile(r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_3=r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+            r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+            r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # chassis_sn
-        p19 = re.compile(r'^[pP]rocessor +board +ID '
-                         r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
+        p19=r'^[pP]rocessor +board +ID '
+            r'+(?P<chassis_sn>[a-zA-Z0-9]+)',
 
         # number_of_intfs
-        p20 = re.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
-                         r'+(interface(?:s)?|line|port(?:s)?)$')
+        p20=r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
+            r'+(interface(?:s)?|line|port(?:s)?)$',
 
         # mem_size
-        p21 = re.compile(r'^(?P<mem_size>\d+)K +bytes +of '
-                         r'+(?P<memories>.+) +[Mm]emory\.')
+        p21=r'^(?P<mem_size>\d+)K +bytes +of '
+            r'+(?P<memories>.+) +[Mm]emory\.',
 
         # disks, disk_size and type_of_disk
-        p22 = re.compile(r'^(?P<disk_size>\d+)K bytes of '
-                         r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
+        p22=r'^(?P<disk_size>\d+)K bytes of '
+            r'(?P<type_of_disk>.*) at (?P<disks>.+)$',
 
         # os
         # Cisco IOS Software,
-        p23 = re.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
-                         r'+[Ss]oftware\,')
+        p23=r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
+            r'+[Ss]oftware\,',
 
         # curr_config_register
-        p24 = re.compile(r'^[Cc]onfiguration +register +is '
-                         r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
+        p24=r'^[Cc]onfiguration +register +is '
+            r'+(?P<curr_config_register>[a-zA-Z0-9]+)',
 
         # next_config_register
-        p25 = re.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
-                         r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
-                         r'at next reload\)')
+        p25=r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
+            r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
+            r'at next reload\)',
 
         # switch_number
-        p26 = re.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
+        p26=r'^[Ss]witch +0(?P<switch_number>\d+)$',
 
         # uptime
-        p27 = re.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
+        p27=r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$',
 
         # mac_address
-        p28 = re.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
-                         r'+\: +(?P<mac_address>.+)$')
+        p28=r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
+            r'+\: +(?P<mac_address>.+)$',
 
         # mb_assembly_num
-        p29 = re.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
-                         r'+(?P<mb_assembly_num>.+)$')
+        p29=r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
+            r'+(?P<mb_assembly_num>.+)$',
 
         # mb_sn
-        p30 = re.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
-                         r'+(?P<mb_sn>.+)$')
+        p30=r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
+            r'+(?P<mb_sn>.+)$',
 
         # model_rev_num
-        p31 = re.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<model_rev_num>.+)$')
+        p31=r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<model_rev_num>.+)$',
 
         # mb_rev_num
-        p32 = re.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<mb_rev_num>.+)$')
+        p32=r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<mb_rev_num>.+)$',
 
         # model_num
-        p33 = re.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
+        p33=r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$',
 
         # system_sn
-        p34 = re.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
+        p34=r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$',
 
         # Compiled Mon 10-Apr-17 04:35 by mcpre
         # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-        p36 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\w+)$')
+        p36=r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+            r'+(?P<compiled_by>\w+)$',
 
         # System returned to ROM by reload at 15:57:52 CDT Mon Sep 24 2018
         # System returned to ROM by Reload Command at 07:15:43 UTC Fri Feb 1 2019
         # System returned to ROM by reload
         # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
         # System returned to ROM by power-on
-        p37 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
-                         r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
-                         r'+(?P<sp_by>[\S\s\-]+)\))?$')
+        p37=r'^System +returned +to +ROM +by '
+            r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
+            r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
+            r'+(?P<sp_by>[\S\s\-]+)\))?$',
 
         # Last reload type: Normal Reload
-        p38 = re.compile(
-            r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$')
+        p38=r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$',
 
         # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
-        p39 = re.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
-                         r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
-                         r'+(?P<supervisor>\S+)))$')
+        p39=r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
+            r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
+            r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
+            r'+(?P<supervisor>\S+)))$',
 
         # 98304K bytes of processor board System flash (Read/Write)
-        p40 = re.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
+        p40=r'^(?P<processor_board_flash>\S+) +bytes .+$',
 
         # Running default software
-        p41 = re.compile(r'^Running +(?P<running_default_software>\S+) +software$')
+        p41=r'^Running +(?P<running_default_software>\S+) +software$',
 
         # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-        p42 = re.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
-                         r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
+        p42=r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
+            r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$',
 
         # ipbase           ipbasek9         Smart License    ipbasek9
         # securityk9       securityk9       RightToUse       securityk9
-        p43 = re.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
-                         r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
-                         r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
+        p43=r'^(?P<technology>\w[\w\-]+)(?: {2,}'
+            r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
+            r'+\w+)?) {2,}(?P<next_boot>\w+))?$',
 
         # Suite                 Suite Current         Type           Suite Next reboot
         # Technology    Technology-package           Technology-package
-        p44 = re.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
-                         r'(Technology\-package))')
+        p44=r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
+            r'(Technology\-package))',
 
         # Suite License Information for Module:'esg'
-        p45 = re.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
-                         r'+[Mm]odule\:\'(?P<module>\S+)\'$')
+        p45=r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
+            r'+[Mm]odule\:\'(?P<module>\S+)\'$',
 
         # License UDI:
-        p46_0 = re.compile(r'^License UDI:$')
+        p46_0=r'^License UDI:$',
 
         #     *0        C3900-SPE150/K9       FOC16050QP6
-        p46 = re.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
+        p46=r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$',
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p47 = re.compile(r'^Image text-base: +(?P<text_base>\S+), '
-                         r'data-base: +(?P<data_base>\S+)$')
+        p47=r'^Image text-base: +(?P<text_base>\S+), '
+            r'data-base: +(?P<data_base>\S+)$',
 
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
         # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p48 = re.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
-                         r'/IEEE 802\.3 +interface\(s\)$')
+        p48=r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
+            r'/IEEE 802\.3 +interface\(s\)$',
 
         # Dagobah Revision 95, Swamp Revision 6
-        p50 = re.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
-                         r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
+        p50=r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
+            r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$',
 
         # power_supply_part_nr
         # Power supply part number: 444-8888-00
-        p51 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
+        p51=r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$',
 
         # power_supply_sn
         # Power supply serial number: CCC4466B6LL
-        p52 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
+        p52=r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$',
 
         # Daughterboard assembly number   : 73-11111-00
         # db_assembly_num
-        p53 = re.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
+        p53=r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$',
 
         # Daughterboard serial number     : FOC87654CWW
         # db_sn
-        p54 = re.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
+        p54=r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$',
 
         # top_assembly_part_num
         # Top Assembly Part Number        : 800-55555-11
-        p55 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
+        p55=r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$',
 
         # top_assembly_rev_num
         # Top Assembly Revision Number    : C0
-        p56 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
+        p56=r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$',
 
         # version_id
         # Version ID                      : V02
-        p57 = re.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
+        p57=r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$',
 
         # clei_code_num
         # CLEI Code Number                : AAALJ00ERT
-        p58 = re.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
+        p58=r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$',
 
         # Daughterboard revision number   : A0
         # db_rev_num
-        p59 = re.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
+        p59=r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$',
 
         # Hardware Board Revision Number  : 0x12
         # hb_rev_num
-        p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
+        p60=r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$',
 
         # Router operating mode: Controller-Managed
-        p61 = re.compile(r'^Router operating mode: (?P<router_operating_mode>.+)$')
+        p61=r'^Router operating mode: (?P<router_operating_mode>.+)$',
 
         # Installation mode is BUNDLE
-        p62 = re.compile(r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$')
+        p62=r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$',
 
         #System FPGA version                : 0.2.11
-        p63 = re.compile(r'^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)')
+        p63=r'^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)',
+    )
+
+    def cli(self, output=None):
+        """parsing mechanism: cli
+
+        Function cli() defines the cli type output parsing mechanism which
+        typically contains 3 steps: exe
+        cuting, transforming, returning
+        """
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        version_dict = {}
+        active_dict = {}
+        rtr_type = ''
+        suite_flag = False
+        license_flag = False
+
+        patterns = self.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-            m = p0.match(line)
+            m = patterns.p0.match(line)
             if m:
                 if 'version' not in version_dict:
                     version_dict['version'] = {}
@@ -704,11 +707,11 @@ class ShowVersion(ShowVersionSchema):
             # IOS (tm) C2600 Software (C2600-I-M), Version 12.2(2)XA1, EARLY DEPLOYMENT RELEASE SOFTWARE (fc1)
             # IOS (tm) 3000 Bootstrap Software (IGS-BOOT-R), Version 11.0(10c)XB1, PLATFORM SPECIFIC RELEASE SOFTWARE (fc1) 
             # IOS (tm) 2500 Software (C2500-J-L), Version 11.2(5)P, SHARED PLATFORM, RELEASE SOFTWARE (fc1)
-            m = p1.match(line) or p1_1.match(line)
+            m = patterns.p1.match(line) or patterns.p1_1.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
-                m2 = p2.match(version)
+                m2 = patterns.p2.match(version)
                 if m2:
                     if 'version' not in version_dict:
                         version_dict['version'] = {}
@@ -728,12 +731,12 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOS Software, 901 Software (ASR901-UNIVERSALK9-M), Version 15.6(2)SP4, RELEASE SOFTWARE (fc3)
             # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
             # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
 
-                m2 = p2.match(version)
+                m2 = patterns.p2.match(version)
 
                 if m2:
                     if 'version' not in version_dict:
@@ -759,20 +762,20 @@ class ShowVersion(ShowVersionSchema):
                     continue
 
             # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'developer image')
                 version_dict.setdefault('version', {}).setdefault('copyright_years', m.groupdict()['copyright_years'])
                 continue
 
             # Technical Support: http://www.cisco.com/techsupport
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'production image')
                 continue
 
             # rom
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 rom = m.groupdict()['rom']
                 version_dict['version']['rom'] = rom
@@ -782,7 +785,7 @@ class ShowVersion(ShowVersionSchema):
 
                 # ROM: Bootstrap program is IOSv
                 if rom != None:
-                    m = p7.match(rom)
+                    m = patterns.p7.match(rom)
                     if m:
                         if 'os' not in version_dict['version']:
                             version_dict['version']['os'] = \
@@ -790,14 +793,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # bootldr
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 version_dict['version']['bootldr'] = \
                     m.groupdict()['bootldr']
                 continue
 
             # hostname & uptime
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 version_dict['version']['hostname'] = \
                     m.groupdict()['hostname']
@@ -806,7 +809,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime_this_cp
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 version_dict['version']['uptime_this_cp'] = \
                     m.groupdict()['uptime_this_cp']
@@ -814,7 +817,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_restarted_at
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 version_dict['version']['system_restarted_at'] = \
                     m.groupdict()['system_restarted_at']
@@ -823,14 +826,14 @@ class ShowVersion(ShowVersionSchema):
             # system_image
             # System image file is "tftp://10.1.6.241//auto/tftp-ssr/Edison/cat3k_caa-universalk9.BLD_V164_THROTTLE_LATEST_20170410_174845.SSA.bin"
             # System image file is "harddisk:test-image-PE1-13113029"
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 version_dict['version']['system_image'] = \
                     m.groupdict()['system_image']
                 continue
 
             # last_reload_reason
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
@@ -838,14 +841,14 @@ class ShowVersion(ShowVersionSchema):
 
             # last_reload_reason
             # Last reset from power-on
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
                 continue
 
             # license_type
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 version_dict['version']['license_type'] = \
                     m.groupdict()['license_type']
@@ -854,12 +857,12 @@ class ShowVersion(ShowVersionSchema):
             # license_level
             # License Level: entservices   Type: Permanent
             # License Level: AdvancedMetroIPAccess
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:
                 group = m.groupdict()
                 if 'Type:' in group['license_level']:
                     lic_type = group['license_level'].strip()
-                    m_1 = p16_1.match(lic_type)
+                    m_1 = patterns.p16_1.match(lic_type)
                     if m_1:
                         lic_group = m_1.groupdict()
                         version_dict['version']['license_type'] = lic_group['license_type']
@@ -869,20 +872,20 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # AIR License Level: AIR DNA Advantage
-            m = p16_2.match(line)
+            m = patterns.p16_2.match(line)
             if m:
                 version_dict['version']['air_license_level'] = m.groupdict()['air_license_level']
                 continue
 
             # Current                        Type                       Next reboot
-            m = p16_3.match(line)
+            m = patterns.p16_3.match(line)
             if m:
                 version_dict['version'].setdefault('license_package', {})
                 continue
 
             # network-advantage     Smart License                    network-advantage
             # dna-advantage         Subscription Smart License       dna-advantage
-            m = p16_4.match(line)
+            m = patterns.p16_4.match(line)
             if m:
                 group = m.groupdict()
                 license_package = group['license_package']
@@ -897,14 +900,14 @@ class ShowVersion(ShowVersionSchema):
             # next_reload_license_level
             # Next reboot license Level: entservices
             # Next reload license Level: advipservices
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m:
                 version_dict['version']['next_reload_license_level'] = \
                     m.groupdict()['next_reload_license_level']
                 continue
 
             # Next reload AIR license Level: AIR DNA Advantage
-            m = p17_1.match(line)
+            m = patterns.p17_1.match(line)
             if m:
                 version_dict['version']['next_reload_air_license_level'] = \
                     m.groupdict()['next_reload_air_license_level']
@@ -916,12 +919,12 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOSv (revision 1.0) with  with 435457K/87040K bytes of memory.
             # cisco WS-C3750X-24P (PowerPC405) processor (revision W0) with 262144K bytes of memory.
             # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
-            m = p18.match(line)
+            m = patterns.p18.match(line)
 
             # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-            m2 = p18_2.match(line)
+            m2 = patterns.p18_2.match(line)
 
-            m3 = p18_3.match(line)
+            m3 = patterns.p18_3.match(line)
 
             if m or m2 or m3:
                 if m:
@@ -949,19 +952,19 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Router operating mode: Controller-Managed
-            m = p61.match(line)
+            m = patterns.p61.match(line)
             if m:
                 version_dict['version']['router_operating_mode'] = m.groupdict()['router_operating_mode']
                 continue
 
             # Installation mode is BUNDLE
-            m = p62.match(line)
+            m = patterns.p62.match(line)
             if m:
                 version_dict['version']['installation_mode'] = m.groupdict()['installation_mode']
                 continue
 
             # chassis_sn
-            m = p19.match(line)
+            m = patterns.p19.match(line)
             if m:
                 version_dict['version']['chassis_sn'] \
                     = m.groupdict()['chassis_sn']
@@ -974,7 +977,7 @@ class ShowVersion(ShowVersionSchema):
             # 2 Ten Gigabit Ethernet interfaces
             # 1 terminal line
             # 8 Channelized T1 ports
-            m = p20.match(line)
+            m = patterns.p20.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 if 'number_of_intfs' not in version_dict['version']:
@@ -984,7 +987,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mem_size
-            m = p21.match(line)
+            m = patterns.p21.match(line)
             if m:
                 memories = m.groupdict()['memories']
                 if 'mem_size' not in version_dict['version']:
@@ -994,7 +997,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # disks, disk_size and type_of_disk
-            m = p22.match(line)
+            m = patterns.p22.match(line)
             if m:
                 disks = m.groupdict()['disks']
                 if 'disks' not in version_dict['version']:
@@ -1008,27 +1011,27 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # os
-            m = p23.match(line)
+            m = patterns.p23.match(line)
             if m:
                 version_dict['version']['os'] = m.groupdict()['os']
 
                 continue
 
             # curr_config_register
-            m = p24.match(line)
+            m = patterns.p24.match(line)
             if m:
                 version_dict['version']['curr_config_register'] \
                     = m.groupdict()['curr_config_register']
 
             # next_config_register
-            m = p25.match(line)
+            m = patterns.p25.match(line)
             if m:
                 version_dict['version']['next_config_register'] \
                     = m.groupdict()['next_config_register']
                 continue
 
             # switch_number
-            m = p26.match(line)
+            m = patterns.p26.match(line)
             if m:
                 switch_number = m.groupdict()['switch_number']
 
@@ -1040,7 +1043,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime
-            m = p27.match(line)
+            m = patterns.p27.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     continue
@@ -1048,7 +1051,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mac_address
-            m = p28.match(line)
+            m = patterns.p28.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mac_address', m.groupdict()['mac_address'])
@@ -1057,7 +1060,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_assembly_num
-            m = p29.match(line)
+            m = patterns.p29.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_assembly_num', m.groupdict()['mb_assembly_num'])
@@ -1066,7 +1069,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_sn
-            m = p30.match(line)
+            m = patterns.p30.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_sn', m.groupdict()['mb_sn'])
@@ -1075,7 +1078,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_rev_num
-            m = p31.match(line)
+            m = patterns.p31.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_rev_num', m.groupdict()['model_rev_num'])
@@ -1084,7 +1087,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_rev_num
-            m = p32.match(line)
+            m = patterns.p32.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_rev_num', m.groupdict()['mb_rev_num'])
@@ -1093,7 +1096,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_num
-            m = p33.match(line)
+            m = patterns.p33.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_num', m.groupdict()['model_num'])
@@ -1102,7 +1105,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_sn
-            m = p34.match(line)
+            m = patterns.p34.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('system_sn', m.groupdict()['system_sn'])
@@ -1111,7 +1114,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_part_nr
-            m = p51.match(line)
+            m = patterns.p51.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_part_nr', m.groupdict()['power_supply_part_nr'])
@@ -1120,7 +1123,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_sn
-            m = p52.match(line)
+            m = patterns.p52.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_sn', m.groupdict()['power_supply_sn'])
@@ -1129,7 +1132,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_assembly_num
-            m = p53.match(line)
+            m = patterns.p53.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_assembly_num', m.groupdict()['db_assembly_num'])
@@ -1138,7 +1141,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_sn
-            m = p54.match(line)
+            m = patterns.p54.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_sn', m.groupdict()['db_sn'])
@@ -1147,7 +1150,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_part_num
-            m = p55.match(line)
+            m = patterns.p55.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_part_num', m.groupdict()['top_assembly_part_num'])
@@ -1156,7 +1159,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_rev_num
-            m = p56.match(line)
+            m = patterns.p56.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_rev_num', m.groupdict()['top_assembly_rev_num'])
@@ -1165,7 +1168,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # version_id
-            m = p57.match(line)
+            m = patterns.p57.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('version_id', m.groupdict()['version_id'])
@@ -1174,7 +1177,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # clei_code_num
-            m = p58.match(line)
+            m = patterns.p58.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('clei_code_num', m.groupdict()['clei_code_num'])
@@ -1183,7 +1186,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_rev_num
-            m = p59.match(line)
+            m = patterns.p59.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_rev_num', m.groupdict()['db_rev_num'])
@@ -1192,7 +1195,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # hb_rev_num
-            m = p60.match(line)
+            m = patterns.p60.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('hb_rev_num', m.groupdict()['hb_rev_num'])
@@ -1202,7 +1205,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Compiled Mon 10-Apr-17 04:35 by mcpre
             # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-            m36 = p36.match(line)
+            m36 = patterns.p36.match(line)
             if m36:
                 group = m36.groupdict()
                 version_dict['version']['compiled_date'] = group['compiled_date']
@@ -1215,7 +1218,7 @@ class ShowVersion(ShowVersionSchema):
             # System returned to ROM by reload
             # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
             # System returned to ROM by power-on
-            m37 = p37.match(line)
+            m37 = patterns.p37.match(line)
             if m37:
                 group = m37.groupdict()
 
@@ -1231,7 +1234,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Last reload type: Normal Reload
-            m38 = p38.match(line)
+            m38 = patterns.p38.match(line)
             if m38:
                 version_dict['version']['last_reload_type'] = m38.groupdict()['last_reload_type']
 
@@ -1239,7 +1242,7 @@ class ShowVersion(ShowVersionSchema):
 
             # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
             # MPC8572 CPU at 1.5GHz, Supervisor 7
-            m39 = p39.match(line)
+            m39 = patterns.p39.match(line)
             if m39:
                 group = m39.groupdict()
                 cpu_dict = version_dict['version'].setdefault('processor', {})
@@ -1256,7 +1259,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # 98304K bytes of processor board System flash (Read/Write)
-            m40 = p40.match(line)
+            m40 = patterns.p40.match(line)
             if m40:
                 flash_dict = version_dict['version']
                 in_kb = m40.groupdict()['processor_board_flash']
@@ -1265,14 +1268,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Running default software
-            m41 = p41.match(line)
+            m41 = patterns.p41.match(line)
             if m41:
                 version_dict['version']['running_default_software'] = True
 
                 continue
 
             # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-            m42 = p42.match(line)
+            m42 = patterns.p42.match(line)
             if m42:
                 version_dict['version']['jawa_revision'] = m42.groupdict()['jawa_revision']
                 version_dict['version']['snowtrooper_revision'] = m42.groupdict()['snowtrooper_rev']
@@ -1281,7 +1284,7 @@ class ShowVersion(ShowVersionSchema):
 
             # ipbase           ipbasek9         Smart License    ipbasek9
             # securityk9       securityk9       RightToUse       securityk9
-            m43 = p43.match(line)
+            m43 = patterns.p43.match(line)
             if m43:
                 group = m43.groupdict()
 
@@ -1314,7 +1317,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Suite                 Suite Current         Type           Suite Next reboot
             # Technology    Technology-package           Technology-package
-            m44 = p44.match(line)
+            m44 = patterns.p44.match(line)
             if m44:
                 if 'Suite' in m44.groupdict()['aname']:
                     suite_flag = True
@@ -1326,7 +1329,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Suite License Information for Module:'esg'
-            m45 = p45.match(line)
+            m45 = patterns.p45.match(line)
             if m45:
                 module_dict = version_dict['version'].setdefault('module', {})
                 suite_dict = module_dict.setdefault(m45.groupdict()['module'], {})
@@ -1334,14 +1337,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # License UDI:
-            m46_0 = p46_0.match(line)
+            m46_0 = patterns.p46_0.match(line)
             if m46_0:
                 if 'license_udi' not in version_dict:
                     license_udi_dict = version_dict['version'].setdefault('license_udi', {})
                 continue
 
             # *0        C3900-SPE150/K9       FOC16050QP6
-            m46 = p46.match(line)
+            m46 = patterns.p46.match(line)
             if m46:
                 group = m46.groupdict()
                 license_udi_sub = license_udi_dict.setdefault('device_num', {}).\
@@ -1351,7 +1354,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Image text-base: 0x40101040, data-base: 0x42D98000
-            m = p47.match(line)
+            m = patterns.p47.match(line)
             if m:
                 version_dict['version']['image'] = {}
                 version_dict['version']['image']['text_base'] = m.groupdict()['text_base']
@@ -1360,7 +1363,7 @@ class ShowVersion(ShowVersionSchema):
 
             # 1 Virtual Ethernet/IEEE 802.3 interface(s)
             # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-            m = p48.match(line)
+            m = patterns.p48.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_type = '_'.join(group['ethernet_type'].lower().split())
@@ -1372,7 +1375,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Dagobah Revision 95, Swamp Revision 6
-            m = p50.match(line)
+            m = patterns.p50.match(line)
             if m:
                 groupdict = m.groupdict()
                 version_dict['version']['revision'] = {}
@@ -1380,7 +1383,7 @@ class ShowVersion(ShowVersionSchema):
                 version_dict['version']['revision'][groupdict['group2']] = int(groupdict['group2_int'])
                 continue
 
-            m = p63.match(line)
+            m = patterns.p63.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('system_fpga_version', m.groupdict()['system_fpga_version'])
@@ -7,6 +7,27 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.scanner import LineScanner
+from genie.libs.parser.utils.incremental import consume_lines
+from genie.libs.parser.utils.predicate import Predicate
+from genie.libs.parser.utils.pushdown import DeviceFilter, execute_filtered
+from genie.libs.parser.utils.records import IndexMap, record_type, \
+    records_result
+from genie.libs.parser.utils.call_schema import CallSchema
+
+
+# compact records of the routes of ShowIpRoute with format='records', the
+# other keys of the schema are kept in a dict of the record
+IpRouteEntry = record_type('IpRouteEntry', [
+    'route', 'active', 'route_preference', 'metric', 'source_protocol',
+    'source_protocol_codes', 'next_hop'],
+    interned=['source_protocol_codes'])
+IpRouteNextHop = record_type('IpRouteNextHop', [
+    'outgoing_interface', 'next_hop_list'])
+IpRouteNextHopEntry = record_type('IpRouteNextHopEntry', [
+    'index', 'next_hop', 'outgoing_interface', 'updated', 'vrf'],
+    interned=['next_hop', 'outgoing_interface', 'updated', 'vrf'])
 
 
 # ====================================================
@@ -26,7 +47,8 @@ class ShowIpRouteDistributor(MetaParser):
 
     exclude = ['updated']
 
-    def cli(self, vrf=None, route=None, protocol=None, output=None, timeout=60):
+    def cli(self, vrf=None, route=None, protocol=None, output=None, timeout=60,
+            format=None, where=None):
 
         if output is None:
             if vrf and protocol:
@@ -45,15 +67,33 @@ class ShowIpRouteDistributor(MetaParser):
         else:
             out = output
 
-        if (route or protocol) in self.protocol_set or (not route and not protocol):
-            parser = ShowIpRoute(self.device)
+        parser = self._route_parser(route=route, protocol=protocol)
+        if format is None and where is None:
             self.schema = parser.schema
             return parser.parse(output=out)
-
+        # the parser drops the schema of the call for the formats it does not
+        # validate, the output is validated with the schema of the call
+        kwargs = {}
+        if format is not None:
+            kwargs['format'] = format
+        if where is not None:
+            kwargs['where'] = where
+        parsed = parser.cli(output=out, **kwargs)
+        self.schema = parser.schema
+        return parsed
+
+    def consume(self, vrf=None, route=None, protocol=None):
+        """parse the lines of the output as they are sent, with the parser
+        cli() picks"""
+        parser = self._route_parser(route=route, protocol=protocol)
+        self.schema = parser.schema
+        return parser.consume()
+
+    def _route_parser(self, route=None, protocol=None):
+        if (route or protocol) in self.protocol_set or (not route and not protocol):
+            return ShowIpRoute(self.device)
         else:
-            parser = ShowIpRouteWord(self.device)
-            self.schema=parser.schema
-            return parser.parse(output=out)
+            return ShowIpRouteWord(self.device)
 
 # ====================================================
 #  distributor class for show ipv6 route
@@ -74,7 +114,8 @@ class ShowIpv6RouteDistributor(MetaParser):
 
     exclude = ['updated']
 
-    def cli(self, vrf=None, route=None, protocol=None, interface=None, output=None):
+    def cli(self, vrf=None, route=None, protocol=None, interface=None, output=None,
+            format=None, where=None):
 
         if output is None:
 
@@ -103,13 +144,23 @@ class ShowIpv6RouteDistributor(MetaParser):
 
         if (route or protocol) in self.protocol_set or (not route and not protocol):
             parser = ShowIpv6Route(self.device)
-            self.schema = parser.schema
-            return parser.parse(vrf=vrf, protocol=protocol, output=out)
-
+            kwargs = {'protocol': protocol}
         else:
             parser = ShowIpv6RouteWord(self.device)
-            self.schema=parser.schema
-            return parser.parse(vrf=vrf, route=route, output=out)
+            kwargs = {'route': route}
+
+        if format is None and where is None:
+            self.schema = parser.schema
+            return parser.parse(vrf=vrf, output=out, **kwargs)
+        # the parser drops the schema of the call for the formats it does not
+        # validate, the output is validated with the schema of the call
+        if format is not None:
+            kwargs['format'] = format
+        if where is not None:
+            kwargs['where'] = where
+        parsed = parser.cli(vrf=vrf, output=out, **kwargs)
+        self.schema = parser.schema
+        return parsed
 
 # ====================================================
 #  schema for show ip route
@@ -180,7 +231,7 @@ class ShowIpRouteSchema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(CallSchema, ShowIpRouteSchema):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -190,7 +241,128 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
-    def cli(self, vrf=None, protocol=None, output=None):
+    patterns = Patterns(
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2=r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+           r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$',
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+        # D        192.168.205.1
+        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+        # L        FF00::/8 [0/0]
+        # S   %    10.34.0.1 [1/0] via 192.168.16.1
+        # C   p    10.34.0.2 is directly connected, Loopback0
+        # S   &    10.69.0.0 [1/0] via 10.34.0.1
+        # S   +    10.186.1.0 [1/0] via 10.144.0.1 (red)
+        # B   +    10.55.0.0 [20/0] via 10.144.0.1 (red), 00:00:09
+        # B   +    10.55.0.0 [20/0] via 10.144.0.1 (vrf-blue), 00:00:09
+        # i*L1  0.0.0.0/0 [115/100] via 10.12.7.37, 3w6d, Vlan101
+        # ND  ::/0 [2/0]
+        # NDp 2001:103::/64 [2/0]
+        p3=r'^(?P<code>[A-Za-z]{0,2}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]|[a-z]{2}|[A-Z]{2}|[+%&p])?\s*(?P<network>[0-9\.\:\/]+)?( '
+           r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?( *('
+           r'via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
+        # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
+        p9=r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$',
+
+        # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
+        # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20
+        # B        1.1.1.10 [200/0] via FC01:101:8:E007:: (default:ipv6), 1d15h
+        p7=r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[0-9a-fA-F\:]+) +\((?P<nh_vrf>[\w\:]+)+\)+, +(?P<date>[dh\d\:]+)+(, +(?P<interface>[\w]+))?$',
+
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4=r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+           r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$',
+
+        #       is directly connected, GigabitEthernet0/2
+        p5=r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+           r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+           r'( +(?P<interface>[\S]+))?$',
+
+        #      via 2001:DB8:1:1::2
+        #      via 10.4.1.1%default, indirectly connected
+        #      via 2001:DB8:4:6::6
+        #      via 2001:DB8:20:4:6::6%VRF2
+        #      via Null0, receive
+        #      via 33.33.33.33%default, Vlan100%default
+        p6=r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]{4,}),?)?'
+           r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+),?)?,?( +receive)?'
+           r'( +directly connected)?( +indirectly connected)?$',
+
+        # B        192.168.1.20/32
+        p8=r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$',
+
+        # Routing entry for 10.151.0.0/24, 1 known subnets
+        # Routing entry for 0.0.0.0/0, supernet
+        # Routing entry for 192.168.154.0/24
+        p100=r'^Routing +entry +for +'
+             r'(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+             r'(, +(?P<net>[\w\s]+))?$',
+
+        # Known via "eigrp 1", distance 130, metric 10880, type internal
+        # Known via "rip", distance 120, metric 2
+        p200=r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+             r'distance +(?P<distance>\d+), +'
+             r'metric +(?P<metric>\d+)'
+             r'(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$',
+
+        # Redistributing via rip
+        # Redistributing via eigrp 1
+        p300=r'^Redistributing +via +(?P<redist_via>\w+) *'
+             r'(?P<redist_via_tag>\d+)?$',
+
+        # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+        # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
+        p400=r'^Last +update +from +(?P<from>[\w\.]+) +'
+             r'on +(?P<interface>[\w\.\/\-]+), +'
+             r'(?P<age>[\w\.\:]+) +ago$',
+
+        # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+        # * 10.69.1.2
+        p500=r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+             r'from +(?P<from>[\w\.]+), +'
+             r'(?P<age>[\w\.\:]+) +ago, +'
+             r'via +(?P<interface>[\w\.\/\-]+))?$',
+
+        # Route metric is 10880, traffic share count is 1
+        p600=r'^Route +metric +is +(?P<metric>\d+), +'
+             r'traffic +share +count +is +(?P<share_count>\d+)$',
+
+        # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+        p700=r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+             r'+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$',
+
+        # Reliability 255/255, minimum MTU 1500 bytes
+        p800=r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$',
+
+        # Loading 1/255, Hops 1
+        p900=r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$',
+    )
+
+    # the chain of cli, in order, matched in a single pass
+    scanner = LineScanner(patterns)
+
+    # keys of cli(where=...)
+    where_keys = {'vrf': None}
+
+    # filter of the device keeping the routing tables of cli(where=...) from
+    # the first one on
+    device_filter = DeviceFilter(patterns, blocks={'vrf': 'Routing Table: {}'},
+                                 block_filter='begin')
+
+    def cli(self, vrf=None, protocol=None, output=None, format=None,
+            where=None):
 
         if output is None:
             if vrf and protocol:
@@ -201,15 +373,38 @@ class ShowIpRoute(ShowIpRouteSchema):
                 cmd = self.parser_command[3].format(protocol=protocol)
             else:
                 cmd = self.parser_command[2]
-            out = self.device.execute(cmd)
+            # the routes before the first routing table are in the vrf of
+            # the command, the device sends them unless they are skipped
+            pipe = None
+            if where is not None and self.device_filter is not None:
+                predicate = Predicate(where, self.where_keys)
+                if not predicate.match({'vrf': vrf or 'default'}):
+                    pipe = self.device_filter.select(predicate)
+            out = execute_filtered(self.device, cmd, pipe)
         else:
             out = output
 
+        parsed = consume_lines(self.consume(vrf=vrf, format=format,
+                                            where=where),
+                               out.splitlines())
+        if format == 'records':
+            return records_result(self, parsed)
+        return parsed
+
+    def consume(self, vrf=None, protocol=None, format=None, where=None):
+        """parse the lines of the output as they are sent, the structure of
+        cli() is returned once None is sent"""
         af = self.IP_VER
         route = ""
         if not vrf:
             vrf = 'default'
 
+        # the routes of the vrfs not kept are skipped up to the next routing
+        # table
+        predicate = None if where is None else \
+            Predicate(where, self.where_keys)
+        skip = predicate is not None and not predicate.match({'vrf': vrf})
+
         source_protocol_dict = {}
         source_protocol_dict['ospf'] = ['O','OI','OE1','OE2','ON1','ON2','IA','N1','N2','E1','E2', '+', '%', 'p', '&']
         source_protocol_dict['odr'] = ['o']
@@ -233,32 +428,12 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         result_dict = {}
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        r'(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        r'(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        r'distance +(?P<distance>\d+), +'
-                        r'metric +(?P<metric>\d+)'
-                        r'(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        r'(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        r'on +(?P<interface>[\w\.\/\-]+), +'
-                        r'(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        r'from +(?P<from>[\w\.]+), +'
-                        r'(?P<age>[\w\.\:]+) +ago, +'
-                        r'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        r'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          r'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          r'+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        # the routes and their next hops are records with format='records'
+        if format == 'records':
+            route_type, next_hop_type, hops_type, path_type = \
+                IpRouteEntry, IpRouteNextHop, IndexMap, IpRouteNextHopEntry
+        else:
+            route_type = next_hop_type = hops_type = path_type = dict
 
         # initial variables
         ret_dict = {}
@@ -266,102 +441,39 @@ class ShowIpRoute(ShowIpRouteSchema):
         index = 0
         active = False
 
-        # Routing Table: VRF1
-        # Routing Table: VRF-infra
-        p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-
-        # 10.1.0.0/32 is subnetted, 1 subnets
-        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-        p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                        r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-
-        # C        10.4.1.1 is directly connected, Loopback0
-        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
-        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
-        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
-        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
-        # D        192.168.205.1
-        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
-        # L        FF00::/8 [0/0]
-        # S   %    10.34.0.1 [1/0] via 192.168.16.1
-        # C   p    10.34.0.2 is directly connected, Loopback0
-        # S   &    10.69.0.0 [1/0] via 10.34.0.1
-        # S   +    10.186.1.0 [1/0] via 10.144.0.1 (red)
-        # B   +    10.55.0.0 [20/0] via 10.144.0.1 (red), 00:00:09
-        # B   +    10.55.0.0 [20/0] via 10.144.0.1 (vrf-blue), 00:00:09
-        # i*L1  0.0.0.0/0 [115/100] via 10.12.7.37, 3w6d, Vlan101
-        # ND  ::/0 [2/0]
-        # NDp 2001:103::/64 [2/0]
-        if self.IP_VER == 'ipv4':
-            p3 = re.compile(
-                r'^(?P<code>[A-Za-z]{0,2}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]|[a-z]{2}|[A-Z]{2}|[+%&p])?\s*(?P<network>[0-9\.\:\/]+)?( '
-                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?( *('
-                r'via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
-            # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20
-            # B        1.1.1.10 [200/0] via FC01:101:8:E007:: (default:ipv6), 1d15h
-            p7 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[0-9a-fA-F\:]+) +\((?P<nh_vrf>[\w\:]+)+\)+, +(?P<date>[dh\d\:]+)+(, +(?P<interface>[\w]+))?$')
-            # B        192.168.1.20/32
-            p8 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
-            # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
-            # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
-            p9 = re.compile(r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$')
-
-        else:
-            p3 = re.compile(
-                r'^(?!via)(?P<code>[A-Za-z]{0,3}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]\s|[a-z]{2}[+%&p])?\s*(?P<network>[\w\.\:\/]+)?'
-                r'( +is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?'
-                r'( *(via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
-            # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20, Vlan500
-            # B        192.168.1.40/32 [200/0] via 2109:1::4 (vrf-blue:ipv6), 00:03:20, Vlan500
-            p7 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w]+)$')
-            # B        192.168.1.20/32
-            p8 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
-            # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
-            # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
-            p9 = re.compile(r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$')
-
-        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-        p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                        r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-
-        #       is directly connected, GigabitEthernet0/2
-        p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                        r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                        r'( +(?P<interface>[\S]+))?$')
-
-        #      via 2001:DB8:1:1::2
-        #      via 10.4.1.1%default, indirectly connected
-        #      via 2001:DB8:4:6::6
-        #      via 2001:DB8:20:4:6::6%VRF2
-        #      via Null0, receive
-        #      via 33.33.33.33%default, Vlan100%default
-        p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]{4,}),?)?'
-                        r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+),?)?,?( +receive)?'
-                        r'( +directly connected)?( +indirectly connected)?$')
+        scan = self.scanner.match
+        p = self.patterns
 
-        for line in out.splitlines():
+        while True:
+            line = yield
+            if line is None:
+                break
             if line:
                 line = line.strip()
             else:
                 continue
+            if skip and not p.p1.match(line):
+                continue
 
             next_hop = interface = updated = metrics = route_preference = nh_vrf = ""
+            name, m = scan(line)
+            if not m:
+                continue
+
             # Routing Table: VRF1
             # Routing Table: VRF-infra
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 vrf = m.groupdict()['vrf']
+                if predicate is not None:
+                    skip = not predicate.match({'vrf': vrf})
+                    if skip:
+                        continue
                 results_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
                 active = True
@@ -391,8 +503,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # B   +    10.55.0.0 [20/0] via 10.144.0.1 (red), 00:00:09
             # ND  ::/0 [2/0]
             # NDp 2001:103::/64 [2/0]
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 active = True
                 if m.groupdict()['code']:
                     source_protocol_codes = m.groupdict()['code'].strip()
@@ -433,7 +544,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -446,14 +557,14 @@ class ShowIpRoute(ShowIpRouteSchema):
                     route_dict['source_protocol_codes'] = source_protocol_codes
                     route_dict['source_protocol'] = source_protocol
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
 
                 if not next_hop and interface:
                     intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
 
                 elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
                     idx_dict['index'] = index
                     idx_dict['next_hop'] = next_hop
 
@@ -466,23 +577,17 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 continue
 
-            # storing the line which moves in the next line because of split in the for loop
-            m = p8.match(line)
-            if m:
-                line1 = line
-
             # B        192.168.1.20/32
             # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 # B        192.168.1.20/32
-                m = p8.match(line1)
-                if m:
+                m1 = p.p8.match(line1)
+                if m1:
                     active = True
                     #source_protocol_codes: 'B'
-                    if m.groupdict()['code']:
+                    if m1.groupdict()['code']:
                         # running the for loop to access all the key and value pair of dict "source_protocol_dict = {}""
-                        source_protocol_codes = m.groupdict()['code'].strip()
+                        source_protocol_codes = m1.groupdict()['code'].strip()
                         for key,val in source_protocol_dict.items():
                             #'If m.groupdict()['code'] = S* then below code will split the 'S' & '*'
                             #and store it in array and the put [0] as to store only 'S' as code '*' has no use in the output
@@ -491,185 +596,180 @@ class ShowIpRoute(ShowIpRouteSchema):
                             if source_protocol_replaced in val:
                                 source_protocol = key
 
-                    if m.groupdict()['network']:
+                    if m1.groupdict()['network']:
                         #'192.168.1.20/32'
-                        network = m.groupdict()['network']
+                        network = m1.groupdict()['network']
                         if '/' not in network and self.IP_VER == 'ipv4':
                             route = '{}/{}'.format(network,netmask)
                         else:
                             route = network
 
                     #'192.168.1.20/32'
-                    if not m.groupdict()['network']:
+                    if not m1.groupdict()['network']:
                         route = route
 
                 # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
-                m = p9.match(line)
-                if m:
-                    #'route_preference': 200,
-                    if m.groupdict()['route_preference']:
-                        routepreference = m.groupdict()['route_preference']
-                        if '/' in routepreference:
-                            route_preference = routepreference.split('/')[0]
-                            metrics = routepreference.split('/')[1]
+                #'route_preference': 200,
+                if m.groupdict()['route_preference']:
+                    routepreference = m.groupdict()['route_preference']
+                    if '/' in routepreference:
+                        route_preference = routepreference.split('/')[0]
+                        metrics = routepreference.split('/')[1]
+
+                #next_hop':
+                if m.groupdict()['next_hop']:
+                    next_hop = m.groupdict()['next_hop']
+                    index = 1
+                else:
+                    index = 0
+
+                #'route': '192.168.1.20/32'
+                if m.groupdict()['interface']:
+                    interface = m.groupdict()['interface']
+
+                #'updated': '00:03:46',
+                if m.groupdict()['date']:
+                    updated = m.groupdict()['date']
+
+                #'vrf': 'red:ipv6'
+                #'vrf': 'vrf-blue:ipv6'
+                if m.groupdict()['nh_vrf']:
+                    nh_vrf = m.groupdict()['nh_vrf']
+                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                        .setdefault('address_family', {}).setdefault(af, {})\
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
+                # 'route': '192.168.1.20/32',
+                route_dict['route'] = route
+                route_dict['active'] = active
+
+                #'route_preference': 200,
+                #'source_protocol': 'bgp',
+                #'source_protocol_codes': 'B'
+                if metrics:
+                    route_dict['metric'] = int(metrics)
+                if route_preference:
+                    route_dict['route_preference'] = int(route_preference)
+                if source_protocol_codes:
+                    route_dict['source_protocol_codes'] = source_protocol_codes
+                    route_dict['source_protocol'] = source_protocol
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
+
+                #'outgoing_interface': 'Vlan500',
+                if not next_hop and interface:
+                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
+
+                # 'next_hop_list': 1
+                elif next_hop:
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
+                    idx_dict['index'] = index
                     #next_hop':
-                    if m.groupdict()['next_hop']:
-                        next_hop = m.groupdict()['next_hop']
-                        index = 1
-                    else:
-                        index = 0
-
-                    #'route': '192.168.1.20/32'
-                    if m.groupdict()['interface']:
-                        interface = m.groupdict()['interface']
-
-                    #'updated': '00:03:46',
-                    if m.groupdict()['date']:
-                        updated = m.groupdict()['date']
-
-                    #'vrf': 'red:ipv6'
-                    #'vrf': 'vrf-blue:ipv6'
-                    if m.groupdict()['nh_vrf']:
-                        nh_vrf = m.groupdict()['nh_vrf']
-                    route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                            .setdefault('address_family', {}).setdefault(af, {})\
-                                            .setdefault('routes', {}).setdefault(route, {})
-
-                    # 'route': '192.168.1.20/32',
-                    route_dict['route'] = route
-                    route_dict['active'] = active
-
-                    #'route_preference': 200,
-                    #'source_protocol': 'bgp',
-                    #'source_protocol_codes': 'B'
-                    if metrics:
-                        route_dict['metric'] = int(metrics)
-                    if route_preference:
-                        route_dict['route_preference'] = int(route_preference)
-                    if source_protocol_codes:
-                        route_dict['source_protocol_codes'] = source_protocol_codes
-                        route_dict['source_protocol'] = source_protocol
-                    next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                    #'outgoing_interface': 'Vlan500',
-                    if not next_hop and interface:
-                        intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                        intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                    # 'next_hop_list': 1
-                    elif next_hop:
-                        idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                        idx_dict['index'] = index
-                        #next_hop':
-                        idx_dict['next_hop'] = next_hop
-                        if updated:
-                            idx_dict['updated'] = updated
-                        if interface:
-                            idx_dict['outgoing_interface'] = interface
-                        if nh_vrf:
-                            idx_dict['vrf'] = nh_vrf
-                    continue
+                    idx_dict['next_hop'] = next_hop
+                    if updated:
+                        idx_dict['updated'] = updated
+                    if interface:
+                        idx_dict['outgoing_interface'] = interface
+                    if nh_vrf:
+                        idx_dict['vrf'] = nh_vrf
+                continue
             # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
             # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20, Vlan500
-            else:
-                m = p7.match(line)
-                if m:
-                    active = True
-                    #source_protocol_codes: 'B'
-                    if m.groupdict()['code']:
-                        # running the for loop to access all the key and value pair of dict "source_protocol_dict = {}""
-                        source_protocol_codes = m.groupdict()['code'].strip()
-                        for key,val in source_protocol_dict.items():
-                            '''If m.groupdict()['code'] = S* then below code will split the 'S' & '*'
-                            and store it in array and the put [0] as to store only 'S' as code '*' has no use in the output'''
-                            # Exmaple = S*       0.0.0.0/0 [1/0] via 10.50.15.1  >>>> ['S', '*']
-                            source_protocol_replaced = source_protocol_codes.split('*')[0]
-                            if source_protocol_replaced in val:
-                                source_protocol = key
-
-                    if m.groupdict()['network']:
-                        #'192.168.1.20/32'
-                        network = m.groupdict()['network']
-                        if '/' not in network and self.IP_VER == 'ipv4':
-                            route = '{}/{}'.format(network,netmask)
-                        else:
-                            route = network
+            if name == 'p7':
+                active = True
+                #source_protocol_codes: 'B'
+                if m.groupdict()['code']:
+                    # running the for loop to access all the key and value pair of dict "source_protocol_dict = {}""
+                    source_protocol_codes = m.groupdict()['code'].strip()
+                    for key,val in source_protocol_dict.items():
+                        '''If m.groupdict()['code'] = S* then below code will split the 'S' & '*'
+                        and store it in array and the put [0] as to store only 'S' as code '*' has no use in the output'''
+                        # Exmaple = S*       0.0.0.0/0 [1/0] via 10.50.15.1  >>>> ['S', '*']
+                        source_protocol_replaced = source_protocol_codes.split('*')[0]
+                        if source_protocol_replaced in val:
+                            source_protocol = key
 
+                if m.groupdict()['network']:
                     #'192.168.1.20/32'
-                    if not m.groupdict()['network']:
-                        route = route
+                    network = m.groupdict()['network']
+                    if '/' not in network and self.IP_VER == 'ipv4':
+                        route = '{}/{}'.format(network,netmask)
+                    else:
+                        route = network
 
-                    #'route_preference': 200,
-                    if m.groupdict()['route_preference']:
-                        routepreference = m.groupdict()['route_preference']
-                        if '/' in routepreference:
-                            route_preference = routepreference.split('/')[0]
-                            metrics = routepreference.split('/')[1]
+                #'192.168.1.20/32'
+                if not m.groupdict()['network']:
+                    route = route
 
-                    #next_hop':
-                    if m.groupdict()['next_hop']:
-                        next_hop = m.groupdict()['next_hop']
-                        index = 1
-                    else:
-                        index = 0
+                #'route_preference': 200,
+                if m.groupdict()['route_preference']:
+                    routepreference = m.groupdict()['route_preference']
+                    if '/' in routepreference:
+                        route_preference = routepreference.split('/')[0]
+                        metrics = routepreference.split('/')[1]
 
-                    #'route': '192.168.1.20/32'
-                    if m.groupdict()['interface']:
-                        interface = m.groupdict()['interface']
+                #next_hop':
+                if m.groupdict()['next_hop']:
+                    next_hop = m.groupdict()['next_hop']
+                    index = 1
+                else:
+                    index = 0
 
-                    #'updated': '00:03:46',
-                    if m.groupdict()['date']:
-                        updated = m.groupdict()['date']
+                #'route': '192.168.1.20/32'
+                if m.groupdict()['interface']:
+                    interface = m.groupdict()['interface']
 
-                    #'vrf': 'red:ipv6'
-                    #'vrf': 'vrf-blue:ipv6'
-                    if m.groupdict()['nh_vrf']:
-                        nh_vrf = m.groupdict()['nh_vrf']
+                #'updated': '00:03:46',
+                if m.groupdict()['date']:
+                    updated = m.groupdict()['date']
 
-                    route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                            .setdefault('address_family', {}).setdefault(af, {})\
-                                            .setdefault('routes', {}).setdefault(route, {})
+                #'vrf': 'red:ipv6'
+                #'vrf': 'vrf-blue:ipv6'
+                if m.groupdict()['nh_vrf']:
+                    nh_vrf = m.groupdict()['nh_vrf']
 
-                    # 'route': '192.168.1.20/32',
-                    route_dict['route'] = route
-                    route_dict['active'] = active
+                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                        .setdefault('address_family', {}).setdefault(af, {})\
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
-                    #'route_preference': 200,
-                    #'source_protocol': 'bgp',
-                    #'source_protocol_codes': 'B'
-                    if metrics:
-                        route_dict['metric'] = int(metrics)
-                    if route_preference:
-                        route_dict['route_preference'] = int(route_preference)
-                    if source_protocol_codes:
-                        route_dict['source_protocol_codes'] = source_protocol_codes
-                        route_dict['source_protocol'] = source_protocol
+                # 'route': '192.168.1.20/32',
+                route_dict['route'] = route
+                route_dict['active'] = active
+
+                #'route_preference': 200,
+                #'source_protocol': 'bgp',
+                #'source_protocol_codes': 'B'
+                if metrics:
+                    route_dict['metric'] = int(metrics)
+                if route_preference:
+                    route_dict['route_preference'] = int(route_preference)
+                if source_protocol_codes:
+                    route_dict['source_protocol_codes'] = source_protocol_codes
+                    route_dict['source_protocol'] = source_protocol
 
-                    next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
 
-                    #'outgoing_interface': 'Vlan500',
-                    if not next_hop and interface:
-                        intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                        intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                #'outgoing_interface': 'Vlan500',
+                if not next_hop and interface:
+                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
 
-                    # 'next_hop_list': 1
-                    elif next_hop:
-                        idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                        idx_dict['index'] = index
-                        idx_dict['next_hop'] = next_hop
+                # 'next_hop_list': 1
+                elif next_hop:
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
+                    idx_dict['index'] = index
+                    idx_dict['next_hop'] = next_hop
 
-                        if updated:
-                            idx_dict['updated'] = updated
-                        if interface:
-                            idx_dict['outgoing_interface'] = interface
-                        if nh_vrf:
-                            idx_dict['vrf'] = nh_vrf
-                    continue
+                    if updated:
+                        idx_dict['updated'] = updated
+                    if interface:
+                        idx_dict['outgoing_interface'] = interface
+                    if nh_vrf:
+                        idx_dict['vrf'] = nh_vrf
+                continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 routepreference = m.groupdict()['route_preference']
                 if routepreference and '/' in routepreference:
                     route_preference = routepreference.split('/')[0]
@@ -685,7 +785,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -698,14 +798,14 @@ class ShowIpRoute(ShowIpRouteSchema):
                     route_dict['source_protocol_codes'] = source_protocol_codes
                     route_dict['source_protocol'] = source_protocol
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
 
                 if not next_hop and interface:
                     intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
 
                 elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
                     idx_dict['index'] = index
                     idx_dict['next_hop'] = next_hop
 
@@ -717,8 +817,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #       is directly connected, GigabitEthernet0/2
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
 
                 if m.groupdict()['route_preference']:
                     routepreference = m.groupdict()['route_preference']
@@ -736,7 +835,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
                 route_dict['route'] = route
 
@@ -745,14 +844,14 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if route_preference:
                     route_dict['route_preference'] = int(route_preference)
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
 
                 if not next_hop and interface:
                     intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
 
                 elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
                     idx_dict['index'] = index
                     idx_dict['next_hop'] = next_hop
 
@@ -769,8 +868,11 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
             #      via 33.33.33.33%default, Vlan100%default
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
+                # storing the line which moves in the next line because of split in the for loop
+                if p.p8.match(line):
+                    line1 = line
+
                 vrf_val = ''
                 tmp_next_hop = m.groupdict()['next_hop']
                 if tmp_next_hop:
@@ -786,19 +888,19 @@ class ShowIpRoute(ShowIpRouteSchema):
                 index += 1
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                                        .setdefault('routes', {}).setdefault(route, route_type())
 
                 route_dict['route'] = route
                 route_dict['active'] = active
 
-                next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop_dict = route_dict.setdefault('next_hop', next_hop_type())
 
                 if not next_hop and interface:
                     intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
+                    intf_dict.setdefault(interface, path_type()).update({'outgoing_interface': interface})
 
                 elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+                    idx_dict = next_hop_dict.setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
                     idx_dict['index'] = index
                     idx_dict['next_hop'] = next_hop
 
@@ -817,15 +919,19 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 continue
 
+            # storing the line which moves in the next line because of split in the for loop
+            if name == 'p8':
+                line1 = line
+                continue
+
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
+            if name == 'p100':
                 group = m.groupdict()
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
                                                                                               {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
+                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, route_type())
                 route_dict.update({'route': group['ip']})
                 route_dict.update({'mask': group['mask']})
                 route_dict.update({'active': True})
@@ -833,8 +939,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
+            if name == 'p200':
                 group = m.groupdict()
                 route_dict.update({'distance': int(group['distance'])})
                 route_dict.update({'metric': int(group['metric'])})
@@ -844,16 +949,14 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
+            if name == 'p300':
                 group = m.groupdict()
                 route_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
+            if name == 'p400':
                 group = m.groupdict()
                 update_dict = route_dict.setdefault('update', {})
                 update_dict.update({k: v for k, v in group.items() if v})
@@ -861,11 +964,10 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
-            if m:
+            if name == 'p500':
                 group = m.groupdict()
                 index += 1
-                path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
+                path_dict = route_dict.setdefault('next_hop', next_hop_type()).setdefault('next_hop_list', hops_type()).setdefault(index, path_type())
                 path_dict.update({'index': index})
                 path_dict.update({'next_hop': group['nexthop']})
                 path_dict.update({'age': group['age']})
@@ -874,28 +976,24 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
+            if name == 'p600':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
 
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
+            if name == 'p700':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
+            if name == 'p800':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
+            if name == 'p900':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
@@ -914,7 +1012,31 @@ class ShowIpv6Route(ShowIpRoute):
     exclude = ['uptime']
 
     IP_VER = 'ipv6'
-    def cli(self, vrf=None, protocol=None, interface=None, output=None):
+
+    # the routing tables of the output are not told apart
+    device_filter = None
+
+    patterns = ShowIpRoute.patterns.extend(
+        # L        FF00::/8 [0/0]
+        # ND  ::/0 [2/0]
+        # NDp 2001:103::/64 [2/0]
+        p3=r'^(?!via)(?P<code>[A-Za-z]{0,3}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]\s|[a-z]{2}[+%&p])?\s*(?P<network>[\w\.\:\/]+)?'
+           r'( +is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?'
+           r'( *(via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
+        # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
+        p9=r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$',
+
+        # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
+        # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20, Vlan500
+        # B        192.168.1.40/32 [200/0] via 2109:1::4 (vrf-blue:ipv6), 00:03:20, Vlan500
+        p7=r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w]+)$',
+    )
+    scanner = LineScanner(patterns)
+
+    def cli(self, vrf=None, protocol=None, interface=None, output=None,
+            format=None, where=None):
 
         if output is None:
             if vrf and protocol:
@@ -932,7 +1054,8 @@ class ShowIpv6Route(ShowIpRoute):
             out = output
         if not vrf:
             vrf = 'default'
-        return super().cli(vrf=vrf, protocol=protocol, output=out)
+        return super().cli(vrf=vrf, protocol=protocol, output=out,
+                           format=format, where=where)
 
 # ====================================================
 #  schema for show ipv6 route updated
@@ -1388,6 +1511,12 @@ class ShowIpRouteWord(ShowIpRouteWordSchema):
         else:
             out = output
 
+        return consume_lines(self.consume(route=route, vrf=vrf),
+                             out.splitlines())
+
+    def consume(self, route=None, vrf=None, interface=None):
+        """parse the lines of the output as they are sent, the structure of
+        cli() is returned once None is sent"""
         if not vrf:
             vrf = 'default'
 
@@ -1491,7 +1620,10 @@ class ShowIpRouteWord(ShowIpRouteWordSchema):
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        while True:
+            line = yield
+            if line is None:
+                break
             line = line.strip()
 
             # Routing Table: Mgmt-intf
@@ -3406,7 +3538,7 @@ class ShowIpRouteSupernet(ShowIpRoute):
 
     cli_command = ['show ip route vrf {vrf} supernets-only', 'show ip route supernets-only']
 
-    def cli(self, vrf=None, output=None):
+    def cli(self, vrf=None, output=None, format=None, where=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[0].format(vrf=vrf)
@@ -3417,7 +3549,7 @@ class ShowIpRouteSupernet(ShowIpRoute):
         else:
             out = output
 
-        return super().cli(vrf=vrf, output=out)
+        return super().cli(vrf=vrf, output=out, format=format, where=where)
 
 # ====================================================
 #  schema for show rib client
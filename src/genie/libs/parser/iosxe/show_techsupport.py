@@ -13,6 +13,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, D
 # pyATS
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.incremental import consume_lines
 
 class ShowTechSupportIncludeShowSchema(MetaParser):
     """Schema for show tech-support | include show"""
@@ -34,13 +35,22 @@ class ShowTechSupportIncludeShow(ShowTechSupportIncludeShowSchema):
         if output is None:
             output = self.device.execute(self.cli_command.format(show_option=show_option),timeout=200)
 
+        return consume_lines(self.consume(), output.splitlines())
+
+    def consume(self, show_option=""):
+        """parse the lines of the output as they are sent, the structure of
+        cli() is returned once None is sent"""
+
         # ------------------ show vlan virtual-port -------------------
         # ------------------ show interfaces history ------------------
         p1 = re.compile(r"^-+\s(?P<command>[\w\.\:\-\s]+)\s-+$")
 
         ret_dict = {}
 
-        for line in output.splitlines():
+        while True:
+            line = yield
+            if line is None:
+                break
             line = line.strip()
 
             # ------------------ show vlan virtual-port -------------------
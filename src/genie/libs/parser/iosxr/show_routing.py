@@ -7,6 +7,22 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
+from genie.libs.parser.utils.records import IndexMap, record_type, \
+    records_result
+from genie.libs.parser.utils.call_schema import CallSchema
+
+
+# compact records of the routes of ShowRouteIpv4 with format='records', the
+# other keys of the schema are kept in a dict of the record
+RouteIpv4Entry = record_type('RouteIpv4Entry', [
+    'route', 'active', 'route_preference', 'metric', 'source_protocol',
+    'source_protocol_codes', 'next_hop'],
+    interned=['source_protocol_codes'])
+RouteIpv4NextHop = record_type('RouteIpv4NextHop', [
+    'outgoing_interface', 'next_hop_list'])
+RouteIpv4NextHopEntry = record_type('RouteIpv4NextHopEntry', [
+    'index', 'next_hop', 'outgoing_interface', 'updated'],
+    interned=['next_hop', 'outgoing_interface', 'updated'])
 
 
 # ====================================================
@@ -615,7 +631,7 @@ class ShowRouteIpv4Schema(MetaParser):
 # ====================================================
 #  parser for show route ipv4
 # ====================================================
-class ShowRouteIpv4(ShowRouteIpv4Schema):
+class ShowRouteIpv4(CallSchema, ShowRouteIpv4Schema):
     cli_command = [
         'show route ipv4',
         'show route vrf {vrf} ipv4',
@@ -661,7 +677,8 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
     protocol_set = {'ospf', 'odr', 'isis', 'eigrp', 'static', 'mobile',
                     'rip', 'lisp', 'nhrp', 'local', 'connected', 'bgp'}
 
-    def cli(self, vrf=None, route=None, protocol=None, next_hop=None, output=None):
+    def cli(self, vrf=None, route=None, protocol=None, next_hop=None, output=None,
+            format=None):
 
         # Check if argument from device.parse is protocol or route
         if protocol and protocol not in self.protocol_set:
@@ -816,6 +833,14 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         # SRv6 Headend: H.Encaps.Red [f3216], SID-list {fc00:c000:1002:e002::}
         p22 = re.compile(r'^SRv6\s+Headend:\s+(?P<srv6_headend>(.*)),\s+SID-list\s+{(?P<sid_list>[\w:]+)}$')
 
+        # the routes and their next hops are records with format='records'
+        if format == 'records':
+            route_type, next_hop_type, hops_type, path_type = \
+                RouteIpv4Entry, RouteIpv4NextHop, IndexMap, \
+                RouteIpv4NextHopEntry
+        else:
+            route_type = next_hop_type = hops_type = path_type = dict
+
         # initial variables
         ret_dict = {}
         index = 0
@@ -870,7 +895,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     setdefault('address_family', {}). \
                     setdefault(address_family, {}). \
                     setdefault('routes', {}). \
-                    setdefault(network, {})
+                    setdefault(network, route_type())
 
                 route_dict.update({'route': network})
                 route_dict.update({'active': True})
@@ -881,9 +906,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
 
                 index = 1
 
-                next_hop_list_dict = route_dict.setdefault('next_hop', {}). \
-                    setdefault('next_hop_list', {}). \
-                    setdefault(int(index), {})
+                next_hop_list_dict = route_dict.setdefault('next_hop', next_hop_type()). \
+                    setdefault('next_hop_list', hops_type()). \
+                    setdefault(int(index), path_type())
                 
                 next_hop_list_dict.update({'index': index})
                 next_hop_list_dict.update({'next_hop': next_hop})
@@ -906,9 +931,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 route_dict.update({'metric': metric})
                 index += 1
 
-                next_hop_list_dict = route_dict.setdefault('next_hop', {}). \
-                    setdefault('next_hop_list', {}). \
-                    setdefault(int(index), {})
+                next_hop_list_dict = route_dict.setdefault('next_hop', next_hop_type()). \
+                    setdefault('next_hop_list', hops_type()). \
+                    setdefault(int(index), path_type())
                 
                 next_hop_list_dict.update({'index': index})
                 next_hop_list_dict.update({'next_hop': next_hop})
@@ -937,7 +962,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                             setdefault('address_family', {}). \
                             setdefault(address_family, {}). \
                             setdefault('routes', {}). \
-                            setdefault(network, {})
+                            setdefault(network, route_type())
 
                         route_dict.update({'route': network})
                         route_dict.update({'active': True})
@@ -956,9 +981,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                             route_dict.update({'source_protocol': source_protocol})
                         route_dict.update({'source_protocol_codes': code1})
                     
-                    outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
+                    outgoing_interface_dict = route_dict.setdefault('next_hop', next_hop_type()). \
                         setdefault('outgoing_interface', {}). \
-                        setdefault(interface, {})
+                        setdefault(interface, path_type())
                     
                     if interface:
                         outgoing_interface_dict.update({'outgoing_interface': interface})
@@ -983,7 +1008,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     setdefault('address_family', {}). \
                     setdefault(address_family, {}). \
                     setdefault('routes', {}). \
-                    setdefault(network, {})
+                    setdefault(network, route_type())
                 route_dict.update({'route': network})
                 route_dict.update({'ip': ip})
                 route_dict.update({'mask': mask})
@@ -1028,7 +1053,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                         setdefault('address_family', {}). \
                         setdefault(address_family, {}). \
                         setdefault('routes', {}). \
-                        setdefault(network, {})
+                        setdefault(network, route_type())
 
                     route_dict.update({'route': network})
                     route_dict.update({'active': True})
@@ -1046,9 +1071,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     route_dict.update({'source_protocol_codes': code1})
                 
                 if interface:
-                    outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
+                    outgoing_interface_dict = route_dict.setdefault('next_hop', next_hop_type()). \
                         setdefault('outgoing_interface', {}). \
-                        setdefault(interface, {})
+                        setdefault(interface, path_type())
                     outgoing_interface_dict.update({'outgoing_interface': interface})
                 
                 if updated:
@@ -1097,9 +1122,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 interface = group['interface']
 
                 index += 1
-                outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
-                    setdefault('next_hop_list', {}). \
-                    setdefault(int(index), {})
+                outgoing_interface_dict = route_dict.setdefault('next_hop', next_hop_type()). \
+                    setdefault('next_hop_list', hops_type()). \
+                    setdefault(int(index), path_type())
                 outgoing_interface_dict.update({'index': index})
                 if interface:
                     outgoing_interface_dict.update({'outgoing_interface': interface})
@@ -1129,9 +1154,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 table_id = group['table_id']
 
                 if interface:
-                    nexthop_intf_dict = route_dict.setdefault('next_hop', {}).\
-                        setdefault('next_hop_list', {}). \
-                        setdefault(int(index), {})
+                    nexthop_intf_dict = route_dict.setdefault('next_hop', next_hop_type()).\
+                        setdefault('next_hop_list', hops_type()). \
+                        setdefault(int(index), path_type())
 
                 nexthop_intf_dict.update({'index': index})
                 if interface:
@@ -1205,6 +1230,8 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 outgoing_interface_dict.update({'sid_list': group['sid_list']})
                 continue
 
+        if format == 'records':
+            return records_result(self, ret_dict)
         return ret_dict
 
 
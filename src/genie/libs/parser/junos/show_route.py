@@ -29,6 +29,25 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf, Or
+from genie.libs.parser.utils.streaming import iter_lines
+from genie.libs.parser.utils.records import record_type, records_result
+from genie.libs.parser.utils.call_schema import CallSchema
+
+
+# compact records of the routes of ShowRoute with format='records', the
+# other keys of the schema are kept in a dict of the record
+RouteRt = record_type('RouteRt', ['rt-destination', 'rt-entry'])
+RouteRtEntry = record_type('RouteRtEntry', [
+    'active-tag', 'protocol-name', 'preference', 'preference2', 'metric',
+    'metric2', 'rt-tag', 'learned-from', 'local-preference', 'med', 'age',
+    'nh-type', 'nh', 'as-path', 'validation-state'],
+    interned=['active-tag', 'protocol-name', 'nh-type', 'validation-state'],
+    numbers=['preference', 'preference2', 'metric', 'metric2',
+             'local-preference'])
+RouteAge = record_type('RouteAge', ['#text'])
+RouteNh = record_type('RouteNh', [
+    'to', 'via', 'mpls-label', 'nh-local-interface', 'nh-table'],
+    interned=['to', 'via', 'nh-local-interface', 'nh-table'])
 '''
 Schema for:
     * show route table {table}
@@ -345,7 +364,7 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+class ShowRoute(CallSchema, ShowRouteSchema):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -360,7 +379,8 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
-    def cli(self, protocol=None, ip_address=None, table=None, output=None):
+    def cli(self, protocol=None, ip_address=None, table=None, output=None,
+            format=None):
         if not output:
             if protocol and table:
                 cmd = self.cli_command[4].format(
@@ -388,7 +408,45 @@ class ShowRoute(ShowRouteSchema):
             out = output
 
         ret_dict = {}
+        for record in self.stream(out, format=format):
+            # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
+            if 'table-name' in record:
+                route_information_dict = ret_dict.setdefault('route-information', {})
+                route_table_list = route_information_dict.setdefault('route-table', [])
+                route_table_dict = record
+                route_table_list.append(route_table_dict)
+                continue
+
+            # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
+            rt_list = route_table_dict.setdefault('rt', [])
+            rt_list.append(record)
+
+        if format == 'records':
+            return records_result(self, ret_dict)
+        return ret_dict
+
+    def stream(self, lines, format=None):
+        """ Yield the route tables and the routes of an output one at a
+            time, in the order of the output. cli() is built from these
+            records.
+
+            Args:
+                lines: output, file object or iterable of lines
+                format: 'records' for compact records of the routes
+
+            Yields:
+                dict: a route table, with 'table-name', or a route of the
+                      last route table, with 'rt-entry'
+        """
         rt_destination = None
+        rt_dict = None
+
+        # the routes are records with format='records'
+        if format == 'records':
+            rt_type, rt_entry_type, age_type, nh_type = \
+                RouteRt, RouteRtEntry, RouteAge, RouteNh
+        else:
+            rt_type = rt_entry_type = age_type = nh_type = dict
 
 
         # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
@@ -427,7 +485,7 @@ class ShowRoute(ShowRouteSchema):
         # 2001:db8:eb18:ca45::1/128
         pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(lines):
             line = line.strip()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
@@ -440,8 +498,9 @@ class ShowRoute(ShowRouteSchema):
                 active_route_count = group['active_route_count']
                 holddown = group['holddown']
                 hidden = group['hidden']
-                route_information_dict = ret_dict.setdefault('route-information', {})
-                route_table_list = route_information_dict.setdefault('route-table', [])
+                if rt_dict:
+                    yield rt_dict
+                    rt_dict = None
                 route_table_dict = {}
                 route_table_dict.update({'active-route-count': active_route_count})
                 route_table_dict.update({'destination-count': destination_count})
@@ -449,7 +508,7 @@ class ShowRoute(ShowRouteSchema):
                 route_table_dict.update({'holddown-route-count': holddown})
                 route_table_dict.update({'table-name': table_name})
                 route_table_dict.update({'total-route-count': total_route_count})
-                route_table_list.append(route_table_dict)
+                yield route_table_dict
                 continue
             
             # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
@@ -470,10 +529,10 @@ class ShowRoute(ShowRouteSchema):
                 learned_from = group['learned_from']
                 local_preference = group['local_preference']
                 med = group['med']
-                rt_list = route_table_dict.setdefault('rt', [])
-                rt_dict = {}
-                rt_list.append(rt_dict)
-                rt_entry_dict = {}
+                if rt_dict:
+                    yield rt_dict
+                rt_dict = rt_type()
+                rt_entry_dict = rt_entry_type()
                 if active_tag:
                     rt_entry_dict.update({'active-tag': active_tag})
                 rt_entry_dict.update({'protocol-name': protocol})
@@ -492,7 +551,7 @@ class ShowRoute(ShowRouteSchema):
                     rt_entry_dict.update({'local-preference': local_preference})
                 if med:
                     rt_entry_dict.update({'med': med})
-                age_dict = rt_entry_dict.setdefault('age', {})
+                age_dict = rt_entry_dict.setdefault('age', age_type())
                 age_dict.update({'#text': text})
                 rt_dict.update({'rt-entry': rt_entry_dict})
                 if rt_destination:
@@ -511,7 +570,7 @@ class ShowRoute(ShowRouteSchema):
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
-                nh_dict = {}
+                nh_dict = nh_type()
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 nh_list.append(nh_dict)
                 continue
@@ -521,7 +580,7 @@ class ShowRoute(ShowRouteSchema):
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
-                nh_dict = {}
+                nh_dict = nh_type()
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 nh_list.append(nh_dict)
                 continue
@@ -539,7 +598,7 @@ class ShowRoute(ShowRouteSchema):
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
-                nh_dict = {}
+                nh_dict = nh_type()
                 nh_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 nh_list.append(nh_dict)
                 continue
@@ -550,14 +609,16 @@ class ShowRoute(ShowRouteSchema):
                 group = m.groupdict()
                 rt_destination = group['rt_destination']
                 continue
-        return ret_dict
+
+        if rt_dict:
+            yield rt_dict
 
 class ShowRouteLogicalSystem(ShowRoute):
     """ Parser for:
             * show route logical-system {logical_name}
     """
     cli_command = 'show route logical-system {logical_name}'
-    def cli(self, logical_name, output=None):
+    def cli(self, logical_name, output=None, format=None):
         if not output:
             cmd = self.cli_command.format(
                     logical_name=logical_name)
@@ -565,14 +626,14 @@ class ShowRouteLogicalSystem(ShowRoute):
         else:
             out = output
         
-        return super().cli(output=out) 
+        return super().cli(output=out, format=format)
 
 class ShowRouteProtocolNoMore(ShowRoute):
     """ Parser for:
             * show route protocol {protocol} {ip_address} | no-more
     """
     cli_command = 'show route protocol {protocol} {ip_address} | no-more'
-    def cli(self, protocol, ip_address, output=None):
+    def cli(self, protocol, ip_address, output=None, format=None):
         if not output:
             cmd = self.cli_command.format(
                     protocol=protocol,
@@ -582,7 +643,7 @@ class ShowRouteProtocolNoMore(ShowRoute):
             out = output
         
         return super().cli(protocol=protocol,
-            ip_address=ip_address, output=out)
+            ip_address=ip_address, output=out, format=format)
 
 class ShowRouteProtocolExtensiveSchema(MetaParser):
     """ Schema for:
@@ -14,6 +14,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.buffer import finditer_lines
 
 # ===================
 # Schema for 'ps -ef'
@@ -64,18 +65,14 @@ class Ps(PsSchema):
             + r'\s+(?P<c>\S+)\s+(?P<stime>\S+)\s+(?P<tty>\S+)'
             + r'\s+(?P<time>\S+)\s+(?P<cmd>.+)$')
  
-        for line in out.splitlines():
-            line = line.strip()
- 
-            m = p1.match(line)
-            if m:
-                if grep and 'grep {}'.format(grep) in line:
-                    continue
+        for m in finditer_lines(p1, out):
+            if grep and 'grep {}'.format(grep) in m.group():
+                continue
 
-                groups = m.groupdict()
-                pid = groups['pid']
-                del groups['pid']
-                parsed_dict.setdefault('pid', {}).setdefault(pid, groups)
+            groups = m.groupdict()
+            pid = groups['pid']
+            del groups['pid']
+            parsed_dict.setdefault('pid', {}).setdefault(pid, groups)
 
         #if len(parsed_dict) == 0:
         #    parsed_dict.setdefault('pid', {})
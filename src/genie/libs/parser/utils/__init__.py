@@ -1,2 +1,6 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands,\
+                    get_parser_cache_info, clear_parser_cache, get_parsers,\
+                    get_command_view, get_parser_data, preload,\
+                    warm_parsers, enable_parse_cache, disable_parse_cache,\
+                    get_parse_cache_info
 
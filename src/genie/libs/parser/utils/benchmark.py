@@ -0,0 +1,337 @@
+"""Time the parsers on their golden outputs.
+
+    python -m genie.libs.parser.utils.benchmark -o iosxe -c ShowInterfaces -r 200 --purge
+
+or `python benchmark_parsing.py ...` from the tests folder of the repository.
+
+Each golden `*_output.txt` of the selected parsers is parsed `repeat` times
+with a mocked device, the same way as the unittests. `--purge` empties the
+`re` module cache before every call, like in a worker cycling through more
+parsers than the cache can hold.
+
+    python -m genie.libs.parser.utils.benchmark -o iosxe --rows 100000 -r 5
+
+times the parsers of `TABLES` on a synthetic table of `rows` rows instead.
+With `--memory`, the parsers of `TABLES` which have a `format='columnar'`
+result are timed and traced in both formats, with the validation of the
+schema of the default format.
+"""
+
+# Python
+import gc
+import re
+import sys
+import glob
+import pathlib
+import argparse
+import importlib
+import tracemalloc
+from time import perf_counter
+from unittest.mock import Mock
+from inspect import getfullargspec
+
+# Genie
+from genie.libs import parser as _parser
+from genie.libs.parser.utils.discovery import discover_files
+from genie.libs.parser.utils.unittests import (get_files, read_from_file,
+                                               read_json_file,
+                                               get_operating_systems,
+                                               files_to_import,
+                                               tested_classes)
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+
+def _ip(index):
+    return '10.{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255,
+                                index & 255)
+
+
+def _port(index):
+    return '{}/{}/{}'.format(index // 10000, index // 100 % 100, index % 100)
+
+
+def _mac(index):
+    return '0000.{:04x}.{:04x}'.format(index >> 16, index & 0xffff)
+
+
+def _arp(index):
+    return 'Internet  {:<16} {:>9}   {}  ARPA   Vlan{}'.format(
+        _ip(index), index % 240 if index % 5 else '-', _mac(index),
+        index % 4094 + 1)
+
+
+# synthetic tables: os -> class name -> (module, header line, row of an
+# index)
+TABLES = {
+    'iosxe': {
+        'ShowIpInterfaceBrief': (
+            'show_interface',
+            'Interface              IP-Address      OK? Method Status'
+            '                Protocol',
+            lambda index: '{:<22} {:<15} YES manual {:<21} {}'.format(
+                'GigabitEthernet' + _port(index), _ip(index),
+                'administratively down' if index % 10 else 'up',
+                'down' if index % 10 else 'up')),
+        'ShowInterfacesStatus': (
+            'show_interface',
+            'Port      Name               Status       Vlan       Duplex'
+            '  Speed Type',
+            lambda index: '{:<9} {:<18} {:<12} {:<10} {:>6} {:>6} {}'.format(
+                'Gi' + _port(index), 'host {}'.format(index) if index % 3
+                else '', 'connected' if index % 2 else 'notconnect',
+                index % 4094 + 1, 'a-full', 'a-1000', '10/100/1000BaseTX')),
+        'ShowArp': (
+            'show_arp',
+            'Protocol  Address          Age (min)  Hardware Addr   Type'
+            '   Interface',
+            _arp),
+        'ShowIpArp': (
+            'show_arp',
+            'Protocol  Address          Age (min)  Hardware Addr   Type'
+            '   Interface',
+            _arp),
+        'ShowMacAddressTableDynamic': (
+            'show_mac_address',
+            '          Mac Address Table\n'
+            '-------------------------------------------\n'
+            '\n'
+            'Vlan    Mac Address       Type        Ports\n'
+            '----    -----------       --------    -----',
+            lambda index: ' {:<4}   {}    DYNAMIC     Gi{}'.format(
+                index % 4094 + 1, _mac(index), _port(index))),
+    },
+}
+
+
+def synthetic_table(operating_system, class_name, rows):
+    '''synthetic_table
+
+    Build the output of a table of `TABLES`
+
+        Args:
+            operating_system (`str`): os of the parser
+            class_name (`str`): name of the parser class
+            rows (`int`): number of rows
+
+        Returns:
+            str: the output
+    '''
+    _, header, row = TABLES[operating_system][class_name]
+    return '\n'.join([header] + [row(index) for index in range(rows)])
+
+
+def _module_name(parse_file):
+    relative = pathlib.Path(parse_file).relative_to(PARSER_ROOT)
+    return '.'.join((_parser.__name__,) + relative.with_suffix('').parts)
+
+
+def find_parsers(operating_system, class_name=None, token=None):
+    '''find_parsers
+
+    Find the parser classes of an os which have golden outputs
+
+        Args:
+            operating_system (`str`): os folder
+            class_name (`str`): only this class
+            token (`str`): only the parsers of this token folder
+
+        Returns:
+            list: (parser class, folder of the golden outputs)
+    '''
+    parse_files = [details for details in get_files(PARSER_ROOT / operating_system)
+                   if not token or token in details['tokens']]
+    parse_files = [details['parse_file'] for details in parse_files]
+    parse_files = files_to_import(parse_files, discover_files(parse_files),
+                                  class_name)
+
+    parsers = []
+    for parse_file in parse_files:
+        module = importlib.import_module(_module_name(parse_file))
+        parent = pathlib.Path(parse_file).parent
+        for name in sorted(tested_classes(parent, class_name)):
+            folder = parent / 'tests' / name / 'cli' / 'equal'
+            local_class = getattr(module, name, None)
+            if local_class is None or not hasattr(local_class, 'cli') or \
+                    not folder.exists() or \
+                    (local_class, folder) in parsers:
+                continue
+            parsers.append((local_class, folder))
+    return parsers
+
+
+def benchmark_parser(local_class, folder, repeat=100, purge=False):
+    '''benchmark_parser
+
+    Parse every golden output of a parser `repeat` times
+
+        Args:
+            local_class (`class`): parser class
+            folder (`pathlib.Path`): folder of the golden outputs
+            repeat (`int`): number of calls per golden output
+            purge (`bool`): empty the `re` cache before every call
+
+        Returns:
+            dict: golden output name -> best and mean seconds per call
+    '''
+    results = {}
+    for output_file in sorted(glob.glob(f'{folder}/*_output.txt')):
+        name = pathlib.Path(output_file).name[:-len('_output.txt')]
+        output = read_from_file(output_file)
+        arguments = {}
+        arguments_file = folder / f'{name}_arguments.json'
+        if arguments_file.exists():
+            arguments = read_json_file(arguments_file)
+
+        results[name] = _time(local_class, output, arguments, repeat, purge)
+    return results
+
+
+def benchmark_table(local_class, output, repeat=10, method='cli',
+                    **arguments):
+    '''benchmark_table
+
+    Parse a synthetic table `repeat` times, with cli() by default: the
+    validation of the schema by parse() is left out
+
+        Args:
+            local_class (`class`): parser class
+            output (`str`): output of the table, see `synthetic_table`
+            repeat (`int`): number of calls
+            method (`str`): 'cli' or 'parse'
+            arguments (`dict`): arguments of the call, eg. format='columnar'
+
+        Returns:
+            dict: best and mean seconds per call
+    '''
+    return _time(local_class, output, arguments, repeat, method=method)
+
+
+def benchmark_memory(local_class, output, **arguments):
+    '''benchmark_memory
+
+    Trace the memory allocated by parse() on an output
+
+        Args:
+            local_class (`class`): parser class
+            output (`str`): the output, see `synthetic_table`
+            arguments (`dict`): arguments of the call, eg. format='columnar'
+
+        Returns:
+            dict: peak bytes allocated during the call and bytes still
+                  allocated after it, mostly the result
+    '''
+    obj = local_class(device=Mock())
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = obj.parse(output=output, **arguments)
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'peak': peak - before, 'size': size - before}
+
+
+def _time(local_class, output, arguments, repeat, purge=False,
+          method='parse'):
+    device = Mock(**{'execute.return_value': output,
+                     'expect.return_value': output})
+    obj = local_class(device=device)
+    if 'command' in getfullargspec(obj.cli).args:
+        arguments['command'] = ''
+    call = getattr(obj, method)
+
+    timings = []
+    for _ in range(repeat):
+        if purge:
+            re.purge()
+        start = perf_counter()
+        try:
+            call(**arguments)
+        except Exception:
+            # empty outputs and the like are timed as well
+            pass
+        timings.append(perf_counter() - start)
+    return {'best': min(timings), 'mean': sum(timings) / len(timings)}
+
+
+def _parse_args(args=None):
+    my_parser = argparse.ArgumentParser(
+        description='Time the parsers on their golden outputs')
+    my_parser.add_argument('-o', '--operating_system', type=str,
+                           help='The OS you wish to filter on')
+    my_parser.add_argument('-c', '--class_name', type=str,
+                           help='The Class you wish to filter on')
+    my_parser.add_argument('-t', '--token', type=str,
+                           help="The Token associated with the class, "
+                                "such as 'asr1k'")
+    my_parser.add_argument('-r', '--repeat', type=int, default=100,
+                           help='Number of calls per golden output')
+    my_parser.add_argument('--purge', action='store_true',
+                           help='Empty the re cache before every call')
+    my_parser.add_argument('--rows', type=int,
+                           help='Time the parsers of synthetic tables of '
+                                'this many rows instead')
+    my_parser.add_argument('--memory', action='store_true',
+                           help="With '--rows', compare the memory and time "
+                                "of the default and columnar formats")
+    return my_parser.parse_args(args)
+
+
+def _main_tables(args):
+    for operating_system, tables in TABLES.items():
+        if args.operating_system and \
+                operating_system != args.operating_system:
+            continue
+        for class_name in tables:
+            if args.class_name and class_name != args.class_name:
+                continue
+            module = importlib.import_module('{}.{}.{}'.format(
+                _parser.__name__, operating_system, tables[class_name][0]))
+            local_class = getattr(module, class_name)
+            output = synthetic_table(operating_system, class_name, args.rows)
+            if not args.memory:
+                result = benchmark_table(local_class, output, args.repeat)
+                print(f"{operating_system:<8} {class_name:<40} "
+                      f"{args.rows:>8} rows best {result['best']:8.3f} s "
+                      f"mean {result['mean']:8.3f} s")
+                continue
+            if 'format' not in getfullargspec(local_class.cli).args:
+                continue
+            for format in [None, 'columnar']:
+                result = benchmark_table(local_class, output, args.repeat,
+                                         method='parse', format=format)
+                result.update(benchmark_memory(local_class, output,
+                                               format=format))
+                print(f"{operating_system:<8} {class_name:<28} "
+                      f"{format or 'dict':<8} {args.rows:>8} rows "
+                      f"mean {result['mean']:8.3f} s "
+                      f"peak {result['peak'] / 2 ** 20:8.1f} MB "
+                      f"result {result['size'] / 2 ** 20:8.1f} MB")
+
+
+def main(args=None):
+    args = _parse_args(args)
+    if args.rows:
+        return _main_tables(args)
+    if not args.operating_system and not args.class_name:
+        sys.exit("Provide at least '-o' or '-c'")
+
+    total = 0
+    for operating_system in get_operating_systems(args.operating_system):
+        for local_class, folder in find_parsers(operating_system,
+                                                args.class_name, args.token):
+            results = benchmark_parser(local_class, folder, args.repeat,
+                                       args.purge)
+            for name, result in results.items():
+                total += result['mean']
+                print(f"{operating_system:<8} {local_class.__name__:<40} "
+                      f"{name:<28} best {result['best'] * 1e6:10.1f} us "
+                      f"mean {result['mean'] * 1e6:10.1f} us")
+    print(f'total mean per call set: {total * 1e3:.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
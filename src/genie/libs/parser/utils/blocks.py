@@ -0,0 +1,301 @@
+'''Parallel parsing of outputs made of a long run of independent blocks
+
+Outputs such as `show interfaces` or `show ip ospf database router` are
+mostly a run of blocks, one per interface, neighbor or LSA, which are parsed
+independently of each other. A parser declares where its blocks start with
+a BlockSplitter; its cli() takes a `workers` argument and hands the output
+to parse_blocks(), which cuts it into one batch of blocks per worker, parses
+the batches in a pool and returns the results in the order of the output,
+for merge_parsed() to merge them.
+
+    class ShowExample(ShowExampleSchema):
+
+        patterns = Patterns(...)
+        blocks = BlockSplitter(patterns, header=('p1',))
+
+        def cli(self, output=None, workers=None):
+            if workers:
+                return merge_parsed(parse_blocks(self, output, workers))
+            ...
+
+A parser whose result needs more than merging, eg. references between
+blocks, parses the batches with another method and does the rest on the
+merged results. parse_cached_blocks() parses the blocks one at a time and
+reuses the blocks parsed before from a BlockCache, for outputs polled
+again and again. BlockSplitter.select() keeps the blocks whose first line
+matches a predicate, for cli(where=...).
+'''
+
+# python
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# parser utils
+from genie.libs.parser.utils.scanner import LineScanner
+
+
+class BlockSplitter(object):
+    '''BlockSplitter
+
+    Cut an output at the first line of each of its blocks, matched against
+    the patterns of the parser once the line is stripped. A run of
+    consecutive header lines starts a single block, eg. an LSA starting
+    with either `Routing Bit Set on this LSA` or `LS age:`.
+
+    The blocks may depend on lines above them, eg. an LSA on the area of the
+    `Router Link States (Area 0)` line before it. The last line matching
+    each of the context patterns is repeated at the start of each batch, so
+    the batch is parsed in the same context as in the whole output.
+
+    Args:
+        patterns (`Patterns`): patterns of the parser
+        header (`iterable`): names of the patterns of the first line of a
+                             block
+        context (`iterable`): names of the patterns of the lines the blocks
+                              depend on
+    '''
+
+    def __init__(self, patterns, header, context=()):
+        self.header = tuple(header)
+        self.context = tuple(context)
+        self._scanner = LineScanner(patterns, self.header + self.context)
+
+    def split(self, output):
+        '''split
+
+        Cut an output into blocks
+
+            Args:
+                output (`str`): the output
+
+            Returns:
+                tuple: (lines before the first block, list of blocks), each
+                       block being a (context lines, block lines) tuple
+        '''
+        header = frozenset(self.header)
+        context = dict.fromkeys(self.context)
+        match = self._scanner.regex.match
+
+        preamble = lines = []
+        blocks = []
+        in_header = False
+        for line in output.splitlines():
+            m = match(line.strip())
+            name = m.lastgroup if m else None
+            if name in header:
+                if not in_header:
+                    lines = []
+                    blocks.append((tuple(value for value in context.values()
+                                         if value is not None), lines))
+                    in_header = True
+            else:
+                in_header = False
+                if name is not None:
+                    context[name] = line
+            lines.append(line)
+        return preamble, blocks
+
+    def select(self, output, keep):
+        '''select
+
+        Keep the blocks of an output whose first line is kept by a
+        predicate. A block is skipped from its first line on, its other
+        lines are only matched against the header and context patterns, to
+        find where the next block starts.
+
+            Args:
+                output (`str`): the output
+                keep (`function`): called with the groups of the first line
+                                   of a block, as a dict, True to keep the
+                                   block
+
+            Returns:
+                list: the outputs of the runs of consecutive blocks kept, in
+                      order, each preceded by its context lines, the lines
+                      before the first block starting the first output
+        '''
+        header = frozenset(self.header)
+        context = dict.fromkeys(self.context)
+        match = self._scanner.match
+
+        outputs = []
+        lines = []
+        kept = True
+        in_header = False
+        for line in output.splitlines():
+            name, m = match(line.strip())
+            if name in header:
+                if not in_header:
+                    in_header = True
+                    was_kept = kept
+                    kept = keep(m.groupdict())
+                    if kept and not was_kept:
+                        # the blocks in between are skipped
+                        if lines:
+                            outputs.append('\n'.join(lines))
+                        lines = [value for value in context.values()
+                                 if value is not None]
+            else:
+                in_header = False
+                if name is not None:
+                    context[name] = line
+            if kept:
+                lines.append(line)
+        if lines or not outputs:
+            outputs.append('\n'.join(lines))
+        return outputs
+
+    def batches(self, output, count):
+        '''batches
+
+        Cut an output into batches of consecutive blocks, of about the same
+        number of lines
+
+            Args:
+                output (`str`): the output
+                count (`int`): number of batches
+
+            Returns:
+                list: the outputs of the batches, in order
+        '''
+        preamble, blocks = self.split(output)
+        count = max(1, min(count, len(blocks)))
+        total = len(preamble) + sum(len(lines) for _, lines in blocks)
+
+        batches = []
+        batch = list(preamble)
+        size = len(preamble)
+        for context, lines in blocks:
+            if batch and size >= total * (len(batches) + 1) / count:
+                batches.append('\n'.join(batch))
+                batch = list(context)
+            batch.extend(lines)
+            size += len(lines)
+        if batch or not batches:
+            batches.append('\n'.join(batch))
+        return batches
+
+
+def _parse_batch(parser_class, method, kwargs, output):
+    # runs in the workers, the parser is not sent to them
+    return getattr(parser_class(device=None), method)(output=output,
+                                                      **kwargs)
+
+
+def _executor(workers):
+    # threads parse in parallel only on a free-threaded build
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    if gil_enabled():
+        return ProcessPoolExecutor(workers)
+    return ThreadPoolExecutor(workers)
+
+
+def parse_blocks(parser, output, workers=None, method='cli', executor=None,
+                 **kwargs):
+    '''parse_blocks
+
+    Parse the batches of blocks of an output in parallel, with a new
+    instance of the parser for each batch
+
+        Args:
+            parser (`MetaParser`): the parser, with a `blocks` BlockSplitter
+            output (`str`): the output
+            workers (`int`): number of batches to parse in parallel, the
+                             output is parsed in this process when below 2
+            method (`str`): method of the parser called with the output of
+                            each batch
+            executor (`Executor`): pool to parse the batches in, defaults to
+                                   a process pool (a thread pool on a
+                                   free-threaded build) of `workers` workers
+            kwargs: other arguments of the method
+
+        Returns:
+            list: results of the method for each batch, in order
+    '''
+    batches = parser.blocks.batches(output, workers) \
+        if workers and workers > 1 else [output]
+    if len(batches) < 2:
+        return [getattr(parser, method)(output=output, **kwargs)]
+
+    parse = [type(parser), method, kwargs]
+    args = [[arg] * len(batches) for arg in parse]
+    if executor is not None:
+        return list(executor.map(_parse_batch, *args, batches))
+    with _executor(workers) as executor:
+        return list(executor.map(_parse_batch, *args, batches))
+
+
+def parse_cached_blocks(parser, output, cache, method='cli', **kwargs):
+    '''parse_cached_blocks
+
+    Parse the blocks of an output one at a time, in this process. A block
+    already parsed with the same text, context and arguments is taken from
+    the cache instead of being parsed again, eg. an interface whose
+    counters did not change since the last poll.
+
+        Args:
+            parser (`MetaParser`): the parser, with a `blocks` BlockSplitter
+            output (`str`): the output
+            cache (`BlockCache`): the parsed blocks
+            method (`str`): method of the parser called with the output of
+                            each block
+            kwargs: other arguments of the method
+
+        Returns:
+            list: results of the method for the lines before the first block
+                  and for each block, in order
+    '''
+    preamble, blocks = parser.blocks.split(output)
+    if preamble:
+        blocks.insert(0, ((), preamble))
+
+    # the same text may be parsed differently by another parser
+    prefix = '{}.{}.{}\n{!r}\n'.format(
+        type(parser).__module__, type(parser).__qualname__, method,
+        sorted(kwargs.items()))
+    parse = getattr(parser, method)
+    make_key, get, put = cache.make_key, cache.get, cache.put
+
+    results = []
+    for context, lines in blocks:
+        text = '\n'.join(context + tuple(lines))
+        key = make_key(prefix + text)
+        result = get(key)
+        if result is None:
+            result = parse(output=text, **kwargs)
+            put(key, result)
+        results.append(result)
+    return results
+
+
+def merge_parsed(results):
+    '''merge_parsed
+
+    Merge the results of the batches of an output, in order: nested dicts
+    are merged, lists are concatenated and other values are replaced, as
+    if the whole output had been parsed at once
+
+        Args:
+            results (`iterable`): the results of the batches, in order
+
+        Returns:
+            dict: the merged result
+    '''
+    results = list(results)
+    if len(results) == 1:
+        return results[0]
+    merged = {}
+    for result in results:
+        _merge(merged, result)
+    return merged
+
+
+def _merge(merged, result):
+    for key, value in result.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            current.extend(value)
+        else:
+            merged[key] = value
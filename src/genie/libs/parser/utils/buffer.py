@@ -0,0 +1,151 @@
+'''Matching of a line pattern over a whole output at once
+
+Parsers of a single kind of record usually loop over the lines:
+
+    for line in out.splitlines():
+        line = line.strip()
+        m = p1.match(line)
+        if m:
+            ...
+
+which makes two strings and one call to the regex engine per line.
+finditer_lines() runs the same pattern once over the whole output and yields
+the match of each line it matches, with the groups of `p1`:
+
+    for m in finditer_lines(p1, out):
+        ...
+
+The pattern is rewritten to match within a single line of the output, as
+if the line had been stripped: the leading and trailing blanks are skipped,
+`$` is the end of the stripped line and `\\s`, `\\W`, `\\D` and negated
+classes do not match the end of a line. Lines end with `\\n`, `\\r\\n` or a
+lone `\\r` like with str.splitlines(), the other line boundaries of
+str.splitlines() are blanks.
+'''
+
+# python
+import re
+import functools
+
+# the characters of \s but the end of a line
+_BLANK = (r'\t\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029'
+          r'\u202f\u205f\u3000')
+
+# replacements of the escapes which match the end of a line
+_ESCAPES = {'s': '[{}]'.format(_BLANK), 'W': r'[^\w\n]', 'D': r'[^\d\n]'}
+
+# end of the stripped line
+_END = r'(?<![{0}])(?=[{0}]*$)'.format(_BLANK)
+
+# a \r which is not the start of a \r\n
+_LONE_CR = re.compile(r'\r(?!\n)')
+
+# global inline flags, only allowed at the start of an expression
+_GLOBAL_FLAGS = re.compile(r'^\(\?[aiLmsux]+\)')
+
+
+def _line_source(source):
+    '''rewrite the source of a line pattern to match within a line'''
+    flags = _GLOBAL_FLAGS.match(source)
+    flags = flags.group() if flags else ''
+    source = source[len(flags):]
+    if source.startswith('^'):
+        source = source[1:]
+
+    parts = []
+    index = 0
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            escape = source[index + 1:index + 2]
+            if escape in _ESCAPES:
+                if not in_class:
+                    parts.append(_ESCAPES[escape])
+                elif escape == 's':
+                    parts.append(_BLANK)
+                elif not negated:
+                    raise ValueError('\\{} in a class cannot be matched over '
+                                     'a whole output: {}'.format(escape,
+                                                                 source))
+                else:
+                    parts.append(source[index:index + 2])
+            else:
+                parts.append(source[index:index + 2])
+            index += 2
+            continue
+        if in_class:
+            if char == ']':
+                if negated:
+                    parts.append('\\n')
+                in_class = False
+        elif char == '[':
+            in_class = True
+            negated = source[index + 1:index + 2] == '^'
+            if negated:
+                parts.append('[^')
+                index += 2
+            else:
+                parts.append('[')
+                index += 1
+            # a ] right after [ or [^ is part of the class
+            if source[index:index + 1] == ']':
+                parts.append(']')
+                index += 1
+            continue
+        elif char == '$':
+            parts.append(_END)
+            index += 1
+            continue
+        elif char == '^':
+            raise ValueError('^ is only supported at the start of the '
+                             'pattern: {}'.format(source))
+        parts.append(char)
+        index += 1
+
+    # there is no line after the last end of line. The leading blanks of a
+    # blank line are not skipped, the match cannot end after them anyway.
+    # The match cannot end in the blanks at the end of the line, as they are
+    # not part of the stripped line
+    return (r'{flags}^(?!\Z)(?:[{blank}]*(?![{blank}])(?!$)|'
+            r'(?=[{blank}]*$))(?:{body})'
+            r'(?:(?<![{blank}])|(?![{blank}]*$))').format(
+                flags=flags, blank=_BLANK, body=''.join(parts))
+
+
+@functools.lru_cache(maxsize=256)
+def buffer_pattern(pattern):
+    '''buffer_pattern
+
+    Build the pattern matching a line pattern over a whole output
+
+        Args:
+            pattern (`re.Pattern`): pattern matched against stripped lines
+
+        Returns:
+            re.Pattern: the pattern for finditer() over the output
+    '''
+    if pattern.flags & re.DOTALL:
+        raise ValueError('a DOTALL pattern cannot be matched over a whole '
+                         'output: {}'.format(pattern.pattern))
+    return re.compile(_line_source(pattern.pattern),
+                      pattern.flags | re.MULTILINE)
+
+
+def finditer_lines(pattern, output):
+    '''finditer_lines
+
+    Match a line pattern against each line of an output, in a single pass
+    of the regex engine over the output
+
+        Args:
+            pattern (`re.Pattern`): pattern matched against stripped lines
+            output (`str`): the output
+
+        Returns:
+            iterator: the match of each line the pattern matches, in order
+    '''
+    if '\r' in output:
+        # the pattern only ends the lines at \n
+        output = _LONE_CR.sub('\n', output)
+    return buffer_pattern(pattern).finditer(output)
@@ -0,0 +1,353 @@
+'''Caches used by the parser lookup and by the parsers'''
+
+# python
+import pickle
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+
+# default number of entries kept by the get_parser resolution cache
+RESOLUTION_CACHE_SIZE = 4096
+
+# default number of blocks kept by a BlockCache
+BLOCK_CACHE_SIZE = 16384
+
+# default number of bytes of pickled outputs kept by a ParseCache
+PARSE_CACHE_BYTES = 64 * 1024 * 1024
+
+# generations of the parser data, unique across loads and updates
+_generations = itertools.count(1)
+
+
+def freeze_tokens(tokens):
+    '''return a hashable version of an abstract tokens dict'''
+    frozen = []
+    for key, value in sorted(tokens.items()):
+        if isinstance(value, (list, tuple)):
+            value = tuple(value)
+        frozen.append((key, value))
+    return tuple(frozen)
+
+
+def track_updates(data):
+    '''track_updates
+
+    Give a loaded parser data a new `generation`, and a new one again after
+    each of its updates with `data.update()`, for what is built from the
+    data to know when it is outdated
+
+        Args:
+            data (`AbstractTree`): the parser data
+
+        Returns:
+            AbstractTree: the parser data
+    '''
+    update = data.update
+
+    def tracked_update(*args, **kwargs):
+        try:
+            return update(*args, **kwargs)
+        finally:
+            data.generation = next(_generations)
+
+    data.update = tracked_update
+    data.generation = next(_generations)
+    return data
+
+
+def data_generation(data):
+    '''return the generation of the parser data, see track_updates, or its
+       number of commands for a data which is not tracked'''
+    generation = getattr(data, 'generation', None)
+    if generation is None:
+        return len(data.nodes)
+    return generation
+
+
+class ResolutionCache(object):
+    '''ResolutionCache
+
+    Bounded LRU cache of get_parser resolutions, keyed by the normalized
+    command and the device abstraction tokens. Each entry holds the matched
+    command, the parser class and the parser kwargs.
+
+    The cache is bound to the parser data it was filled from, it is emptied
+    as soon as that data is replaced or updated, see track_updates.
+
+    Args:
+        maxsize (`int`): maximum number of entries, 0 disables the cache
+    '''
+
+    def __init__(self, maxsize=RESOLUTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._source = None
+        self._source_generation = None
+
+    @staticmethod
+    def make_key(command, tokens):
+        '''build the cache key of a command and abstract tokens dict'''
+        return ' '.join(command.split()), freeze_tokens(tokens)
+
+    def _check_source(self, data):
+        # must be called with the lock held
+        generation = data_generation(data)
+        if self._source is not data or \
+                self._source_generation != generation:
+            self._entries.clear()
+            self._source = data
+            self._source_generation = generation
+
+    def get(self, key, data):
+        '''get
+
+        Return the cached (command, parser class, kwargs) entry of the key, the
+        kwargs are a copy which the caller is free to modify.
+
+            Args:
+                key (`tuple`): key built by `make_key`
+                data (`AbstractTree`): current parser data
+
+            Returns:
+                tuple: (command, parser class, kwargs)
+                None: key is not cached
+        '''
+        with self._lock:
+            self._check_source(data)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        command, parser_class, kwargs = entry
+        return command, parser_class, dict(kwargs)
+
+    def put(self, key, entry, data):
+        '''store a (command, parser class, kwargs) entry'''
+        if self.maxsize <= 0:
+            return
+
+        command, parser_class, kwargs = entry
+        with self._lock:
+            self._check_source(data)
+            self._entries[key] = (command, parser_class, dict(kwargs))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        '''remove all entries and reset the statistics'''
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        '''return the cache statistics'''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _PickledCache(object):
+    '''_PickledCache
+
+    Bounded LRU cache of pickled entries, each `get` returns a new copy
+    which the caller is free to modify. The least recently used entries
+    are evicted once the weight of the entries is over `limit`.
+
+    Args:
+        limit (`int`): maximum weight of the entries, 0 disables the cache
+    '''
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self._weight = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def weigh(entry):
+        '''return the weight of a pickled entry'''
+        return 1
+
+    def get(self, key):
+        '''get
+
+        Return a copy of the entry of the key
+
+            Args:
+                key: key built by `make_key`
+
+            Returns:
+                the entry
+                None: key is not cached
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(entry)
+
+    def put(self, key, parsed):
+        '''store an entry, unless it weighs more than the cache'''
+        if self.limit <= 0:
+            return
+
+        entry = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        weight = self.weigh(entry)
+        if weight > self.limit:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= self.weigh(previous)
+            self._entries[key] = entry
+            self._weight += weight
+            while self._weight > self.limit:
+                _, evicted = self._entries.popitem(last=False)
+                self._weight -= self.weigh(evicted)
+
+    def clear(self):
+        '''remove all entries and reset the statistics'''
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        '''return the cache statistics'''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class BlockCache(_PickledCache):
+    '''BlockCache
+
+    Bounded LRU cache of the parsed blocks of outputs, keyed by a digest of
+    the text of each block, for outputs polled again and again of which
+    only a few blocks change between two polls, eg. the counters of some
+    interfaces. The entries are kept pickled, each `get` returns a new copy
+    which the caller is free to modify.
+
+    The cache has to hold all the blocks of an output for the next poll to
+    find them, eg. one per interface of the device.
+
+    Args:
+        maxsize (`int`): maximum number of blocks, 0 disables the cache
+    '''
+
+    def __init__(self, maxsize=BLOCK_CACHE_SIZE):
+        super().__init__(maxsize)
+
+    @property
+    def maxsize(self):
+        return self.limit
+
+    @staticmethod
+    def make_key(text):
+        '''build the cache key of the text of a block'''
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def info(self):
+        '''return the cache statistics'''
+        info = super().info()
+        info['maxsize'] = self.maxsize
+        return info
+
+
+def _is_literal(value):
+    '''whether a value is made of literals only, its repr is then the same
+       for equal values'''
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(map(_is_literal, value))
+    if isinstance(value, dict):
+        return all(_is_literal(key) and _is_literal(item)
+                   for key, item in value.items())
+    return False
+
+
+class ParseCache(_PickledCache):
+    '''ParseCache
+
+    Bounded LRU cache of parsed outputs, keyed by the parser class, the
+    arguments of `parse()` and a digest of the output, for the outputs parsed
+    more than once in a run, eg. by a distributor and the parser it hands the
+    output to, or by a verification retried on an unchanged output.
+
+    The entries are kept pickled, each `get` returns a new copy which the
+    caller is free to modify. The least recently used entries are evicted
+    once the pickled entries take more than `maxbytes`.
+
+    Args:
+        maxbytes (`int`): maximum size of the pickled entries, 0 disables
+                          the cache
+    '''
+
+    def __init__(self, maxbytes=PARSE_CACHE_BYTES):
+        super().__init__(maxbytes)
+
+    @property
+    def maxbytes(self):
+        return self.limit
+
+    weigh = staticmethod(len)
+
+    @staticmethod
+    def make_key(parser_class, kwargs, output):
+        '''make_key
+
+        Build the cache key of a parsed output
+
+            Args:
+                parser_class (`type`): class of the parser
+                kwargs (`dict`): arguments of `parse()`, but the output
+                output (`str`): the output
+
+            Returns:
+                tuple: the key
+                None: an argument is not made of literals, eg. an object
+                      whose repr holds its id, the output is not cached
+        '''
+        if not _is_literal(kwargs):
+            return None
+        return ('{}.{}'.format(parser_class.__module__,
+                               parser_class.__qualname__),
+                repr(sorted(kwargs.items())),
+                hashlib.blake2b(output.encode(), digest_size=16).digest())
+
+    def info(self):
+        '''return the cache statistics'''
+        info = super().info()
+        with self._lock:
+            info['bytes'] = self._weight
+        info['maxbytes'] = self.maxbytes
+        return info
@@ -0,0 +1,58 @@
+'''Schema of a single call of a parser
+
+parse() validates the output of cli() against the schema of the parser. A
+cli() which returns another structure for some of its arguments, eg. a
+ColumnarTable for `format='columnar'` or a projection for `fields=`, sets
+the schema of that call with set_call_schema(). The parser inherits from
+CallSchema, whose parse() restores the schema of the class once the output
+is validated, so the next call is validated against the full schema again:
+
+    class ShowExample(CallSchema, ShowExampleSchema):
+
+        def cli(self, output=None, format=None):
+            ...
+            if format == 'columnar':
+                set_call_schema(self, None)
+                return table
+            return ret_dict
+'''
+
+# the instance attribute set by set_call_schema()
+_OVERRIDDEN = '_call_schema'
+
+
+class CallSchema(object):
+    '''CallSchema
+
+    Mixin of the parsers whose cli() sets the schema of its call with
+    set_call_schema(), the schema of the class is restored once parse()
+    returns
+    '''
+
+    def parse(self, **kwargs):
+        # a schema left by a direct call of cli()
+        restore_schema(self)
+        try:
+            return super().parse(**kwargs)
+        finally:
+            restore_schema(self)
+
+
+def set_call_schema(parser, schema):
+    '''set_call_schema
+
+    Validate the output of the current call of cli() against `schema`
+
+        Args:
+            parser (`MetaParser`): the parser, a CallSchema
+            schema (`dict`): schema of the output, None to skip the
+                             validation
+    '''
+    parser.schema = schema
+    setattr(parser, _OVERRIDDEN, True)
+
+
+def restore_schema(parser):
+    '''restore the schema of the class of a parser'''
+    if parser.__dict__.pop(_OVERRIDDEN, False):
+        parser.__dict__.pop('schema', None)
@@ -0,0 +1,245 @@
+'''Columnar results for the parsers of very large tables
+
+A parser of a large table, eg. the MAC address table or the ARP table of a
+big switch, builds a nested dict per entry, which takes hundreds of bytes.
+With `format='columnar'` such a parser returns a ColumnarTable instead: the
+values of each field of the entries in a column, integers in an array and
+strings interned in a StringColumn.
+
+    table = ShowIpArp(device=device).parse(format='columnar')
+    table['address'][0], table.row(0)['mac'], table.nrows
+    parsed = table.to_dict()  # the structure of the schema
+
+The parser adds an entry to a dict of its schema with a function, used both
+to parse in the default format and by to_dict():
+
+    @staticmethod
+    def _add_entry(ret_dict, address, mac, ...):
+        ...
+
+    def cli(self, output=None, format=None):
+        ...
+        if format == 'columnar':
+            table = ColumnarTable(['address', 'mac', ...],
+                                  add_entry=self._add_entry)
+            add = table.append
+        else:
+            ret_dict = {}
+            add = functools.partial(self._add_entry, ret_dict)
+        for m in finditer_lines(p1, out):
+            add(m.group('address'), m.group('mac'), ...)
+        if format == 'columnar':
+            return columnar_result(self, table)
+        return ret_dict
+
+columnar_result() skips the schema validation of that call only, the
+parser inherits from CallSchema.
+
+The integer columns are NumPy arrays once the table is complete, when
+NumPy is installed (`pip install genie.libs.parser[columnar]`).
+'''
+
+# python
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# parser utils
+from genie.libs.parser.utils.call_schema import set_call_schema
+
+
+class StringColumn(object):
+    '''StringColumn
+
+    Column of strings, each distinct string is kept once and the column
+    holds its index. A missing value is None.
+    '''
+
+    __slots__ = ('values', 'codes', '_codes')
+
+    def __init__(self):
+        # the distinct strings, None first
+        self.values = [None]
+        self.codes = array('I')
+        self._codes = {None: 0}
+
+    def append(self, value):
+        '''add the value of the next row'''
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+    def __iter__(self):
+        values = self.values
+        return (values[code] for code in self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return 'StringColumn({!r})'.format(list(self))
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+
+class ColumnarRow(object):
+    '''ColumnarRow
+
+    Row of a ColumnarTable, read as a mapping of the names of the columns
+    to the values of the row, None for a missing value
+    '''
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, name):
+        table = self._table
+        value = table[name][self._index]
+        if name in table.integers:
+            value = int(value)
+            if value == table.missing:
+                return None
+        return value
+
+    def keys(self):
+        return self._table.keys()
+
+    def values(self):
+        return [self[name] for name in self._table]
+
+    def items(self):
+        return [(name, self[name]) for name in self._table]
+
+    def __repr__(self):
+        return 'ColumnarRow({!r})'.format(dict(self.items()))
+
+
+class ColumnarTable(dict):
+    '''ColumnarTable
+
+    Columns of the entries of a table, by name. Integer columns are arrays,
+    NumPy arrays once the table is frozen if NumPy is installed, the other
+    columns are StringColumns.
+
+    Args:
+        columns (`list`): names of the columns, in the order of the
+                          arguments of `append` and of `add_entry`
+        integers (`list`): names of the integer columns, a missing integer
+                           is stored as `missing`
+        add_entry (`function`): function adding the values of a row to a dict
+                                of the schema of the parser, for to_dict()
+        missing (`int`): stored value of a missing integer
+    '''
+
+    def __init__(self, columns, integers=(), add_entry=None, missing=-1):
+        super().__init__((name, array('q') if name in integers
+                          else StringColumn()) for name in columns)
+        self.integers = tuple(integers)
+        self.add_entry = add_entry
+        self.missing = missing
+        self.nrows = 0
+
+    def append(self, *values):
+        '''add a row, a value per column'''
+        missing = self.missing
+        for column, value in zip(self.values(), values):
+            if value is None and isinstance(column, array):
+                value = missing
+            column.append(value)
+        self.nrows += 1
+
+    def freeze(self):
+        '''turn the integer columns into NumPy arrays, the table is then
+        complete
+
+            Returns:
+                ColumnarTable: the table
+        '''
+        if numpy is not None:
+            for name in self.integers:
+                column = self[name]
+                if isinstance(column, array):
+                    self[name] = numpy.frombuffer(column, dtype=numpy.int64)
+        return self
+
+    def row(self, index):
+        '''row(index) -> ColumnarRow'''
+        if not -self.nrows <= index < self.nrows:
+            raise IndexError('row index out of range')
+        return ColumnarRow(self, index % self.nrows)
+
+    def rows(self):
+        '''iterate over the rows'''
+        return (ColumnarRow(self, index) for index in range(self.nrows))
+
+    def to_dict(self):
+        '''to_dict
+
+        Build the structure of the schema of the parser from the rows
+
+            Returns:
+                dict: the structure the parser returns in the default format
+        '''
+        ret_dict = {}
+        add_entry = self.add_entry
+        missing = self.missing
+        integers = [name in self.integers for name in self]
+        columns = [[None if integer and value == missing else
+                    (int(value) if integer else value) for value in column]
+                   for integer, column in zip(integers, self.values())]
+        for values in zip(*columns):
+            add_entry(ret_dict, *values)
+        return ret_dict
+
+    def __reduce__(self):
+        return (_rebuild_table,
+                (list(self), self.integers, self.add_entry, self.missing,
+                 self.nrows, list(self.values())))
+
+
+def _rebuild_table(columns, integers, add_entry, missing, nrows, values):
+    table = ColumnarTable(columns, integers, add_entry, missing)
+    table.update(zip(columns, values))
+    table.nrows = nrows
+    return table
+
+
+def columnar_result(parser, table):
+    '''columnar_result
+
+    Return a ColumnarTable from the cli() of a parser, the table is not
+    validated against the schema of the parser, which describes the
+    structure of to_dict(). The next calls are validated again
+
+        Args:
+            parser (`MetaParser`): the parser, a CallSchema
+            table (`ColumnarTable`): the table the parser filled
+
+        Returns:
+            ColumnarTable: the table, frozen
+            dict: empty dict when the table has no rows, which the parser
+                  reports as an empty output
+    '''
+    if not table.nrows:
+        return {}
+    set_call_schema(parser, None)
+    return table.freeze()
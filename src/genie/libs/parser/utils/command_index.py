@@ -0,0 +1,362 @@
+'''Token trie index over parser command templates'''
+
+# python
+import re
+import bisect
+import threading
+
+from .cache import freeze_tokens, data_generation
+
+# arguments which can only consume a single search token, must stay in sync
+# with the list used by `_matches_fuzzy`
+SINGLE_TOKEN_ARGUMENTS = frozenset([
+    'vrf',
+    'rd',
+    'instance',
+    'vrf_type',
+    'feature',
+    'fileA',
+    'fileB',
+])
+
+
+class _TrieNode(object):
+    '''A single token position of the command trie'''
+
+    __slots__ = ('literals', 'wildcards', 'commands', '_sorted')
+
+    def __init__(self):
+        # literal command token -> child node
+        self.literals = {}
+        # argument command token ({vrf}, /api/{interface}, ...) ->
+        # (argument name, prefix, suffix, child node)
+        self.wildcards = {}
+        # (insertion index, command) of commands ending on this node
+        self.commands = []
+        # sorted literal keys, built lazily for prefix lookups
+        self._sorted = None
+
+    def prefixed(self, token):
+        '''yield the child nodes whose literal token starts with `token`'''
+        if self._sorted is None:
+            self._sorted = sorted(self.literals)
+        keys = self._sorted
+        index = bisect.bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.literals[keys[index]]
+            index += 1
+
+
+class CommandTrie(object):
+    '''CommandTrie
+
+    Token trie built from the parser command templates. Literal command tokens
+    are edges, `{argument}` slots are wildcard edges and a search token also
+    follows every literal edge it is a prefix of (`sh ver` -> `show version`).
+
+    `candidates()` returns the commands that can possibly be matched by a
+    search in time proportional to the search length. It never drops a command
+    that `_matches_fuzzy` would accept in non fuzzy mode, the final matching,
+    scoring and ambiguity rules are still done by `_fuzzy_search_command`.
+
+    Args:
+        commands (`iterable`): command templates, in lookup order
+        source (`object`): the parser data the commands were taken from
+    '''
+
+    def __init__(self, commands=(), source=None):
+        self.root = _TrieNode()
+        self.size = 0
+        self.source = source
+        self.source_size = None
+        self._token_index = None
+        for command in commands:
+            self.add(command)
+
+    @classmethod
+    def from_data(cls, data):
+        '''build the trie from a parser data AbstractTree'''
+        trie = cls(data, source=data)
+        trie.source_size = len(data.nodes)
+        return trie
+
+    def is_built_for(self, data):
+        '''whether the trie is up to date with the given parser data'''
+        return self.source is data and self.source_size == len(data.nodes)
+
+    def add(self, command):
+        '''add a command template to the trie'''
+        # ! Same band-aid as _fuzzy_search_command
+        if command is None:
+            return
+
+        node = self.root
+        for token in command.split():
+            if '{' in token:
+                child = node.wildcards.get(token)
+                if child is None:
+                    name = re.search(r'{(.*)}', token).groups()[0]
+                    prefix, suffix = re.match(r'(.*){.*?}(.*)', token).groups()
+                    child = (name, prefix, suffix, _TrieNode())
+                    node.wildcards[token] = child
+                node = child[3]
+            else:
+                child = node.literals.get(token)
+                if child is None:
+                    child = node.literals[token] = _TrieNode()
+                    node._sorted = None
+                node = child
+
+        node.commands.append((self.size, command))
+        self.size += 1
+        self._token_index = None
+
+    def candidates(self, tokens):
+        '''candidates
+
+        Find all commands which can be matched by the search tokens
+
+            Args:
+                tokens (`list`): the search tokens
+
+            Returns:
+                list: candidate commands, in the order they were added
+        '''
+        found = []
+        seen = set()
+        stack = [(self.root, 0)]
+        length = len(tokens)
+
+        while stack:
+            node, i = stack.pop()
+            key = (id(node), i)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if i == length:
+                found.extend(node.commands)
+                continue
+
+            token = tokens[i]
+
+            # Literal command tokens, exact or abbreviated
+            for child in node.prefixed(token):
+                stack.append((child, i + 1))
+
+            # Argument command tokens
+            for name, prefix, suffix, child in node.wildcards.values():
+                if prefix:
+                    # Argument embedded in a token, needs a perfect match
+                    if token.startswith(prefix) and token.endswith(suffix):
+                        stack.append((child, i + 1))
+                    continue
+
+                stack.append((child, i + 1))
+                # Argument can span up to 2 tokens
+                if name not in SINGLE_TOKEN_ARGUMENTS and i + 2 <= length:
+                    stack.append((child, i + 2))
+
+        found.sort()
+        return [command for _, command in found]
+
+    def prefix_candidates(self, tokens):
+        '''prefix_candidates
+
+        Find all commands which start with something matched by the search
+        tokens, used when the rest of the search is a regex expression
+
+            Args:
+                tokens (`list`): the leading search tokens
+
+            Returns:
+                list: (position, command) of the candidate commands, in the
+                      order they were added
+        '''
+        found = []
+        seen = set()
+        stack = [(self.root, 0)]
+        length = len(tokens)
+        ends = []
+
+        while stack:
+            node, i = stack.pop()
+            key = (id(node), i)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if i == length:
+                ends.append(node)
+                continue
+
+            token = tokens[i]
+            for child in node.prefixed(token):
+                stack.append((child, i + 1))
+
+            for name, prefix, suffix, child in node.wildcards.values():
+                if prefix:
+                    if token.startswith(prefix) and token.endswith(suffix):
+                        stack.append((child, i + 1))
+                    continue
+
+                stack.append((child, i + 1))
+                if name not in SINGLE_TOKEN_ARGUMENTS and i + 2 <= length:
+                    stack.append((child, i + 2))
+
+        # Every command below the reached nodes is a candidate
+        visited = set()
+        while ends:
+            node = ends.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            found.extend(node.commands)
+            ends.extend(node.literals.values())
+            ends.extend(child[3] for child in node.wildcards.values())
+
+        found.sort()
+        return found
+
+    def token_index(self):
+        '''token_index
+
+        Inverted index of the literal command tokens, built on first use
+
+            Returns:
+                tuple: (literal token -> commands containing it,
+                        commands with an argument embedded in a token)
+        '''
+        index = getattr(self, '_token_index', None)
+        if index is None:
+            postings = {}
+            embedded = set()
+            stack = [(self.root, (), False)]
+            while stack:
+                node, path, is_embedded = stack.pop()
+                for _, command in node.commands:
+                    for token in set(path):
+                        postings.setdefault(token, set()).add(command)
+                    if is_embedded:
+                        embedded.add(command)
+                for token, child in node.literals.items():
+                    stack.append((child, path + (token,), is_embedded))
+                for _, prefix, _, child in node.wildcards.values():
+                    stack.append((child, path, is_embedded or bool(prefix)))
+            index = self._token_index = (postings, embedded)
+        return index
+
+
+class CommandView(object):
+    '''CommandView
+
+    Commands of the parser data which are available for one set of device
+    abstraction tokens.
+
+    Args:
+        commands (`tuple`): commands without argument
+        argument_commands (`dict`): command with arguments -> argument names
+        tokens (`dict`): abstraction tokens of the view
+        resolver (`callable`): resolver(command, tokens) returning the parser
+                               class of a command, or None
+    '''
+
+    def __init__(self, commands, argument_commands, tokens, resolver):
+        self.commands = commands
+        self.argument_commands = argument_commands
+        self.tokens = tokens
+        self._resolver = resolver
+        self._classes = {}
+
+    def parser_class(self, command):
+        '''return the parser class of a command, resolved once per view'''
+        try:
+            return self._classes[command]
+        except KeyError:
+            parser_cls = self._classes[command] = \
+                self._resolver(command, self.tokens)
+            return parser_cls
+
+    def parser_classes(self, commands=None):
+        '''return {command: parser class} for the given commands, defaults to
+           all the commands without argument'''
+        if commands is None:
+            commands = self.commands
+        return {command: self.parser_class(command) for command in commands}
+
+
+class CommandViews(object):
+    '''CommandViews
+
+    Cache of CommandView per abstraction tokens. The commands of an os are
+    extracted from the parser data once and shared by all the views of that
+    os. All views are dropped when the parser data is replaced or updated.
+    '''
+
+    def __init__(self):
+        self._source = None
+        self._source_generation = None
+        self._partitions = {}
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def _partition(self, data, os):
+        # must be called with the lock held
+        partition = self._partitions.get(os)
+        if partition is None:
+            # the tokens before os in the token order, eg. origin, are not
+            # set for the parsers of the data, their value is None
+            depth = data.order.index('os') if 'os' in data.order else 0
+            commands = []
+            argument_commands = {}
+            for command, values in data.items():
+                if command is None or command == 'tokens':
+                    continue
+                for _ in range(depth):
+                    values = values[None] if None in values else ()
+                if os not in values:
+                    continue
+                if '{' in command:
+                    argument_commands[command] = tuple(
+                        re.findall(r'{(.*?)}', command))
+                else:
+                    commands.append(command)
+            partition = self._partitions[os] = (tuple(commands),
+                                                argument_commands)
+        return partition
+
+    def get(self, data, os, tokens, resolver):
+        '''get
+
+        Return the CommandView of a device
+
+            Args:
+                data (`AbstractTree`): parser data
+                os (`str`): os of the device, used to select the commands
+                tokens (`dict`): abstraction tokens of the device
+                resolver (`callable`): see CommandView
+
+            Returns:
+                CommandView
+        '''
+        key = (os, freeze_tokens(tokens))
+        with self._lock:
+            generation = data_generation(data)
+            if self._source is not data or \
+                    self._source_generation != generation:
+                self._partitions.clear()
+                self._views.clear()
+                self._source = data
+                self._source_generation = generation
+
+            view = self._views.get(key)
+            if view is None:
+                commands, argument_commands = self._partition(data, os)
+                view = self._views[key] = CommandView(
+                    commands, argument_commands, dict(tokens), resolver)
+            return view
+
+    def clear(self):
+        with self._lock:
+            self._partitions.clear()
+            self._views.clear()
@@ -4,23 +4,34 @@
 import re
 import os
 import sys
+import gc
 import json
 import math
+import time
 import logging
+import functools
+import collections
 import warnings
+import threading
 import importlib
 import pkg_resources
 from packaging import version
 from inspect import getfullargspec
 from json.decoder import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
 
 from pyats.log.utils import banner
 from pyats.configuration import configuration as cfg
 
 from genie.abstract.package import AbstractTree, DEFAULT_ABSTRACT_ORDER
 from genie.abstract import Lookup
+from genie.metaparser import MetaParser
 
 from .extension import ExtendParsers
+from .command_index import CommandTrie, CommandViews
+from .cache import ResolutionCache, ParseCache, PARSE_CACHE_BYTES, \
+    track_updates
+from .patterns import Patterns
 
 PARSER_MODULE_NAME = 'genie.libs.parser'
 ENTRY_POINT_NAME = PARSER_MODULE_NAME
@@ -35,6 +46,13 @@ except:
     INTERNAL = False
 
 parser_data = None
+_parser_data_lock = threading.RLock()
+command_index = None
+resolution_cache = ResolutionCache()
+# opt-in cache of the parsed outputs, see enable_parse_cache()
+parse_cache = None
+_metaparser_parse = MetaParser.parse
+command_views = CommandViews()
 
 INTERFACE_ABBREVIATION_MAPPING_TABLE = {
     # Please add more when face other type of interface
@@ -148,10 +166,74 @@ class ParserNotFound(Exception):
         )
 
 
+class AmbiguousParserSearch(Exception):
+    '''raise exception if a search matches several parser commands'''
+
+
+def get_parser_data():
+    '''Return the parser data, loading it on first use
+
+    The data is loaded only once even when many threads ask for it at the
+    same time.
+    '''
+    data = parser_data
+    if data is None:
+        with _parser_data_lock:
+            # another thread may have loaded it while waiting for the lock
+            data = parser_data
+            if data is None:
+                data = _load_parser_json()
+    return data
+
+
+def preload(freeze=False):
+    '''Load the parser data and the command index ahead of time
+
+    Call it in the parent process before forking workers, the children then
+    share the loaded data copy-on-write instead of loading it again.
+
+        Args:
+            freeze (`bool`): move all objects to the permanent generation of
+                             the garbage collector (gc.freeze) so that
+                             collections in the children do not write to the
+                             shared pages
+
+        Returns:
+            AbstractTree: the parser data
+    '''
+    data = get_parser_data()
+    _get_command_index(data)
+    if freeze:
+        gc.freeze()
+    return data
+
+
+def _reset_locks():
+    '''re-create the locks in a forked child, a lock held by another thread
+       at fork time would never be released there'''
+    global _parser_data_lock
+    _parser_data_lock = threading.RLock()
+    resolution_cache._lock = threading.Lock()
+    command_views._lock = threading.Lock()
+    if parse_cache is not None:
+        parse_cache._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
 def _load_parser_json():
     '''get all parser data in json file'''
+    with _parser_data_lock:
+        return _read_parser_json()
+
+
+def _read_parser_json():
+    '''read all parser data, must be called with _parser_data_lock held'''
 
     global parser_data
+    global command_index
 
     try:
         mod = importlib.import_module(PARSER_MODULE_NAME)
@@ -176,13 +258,15 @@ def _load_parser_json():
             log.error(banner("parser json file could be corrupted. "
                                 "Please try 'make json'"))
             raise
-    parser_data = AbstractTree.from_json(json_data,
-                                            package=PARSER_MODULE_NAME,
-                                            feature='parser')
-    if parser_data.order != token_order:
+    # Build the data locally, it is only published once fully extended so
+    # that get_parser_data never returns a partial tree
+    data = AbstractTree.from_json(json_data,
+                                  package=PARSER_MODULE_NAME,
+                                  feature='parser')
+    if data.order != token_order:
         raise KeyError('Loaded token order from json does not match '
                         'package token order\n{} != {}'.\
-                            format(parser_data.order, token_order))
+                            format(data.order, token_order))
 
     # check if provided external parser packages
     PYATS_EXT_PARSER_ENV_VAR = PYATS_EXT_PARSER.upper().replace('.', '_')
@@ -204,7 +288,7 @@ def _load_parser_json():
             log.warning(
                 f'{ep.name}: callable parser loading is deprecated. '
                 'Please create an abstracted package instead.')
-            _load_parser_callable(parser_package, parser_data)
+            _load_parser_callable(parser_package, data)
         else:
             ext_parser_packages.append(ep.module_name)
 
@@ -222,14 +306,27 @@ def _load_parser_json():
         extend_matrix = AbstractTree.from_json(ext.output,
                                                 package=PARSER_MODULE_NAME,
                                                 feature='parser')
-        parser_data.update(extend_matrix)
+        data.update(extend_matrix)
 
         log.debug("External parser {} counts: {}\nSummary:\n{}".format(
             ext_parser_package,
             len(extend_info),
             json.dumps(extend_info, indent=2)))
 
-    return parser_data
+    command_index = CommandTrie.from_data(data)
+    parser_data = track_updates(data)
+
+    return data
+
+
+def _get_command_index(data):
+    '''return the command trie of the given parser data, (re)building it when
+       the data has changed since the trie was built'''
+    global command_index
+
+    if command_index is None or not command_index.is_built_for(data):
+        command_index = CommandTrie.from_data(data)
+    return command_index
 
 
 def _load_parser_callable(package, parser_data):
@@ -267,17 +364,152 @@ def get_parser_commands(device, data=None):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
-    global parser_data
+    return list(get_command_view(device, data).commands)
+
+
+def get_command_view(device, data=None):
+    '''Return the commands available for a device
+
+    The commands of each os are computed once, and the view of each set of
+    device abstraction tokens is cached until the parser data changes.
+
+        Args:
+            device (`Device`): the device
+            data (`AbstractTree`): parser data, defaults to the loaded one
+
+        Returns:
+            CommandView: with attributes
+                commands: commands without argument
+                argument_commands: dict of command -> argument names
+                and methods parser_class(command) and parser_classes()
+                to get the parser classes of this device
+    '''
     if data is None:
-        if parser_data is None:
-            data = _load_parser_json()
-        else:
-            data = parser_data
+        data = get_parser_data()
+
+    try:
+        tokens = _get_device_tokens(device, data)
+    except (AttributeError, TypeError):
+        # a device with only its os set, the view is then only filtered by
+        # os as get_parser_commands always did
+        tokens = {'os': device.os}
+    return command_views.get(data, device.os, tokens, _get_parser_cls)
+
+
+def warm_parsers(device=None,
+                 tokens=None,
+                 commands=None,
+                 max_workers=None,
+                 wait=True):
+    '''warm_parsers
+
+    Import the parser modules of a device ahead of time, on a thread pool, so
+    that the first get_parser of each command does not pay for the import of
+    its (possibly very large) parser module nor for the compilation of its
+    class level patterns.
+
+        Args:
+            device (`Device`): the device, its abstraction tokens are used
+            tokens (`dict`): abstraction tokens to use instead of a device,
+                             must contain `os`
+            commands (`list`): commands to warm up, defaults to all the
+                               commands of the device, see get_command_view
+            max_workers (`int`): size of the thread pool
+            wait (`bool`): wait for all the imports to be done, otherwise
+                           return immediately and import in the background
+
+        Returns:
+            dict: module name -> import time in seconds, when wait is True
+            Future: which result is that dict, when wait is False
+    '''
+    if device is None and tokens is None:
+        raise TypeError('warm_parsers needs a device or abstraction tokens')
+
+    data = get_parser_data()
+    if device is not None:
+        tokens = _get_device_tokens(device, data)
+        os_name = device.os
+    else:
+        os_name = tokens.get('os')
+        if isinstance(os_name, (list, tuple)):
+            os_name = os_name[0] if os_name else None
+    view = command_views.get(data, os_name, tokens, _get_parser_cls)
+
+    if commands is None:
+        commands = list(view.commands) + list(view.argument_commands)
+
+    # Group the commands by the module of the class they resolve to
+    modules = {}
+    for command in commands:
+        if command not in data:
+            log.debug(f'No parser for {command!r}, not warmed up')
+            continue
+        modules.setdefault(_get_parser_module(data, command, view.tokens),
+                           []).append(command)
+    tasks = [(module, commands) for module, commands in modules.items()
+             if module is not None]
+    # the module of these commands is only known once their class is
+    # loaded, each of them is resolved in its own task
+    tasks.extend((None, [command]) for command in modules.get(None, ()))
+
+    def warm(module, commands):
+        start = time.perf_counter()
+        try:
+            if module is not None:
+                importlib.import_module(module)
+            for command in commands:
+                parser_cls = view.parser_class(command)
+                if module is None and parser_cls is not None:
+                    module = parser_cls.__module__
+                # compile the class level patterns as well
+                patterns = getattr(parser_cls, 'patterns', None)
+                if isinstance(patterns, Patterns):
+                    patterns.compile()
+        except Exception as e:
+            # the other modules are still warmed up, the parser fails again
+            # with its error when it is used
+            log.warning(f'Failed to import parser module {module}: {e}')
+            return module, None
+        return module, time.perf_counter() - start
+
+    def run():
+        timings = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(warm, module, commands)
+                       for module, commands in tasks]
+            for future in futures:
+                module, elapsed = future.result()
+                if module is not None and elapsed is not None:
+                    # tasks of the same module wait for a single import
+                    timings[module] = max(timings.get(module, 0), elapsed)
+        log.debug(f'Warmed up {len(timings)} parser modules for '
+                  f'{os_name}')
+        return timings
+
+    if wait:
+        return run()
+
+    # the future of the single background task carries its result or error
+    executor = ThreadPoolExecutor(max_workers=1,
+                                  thread_name_prefix='warm_parsers')
+    result = executor.submit(run)
+    executor.shutdown(wait=False)
+    return result
 
-    return [
-        command for command, values in data.items()
-        if '{' not in command and command != 'tokens' and device.os in values
-    ]
+
+def _get_parser_module(data, command, tokens):
+    '''return the module of the parser class a command resolves to, without
+       importing it, None if it cannot be known before import'''
+    if command not in data:
+        return None
+    for matrix_ptr in data.iter_lookup(tokens=tokens, top=command):
+        ptr = getattr(matrix_ptr, 'ptr', None)
+        if isinstance(ptr, str) and ptr:
+            return ptr.rsplit('.', 1)[0]
+        if isinstance(ptr, type):
+            # already loaded
+            return ptr.__module__
+    return None
 
 
 def format_output(parser_data, tab=2):
@@ -302,14 +534,79 @@ def get_parser_exclude(command, device):
 
 def get_parser(command, device, fuzzy=False, revision=None, abstract=None, **kwargs):
     '''From a show command and device, return parser class and kwargs if any'''
-    global parser_data
+    data = get_parser_data()
 
-    if parser_data is None:
-        data = _load_parser_json()
-    else:
-        data = parser_data
+    tokens = _get_device_tokens(device, data, revision, abstract)
+
+    if not fuzzy:
+        return _resolve_parser(command, device, tokens, data)
+
+    valid_results = _find_parsers(command, fuzzy, tokens, device)
+    log.debug(f'Parser search results: {valid_results}')
+    return valid_results
+
+
+def get_parsers(commands, device, revision=None, abstract=None):
+    '''Resolve many show commands for the same device at once
+
+    The device abstraction tokens are computed once, the commands which only
+    differ by their spacing are searched once, and every parser class is
+    only looked up (and its module imported) once for all the commands.
+
+    Each search still walks the command trie on its own: the trie walk is
+    bounded by the tokens of the search, a combined walk for all the commands
+    would not visit fewer nodes. The per-device cost that is shared between
+    commands is the token and parser class resolution done once here.
+
+        Args:
+            commands (`list`): show commands
+            device (`Device`): device the commands are for
+            revision (`str`): parser revision, see get_parser
+            abstract (`dict`): extra abstraction tokens, see get_parser
+
+        Returns:
+            dict: command -> (parser class, kwargs), or command ->
+                  ParserNotFound or AmbiguousParserSearch when the command
+                  could not be resolved
+
+        Example:
+            >>> results = get_parsers(['show version', 'show clock'], device)
+            >>> for command, result in results.items():
+            ...     if isinstance(result, Exception):
+            ...         continue
+            ...     parser_class, kwargs = result
+    '''
+    data = get_parser_data()
+
+    tokens = _get_device_tokens(device, data, revision, abstract)
 
-    # get tokens from device including specific ones for genie.libs.parser
+    # command template -> parser class, shared by all the searches
+    parser_cls_cache = {}
+    # search without extra spaces -> result
+    searches = {}
+    results = {}
+    for command in commands:
+        if command in results:
+            continue
+        search = ' '.join(command.split())
+        if search not in searches:
+            try:
+                searches[search] = _resolve_parser(
+                    search, device, tokens, data, parser_cls_cache)
+            except (ParserNotFound, AmbiguousParserSearch) as e:
+                log.debug(f'Could not resolve parser for {command!r}: {e}')
+                searches[search] = e
+        result = searches[search]
+        if isinstance(result, tuple):
+            # each command gets its own kwargs
+            result = (result[0], dict(result[1]))
+        results[command] = result
+
+    return results
+
+
+def _get_device_tokens(device, data, revision=None, abstract=None):
+    '''get tokens from device including specific ones for genie.libs.parser'''
     tokens = Lookup.tokens_from_device(device, data.order, PARSER_MODULE_NAME)
     if abstract:
         tokens.update(abstract)
@@ -319,13 +616,45 @@ def get_parser(command, device, fuzzy=False, revision=None, abstract=None, **kwa
     if revision:
         tokens['revision'] = revision
 
-    revision = revision or tokens.get('revision')
-    if revision and not isinstance(revision, list):
-        revision = [revision]
-    if revision:
-        tokens['revision'] = revision
+    return tokens
+
+
+def _resolve_parser(command, device, tokens, data, parser_cls_cache=None):
+    '''return the best parser class and kwargs for a command, non fuzzy'''
+    cache_key = resolution_cache.make_key(command, tokens)
+    cached = resolution_cache.get(cache_key, data)
+    if cached is not None:
+        _add_parser_usage_data(cached, device)
+        _, parser_class, parser_kwargs = cached
+        log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
+        return parser_class, parser_kwargs
 
-    results = _fuzzy_search_command(command, fuzzy, tokens)
+    valid_results = _find_parsers(command, False, tokens, device,
+                                  parser_cls_cache)
+
+    # valid_results is a list of found parsers for a given show command
+    #  - first element in this list is the closest parser match found
+    #  - each element has the format (show command, class, kwargs)
+    # valid_results[0][0] is the matched command string from the parser cli_command
+    # valid_results[0][1] is the class of the best match
+    # valid_results[0][2] is a dict of parser kwargs
+    parser_class = valid_results[0][1]
+    parser_kwargs = valid_results[0][2]
+    spec = getfullargspec(parser_class.cli)
+    if 'command' in spec.args:
+        cmd = valid_results[0][0]
+        parser_kwargs['command'] = cmd.format(**parser_kwargs)
+    resolution_cache.put(cache_key,
+                         (valid_results[0][0], parser_class, parser_kwargs),
+                         data)
+    log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
+    return parser_class, parser_kwargs
+
+
+def _find_parsers(command, fuzzy, tokens, device, parser_cls_cache=None):
+    '''return the (command, parser class, kwargs) of the parsers matching
+       the command, best match first'''
+    results = _fuzzy_search_command(command, fuzzy, tokens, parser_cls_cache)
     valid_results = []
 
     for result in results:
@@ -348,63 +677,122 @@ def get_parser(command, device, fuzzy=False, revision=None, abstract=None, **kwa
     log.debug('Parsers found for command "{}": {}'.format(command,
                                                          str(valid_results)))
 
-    # Try to add parser to telemetry data
+    # valid_results is a list of found parsers for a given show command
+    #  - first element in this list is the closest parser match found
+    #  - each element has the format (show command, class, kwargs)
+    # valid_results[0] is the best parser match
+    _add_parser_usage_data(valid_results[0], device)
+
+    return valid_results
+
+
+def _add_parser_usage_data(result, device):
+    '''Try to add parser to telemetry data'''
     if INTERNAL:
         try:
-            # valid_results is a list of found parsers for a given show command
-            #  - first element in this list is the closest parser match found
-            #  - each element has the format (show command, class, kwargs)
-            # valid_results[0] is the best parser match
-            add_parser_usage_data(valid_results[0], device)
+            add_parser_usage_data(result, device)
         except Exception as e:
             log.debug("Encountered an unexpected error while adding parser "
                       "telemetry data: %s" % e)
 
-    if not fuzzy:
-        # valid_results is a list of found parsers for a given show command
-        #  - first element in this list is the closest parser match found
-        #  - each element has the format (show command, class, kwargs)
-        # valid_results[0][0] is the matched command string from the parser cli_command
-        # valid_results[0][1] is the class of the best match
-        # valid_results[0][2] is a dict of parser kwargs
-        parser_class = valid_results[0][1]
-        parser_kwargs = valid_results[0][2]
-        spec = getfullargspec(parser_class.cli)
-        if 'command' in spec.args:
-            cmd = valid_results[0][0]
-            parser_kwargs['command'] = cmd.format(**parser_kwargs)
-        log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
-        return parser_class, parser_kwargs
 
-    log.debug(f'Parser search results: {valid_results}')
-    return valid_results
+def get_parser_cache_info():
+    '''Return the get_parser resolution cache statistics
+
+        Returns:
+            dict: hits, misses, size and maxsize of the cache
+    '''
+    return resolution_cache.info()
+
+
+def clear_parser_cache():
+    '''Empty the get_parser resolution cache and reset its statistics'''
+    resolution_cache.clear()
+
+
+def enable_parse_cache(maxbytes=PARSE_CACHE_BYTES):
+    '''Cache the outputs parsed by the genieparser parsers
+
+    Once enabled, `parse(output=...)` of a parser of this package returns a
+    copy of the structure parsed before for the same parser class, arguments
+    and output, instead of parsing the output again. Outputs collected from
+    the device by the parser itself are not cached.
+
+        Args:
+            maxbytes (`int`): maximum size of the cached structures, pickled
+
+        Returns:
+            ParseCache: the cache
+    '''
+    global parse_cache
+    parse_cache = ParseCache(maxbytes=maxbytes)
+    MetaParser.parse = _cached_parse
+    return parse_cache
+
+
+def disable_parse_cache():
+    '''Stop caching the parsed outputs and drop the cache'''
+    global parse_cache
+    MetaParser.parse = _metaparser_parse
+    parse_cache = None
+
+
+def get_parse_cache_info():
+    '''Return the parsed output cache statistics
+
+        Returns:
+            dict: hits, misses, size, bytes and maxbytes of the cache
+            None: the cache is not enabled
+    '''
+    return parse_cache.info() if parse_cache is not None else None
+
+
+def _cached_parse(self, **kwargs):
+    cache = parse_cache
+    output = kwargs.get('output')
+    if cache is None or not isinstance(output, str) or \
+            not type(self).__module__.startswith(PARSER_MODULE_NAME + '.'):
+        return _metaparser_parse(self, **kwargs)
+
+    # the context may be given to the constructor instead of parse()
+    key_kwargs = {key: value for key, value in kwargs.items()
+                  if key != 'output'}
+    key_kwargs.setdefault('context', self.context)
+    key = cache.make_key(type(self), key_kwargs, output)
+    if key is None:
+        return _metaparser_parse(self, **kwargs)
+    parsed = cache.get(key)
+    if parsed is None:
+        parsed = _metaparser_parse(self, **kwargs)
+        cache.put(key, parsed)
+    else:
+        self.parsed_output = parsed
+    return parsed
 
 
 def _fuzzy_search_command(search,
                           fuzzy,
-                          abstract=None):
+                          abstract=None,
+                          parser_cls_cache=None):
     """ Find commands that match the search criteria.
 
         Args:
             search (`str`): the search query
             fuzzy (`bool`): whether or not fuzzy mode should be used
             abstract (`dict`): abstract tokens dict
+            parser_cls_cache (`dict`): command -> parser class already looked
+                                       up for the same abstract tokens
 
         Returns:
             list: the result of the search
     """
-    global parser_data
-
-    if parser_data is None:
-        data = _load_parser_json()
-    else:
-        data = parser_data
+    data = get_parser_data()
 
     # Perfect match should return
     if search in data:
         parser_cls = None
         if abstract:
-            parser_cls = _get_parser_cls(search, abstract)
+            parser_cls = _get_parser_cls(search, abstract, parser_cls_cache)
         if parser_cls is not None:
             return [(search, parser_cls, {})]
 
@@ -421,11 +809,18 @@ def _fuzzy_search_command(search,
     best_score = -math.inf
     result = []
 
-    for command in data:
-        # ! This was a band-aid fix. Root cause has been resolved, but this will
-        # ! remain in-place for peace of mind
-        if command is None:
-            continue
+    index = _get_command_index(data)
+    if fuzzy:
+        candidates = _fuzzy_candidates(tokens, index)
+    else:
+        # Only the commands reachable in the trie can match the search
+        candidates = ((math.inf, position, command) for position, command
+                      in enumerate(index.candidates(tokens)))
+
+    for bound, position, command in candidates:
+        if bound < best_score:
+            # Candidates are sorted by bound, none can beat the best match
+            break
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(), command, {}, fuzzy)
 
@@ -438,13 +833,14 @@ def _fuzzy_search_command(search,
 
             parser_cls = None
             if abstract:
-                parser_cls = _get_parser_cls(command, abstract)
+                parser_cls = _get_parser_cls(command, abstract,
+                                             parser_cls_cache)
                 if parser_cls is None:
                     # No matching class found for this abstract token dict, not
                     # the right parser
                     continue
 
-            entry = (command, parser_cls, kwargs)
+            entry = (position, (command, parser_cls, kwargs))
 
             if score > best_score:
                 # If we found a better match, discard everything and start new
@@ -454,6 +850,9 @@ def _fuzzy_search_command(search,
             elif score == best_score:
                 result.append(entry)
 
+    # Keep the matches in lookup order
+    result = [entry for _, entry in sorted(result, key=lambda e: e[0])]
+
     # Return only one instance if fuzzy is not used
     # Check if any ambiguous commands
     if not fuzzy and len(result) > 1:
@@ -472,15 +871,84 @@ def _fuzzy_search_command(search,
             return [result[0]]
         else:
             # Search is ambiguous
-            raise Exception("\nSearch for '" + search + "' is ambiguous. " +
-                            "Please be more specific in your keywords.\n\n" +
-                            "Results matched:\n" + '\n'.join('> ' + i[0]
-                                                             for i in result))
+            raise AmbiguousParserSearch(
+                "\nSearch for '" + search + "' is ambiguous. " +
+                "Please be more specific in your keywords.\n\n" +
+                "Results matched:\n" + '\n'.join('> ' + i[0]
+                                                 for i in result))
 
     return result
 
 
-def _get_parser_cls(command, abstract):
+@functools.lru_cache(maxsize=1024)
+def _compile_fuzzy_pattern(pattern):
+    return re.compile(pattern)
+
+
+def _fuzzy_candidates(tokens, index):
+    """ Find the commands a fuzzy search can match, and the best score each
+        of them can reach.
+
+        The leading regular tokens are looked up in the command trie, a
+        leading regex expression is matched once against every command and
+        the regular tokens are counted in the inverted token index to bound
+        the score. `_matches_fuzzy` still decides of the actual match.
+
+        Args:
+            tokens (`list`): the search tokens
+            index (`CommandTrie`): command trie of the parser data
+
+        Returns:
+            list: (score bound, position, command), highest bound first and
+                  in lookup order for the same bound
+    """
+    regular = []
+    for token in tokens:
+        if token == '*' or _is_regular_token(token):
+            regular.append(token.replace(r'\|', '|').replace(r'\.', '.'))
+        else:
+            regular.append(None)
+
+    prefix = 0
+    while prefix < len(regular) and regular[prefix] is not None:
+        prefix += 1
+
+    if prefix == len(regular):
+        candidates = list(enumerate(index.candidates(regular)))
+    else:
+        candidates = index.prefix_candidates(regular[:prefix])
+        if prefix == 0:
+            # Commands must start with the leading regex expression
+            end = 1
+            while end < len(tokens) and not _is_regular_token(tokens[end]):
+                end += 1
+            pattern = _compile_fuzzy_pattern(' '.join(tokens[:end]))
+            candidates = [(position, command)
+                          for position, command in candidates
+                          if pattern.match(command)]
+
+    # A regular token scores at most 103 for an argument embedded in a
+    # token, 102 if it is a command token and 100 otherwise, a regex
+    # expression does not score
+    postings, embedded = index.token_index()
+    regular = [token for token in regular if token is not None]
+    exact = collections.Counter()
+    for token in regular:
+        exact.update(postings.get(token, ()))
+
+    bounds = []
+    for position, command in candidates:
+        if command in embedded:
+            bound = 103 * len(regular)
+        else:
+            bound = 100 * len(regular) + 2 * exact[command]
+        bounds.append((bound, position, command))
+
+    bounds.sort(key=lambda b: (-b[0], b[1]))
+    return bounds
+
+
+def _get_parser_cls(command, abstract, parser_cls_cache=None):
     '''_get_parser_cls
 
     retrieves a parser class from the abstract matrix given an abstract token
@@ -489,30 +957,35 @@ def _get_parser_cls(command, abstract):
         Args:
             command (`str`): the unformatted command to load a class for
             abstract (`dict`): abstract tokens dict with device values
+            parser_cls_cache (`dict`): optional command -> class memo, only
+                                       valid for one abstract tokens dict
 
         Returns:
             class: Class of the parser implementation for the given tokens
             None: No matching parser for that command
     '''
-    global parser_data
+    if parser_cls_cache is not None and command in parser_cls_cache:
+        return parser_cls_cache[command]
 
-    if parser_data is None:
-        data = _load_parser_json()
-    else:
-        data = parser_data
+    data = get_parser_data()
 
+    parser_cls = None
     # Ensure the matching command is valid for this device
     for matrix_ptr in data.iter_lookup(tokens=abstract, top=command):
 
         # get the best fit class of the command for this device
         try:
-            return matrix_ptr.load_ptr()
+            parser_cls = matrix_ptr.load_ptr()
             # we only need one result for this command
+            break
         except KeyError:
             # fallback to lower priority token values
             continue
+
+    if parser_cls_cache is not None:
+        parser_cls_cache[command] = parser_cls
     # No appropriate class found, return None
-    return None
+    return parser_cls
 
 
 def _is_regular_token(token):
@@ -714,7 +1187,8 @@ def _matches_fuzzy(i,
                 skipped += 1
 
             # Match current span with command
-            test = re.match(' '.join(tokens[:i + 1]), command)
+            test = _compile_fuzzy_pattern(' '.join(tokens[:i + 1])).match(
+                command)
 
             if not test:
                 # Failed to match fuzzy
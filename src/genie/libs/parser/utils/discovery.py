@@ -0,0 +1,265 @@
+'''Static parser discovery
+
+Finds parser classes by reading the source code of the modules with `ast`
+instead of importing them. Only module level class definitions are
+considered, attributes inherited from a base class defined in the same module
+are resolved, bases imported from other modules are reported as unresolved.
+'''
+
+# python
+import os
+import ast
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# Below this number of files, parsing in a process pool is slower than serial
+PARALLEL_THRESHOLD = 64
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def _commands(node):
+    '''return the commands of a cli_command/parser_command assignment'''
+    value = _literal(node)
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [v for v in value if isinstance(v, str)]
+    return None
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _schema_source(lines, node):
+    '''return the source of a schema assignment value, with the
+    continuation lines unindented to the level of the assignment'''
+    value = node.value
+    if value.end_lineno is None:
+        return None
+
+    # ast column offsets are utf-8 byte offsets
+    segment = [line.encode() for line in
+               lines[value.lineno - 1:value.end_lineno]]
+    if len(segment) == 1:
+        segment[0] = segment[0][value.col_offset:value.end_col_offset]
+    else:
+        segment[0] = segment[0][value.col_offset:]
+        segment[-1] = segment[-1][:value.end_col_offset]
+
+    indent = b' ' * node.col_offset
+    segment[1:] = [line[len(indent):] if line.startswith(indent) else line
+                   for line in segment[1:]]
+    return b'\n'.join(line.rstrip(b'\r\n') for line in segment).decode()
+
+
+def declared_tokens(path):
+    '''declared_tokens
+
+    Return the abstraction tokens declared by `abstract.declare_token()` in an
+    `__init__.py` file
+
+        Args:
+            path (`str`): path of the __init__.py file
+
+        Returns:
+            dict: token name -> value, empty if nothing is declared
+    '''
+    try:
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return {}
+
+    tokens = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and \
+                _base_name(node.func) == 'declare_token':
+            for keyword in node.keywords:
+                value = _literal(keyword.value)
+                if keyword.arg and isinstance(value, str):
+                    tokens[keyword.arg] = value
+    return tokens
+
+
+def discover_module(path):
+    '''discover_module
+
+    Read the parser classes defined in a python file
+
+        Args:
+            path (`str`): path of the python file
+
+        Returns:
+            list: one dict per class, with keys
+                  class, bases, lineno, doc, cli_command, parser_command,
+                  schema, has_cli and unresolved_bases.
+                  cli_command and parser_command are None when not defined,
+                  has_cli is None when it depends on an unresolved base.
+    '''
+    try:
+        with open(path) as f:
+            source = f.read()
+        tree = ast.parse(source, path)
+    except (OSError, SyntaxError, ValueError) as e:
+        log.debug(f'Cannot read {path}: {e}')
+        return []
+
+    lines = source.splitlines()
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        info = {
+            'class': node.name,
+            'bases': [b for b in map(_base_name, node.bases) if b],
+            'lineno': node.lineno,
+            'doc': ast.get_docstring(node, clean=False),
+            'cli_command': None,
+            'parser_command': None,
+            'schema': None,
+            'has_cli': False,
+        }
+
+        for item in node.body:
+            if isinstance(item, ast.Assign):
+                for target in item.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+                    if target.id in ('cli_command', 'parser_command'):
+                        info[target.id] = _commands(item.value)
+                    elif target.id == 'schema':
+                        info['schema'] = _schema_source(lines, item)
+            elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                    and item.name == 'cli':
+                info['has_cli'] = True
+
+        classes[node.name] = info
+
+    # Resolve attributes inherited from classes of the same module
+    def resolve(name, seen):
+        info = classes[name]
+        if name in seen or info.get('_resolved'):
+            return info
+        seen.add(name)
+        unresolved = []
+        for base in info['bases']:
+            # a base with the name of a class being resolved is an imported
+            # class shadowed by a local definition, eg. ShowX(ShowX)
+            if base not in classes or base in seen:
+                if base not in ('object', 'MetaParser'):
+                    unresolved.append(base)
+                continue
+            base_info = resolve(base, seen)
+            for key in ('cli_command', 'parser_command', 'schema'):
+                if info[key] is None:
+                    info[key] = base_info[key]
+            if not info['has_cli']:
+                info['has_cli'] = base_info['has_cli']
+            unresolved.extend(base_info['unresolved_bases'])
+        info['unresolved_bases'] = unresolved
+        if not info['has_cli'] and unresolved:
+            info['has_cli'] = None
+        info['_resolved'] = True
+        return info
+
+    result = []
+    for name in classes:
+        info = resolve(name, set())
+        result.append(info)
+    for info in result:
+        info.pop('_resolved', None)
+    return result
+
+
+def _discover(path):
+    return path, discover_module(path)
+
+
+def discover_files(paths, processes=None):
+    '''discover_files
+
+    Run `discover_module` on many files, in a process pool when there are
+    enough of them
+
+        Args:
+            paths (`list`): paths of the python files
+            processes (`int`): number of worker processes, defaults to the
+                               number of cpus. 1 disables the pool.
+
+        Returns:
+            dict: path -> list of class dicts
+    '''
+    paths = list(paths)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes > 1 and len(paths) >= PARALLEL_THRESHOLD:
+        chunksize = max(1, len(paths) // (processes * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                return dict(executor.map(_discover, paths,
+                                         chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            # e.g. no permission to create semaphores, run serially
+            log.debug(f'Parallel parser discovery failed: {e}')
+
+    return dict(map(_discover, paths))
+
+
+def discover_package(location, ignore_dirs=(), ignore_files=(),
+                     processes=None):
+    '''discover_package
+
+    Walk a parser package and read all of its parser classes statically
+
+        Args:
+            location (`str`): directory of the package
+            ignore_dirs (`list`): directory names not to walk into
+            ignore_files (`list`): file names to skip
+            processes (`int`): see `discover_files`
+
+        Returns:
+            list: one dict per python file, with keys
+                  path, folders (directories from the package root),
+                  tokens (list of the token dicts declared by each folder)
+                  and classes (see `discover_module`)
+    '''
+    files = []
+    folder_tokens = {}
+
+    for root, dirs, names in os.walk(location):
+        dirs[:] = sorted(d for d in dirs if d not in ignore_dirs)
+        rel = os.path.relpath(root, location)
+        folders = [] if rel == os.curdir else rel.split(os.sep)
+
+        tokens = declared_tokens(os.path.join(root, '__init__.py'))
+        parent = folder_tokens.get(tuple(folders[:-1]), [])
+        folder_tokens[tuple(folders)] = parent + [tokens] if folders else []
+
+        for name in sorted(names):
+            if not name.endswith('.py') or name in ignore_files:
+                continue
+            files.append({
+                'path': os.path.join(root, name),
+                'folders': folders,
+                'tokens': folder_tokens[tuple(folders)],
+            })
+
+    classes = discover_files([f['path'] for f in files], processes=processes)
+    for f in files:
+        f['classes'] = classes[f['path']]
+    return files
@@ -0,0 +1,270 @@
+'''Dispatch of the lines of an output to the patterns which can match them'''
+
+# python
+import re
+
+# characters with a meaning in a regular expression
+_SPECIAL = frozenset('.^$*+?{}[]\\|()')
+
+# flags which make the literal text of a pattern unusable as a key
+_UNKEYED_FLAGS = re.IGNORECASE | re.VERBOSE
+
+
+def _has_top_level_alternation(source):
+    depth = 0
+    in_class = False
+    index = 0
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            index += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            # a ] right after [ or [^ is part of the class
+            if source[index + 1:index + 2] == '^':
+                index += 1
+            if source[index + 1:index + 2] == ']':
+                index += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        index += 1
+    return False
+
+
+def _atom(source, index):
+    '''return (literal character or None, index after the atom)'''
+    char = source[index]
+    if char == '\\':
+        escaped = source[index + 1:index + 2]
+        if escaped and not escaped.isalnum():
+            return escaped, index + 2
+        return None, index + 2
+    if char in _SPECIAL:
+        return None, index + 1
+    return char, index + 1
+
+
+def _quantifier(source, index):
+    '''return (quantifier character or '', index after the quantifier)'''
+    if index < len(source) and source[index] in '*+?{':
+        quantifier = source[index]
+        if quantifier == '{':
+            end = source.find('}', index)
+            index = len(source) if end == -1 else end + 1
+        else:
+            index += 1
+        # lazy and possessive forms
+        if index < len(source) and source[index] in '?+':
+            index += 1
+        return quantifier, index
+    return '', index
+
+
+def literal_prefix(pattern):
+    '''literal_prefix
+
+    Text every line matched by `pattern.match()` starts with, once its
+    leading whitespace is removed
+
+        Args:
+            pattern (`re.Pattern`): compiled regular expression
+
+        Returns:
+            str: the literal prefix, empty when there is none
+    '''
+    source = pattern.pattern
+    if not isinstance(source, str) or pattern.flags & _UNKEYED_FLAGS or \
+            _has_top_level_alternation(source):
+        return ''
+
+    index = 0
+    if source.startswith('^'):
+        index = 1
+    elif source.startswith('\\A'):
+        index = 2
+
+    # leading whitespace, any amount of it
+    while index < len(source):
+        if source[index] == ' ':
+            end = index + 1
+        elif source.startswith(('\\s', '\\t'), index):
+            end = index + 2
+        else:
+            break
+        _, index = _quantifier(source, end)
+
+    prefix = []
+    while index < len(source):
+        literal, end = _atom(source, index)
+        if literal is None:
+            break
+        quantifier, end = _quantifier(source, end)
+        if quantifier in ('*', '?', '{'):
+            # optional or repeated a variable number of times
+            break
+        prefix.append(literal)
+        index = end
+        if quantifier == '+':
+            break
+    return ''.join(prefix)
+
+
+class LineDispatcher(object):
+    '''LineDispatcher
+
+    Select the patterns of a parser which can match a line from the first
+    word of the line, instead of trying all the patterns of the chain in
+    turn. A pattern starting with a literal text (`^Hardware +is`,
+    `^Input +queue:`, `^\\s*LS +age:`) is only tried on the lines whose first
+    word is, or starts with, that text. The other patterns are tried on every
+    line. The patterns are always tried in the order of the chain, so the
+    first pattern which matches is the same as with the full chain.
+
+        class ShowExample(ShowExampleSchema):
+
+            patterns = Patterns(
+                p1=r'^(?P<interface>\\S+) +is +(?P<status>\\w+)$',
+                p2=r'^MTU +(?P<mtu>\\d+) +bytes$',
+            )
+            dispatcher = LineDispatcher(patterns)
+
+            def cli(self, output=None):
+                for line in output.splitlines():
+                    name, m = self.dispatcher.match(line.strip())
+                    if name == 'p1':
+                        ...
+
+    Args:
+        patterns (`Patterns`): patterns of the parser, or a dict of name ->
+                               compiled regex
+        names (`iterable`): names of the patterns of the chain, in the
+                            order they are tried, defaults to all the patterns
+        cache_size (`int`): number of first words whose candidate patterns
+                            are kept
+        selected (`iterable`): names of the patterns whose matches are
+                               returned, see select()
+    '''
+
+    def __init__(self, patterns, names=None, cache_size=1024, selected=None):
+        self.patterns = patterns
+        self.names = tuple(patterns) if names is None else tuple(names)
+        self.cache_size = cache_size
+        self.selected = None if selected is None else frozenset(selected)
+        self._index = None
+        self._cache = {}
+        self._selections = {}
+
+    def _build(self):
+        # first word -> entries, first word prefix -> entries
+        words = {}
+        prefixes = {}
+        always = []
+        selected = self.selected
+        for position, name in enumerate(self.names):
+            pattern = self.patterns[name]
+            if selected is not None and name not in selected:
+                name = None
+            entry = (position, name, pattern)
+            prefix = literal_prefix(pattern)
+            head = prefix.split(None, 1)
+            if not head:
+                always.append(entry)
+            elif len(head) > 1 or prefix[-1].isspace():
+                # the whole first word is known
+                words.setdefault(head[0], []).append(entry)
+            else:
+                prefixes.setdefault(head[0], []).append(entry)
+        lengths = sorted({len(prefix) for prefix in prefixes})
+        self._index = (words, prefixes, lengths, tuple(always))
+        return self._index
+
+    def candidates(self, line):
+        '''candidates
+
+        Patterns which can match a line
+
+            Args:
+                line (`str`): the line
+
+            Returns:
+                tuple: (name, compiled regex) in the order of the chain, the
+                       name is None for a pattern not selected
+        '''
+        tokens = line.split(None, 1)
+        word = tokens[0] if tokens else ''
+        try:
+            return self._cache[word]
+        except KeyError:
+            pass
+
+        words, prefixes, lengths, always = self._index or self._build()
+        entries = list(always)
+        entries.extend(words.get(word, ()))
+        for length in lengths:
+            if length > len(word):
+                break
+            entries.extend(prefixes.get(word[:length], ()))
+        entries.sort()
+        # the patterns not selected after the last selected one cannot
+        # change which selected pattern matches
+        while entries and entries[-1][1] is None:
+            entries.pop()
+        candidates = tuple((name, pattern) for _, name, pattern in entries)
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[word] = candidates
+        return candidates
+
+    def match(self, line):
+        '''match
+
+        Match a line against its candidate patterns
+
+            Args:
+                line (`str`): the line
+
+            Returns:
+                tuple: (name, match object) of the first pattern of the chain
+                       which matches the line, (None, None) when none does
+        '''
+        for name, pattern in self.candidates(line):
+            m = pattern.match(line)
+            if m:
+                if name is None:
+                    break
+                return name, m
+        return None, None
+
+    def select(self, names):
+        '''select
+
+        Dispatcher of the same chain which only returns the matches of some
+        of its patterns, eg. the patterns populating the fields a caller
+        needs. A line matched first by a pattern not selected is not matched,
+        as with the whole chain, so the patterns not selected are still tried
+        before a selected pattern. The others are not tried at all.
+
+            Args:
+                names (`iterable`): names of the selected patterns
+
+            Returns:
+                LineDispatcher: the dispatcher, kept for the next calls with
+                                the same names
+        '''
+        names = frozenset(names)
+        if self.selected is not None:
+            names &= self.selected
+        dispatcher = self._selections.get(names)
+        if dispatcher is None:
+            dispatcher = self._selections[names] = LineDispatcher(
+                self.patterns, self.names, self.cache_size, selected=names)
+        return dispatcher
@@ -1,19 +1,47 @@
+import os
+import sys
+import ast
+import json
+import hashlib
 import logging
 import pathlib
 import inspect
 import itertools
 import importlib
+import sysconfig
 from genie.metaparser import MetaParser
+from genie.metaparser.util import schemaengine
 from genie.json.make_json import MakeParsers
+from genie.abstract.package import DEFAULT_ABSTRACT_ORDER
+
+from .discovery import discover_package
 
 log = logging.getLogger(__name__)
 
+# Location of the discovery manifests of external parser packages, the
+# manifests are only used when it is set or when asked for with
+# extend(use_manifest=True)
+MANIFEST_DIR_ENV_VAR = 'GENIE_PARSER_MANIFEST_DIR'
+MANIFEST_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'genie',
+                            'parser')
+MANIFEST_FORMAT_VERSION = 2
+
+# Set to a true value to discover external parsers without importing them
+STATIC_DISCOVERY_ENV_VAR = 'GENIE_PARSER_STATIC_DISCOVERY'
+
+# Names a schema read from the source code may use to be evaluated
+SCHEMA_NAMES = {name: getattr(schemaengine, name) for name in
+                ('Any', 'Optional', 'Or', 'And', 'Default', 'Use', 'ListOf',
+                 'Schema', 'Required', 'Fallback')}
+SCHEMA_NAMES.update({t.__name__: t for t in (str, int, float, bool, list,
+                                             dict, tuple, type(None))})
+
 class ExtendParsers(MakeParsers):
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
     IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
 
-    def __init__(self, package):
+    def __init__(self, package, manifest_dir=None, static=None):
         self.output = {'tokens': {}, 'extend_info': []}
         self.package = package
         self.root = {
@@ -26,11 +54,185 @@ class ExtendParsers(MakeParsers):
                 'style': 'github',
             },
         }
-        self.module_loc = importlib.import_module(package).__path__[0]
+        self.module = importlib.import_module(package)
+        self.module_loc = self.module.__path__[0]
         self.package_location = self.module_loc
+        self.manifest_dir = manifest_dir or os.environ.get(
+            MANIFEST_DIR_ENV_VAR)
+        if static is None:
+            static = os.environ.get(STATIC_DISCOVERY_ENV_VAR, '').lower() \
+                in ('1', 'true', 'yes')
+        self.static = static
         log.debug(f'Parser extension: {package} {self.package_location}')
 
-    def extend(self):
+    def extend(self, use_manifest=None):
+        '''Find all parsers of the package
+
+        When `use_manifest` is True, the output of a previous walk is reused
+        as long as the package version and its files did not change. It
+        defaults to True when a manifest directory is given, with
+        `manifest_dir` or GENIE_PARSER_MANIFEST_DIR, and to False otherwise.
+        '''
+        if use_manifest is None:
+            use_manifest = self.manifest_dir is not None
+        if use_manifest:
+            fingerprint = self.fingerprint()
+            output = self.load_manifest(fingerprint)
+            if output is not None:
+                log.debug(f'Parser extension {self.package} loaded from '
+                          f'manifest')
+                self.output = output
+                return
+
         # Walk all files in the given package and find all parsers
         log.debug(f'Parser module: {self.module_loc}')
-        self._recursive_find(pathlib.Path(self.module_loc))
+        if self.static:
+            self._static_find()
+        else:
+            self._recursive_find(pathlib.Path(self.module_loc))
+
+        if use_manifest:
+            self.save_manifest(fingerprint)
+
+    def _static_find(self):
+        '''Find all parsers of the package by reading their source code,
+        without importing any parser module'''
+        url = self.root['url']
+        link = url['link'].format(branch=url['branch'])
+        abstract_pkg = getattr(self.module, '__abstract_pkg', None)
+        self.output['token_order'] = list(getattr(abstract_pkg, 'order',
+                                                  DEFAULT_ABSTRACT_ORDER))
+
+        for details in discover_package(self.module_loc,
+                                        ignore_dirs=self.IGNORE_DIR,
+                                        ignore_files=self.IGNORE_FILE):
+            path = os.path.relpath(details['path'], self.module_loc)
+            module_name = path[:-len('.py')].replace(os.sep, '.')
+
+            for info in details['classes']:
+                # has_cli is None when cli may come from an imported base
+                if not info['cli_command'] or info['has_cli'] is False:
+                    continue
+
+                for command in info['cli_command']:
+                    node = self.output.setdefault(command, {})
+                    for folder, tokens in zip(details['folders'],
+                                              details['tokens']):
+                        node = node.setdefault('folders', {}).\
+                            setdefault(folder, {})
+                        if tokens:
+                            node['tokens'] = dict(tokens)
+                    node.update({
+                        'class': info['class'],
+                        'doc': info['doc'],
+                        'module_name': module_name,
+                        'package': self.package,
+                        'schema': self._static_schema(info['schema']),
+                        'uid': command.replace('{', '').replace('}', '').\
+                            replace(' ', '_').replace('|', '_'),
+                        'url': f"{link}src/{path.replace(os.sep, '/')}"
+                               f"#L{info['lineno']}",
+                    })
+
+                for tokens in details['tokens']:
+                    for name, value in tokens.items():
+                        values = self.output['tokens'].setdefault(name, [])
+                        if value not in values:
+                            values.append(value)
+
+                self.output['extend_info'].append(
+                    f"{module_name}.{info['class']}")
+
+    def _static_schema(self, source):
+        '''Format a schema read from the source code as MakeParsers formats
+        the schema of an imported class. A schema using names other than
+        the builtin types and the schemaengine classes, eg. a sub-schema
+        defined in the module, cannot be evaluated without importing the
+        module and is kept as its source code.'''
+        if source is None:
+            return None
+        try:
+            tree = ast.parse(source, mode='eval')
+        except SyntaxError:
+            return source
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id not in SCHEMA_NAMES:
+                return source
+            if not isinstance(node, (ast.Expression, ast.Dict, ast.List,
+                                     ast.Tuple, ast.Set, ast.Constant,
+                                     ast.Name, ast.Call, ast.keyword,
+                                     ast.Load)) or \
+                    isinstance(node, ast.Call) and \
+                    not isinstance(node.func, ast.Name):
+                return source
+        try:
+            schema = eval(compile(tree, '<schema>', 'eval'),
+                          {'__builtins__': {}}, dict(SCHEMA_NAMES))
+            return self._format_schema(schema)
+        except Exception as e:
+            log.debug(f'Cannot format the schema {source!r}: {e}')
+            return source
+
+    @property
+    def manifest_path(self):
+        '''Manifest of the package for this interpreter and this install of
+        the package, the venvs and checkouts sharing a manifest directory
+        each have their own'''
+        install = hashlib.sha1(repr((sys.executable,
+                                     sysconfig.get_paths()['purelib'],
+                                     self.module_loc)).encode())
+        return os.path.join(self.manifest_dir or MANIFEST_DIR,
+                            f'{self.package}-{install.hexdigest()[:16]}.json')
+
+    def fingerprint(self):
+        '''Digest of the package version and of the name, size and mtime of
+        every python file of the package'''
+        digest = hashlib.sha1()
+        digest.update(repr((MANIFEST_FORMAT_VERSION,
+                            self.package,
+                            self.module_loc,
+                            self.static,
+                            getattr(self.module, '__version__', None))).encode())
+
+        for root, dirs, files in os.walk(self.module_loc):
+            dirs[:] = sorted(d for d in dirs if d not in self.IGNORE_DIR)
+            for name in sorted(files):
+                if not name.endswith('.py'):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                digest.update(repr((os.path.relpath(path, self.module_loc),
+                                    stat.st_size,
+                                    stat.st_mtime_ns)).encode())
+        return digest.hexdigest()
+
+    def load_manifest(self, fingerprint):
+        '''Return the cached output of the package, None if there is no
+        manifest or if the package changed since it was written'''
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('fingerprint') != fingerprint:
+            log.debug(f'Parser manifest of {self.package} is outdated')
+            return None
+        return manifest.get('output')
+
+    def save_manifest(self, fingerprint):
+        '''Write the output of the package walk to its manifest'''
+        manifest = {'fingerprint': fingerprint, 'output': self.output}
+        tmp = f'{self.manifest_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp, self.manifest_path)
+        except (OSError, TypeError, ValueError) as e:
+            log.debug(f'Could not write parser manifest of {self.package}: '
+                      f'{e}')
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,143 @@
+'''Parsing of outputs while they arrive in chunks
+
+A parser which can parse an output as it arrives has a `consume(...)`
+coroutine next to its `cli()`: each line of the output is sent to it as
+soon as it is received, and sending None ends the output and returns the
+structure of `cli()`. `cli()` runs the same coroutine over the whole output.
+
+    parser = IncrementalParser(ShowIpRoute(device=device))
+    for chunk in chunks:
+        parser.feed(chunk)
+    parsed = parser.close()
+'''
+
+# python
+import codecs
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema
+
+# the line boundaries of str.splitlines(), which cli() splits the output on
+_LINE_ENDS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+def consume_lines(consumer, lines):
+    '''consume_lines
+
+    Run a consume() coroutine over all the lines of an output
+
+        Args:
+            consumer (`generator`): the coroutine returned by consume()
+            lines (`iterable`): lines of the output
+
+        Returns:
+            dict: the structure returned by the coroutine
+    '''
+    send = consumer.send
+    send(None)
+    for line in lines:
+        send(line)
+    try:
+        send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError('consume() did not stop at the end of the output')
+
+
+class IncrementalParser(object):
+    '''IncrementalParser
+
+    Parse an output while it arrives: `feed()` the chunks as they are
+    received and `close()` once the output is complete. The complete lines
+    of each chunk are parsed right away, a partial line is kept until the
+    rest of it arrives. Parsers without a `consume()` coroutine are parsed
+    on `close()`.
+
+    Args:
+        parser (`MetaParser`): the parser
+        encoding (`str`): encoding of the chunks received as bytes
+        kwargs: arguments of the parser, as for `parse()`
+    '''
+
+    def __init__(self, parser, encoding='utf-8', **kwargs):
+        self.parser = parser
+        self.kwargs = kwargs
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._partial = ''
+        self._parsed = None
+        self._closed = False
+
+        consume = getattr(parser, 'consume', None)
+        if consume is None:
+            self._lines = []
+            self._send = self._lines.append
+            self._consumer = None
+        else:
+            self._consumer = consume(**kwargs)
+            self._consumer.send(None)
+            self._send = self._consumer.send
+
+    def feed(self, chunk):
+        '''feed
+
+        Parse the lines completed by a chunk of the output
+
+            Args:
+                chunk (`str` or `bytes`): the next chunk of the output
+        '''
+        if self._closed:
+            raise ValueError('feed() after close()')
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = self._decoder.decode(chunk)
+        if not chunk:
+            return
+
+        lines = (self._partial + chunk).splitlines(True)
+        last = lines[-1]
+        # a \r at the end of a chunk may be the start of a \r\n
+        if last[-1] in _LINE_ENDS and last[-1] != '\r':
+            self._partial = ''
+        else:
+            self._partial = last
+            lines.pop()
+
+        send = self._send
+        for line in lines:
+            send(line.rstrip(_LINE_ENDS))
+
+    def close(self):
+        '''close
+
+        End the output and parse its last line
+
+            Returns:
+                dict: the parsed output, as returned by `parse()`
+        '''
+        if self._closed:
+            return self._parsed
+        self.feed(self._decoder.decode(b'', final=True))
+        if self._partial:
+            self._send(self._partial.rstrip(_LINE_ENDS))
+            self._partial = ''
+        self._closed = True
+
+        if self._consumer is None:
+            self._parsed = self.parser.parse(output='\n'.join(self._lines),
+                                             **self.kwargs)
+            return self._parsed
+
+        try:
+            self._consumer.send(None)
+        except StopIteration as e:
+            parsed = e.value
+        else:
+            raise RuntimeError('consume() did not stop at the end of the '
+                               'output')
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        schema = getattr(self.parser, 'schema', None)
+        if schema:
+            Schema(schema).validate(parsed)
+        self._parsed = parsed
+        return parsed
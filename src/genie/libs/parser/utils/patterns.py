@@ -0,0 +1,114 @@
+'''Regular expressions compiled once per process for the parsers'''
+
+# python
+import re
+import threading
+
+# every Patterns declared, used by compile_patterns
+_registry = []
+_registry_lock = threading.Lock()
+
+
+class Patterns(object):
+    '''Patterns
+
+    Class level registry of the regular expressions of a parser. The
+    expressions are compiled the first time one of them is used and are then
+    shared by all the instances and calls of the parser, they are not subject
+    to the size of the `re` module cache.
+
+        class ShowExample(ShowExampleSchema):
+
+            patterns = Patterns(
+                # Interface GigabitEthernet1
+                p1=r'^Interface +(?P<interface>\\S+)$',
+                # mtu 1500
+                p2=(r'^mtu +(?P<mtu>\\d+)$', re.IGNORECASE),
+            )
+
+            def cli(self, output=None):
+                p = self.patterns
+                for line in output.splitlines():
+                    m = p.p1.match(line)
+
+    Args:
+        **patterns: name -> regex string, (regex string, flags) or compiled
+                    regex
+    '''
+
+    def __init__(self, **patterns):
+        self._sources = patterns
+        self._compiled = False
+        with _registry_lock:
+            _registry.append(self)
+
+    def compile(self):
+        '''compile all the patterns, done once'''
+        if not self._compiled:
+            for name, source in self._sources.items():
+                if isinstance(source, str):
+                    pattern = re.compile(source)
+                elif isinstance(source, tuple):
+                    pattern = re.compile(*source)
+                else:
+                    pattern = source
+                setattr(self, name, pattern)
+            self._compiled = True
+        return self
+
+    def __getattr__(self, name):
+        # only called while the patterns are not compiled yet
+        if name.startswith('_') or name not in self._sources:
+            raise AttributeError(name)
+        return getattr(self.compile(), name)
+
+    def __getitem__(self, name):
+        if name not in self._sources:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def items(self):
+        '''(name, compiled pattern) in declaration order'''
+        self.compile()
+        return [(name, getattr(self, name)) for name in self._sources]
+
+    def extend(self, **patterns):
+        '''extend
+
+        New Patterns with the patterns of this one, added to or replaced by
+        `patterns`, eg. for a subclass. A replaced pattern keeps its place
+        in the declaration order.
+
+            Args:
+                **patterns: name -> regex string, (regex string, flags) or
+                            compiled regex
+
+            Returns:
+                Patterns: the new patterns
+        '''
+        return Patterns(**dict(self._sources, **patterns))
+
+
+def compile_patterns():
+    '''compile_patterns
+
+    Compile the patterns of all the parsers imported so far, eg. in a parent
+    process before forking workers
+
+        Returns:
+            int: number of Patterns compiled
+    '''
+    with _registry_lock:
+        registry = list(_registry)
+    for patterns in registry:
+        patterns.compile()
+    return len(registry)
@@ -0,0 +1,124 @@
+'''Filter of the blocks of an output on the keys of their first line
+
+Users often parse a whole output to pick out one interface, neighbor or
+VRF. With `where`, a parser of an output made of blocks keeps the blocks
+whose key matches and skips the others right after their first line, so
+their lines never reach the patterns of the parser:
+
+    parsed = ShowInterfaces(device=device).parse(
+        where={'interface': 'Te1/0/*'})
+    parsed = ShowIpBgpNeighbors(device=device).parse(
+        where={'vrf': 'CUST-A', 'neighbor': ['10.1.1.*', '10.2.2.2']})
+
+The value of each key is a glob pattern, or a list of them, matched with
+fnmatch. The parser declares the keys it filters on, with a function
+normalizing both their values and the patterns, eg. to the full name of an
+interface:
+
+    class ShowExample(ShowExampleSchema):
+
+        patterns = Patterns(p1=r'^(?P<interface>\\S+) +is +...')
+        blocks = BlockSplitter(patterns, header=('p1',))
+        where_keys = {'interface': interface_name}
+
+        def cli(self, output=None, where=None):
+            if where is not None:
+                predicate = Predicate(where, self.where_keys)
+                return merge_parsed(
+                    self.cli(output=text)
+                    for text in self.blocks.select(output, predicate.match))
+            ...
+'''
+
+# python
+import re
+from fnmatch import fnmatchcase
+
+# parser utils
+from genie.libs.parser.utils.common import Common, \
+    INTERFACE_ABBREVIATION_MAPPING_TABLE
+
+# type at the start of an interface name, eg. the Te of Te1/0/1
+_INTERFACE_TYPE = re.compile(r'[-a-zA-Z]+')
+
+# characters of a glob pattern which match more than themselves
+_WILDCARDS = frozenset('*?[')
+
+
+def interface_name(name):
+    '''interface_name
+
+    Full name of an interface, as the parsers name it, or of the interfaces
+    of a glob pattern, eg. `TenGigabitEthernet1/0/*` for `Te1/0/*`
+
+        Args:
+            name (`str`): the name or the pattern, None for no name
+
+        Returns:
+            str: the name or the pattern with the full type of interface
+    '''
+    if not name:
+        return name
+    if _WILDCARDS.isdisjoint(name):
+        return Common.convert_intf_name(name)
+    m = _INTERFACE_TYPE.match(name)
+    if not m:
+        return name
+    types = INTERFACE_ABBREVIATION_MAPPING_TABLE['generic']
+    return types.get(m.group(), m.group()) + name[m.end():]
+
+
+class Predicate(object):
+    '''Predicate
+
+    Glob patterns the keys of a block must match for the block to be kept
+
+    Args:
+        where (`dict`): key -> glob pattern, or list of glob patterns, the
+                        value of the key must match one of them
+        keys (`dict`): keys the parser filters on -> function normalizing
+                       their values and patterns, None to match them as is
+    '''
+
+    def __init__(self, where, keys):
+        unknown = sorted(set(where) - set(keys))
+        if unknown:
+            raise ValueError('cannot filter on {}, only on {}'.format(
+                ', '.join(unknown), ', '.join(sorted(keys))))
+        self.patterns = {}
+        for key, patterns in where.items():
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            normalize = keys[key]
+            if normalize is not None:
+                patterns = [normalize(pattern) for pattern in patterns]
+            self.patterns[key] = (normalize, tuple(patterns))
+
+    def __repr__(self):
+        where = {key: list(patterns)
+                 for key, (_, patterns) in self.patterns.items()}
+        return 'Predicate({!r})'.format(where)
+
+    def match(self, values):
+        '''match
+
+        Whether the values of the keys of a block match their patterns
+
+            Args:
+                values (`dict`): values of the keys of the block, eg. the
+                                 groups of its first line, a key missing or
+                                 None having no value
+
+            Returns:
+                bool: True when each key matches one of its patterns
+        '''
+        for key, (normalize, patterns) in self.patterns.items():
+            value = values.get(key)
+            if normalize is not None:
+                value = normalize(value)
+            if value is None:
+                return False
+            value = str(value)
+            if not any(fnmatchcase(value, pattern) for pattern in patterns):
+                return False
+        return True
@@ -0,0 +1,228 @@
+'''Projection of a parsed output on the fields a caller needs
+
+Most checks read a handful of keys of a large parsed output, eg. the
+operational status and the input errors of the interfaces. With `fields`, a
+parser returns only these keys and skips the patterns which populate none
+of them:
+
+    parsed = ShowInterfaces(device=device).parse(
+        fields=['*.oper_status', '*.counters.in_errors'])
+
+A field is a path of keys joined with dots, each key a glob pattern matched
+with fnmatch, `*` for any interface, neighbor or address. A key holding a
+dot, eg. an address, is given with a field as a tuple of keys:
+`('*', 'ipv4', '10.1.1.1/24')`. A field selects the whole value at its path,
+`*.counters` selects all the counters.
+
+The parser declares the keys each pattern populates, as fields with `*` for
+the keys of the schema matched by Any(). The patterns it does not declare,
+eg. the first line of each block which gives its key, are always tried:
+
+    class ShowExample(CallSchema, ShowExampleSchema):
+
+        patterns = Patterns(p1=..., p2=..., p3=...)
+        dispatcher = LineDispatcher(patterns)
+        pattern_fields = {
+            'p2': ['*.mtu'],
+            'p3': ['*.counters.in_errors', '*.counters.in_crc_errors'],
+        }
+
+        def cli(self, output=None, fields=None):
+            dispatch = self.dispatcher
+            if fields is not None:
+                projection = Projection(fields)
+                dispatch = dispatch.select(projection.select(
+                    dispatch.names, self.pattern_fields))
+            ...
+            if fields is not None:
+                return projected_result(self, ret_dict, projection)
+            return ret_dict
+
+The projected output of a call is validated against the schema of the class
+projected on the same fields, see call_schema.
+'''
+
+# python
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+
+# metaparser
+from genie.metaparser.util.schemaengine import Any, Optional
+
+# parser utils
+from genie.libs.parser.utils.call_schema import set_call_schema
+
+# characters of a glob pattern which match more than themselves
+_WILDCARDS = frozenset('*?[')
+
+
+def _split(field):
+    if isinstance(field, str):
+        return tuple(field.split('.'))
+    return tuple(str(key) for key in field)
+
+
+def _key_name(key):
+    '''name of a key of a schema, None for a key matched by Any()'''
+    while isinstance(key, Optional):
+        if isinstance(key, Any):
+            return None
+        key = key.schema
+    return str(key)
+
+
+def _overlap(first, second):
+    '''whether two glob patterns may match the same key'''
+    if _WILDCARDS.isdisjoint(first):
+        return fnmatchcase(first, second)
+    if _WILDCARDS.isdisjoint(second):
+        return fnmatchcase(second, first)
+    return True
+
+
+class Projection(object):
+    '''Projection
+
+    Fields of a parsed output a caller needs
+
+    Args:
+        fields (`list`): the fields, each a path of glob patterns joined
+                         with dots or a tuple of glob patterns
+    '''
+
+    def __init__(self, fields):
+        if isinstance(fields, (str, tuple)):
+            fields = [fields]
+        self.fields = tuple(_split(field) for field in fields)
+        if not self.fields or not all(all(field) for field in self.fields):
+            raise ValueError('no field to project on: {!r}'.format(fields))
+
+    def __repr__(self):
+        return 'Projection({!r})'.format(['.'.join(field)
+                                          for field in self.fields])
+
+    def needs(self, path):
+        '''needs
+
+        Whether keys populated at a path are part of the projection
+
+            Args:
+                path (`str`): fields of the keys, `*` for any key, as the
+                              parser declares them for its patterns
+
+            Returns:
+                bool: True when a field selects the path, a key within it
+                      or a key above it
+        '''
+        path = _split(path)
+        return any(all(_overlap(key, pattern)
+                       for key, pattern in zip(path, field))
+                   for field in self.fields)
+
+    def select(self, names, pattern_fields):
+        '''select
+
+        Patterns which populate the fields of the projection
+
+            Args:
+                names (`iterable`): names of the patterns of the parser
+                pattern_fields (`dict`): name of a pattern -> fields of the
+                                         keys it populates
+
+            Returns:
+                tuple: the names of the patterns which populate one of the
+                       fields, and of the patterns not in `pattern_fields`,
+                       in order
+        '''
+        return tuple(name for name in names
+                     if name not in pattern_fields or
+                     any(self.needs(path) for path in pattern_fields[name]))
+
+    def project(self, parsed):
+        '''project
+
+        Keep the fields of the projection of a parsed output. A dict left
+        without any of the fields is removed.
+
+            Args:
+                parsed (`dict`): the parsed output
+
+            Returns:
+                dict: the projected output, a new dict sharing the selected
+                      values with `parsed`
+        '''
+        projected = _project(parsed, self.fields)
+        return {} if projected is None else projected
+
+    def schema(self, schema):
+        '''schema
+
+        Project a schema on the fields. The keys within which only some
+        fields are selected become optional, as the projection of their
+        value may be empty.
+
+            Args:
+                schema (`dict`): schema of the parser
+
+            Returns:
+                dict: the schema of the projected output
+        '''
+        projected = _project_schema(schema, self.fields)
+        return {} if projected is None else projected
+
+
+def _project(value, fields):
+    if not all(fields):
+        # a field ends here, the whole value is selected
+        return value
+    if not isinstance(value, Mapping):
+        return None
+    projected = {}
+    for key, item in value.items():
+        name = str(key)
+        rest = [field[1:] for field in fields if fnmatchcase(name, field[0])]
+        if rest:
+            item = _project(item, rest)
+            if item is not None:
+                projected[key] = item
+    return projected or None
+
+
+def _project_schema(schema, fields):
+    if not all(fields):
+        return schema
+    if not isinstance(schema, dict):
+        return None
+    projected = {}
+    for key, value in schema.items():
+        name = _key_name(key)
+        rest = [field[1:] for field in fields
+                if name is None or fnmatchcase(name, field[0])]
+        if not rest:
+            continue
+        value = _project_schema(value, rest)
+        if value is None:
+            continue
+        if all(rest) and not isinstance(key, Optional):
+            key = Optional(key)
+        projected[key] = value
+    return projected or None
+
+
+def projected_result(parser, parsed, projection):
+    '''projected_result
+
+    Return the projection of a parsed output from the cli() of a parser,
+    validated against the schema of the parser projected on the same fields
+
+        Args:
+            parser (`MetaParser`): the parser, a CallSchema
+            parsed (`dict`): the parsed output
+            projection (`Projection`): the fields to return
+
+        Returns:
+            dict: the projected output, empty when the output has none of
+                  the fields, which the parser reports as an empty output
+    '''
+    set_call_schema(parser, projection.schema(type(parser).schema))
+    return projection.project(parsed)
@@ -0,0 +1,243 @@
+'''Filters of the device on the output of a command
+
+A parser asked for a few fields or blocks parses a small part of a long
+output, which the device still sends in full over a slow console or SSH
+session. The parser may rather add a filter to its command, for the device
+to send the lines it parses only:
+
+    show interfaces | include line +protocol|Internet|input +errors,
+    show interfaces | begin ^ *Port-channel|^ *TenGigabitEthernet1/0/.* +is
+
+The parser declares the filters which keep every line it parses with a
+DeviceFilter, and asks it for the filter of the fields or the `where` of a
+parse. A line is kept with `| include` by the literal text each of the
+patterns selected starts with, or a regular expression of the device
+declared for the patterns starting with a value. The blocks are kept with
+`| section` when every line of a block is indented below its first line, or
+else with `| begin`, from the first block kept on:
+
+    class ShowExample(ShowExampleSchema):
+
+        patterns = Patterns(p1=..., p2=..., p3=...)
+        device_filter = DeviceFilter(
+            patterns, lines={'p1': 'line +protocol', 'p3': 'input +errors'},
+            blocks={'interface': '^{} +is'})
+
+        def cli(self, output=None, where=None):
+            if output is None:
+                pipe = None
+                if where is not None:
+                    pipe = self.device_filter.select(
+                        Predicate(where, self.where_keys))
+                output = execute_filtered(self.device, self.cli_command,
+                                          pipe)
+            ...
+
+The device filters are regular expressions, a superset of the lines or the
+blocks parsed, which the parser still filters as for the full output. A
+platform rejecting the filter sends the full output.
+'''
+
+# python
+import re
+
+# parser utils
+from genie.libs.parser.utils.dispatch import literal_prefix
+
+# characters with a meaning in a regular expression of the device, `_`
+# standing for a delimiter
+_SPECIAL = frozenset('.^$*+?{}[]()|\\_')
+
+# output of a device rejecting a filter
+_REJECTED = re.compile(r'^\s*% *(Invalid input|Unrecognized command|'
+                       r'Incomplete command)', re.MULTILINE)
+
+
+def device_regex(text):
+    '''device_regex
+
+    Regular expression of the device matching a literal text
+
+        Args:
+            text (`str`): the text
+
+        Returns:
+            str: the text with the special characters escaped
+    '''
+    return ''.join('\\' + char if char in _SPECIAL else char
+                   for char in text)
+
+
+def glob_regex(pattern):
+    '''glob_regex
+
+    Regular expression of the device matching the names a glob pattern
+    matches, and maybe others
+
+        Args:
+            pattern (`str`): the glob pattern
+
+        Returns:
+            str: the regular expression
+    '''
+    regex = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char == '*':
+            regex.append('.*')
+        elif char == '?':
+            regex.append('.')
+        elif char == '[' and ']' in pattern[index + 1:]:
+            end = pattern.index(']', index + 1)
+            chars = pattern[index:end]
+            if chars.startswith('!'):
+                chars = '^' + chars[1:]
+            regex.append('[{}]'.format(chars))
+            index = end + 1
+        else:
+            regex.append(device_regex(char))
+    return ''.join(regex)
+
+
+def interface_regex(pattern):
+    '''interface_regex
+
+    Regular expression of the device matching the interfaces a glob pattern
+    of full names matches, the first letter in either case, as the parsers
+    capitalize the names the device prints in lower case, eg. pseudowire1
+
+        Args:
+            pattern (`str`): the glob pattern
+
+        Returns:
+            str: the regular expression
+    '''
+    regex = glob_regex(pattern)
+    if regex[:1].isalpha():
+        regex = '[{}{}]{}'.format(regex[0].upper(), regex[0].lower(),
+                                  regex[1:])
+    return regex
+
+
+class DeviceFilter(object):
+    '''DeviceFilter
+
+    Filters of the device a parser may add to its command, as regular
+    expressions of the device keeping every line the parser parses
+
+    Args:
+        patterns (`Patterns`): patterns of the parser
+        lines (`dict`): name of a pattern -> regular expression of the
+                        device found in each line the pattern matches, for
+                        the patterns without a literal text to start with
+        blocks (`dict`): key of `where` -> regular expression of the device
+                         matching the first line of the blocks of the key,
+                         with `{}` for the value of the key, or function
+                         returning it for a glob pattern of the key
+        context (`iterable`): regular expressions of the device of the
+                              lines kept with the blocks in any case
+        block_filter (`str`): filter of the device keeping the blocks,
+                              `section` or `begin`
+        max_length (`int`): length of the longest filter sent to the device
+    '''
+
+    def __init__(self, patterns, lines=None, blocks=None, context=(),
+                 block_filter='section', max_length=240):
+        self.lines = {}
+        for name in patterns:
+            prefix = literal_prefix(patterns[name]).rstrip()
+            if prefix:
+                self.lines[name] = device_regex(prefix)
+        self.lines.update(lines or {})
+        self.blocks = dict(blocks or {})
+        self.context = tuple(context)
+        self.block_filter = block_filter
+        self.max_length = max_length
+
+    def _pipe(self, command, regexes):
+        regexes = list(dict.fromkeys(regexes))
+        pipe = '{} {}'.format(command, '|'.join(regexes))
+        if len(pipe) > self.max_length:
+            return None
+        return pipe
+
+    def include(self, names):
+        '''include
+
+        Filter of the device keeping the lines some patterns match
+
+            Args:
+                names (`iterable`): names of the patterns, None for all of
+                                    them
+
+            Returns:
+                str: the `include` filter, None when a pattern has no
+                     regular expression of the device or the filter is too
+                     long
+        '''
+        if names is None:
+            return None
+        regexes = [self.lines.get(name) for name in names]
+        if not regexes or None in regexes:
+            return None
+        return self._pipe('include', regexes)
+
+    def select(self, predicate):
+        '''select
+
+        Filter of the device keeping the blocks whose key matches a
+        predicate, on the first of its keys with a regular expression of
+        the device
+
+            Args:
+                predicate (`Predicate`): the keys of the blocks to keep
+
+            Returns:
+                str: the `section` or `begin` filter, None when no key of
+                     the predicate has a regular expression of the device,
+                     one of its patterns matches any value or the filter
+                     is too long
+        '''
+        if predicate is None:
+            return None
+        for key, (_, patterns) in predicate.patterns.items():
+            if key in self.blocks:
+                break
+        else:
+            return None
+        if any(set(pattern) == {'*'} for pattern in patterns):
+            return None
+        regex = self.blocks[key]
+        if isinstance(regex, str):
+            regexes = [regex.format(glob_regex(pattern))
+                       for pattern in patterns]
+        else:
+            regexes = [regex(pattern) for pattern in patterns]
+        return self._pipe(self.block_filter, list(self.context) + regexes)
+
+
+def execute_filtered(device, command, pipe=None):
+    '''execute_filtered
+
+    Execute a command with a filter of the device, or without it when the
+    device rejects the filter
+
+        Args:
+            device (`Device`): the device
+            command (`str`): the command
+            pipe (`str`): the filter, None to execute the command as is
+
+        Returns:
+            str: the output
+    '''
+    if pipe:
+        try:
+            output = device.execute('{} | {}'.format(command, pipe))
+        except Exception:
+            # the connection raises on the error patterns of the platform
+            output = None
+        if output is not None and not _REJECTED.search(output):
+            return output
+    return device.execute(command)
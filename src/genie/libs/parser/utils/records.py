@@ -0,0 +1,265 @@
+'''Compact records for the entries of very large parsed outputs
+
+The parsers of routing tables build a dict per route and per next hop, and
+these dicts take most of the memory of a parsed table. With
+`format='records'` such a parser builds records instead: mappings with the
+keys of the schema, whose values are kept in the slots of the record rather
+than in a dict.
+
+A record type is made with record_type(), from the keys of the schema
+usually present in an entry:
+
+    RouteEntry = record_type('RouteEntry', [
+        'route', 'active', 'route_preference', 'metric', 'source_protocol',
+        'source_protocol_codes', 'next_hop'],
+        interned=['source_protocol', 'source_protocol_codes'])
+
+A record is used as the dict of the entry would be:
+`record['metric']`, `record.get('next_hop', {})`,
+`record.setdefault(...)` or `record == {...}`. Keys outside of the record
+type are kept in a dict of the record. The strings of the keys in `interned`
+are interned, eg. the outgoing interface shared by thousands of routes is
+then kept once. The keys in `numbers` of a schema with string values, eg.
+the metric of a Junos route, are kept as int and read as str. An IndexMap
+keeps the entries of consecutive int keys, eg. the next hops of a route by
+index, in a list.
+
+to_dict() turns the records of a parsed output back into dicts, eg. to dump
+the output to json.
+
+The parser returns its output with records_result(), which skips the schema
+validation of that call only, and inherits from CallSchema.
+'''
+
+# python
+import re
+import sys
+from collections.abc import Mapping, MutableMapping
+
+# parser utils
+from genie.libs.parser.utils.call_schema import set_call_schema
+
+# characters of the keys replaced in the names of their slots
+_SLOT = re.compile(r'\W')
+
+# decimal strings which read the same once turned into int
+_NUMBER = re.compile(r'^(0|[1-9][0-9]*)\Z')
+
+
+class Record(MutableMapping):
+    '''Record
+
+    Base class of the record types made by record_type()
+    '''
+
+    __slots__ = ('_extra',)
+
+    # key -> slot of the keys of the record type, in order
+    _slots = {}
+    interned = frozenset()
+    numbers = frozenset()
+
+    def __init__(self, *args, **kwargs):
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            try:
+                value = getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+            return str(value) if key in self.numbers else value
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        slot = self._slots.get(key)
+        if slot is None:
+            try:
+                self._extra[key] = value
+            except AttributeError:
+                self._extra = {key: value}
+            return
+        if type(value) is str:
+            if key in self.interned:
+                value = sys.intern(value)
+            elif key in self.numbers and _NUMBER.match(value):
+                value = int(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        slot = self._slots.get(key)
+        try:
+            if slot is None:
+                del self._extra[key]
+            else:
+                delattr(self, slot)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return key in getattr(self, '_extra', ())
+
+    def __iter__(self):
+        for key, slot in self._slots.items():
+            if hasattr(self, slot):
+                yield key
+        yield from getattr(self, '_extra', ())
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self.items()))
+
+    def copy(self):
+        return type(self)(self)
+
+    def to_dict(self):
+        '''the entry as a dict, records within it included'''
+        return to_dict(self)
+
+
+class IndexMap(MutableMapping):
+    '''IndexMap
+
+    Mapping of consecutive int keys, eg. the index of the next hops of a
+    route, kept in a list. It turns into a dict once given another key.
+    '''
+
+    __slots__ = ('_first', '_items')
+
+    def __init__(self, *args, **kwargs):
+        # key of the first item of the list, None once the items are a dict
+        self._first = 0
+        self._items = []
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        first = self._first
+        if first is None:
+            return self._items[key]
+        if type(key) is int and first <= key < first + len(self._items):
+            return self._items[key - first]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        first = self._first
+        items = self._items
+        if first is not None and type(key) is int:
+            if not items:
+                self._first = key
+                items.append(value)
+                return
+            if first <= key < first + len(items):
+                items[key - first] = value
+                return
+            if key == first + len(items):
+                items.append(value)
+                return
+        if first is not None:
+            self._items = items = dict(zip(range(first, first + len(items)),
+                                           items))
+            self._first = None
+        items[key] = value
+
+    def __delitem__(self, key):
+        first = self._first
+        if first is not None:
+            if type(key) is not int or \
+                    not first <= key < first + len(self._items):
+                raise KeyError(key)
+            # the keys after the key are kept
+            self._items = dict(zip(range(first, first + len(self._items)),
+                                   self._items))
+            self._first = None
+        del self._items[key]
+
+    def __iter__(self):
+        if self._first is None:
+            return iter(self._items)
+        return iter(range(self._first, self._first + len(self._items)))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return 'IndexMap({!r})'.format(dict(self.items()))
+
+    def copy(self):
+        return type(self)(self)
+
+
+def record_type(name, keys, interned=(), numbers=(), module=None):
+    '''record_type
+
+    Make a record type, with a slot for each key
+
+        Args:
+            name (`str`): name of the type
+            keys (`list`): keys of the schema usually present in an entry
+            interned (`list`): keys whose strings are interned
+            numbers (`list`): keys whose decimal strings are kept as int and
+                              read as str
+            module (`str`): module of the type, for pickle, by default the
+                            module which calls record_type()
+
+        Returns:
+            type: the record type, a subclass of Record
+    '''
+    # a single leading underscore, a slot starting with two is name mangled
+    slots = {key: '_' + _SLOT.sub('_', key).lstrip('_') for key in keys}
+    if len(set(slots.values()) | {'_extra'}) != len(slots) + 1:
+        raise ValueError('the keys of {} are not distinct once their non '
+                         'word characters are replaced: {}'.format(name,
+                                                                   keys))
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__', __name__)
+    return type(name, (Record,), {
+        '__slots__': tuple(slots.values()),
+        '__module__': module,
+        '_slots': slots,
+        'interned': frozenset(interned),
+        'numbers': frozenset(numbers)})
+
+
+def to_dict(parsed):
+    '''to_dict
+
+    Turn the records of a parsed output into dicts
+
+        Args:
+            parsed (`dict`): parsed output, with records
+
+        Returns:
+            dict: the parsed output with dicts only
+    '''
+    if isinstance(parsed, Mapping):
+        return {key: to_dict(value) for key, value in parsed.items()}
+    if isinstance(parsed, list):
+        return [to_dict(value) for value in parsed]
+    return parsed
+
+
+def records_result(parser, parsed):
+    '''records_result
+
+    Return a parsed output with records from the cli() of a parser. The
+    schema validation of the parser, which only checks dicts, is skipped for
+    this call: the records hold the values the default format validates.
+
+        Args:
+            parser (`MetaParser`): the parser, a CallSchema
+            parsed (`dict`): the parsed output, with records
+
+        Returns:
+            dict: the parsed output
+    '''
+    set_call_schema(parser, None)
+    return parsed
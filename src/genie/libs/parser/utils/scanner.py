@@ -0,0 +1,240 @@
+'''Single pass matching of a line against all the patterns of a parser'''
+
+# python
+import re
+
+# inline flags a pattern can carry into the combined expression
+_SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'),
+                 (re.DOTALL, 's'), (re.VERBOSE, 'x'), (re.ASCII, 'a'))
+
+# global inline flags, only allowed at the start of an expression
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+_GROUP_NAME = re.compile(r'\(\?P?<(?P<name>\w+)>|\(\?P=(?P<ref>\w+)\)|'
+                         r'\(\?\((?P<cond>\w+)\)')
+
+
+def _prefix_groups(source, prefix, verbose=False):
+    '''rename the named groups of a regex source, so the group names of
+    several patterns do not clash once they are combined'''
+    parts = []
+    start = index = 0
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            if not in_class and source[index + 1:index + 2] in '123456789':
+                raise ValueError('numbered backreferences cannot be '
+                                 'combined: {}'.format(source))
+            index += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            # a ] right after [ or [^ is part of the class
+            if source[index + 1:index + 2] == '^':
+                index += 1
+            if source[index + 1:index + 2] == ']':
+                index += 1
+        elif char == '#' and verbose:
+            end = source.find('\n', index)
+            index = len(source) if end == -1 else end
+            continue
+        elif char == '(':
+            m = _GROUP_NAME.match(source, index)
+            if m:
+                name = m.lastgroup
+                if name == 'cond' and m.group(name).isdigit():
+                    raise ValueError('numbered backreferences cannot be '
+                                     'combined: {}'.format(source))
+                parts.append(source[start:m.start(name)])
+                parts.append(prefix + m.group(name))
+                start = index = m.end(name)
+                continue
+        index += 1
+    parts.append(source[start:])
+    return ''.join(parts)
+
+
+class ScanMatch(object):
+    '''ScanMatch
+
+    Match of one of the patterns of a LineScanner, with the groups numbered
+    and named as in that pattern. Supports the methods of a match object the
+    parsers use.
+    '''
+
+    __slots__ = ('_match', '_alternative', '_groupdict')
+
+    def __init__(self, match, alternative):
+        # alternative: (pattern, offset of its groups, group names, indices)
+        self._match = match
+        self._alternative = alternative
+        self._groupdict = None
+
+    @property
+    def re(self):
+        return self._alternative[0]
+
+    @property
+    def string(self):
+        return self._match.string
+
+    def _index(self, group):
+        pattern, offset = self._alternative[:2]
+        if isinstance(group, str):
+            try:
+                group = pattern.groupindex[group]
+            except KeyError:
+                raise IndexError('no such group') from None
+        elif not 0 <= group <= pattern.groups:
+            raise IndexError('no such group')
+        return offset + group
+
+    def group(self, *groups):
+        if len(groups) < 2:
+            return self._match.group(self._index(groups[0] if groups else 0))
+        return self._match.group(*[self._index(group) for group in groups])
+
+    def __getitem__(self, group):
+        return self._match.group(self._index(group))
+
+    def groups(self, default=None):
+        pattern, offset = self._alternative[:2]
+        return self._match.groups(default)[offset:offset + pattern.groups]
+
+    def groupdict(self, default=None):
+        groupdict = self._groupdict
+        if groupdict is None:
+            _, _, names, indices = self._alternative
+            if len(indices) > 1:
+                values = self._match.group(*indices)
+            elif indices:
+                values = (self._match.group(indices[0]),)
+            else:
+                values = ()
+            # parsers call groupdict() again and again on the same match
+            groupdict = self._groupdict = dict(zip(names, values))
+        if default is not None:
+            return {name: default if value is None else value
+                    for name, value in groupdict.items()}
+        return groupdict.copy()
+
+    def start(self, group=0):
+        return self._match.start(self._index(group))
+
+    def end(self, group=0):
+        return self._match.end(self._index(group))
+
+    def span(self, group=0):
+        return self._match.span(self._index(group))
+
+    def __repr__(self):
+        return '<ScanMatch {!r}: {!r}>'.format(self.re.pattern, self.group())
+
+
+class LineScanner(object):
+    '''LineScanner
+
+    Match a line against all the patterns of a parser chain with a single
+    regular expression: the patterns are combined into one alternation with
+    a named group per pattern, and `lastgroup` tells which one matched. The
+    alternatives are tried in the order of the chain, so the pattern which
+    matches is the same as with one `match()` call per pattern, for one pass
+    of the regex engine instead of up to one per pattern.
+
+        class ShowExample(ShowExampleSchema):
+
+            patterns = Patterns(
+                p1=r'^(?P<interface>\\S+) +is +(?P<status>\\w+)$',
+                p2=r'^MTU +(?P<mtu>\\d+) +bytes$',
+            )
+            scanner = LineScanner(patterns)
+
+            def cli(self, output=None):
+                for line in output.splitlines():
+                    name, m = self.scanner.match(line.strip())
+                    if name == 'p1':
+                        group = m.groupdict()
+
+    The match returned is a ScanMatch, its groups are numbered and named as
+    in the pattern which matched.
+
+    Args:
+        patterns (`Patterns`): patterns of the parser, or a dict of name ->
+                               compiled regex
+        names (`iterable`): names of the patterns of the chain, in the
+                            order they are tried, defaults to all the patterns
+    '''
+
+    def __init__(self, patterns, names=None):
+        self.patterns = patterns
+        self.names = tuple(patterns) if names is None else tuple(names)
+        self._regex = None
+        self._alternatives = None
+
+    @property
+    def regex(self):
+        '''the combined regular expression, compiled on first use'''
+        if self._regex is None:
+            self._build()
+        return self._regex
+
+    def _build(self):
+        sources = []
+        for position, name in enumerate(self.names):
+            pattern = self.patterns[name]
+            if not isinstance(pattern.pattern, str):
+                raise ValueError('only str patterns can be combined')
+            source = pattern.pattern
+            while True:
+                # the flags are already in pattern.flags
+                m = _GLOBAL_FLAGS.match(source)
+                if not m:
+                    break
+                source = source[m.end():]
+            verbose = bool(pattern.flags & re.VERBOSE)
+            source = _prefix_groups(source, '_{}_'.format(position), verbose)
+
+            letters = ''.join(letter for flag, letter in _SCOPED_FLAGS
+                              if pattern.flags & flag)
+            if letters:
+                # a trailing comment of a verbose pattern ends at a newline
+                source = '(?{}:{}{})'.format(letters, source,
+                                             '\n' if verbose else '')
+            sources.append('(?P<{}>{})'.format(name, source))
+
+        regex = re.compile('|'.join(sources))
+        alternatives = {}
+        for name in self.names:
+            pattern = self.patterns[name]
+            offset = regex.groupindex[name]
+            groups = sorted(pattern.groupindex.items(),
+                            key=lambda item: item[1])
+            alternatives[name] = (pattern, offset,
+                                  tuple(group for group, _ in groups),
+                                  tuple(offset + index for _, index in groups))
+        self._alternatives = alternatives
+        self._regex = regex
+
+    def match(self, line):
+        '''match
+
+        Match a line against the patterns of the chain
+
+            Args:
+                line (`str`): the line
+
+            Returns:
+                tuple: (name, ScanMatch) of the first pattern of the chain
+                       which matches the line, (None, None) when none does
+        '''
+        if self._regex is None:
+            self._build()
+        m = self._regex.match(line)
+        if not m:
+            return None, None
+        name = m.lastgroup
+        return name, ScanMatch(m, self._alternatives[name])
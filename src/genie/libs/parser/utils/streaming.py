@@ -0,0 +1,64 @@
+'''Parsing of outputs one line and one record at a time
+
+A record oriented parser has a `stream(lines, ...)` generator next to its
+`cli()`. `stream()` reads the output line by line and yields each record (a
+path, a route, a log line) as soon as it is complete, so memory does not
+grow with the size of the output. `cli()` builds its structure from the
+same records.
+
+    with open('show_ip_bgp.txt') as f:
+        for keys, path in ShowIpBgp(device=device).stream(f):
+            ...
+'''
+
+# python
+import mmap
+
+
+def iter_lines(source, encoding='utf-8'):
+    '''iter_lines
+
+    Lines of an output, without their line ending, read one at a time
+
+        Args:
+            source: output as a str or bytes, a text or binary file object
+                    (eg. from `socket.makefile()`), an mmap, or any iterable
+                    of lines
+            encoding (`str`): encoding of the bytes
+
+        Returns:
+            iterator of str
+    '''
+    if isinstance(source, (bytes, bytearray)):
+        source = source.decode(encoding, 'replace')
+    if isinstance(source, str):
+        # same lines as output.splitlines() in cli()
+        yield from source.splitlines()
+        return
+    if isinstance(source, mmap.mmap):
+        source = iter(source.readline, b'')
+
+    for line in source:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode(encoding, 'replace')
+        yield line.rstrip('\r\n')
+
+
+def merge_record(structure, keys, values):
+    '''merge_record
+
+    Merge a (keys, values) record into the structure of cli(), the dicts
+    along the keys are created when missing
+
+        Args:
+            structure (`dict`): structure of cli()
+            keys (`tuple`): path of the record in the structure
+            values (`dict`): values of the record
+
+        Returns:
+            dict: the dict the values were merged into
+    '''
+    for key in keys:
+        structure = structure.setdefault(key, {})
+    structure.update(values)
+    return structure
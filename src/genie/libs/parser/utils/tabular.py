@@ -0,0 +1,165 @@
+'''Parsing of column aligned tables by slicing their rows
+
+Many show commands print a table whose columns line up under a header line:
+
+    Interface              IP-Address      OK? Method Status      Protocol
+    GigabitEthernet0/0/0   10.105.44.23    YES other  up          up
+
+A ColumnTable finds the header line, takes the position of each column from
+it and slices the rows at these positions, instead of matching every row
+against a regex. Values may be aligned on either side of their header and
+may contain spaces, eg. `administratively down`. A row which does not line
+up with the header, eg. an interface name too long for its column which
+pushes the other values to the right, is matched against the fallback regex
+of the parser instead. The table ends at the first blank line after its rows,
+the lines outside of it are ignored.
+'''
+
+# python
+import re
+
+# separator lines printed between the header and the rows
+_SEPARATOR = re.compile(r'^[\s\-=+|]+$')
+
+
+class ColumnTable(object):
+    '''ColumnTable
+
+    Parse the rows of a column aligned table
+
+    Args:
+        header (`list`): regexes of the column names of the header line, in
+                         order
+        labels (`list`): keys of the values of each column, in order
+        fallback (`str` or `re.Pattern`): regex with a named group per label,
+                                          matched against the stripped rows
+                                          of the table which do not line up
+                                          with the header
+
+    Example:
+
+        table = ColumnTable(
+            header=['Interface', 'IP-Address', r'OK\\?', 'Method', 'Status',
+                    'Protocol'],
+            labels=['interface', 'ip_address', 'interface_is_ok', 'method',
+                    'status', 'protocol'],
+            fallback=r'^(?P<interface>\\S+) +(?P<ip_address>\\S+) ...$')
+
+        for row in table.rows(output):
+            row['interface'], row['status']
+    '''
+
+    def __init__(self, header, labels, fallback=None):
+        if len(header) != len(labels):
+            raise ValueError('a label is needed for each of the {} columns'
+                             .format(len(header)))
+        self.labels = tuple(labels)
+        self.header = re.compile(
+            r'^ *' + r' +'.join('({})'.format(name) for name in header) +
+            r' *$')
+        if isinstance(fallback, str):
+            fallback = re.compile(fallback)
+        self.fallback = fallback
+
+    def columns(self, line):
+        '''columns
+
+        Find the columns of a header line
+
+            Args:
+                line (`str`): the header line
+
+            Returns:
+                list: (start, end) of each column name in the line
+                None: the line is not the header of the table
+        '''
+        m = self.header.match(line)
+        if not m:
+            return None
+        return [m.span(index + 1) for index in range(len(self.labels))]
+
+    def rows(self, output):
+        '''rows
+
+        Parse the rows of the table, from its header line to the next blank
+        line. A header line found again later starts a new table with its own
+        columns
+
+            Args:
+                output (`str`): the output
+
+            Yields:
+                dict: stripped value of each column of a row, an empty string
+                      for an empty column
+        '''
+        labels = self.labels
+        fallback = self.fallback
+        header = self.header.match
+        split = None
+        # a blank line right after the header does not end the table
+        started = False
+
+        for line in output.splitlines():
+            line = line.rstrip()
+            if header(line):
+                split = self._splitter(self.columns(line))
+                started = False
+                continue
+            if split is None:
+                continue
+            if not line:
+                if started:
+                    split = None
+                continue
+            if _SEPARATOR.match(line):
+                continue
+            started = True
+            values = split(line)
+            if values is not None:
+                yield dict(zip(labels, values))
+            elif fallback is not None:
+                m = fallback.match(line.strip())
+                if m:
+                    yield {label: (m.group(label) or '').strip()
+                           for label in labels}
+
+    @staticmethod
+    def _splitter(columns):
+        '''build the function slicing a row at the columns of its header, it
+        returns None for a row which does not line up with the header'''
+        # a value may go from the end of the previous column name to the
+        # start of the next one: the cut between two columns is the last
+        # space between the two names
+        windows = [(columns[index][1], columns[index + 1][0] + 1)
+                   for index in range(len(columns) - 1)]
+        ends = [end for _, end in columns]
+
+        def split(line):
+            length = len(line)
+            rfind = line.rfind
+            cuts = [0]
+            for low, high in windows:
+                if length <= low:
+                    cut = length
+                else:
+                    cut = rfind(' ', low, high)
+                    if cut < 0:
+                        if length >= high:
+                            # a value runs over from a column into the next
+                            return None
+                        cut = length
+                cuts.append(cut)
+            cuts.append(length)
+
+            values = []
+            for start, stop, end in zip(cuts, cuts[1:], ends):
+                value = line[start:stop]
+                stripped = value.lstrip()
+                # the value has to start under its column name, whichever
+                # side it is aligned on
+                if stripped and stop - len(stripped) >= end:
+                    return None
+                values.append(stripped.rstrip())
+            return values
+
+        return split
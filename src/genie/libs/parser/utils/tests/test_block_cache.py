@@ -0,0 +1,126 @@
+import pathlib
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils.blocks import parse_cached_blocks
+from genie.libs.parser.utils.cache import BlockCache
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces, \
+    ShowIpInterface
+from genie.libs.parser.utils.tests.test_blocks import PORT_CHANNEL_OUTPUT
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+
+def golden_outputs(os, class_name):
+    folder = PARSERS / os / 'tests' / class_name / 'cli' / 'equal'
+    return [path.read_text() for path in sorted(folder.glob('*_output.txt'))]
+
+
+class TestBlockCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = BlockCache(maxsize=2)
+
+    def test_hit_returns_copy(self):
+        key = self.cache.make_key('interface Gi1')
+        self.assertEqual(len(key), 16)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {'GigabitEthernet1': {'enabled': True}})
+
+        parsed = self.cache.get(key)
+        parsed['GigabitEthernet1']['enabled'] = False
+        self.assertEqual(self.cache.get(key),
+                         {'GigabitEthernet1': {'enabled': True}})
+        self.assertEqual(self.cache.info(),
+                         {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+    def test_lru_eviction(self):
+        keys = [self.cache.make_key(text) for text in 'abc']
+        self.cache.put(keys[0], 'a')
+        self.cache.put(keys[1], 'b')
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], 'c')
+        self.assertEqual(self.cache.get(keys[0]), 'a')
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(len(self.cache), 2)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.info(),
+                         {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2})
+
+    def test_disabled(self):
+        cache = BlockCache(maxsize=0)
+        key = cache.make_key('a')
+        cache.put(key, 'a')
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 0)
+
+
+class TestParseCachedBlocks(unittest.TestCase):
+
+    def test_same_as_cli(self):
+        for parser_class in [ShowInterfaces, ShowIpInterface]:
+            for output in golden_outputs('iosxe', parser_class.__name__):
+                expected = parser_class(device=None).cli(output=output)
+                cache = BlockCache()
+                for _ in range(2):
+                    parsed = parser_class(device=None).cli(
+                        output=output, block_cache=cache)
+                    self.assertEqual(parsed, expected)
+                    self.assertEqual(list(parsed), list(expected))
+                # the second poll is parsed from the cache
+                self.assertEqual(cache.hits, cache.misses)
+
+    def test_port_channel_member(self):
+        expected = ShowInterfaces(device=None).cli(output=PORT_CHANNEL_OUTPUT)
+        cache = BlockCache()
+        for _ in range(2):
+            parsed = ShowInterfaces(device=None).cli(
+                output=PORT_CHANNEL_OUTPUT, block_cache=cache)
+            self.assertEqual(parsed, expected)
+        self.assertTrue(parsed['GigabitEthernet1/0/2']['port_channel']
+                        ['port_channel_member'])
+
+    def test_only_changed_blocks_parsed(self):
+        output = golden_outputs('iosxe', 'ShowInterfaces')[-1]
+        parser = ShowInterfaces(device=None)
+        cache = BlockCache()
+        parser.cli(output=output, block_cache=cache)
+        blocks = len(cache)
+        self.assertGreater(blocks, 1)
+
+        # the counters of a single interface changed since the last poll
+        polled = output.replace('1 interface resets', '2 interface resets',
+                                1)
+        self.assertNotEqual(polled, output)
+        with patch.object(parser, '_parse_interfaces',
+                          wraps=parser._parse_interfaces) as parse:
+            parsed = parser.cli(output=polled, block_cache=cache)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(cache.hits, blocks - 1)
+        self.assertEqual(parsed, ShowInterfaces(device=None).cli(
+            output=polled))
+
+    def test_parsed_copies(self):
+        output = golden_outputs('iosxe', 'ShowIpInterface')[0]
+        parser = ShowIpInterface(device=None)
+        cache = BlockCache()
+        first = parser.cli(output=output, block_cache=cache)
+        first.clear()
+        self.assertEqual(parser.cli(output=output, block_cache=cache),
+                         parser.cli(output=output))
+
+    def test_key_per_parser(self):
+        # the same block parsed by two parsers is cached twice
+        output = golden_outputs('iosxe', 'ShowIpInterface')[0]
+        cache = BlockCache()
+        parse_cached_blocks(ShowIpInterface(device=None), output, cache,
+                            method='_parse_interfaces')
+        self.assertEqual(cache.hits, 0)
+        parse_cached_blocks(ShowInterfaces(device=None), output, cache,
+                            method='_parse_interfaces')
+        self.assertEqual(cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
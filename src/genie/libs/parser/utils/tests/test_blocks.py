@@ -0,0 +1,174 @@
+import pathlib
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from genie.libs.parser.utils import patterns as patterns_module
+from genie.libs.parser.utils.blocks import BlockSplitter, parse_blocks, \
+    merge_parsed
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_ip_bgp import ShowIpBgpNeighbors
+from genie.libs.parser.iosxe.show_isis import ShowIsisDatabaseDetail
+from genie.libs.parser.iosxe.show_ospf_database import \
+    ShowIpOspfDatabaseRouter
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+OUTPUT = '''\
+Load for five secs: 1%/0%
+OSPF Router with ID (10.4.1.1) (Process ID 1)
+    Router Link States (Area 0)
+  Routing Bit Set on this LSA
+  LS age: 10
+  Link State ID: 10.4.1.1
+  LS age: 20
+  Link State ID: 10.16.2.2
+    Router Link States (Area 1)
+  LS age: 30
+  Link State ID: 10.36.3.3'''
+
+# a member listed by its port-channel before its own block
+PORT_CHANNEL_OUTPUT = '''\
+Port-channel1 is up, line protocol is up (connected)
+  Hardware is EtherChannel, address is 0057.d2ff.422a (bia 0057.d2ff.422a)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+  Members in this channel: Gi1/0/2
+GigabitEthernet1/0/2 is up, line protocol is up (connected)
+  Hardware is Gigabit Ethernet, address is 0057.d2ff.422b (bia 0057.d2ff.422b)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,'''
+
+
+def golden_outputs(os, class_name):
+    folder = PARSERS / os / 'tests' / class_name / 'cli' / 'equal'
+    return [path.read_text() for path in sorted(folder.glob('*_output.txt'))]
+
+
+class TestBlockSplitter(unittest.TestCase):
+
+    def setUp(self):
+        registry = patch.object(patterns_module, '_registry', [])
+        registry.start()
+        self.addCleanup(registry.stop)
+
+        self.splitter = BlockSplitter(Patterns(
+            p1=r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\)',
+            p2=r'^Router +Link +States +\(Area +(?P<area>\S+)\)$',
+            p3=r'^Routing +Bit +Set +on +this +LSA$',
+            p4=r'^LS +age: +(?P<age>\d+)$',
+        ), header=('p3', 'p4'), context=('p1', 'p2'))
+
+    def test_split(self):
+        preamble, blocks = self.splitter.split(OUTPUT)
+        lines = OUTPUT.splitlines()
+        self.assertEqual(preamble, lines[:3])
+        # Routing Bit Set and LS age start a single block
+        self.assertEqual(blocks, [
+            ((lines[1], lines[2]), lines[3:6]),
+            ((lines[1], lines[2]), lines[6:9]),
+            ((lines[1], lines[8]), lines[9:]),
+        ])
+
+    def test_batches(self):
+        lines = OUTPUT.splitlines()
+        self.assertEqual(self.splitter.batches(OUTPUT, 1), [OUTPUT])
+        self.assertEqual(self.splitter.batches(OUTPUT, 3), [
+            '\n'.join(lines[:6]),
+            '\n'.join(lines[1:3] + lines[6:9]),
+            '\n'.join([lines[1], lines[8]] + lines[9:]),
+        ])
+        # no more batches than blocks
+        self.assertEqual(len(self.splitter.batches(OUTPUT, 10)), 3)
+        self.assertEqual(self.splitter.batches('no blocks', 4),
+                         ['no blocks'])
+
+    def test_select(self):
+        lines = OUTPUT.splitlines()
+        ages = []
+
+        def keep(groups):
+            ages.append(groups.get('age'))
+            return groups.get('age') != '20'
+        # the skipped block is cut out, the next one keeps its context
+        self.assertEqual(self.splitter.select(OUTPUT, keep), [
+            '\n'.join(lines[:6]),
+            '\n'.join([lines[1], lines[8]] + lines[9:]),
+        ])
+        # a block is kept or skipped on its first line
+        self.assertEqual(ages, [None, '20', '30'])
+        self.assertEqual(self.splitter.select(OUTPUT, lambda groups: False),
+                         ['\n'.join(lines[:3])])
+        self.assertEqual(self.splitter.select('', lambda groups: True), [''])
+
+
+class TestMergeParsed(unittest.TestCase):
+
+    def test_merge_parsed(self):
+        merged = merge_parsed([
+            {'vrf': {'default': {'neighbor': {'10.4.1.1': {'up': True}}}},
+             'list_of_neighbors': ['10.4.1.1'], 'total': 1},
+            {'vrf': {'default': {'neighbor': {'10.16.2.2': {'up': False}}},
+                     'red': {}},
+             'list_of_neighbors': ['10.16.2.2'], 'total': 2},
+        ])
+        self.assertEqual(merged, {
+            'vrf': {'default': {'neighbor': {'10.4.1.1': {'up': True},
+                                             '10.16.2.2': {'up': False}}},
+                    'red': {}},
+            'list_of_neighbors': ['10.4.1.1', '10.16.2.2'], 'total': 2})
+
+    def test_single(self):
+        result = {'a': 1}
+        self.assertIs(merge_parsed([result]), result)
+
+
+class TestParseBlocks(unittest.TestCase):
+
+    def assertSameAsWhole(self, parser_class, outputs, executor):
+        for output in outputs:
+            expected = parser_class(device=None).cli(output=output)
+            parser = parser_class(device=None)
+            # about one batch per block
+            results = parse_blocks(parser, output, workers=len(output),
+                                   executor=executor)
+            if len(parser.blocks.split(output)[1]) > 1:
+                self.assertGreater(len(results), 1)
+            self.assertEqual(merge_parsed(results), expected)
+
+    def test_same_as_whole_output(self):
+        with ThreadPoolExecutor(4) as executor:
+            for os, parser_class in [('iosxe', ShowIpBgpNeighbors),
+                                     ('iosxe', ShowIpOspfDatabaseRouter),
+                                     ('iosxe', ShowIsisDatabaseDetail)]:
+                self.assertSameAsWhole(
+                    parser_class,
+                    golden_outputs(os, parser_class.__name__), executor)
+
+    def test_cli_workers(self):
+        # the interfaces are parsed in a process pool, the unnumbered
+        # interfaces and the port-channel members resolved across the batches
+        for output in golden_outputs('iosxe', 'ShowInterfaces'):
+            parser = ShowInterfaces(device=None)
+            self.assertEqual(parser.cli(output=output, workers=4),
+                             parser.cli(output=output))
+
+    def test_cli_workers_port_channel_member(self):
+        parser = ShowInterfaces(device=None)
+        expected = parser.cli(output=PORT_CHANNEL_OUTPUT)
+        self.assertEqual(expected['GigabitEthernet1/0/2']['port_channel'],
+                         {'port_channel_member': True,
+                          'port_channel_int': 'Port-channel1'})
+        self.assertEqual(parser.cli(output=PORT_CHANNEL_OUTPUT, workers=2),
+                         expected)
+
+    def test_no_workers(self):
+        output = golden_outputs('iosxe', 'ShowIsisDatabaseDetail')[0]
+        parser = ShowIsisDatabaseDetail(device=None)
+        with patch.object(parser.blocks, 'split') as split:
+            self.assertEqual(parse_blocks(parser, output),
+                             [parser.cli(output=output)])
+        split.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
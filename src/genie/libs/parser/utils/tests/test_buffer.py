@@ -0,0 +1,128 @@
+import re
+import json
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs import parser
+from genie.libs.parser.utils.buffer import buffer_pattern, finditer_lines
+from genie.libs.parser.iosxe.show_arp import ShowArp, ShowIpArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressMacVlan
+from genie.libs.parser.iosxe.show_mac_address import \
+    ShowMacAddressTableDynamic
+from genie.libs.parser.linux.ps import Ps
+
+PARSER_ROOT = pathlib.Path(parser.__file__).parent
+
+OUTPUT = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.1.1                -   aabb.0011.0022  ARPA   Vlan100
+  Internet  10.1.1.2            3   aabb.0011.0023  ARPA\r
+Internet  10.1.1.3
+          5   aabb.0011.0024  ARPA   Vlan100
+
+  \t\r
+root      2322     1  0  2019 tty2     00:00:00 /sbin/mingetty /dev/tty2
+Total: 3,  key = value , other
+'''
+
+
+def match_lines(pattern, output):
+    '''the loop finditer_lines replaces'''
+    matches = []
+    for line in output.splitlines():
+        line = line.strip()
+        m = pattern.match(line)
+        if m:
+            matches.append(m)
+    return matches
+
+
+class TestFinditerLines(unittest.TestCase):
+
+    def assertSameMatches(self, pattern, output=OUTPUT):
+        expected = match_lines(pattern, output)
+        matches = list(finditer_lines(pattern, output))
+        self.assertEqual([m.groups() for m in matches],
+                         [m.groups() for m in expected], pattern.pattern)
+        self.assertEqual([m.groupdict() for m in matches],
+                         [m.groupdict() for m in expected])
+        return matches
+
+    def test_same_as_line_loop(self):
+        for source in [
+                r'^(?P<protocol>\w+) +(?P<address>[\d\.]+) +(?P<age>[\d\-]+) +'
+                r'(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<intf>\S+))?$',
+                # \s between the fields does not go on to the next line
+                r'^(?P<protocol>\w+)\s+(?P<address>[\d\.]+)\s+(?P<age>[\d\-]+)',
+                # the trailing blanks are not part of the last field
+                r'^(?P<uid>\S+)\s+(?P<pid>\d+)\s+(?P<ppid>\d+)\s+(?P<c>\S+)'
+                r'\s+(?P<stime>\S+)\s+(?P<tty>\S+)\s+(?P<time>\S+)'
+                r'\s+(?P<cmd>.+)$',
+                r'(?P<word>\w+) +(?P<rest>.*)',
+                # negated classes and \W stop at the end of the line
+                r'^Total:\s+(?P<total>[^,]+),(?P<kv>[^\d]+)\W*(?P<end>.*)$',
+                r'(?i)^internet +(?P<address>\S+)$',
+                r'^(?P<blank>[\s\S]*)$',
+                # blank lines
+                r'^(?P<all>.*?)\s*$',
+                r'(?P<blanks>\s*)',
+                r'^(?P<a>\w+)(?: +(?P<b>\S+)$|(?P<c>.*))']:
+            self.assertSameMatches(re.compile(source))
+
+    def test_positions(self):
+        matches = self.assertSameMatches(
+            re.compile(r'^Internet +(?P<address>\S+)'))
+        self.assertEqual(OUTPUT[matches[1].start('address'):].split()[0],
+                         '10.1.1.2')
+
+    def test_lone_cr(self):
+        for output in [OUTPUT.replace('\n', '\r'),
+                       'a 1\rb 2\r\nc 3\r\r\nd 4\n\re 5']:
+            self.assertSameMatches(re.compile(r'^(?P<a>\w+) +(?P<b>\d+)$'),
+                                   output)
+
+    def test_pattern_cached(self):
+        pattern = re.compile(r'^(?P<a>\w+)$')
+        self.assertIs(buffer_pattern(pattern), buffer_pattern(pattern))
+        self.assertTrue(buffer_pattern(pattern).flags & re.MULTILINE)
+
+    def test_unsupported(self):
+        for pattern in [re.compile(r'^(?P<a>.+)$', re.DOTALL),
+                        re.compile(r'^a|^b'),
+                        re.compile(r'^[\W\d]+$')]:
+            with self.assertRaises(ValueError):
+                buffer_pattern(pattern)
+
+
+class TestBufferParsers(unittest.TestCase):
+
+    def test_cr_line_ends(self):
+        # the golden outputs parse the same with \r only line ends
+        for local_class, folder in [
+                (ShowArp, 'iosxe/tests/ShowArp'),
+                (ShowIpArp, 'iosxe/tests/ShowIpArp'),
+                (ShowMacAddressTableDynamic,
+                 'iosxe/tests/ShowMacAddressTableDynamic'),
+                (ShowMacAddressMacVlan, 'iosxe/tests/ShowMacAddressMacVlan'),
+                (Ps, 'linux/tests/Ps')]:
+            for output_file in sorted(
+                    (PARSER_ROOT / folder / 'cli' / 'equal').glob(
+                        '*_output.txt')):
+                arguments_file = output_file.with_name(
+                    output_file.name.replace('_output.txt',
+                                             '_arguments.json'))
+                arguments = {}
+                if arguments_file.exists():
+                    arguments = json.loads(arguments_file.read_text())
+                output = output_file.read_text()
+                results = []
+                for lines in [output, output.replace('\n', '\r')]:
+                    device = Mock(**{'execute.return_value': lines})
+                    results.append(
+                        local_class(device=device).parse(**arguments))
+                self.assertEqual(results[1], results[0], output_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
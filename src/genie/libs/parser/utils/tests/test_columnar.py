@@ -0,0 +1,140 @@
+import pickle
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+    SchemaError
+
+from genie.libs.parser.utils.columnar import ColumnarTable, StringColumn
+from genie.libs.parser.utils.benchmark import synthetic_table
+from genie.libs.parser.iosxe.show_arp import ShowArp, ShowIpArp
+from genie.libs.parser.iosxe.show_mac_address import \
+    ShowMacAddressTableDynamic
+
+ARP = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          12   58bf.eaff.e509  ARPA   Vlan100
+Internet  10.169.197.93           -   fa16.3eff.b7ad  ARPA
+Internet  192.168.1.203           3   0015.0100.0001  ARPA   Vlan201 pv 203
+'''
+
+MAC = '''\
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+ 10    0000.0c9f.f00a    DYNAMIC     Gi1/0/1
+ 10    0000.0c9f.f00b    DYNAMIC     Gi1/0/2
+ 20    0000.0c9f.f00c    DYNAMIC     Gi1/0/1
+Total Mac Addresses for this criterion: 3
+'''
+
+
+class TestStringColumn(unittest.TestCase):
+
+    def test_interned(self):
+        column = StringColumn()
+        for value in ['Vlan100', 'Vlan100', None, 'Vlan200', 'Vlan100']:
+            column.append(value)
+        self.assertEqual(list(column),
+                         ['Vlan100', 'Vlan100', None, 'Vlan200', 'Vlan100'])
+        self.assertEqual(column.values, [None, 'Vlan100', 'Vlan200'])
+        self.assertEqual(column[3], 'Vlan200')
+        self.assertEqual(len(column), 5)
+
+    def test_pickle(self):
+        column = StringColumn()
+        column.append('a')
+        column = pickle.loads(pickle.dumps(column))
+        column.append('b')
+        column.append('a')
+        self.assertEqual(list(column), ['a', 'b', 'a'])
+        self.assertEqual(column.values, [None, 'a', 'b'])
+
+
+class TestColumnarTable(unittest.TestCase):
+
+    def test_rows(self):
+        table = ColumnarTable(['name', 'count'], integers=['count'])
+        table.append('a', 1)
+        table.append('b', None)
+        table.freeze()
+        self.assertEqual(table.nrows, 2)
+        self.assertEqual(table.row(0)['name'], 'a')
+        self.assertIsNone(table.row(1)['count'])
+        self.assertEqual(table.row(-1)['name'], 'b')
+        self.assertEqual([dict(row.items()) for row in table.rows()],
+                         [{'name': 'a', 'count': 1},
+                          {'name': 'b', 'count': None}])
+        with self.assertRaises(IndexError):
+            table.row(2)
+
+
+class TestColumnarParsers(unittest.TestCase):
+
+    def test_arp(self):
+        parsed = ShowArp(device=Mock()).parse(output=ARP)
+        table = ShowArp(device=Mock()).parse(output=ARP, format='columnar')
+        self.assertIsInstance(table, ColumnarTable)
+        self.assertEqual(table.nrows, 4)
+        self.assertEqual(list(table['interface']),
+                         ['Vlan100', 'Vlan100', None, 'Vlan201'])
+        self.assertEqual(table.row(3)['private_vlan'], 203)
+        self.assertIsNone(table.row(0)['private_vlan'])
+        self.assertEqual(table.to_dict(), parsed)
+
+    def test_ip_arp(self):
+        table = ShowIpArp(device=Mock()).parse(output=ARP, format='columnar')
+        self.assertEqual(table.to_dict(),
+                         ShowIpArp(device=Mock()).parse(output=ARP))
+
+    def test_mac_address_table(self):
+        parser = ShowMacAddressTableDynamic(device=Mock())
+        parsed = parser.parse(output=MAC)
+        table = parser.parse(output=MAC, format='columnar')
+        self.assertEqual(list(table['vlan_id']), [10, 10, 20])
+        self.assertEqual(table.to_dict(), parsed)
+        # the schema of the parser is left for the other instances
+        self.assertEqual(ShowMacAddressTableDynamic(device=Mock()).parse(
+            output=MAC), parsed)
+
+    def test_next_call_validated(self):
+        parser = ShowArp(device=Mock())
+        parser.parse(output=ARP, format='columnar')
+        self.assertIs(parser.schema, ShowArp.schema)
+        with patch.object(parser, 'cli', return_value={'bogus': 1}):
+            with self.assertRaises(SchemaError):
+                parser.parse(output=ARP)
+
+        # nor a direct call of cli() skips the validation of parse()
+        parser.cli(output=ARP, format='columnar')
+        with patch.object(parser, 'cli', return_value={'bogus': 1}):
+            with self.assertRaises(SchemaError):
+                parser.parse(output=ARP)
+
+    def test_pickle(self):
+        table = ShowArp(device=Mock()).parse(output=ARP, format='columnar')
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertEqual(copy.nrows, 4)
+        self.assertEqual(copy.to_dict(), table.to_dict())
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowArp(device=Mock()).parse(output='', format='columnar')
+
+    def test_synthetic_tables(self):
+        # the tables of the benchmark parse to one entry per row
+        for local_class in [ShowArp, ShowIpArp, ShowMacAddressTableDynamic]:
+            output = synthetic_table('iosxe', local_class.__name__, 300)
+            table = local_class(device=Mock()).parse(output=output,
+                                                     format='columnar')
+            self.assertEqual(table.nrows, 300)
+            self.assertEqual(
+                table.to_dict(),
+                local_class(device=Mock()).parse(output=output))
+
+
+if __name__ == '__main__':
+    unittest.main()
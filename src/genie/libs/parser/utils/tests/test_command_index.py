@@ -0,0 +1,199 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import track_updates
+from genie.libs.parser.utils.command_index import CommandTrie, CommandViews
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    commands = [
+        'show version',
+        'show vrf',
+        'show ip interface brief',
+        'show interfaces',
+        'show interfaces {interface}',
+        'show ip route vrf {vrf}',
+        'show ip route vrf {vrf} {route}',
+        '/dna/intent/api/v1/interface',
+        '/dna/intent/api/v1/interface/{interface}',
+    ]
+
+    def setUp(self):
+        self.trie = CommandTrie(self.commands)
+
+    def test_exact(self):
+        self.assertEqual(self.trie.candidates('show version'.split()),
+                         ['show version'])
+
+    def test_abbreviation(self):
+        self.assertEqual(self.trie.candidates('sh v'.split()),
+                         ['show version', 'show vrf'])
+        self.assertEqual(self.trie.candidates('sh ip int br'.split()),
+                         ['show ip interface brief'])
+
+    def test_argument(self):
+        self.assertEqual(self.trie.candidates('show int Gi1/0/1'.split()),
+                         ['show interfaces {interface}'])
+        # argument spanning two tokens
+        self.assertEqual(self.trie.candidates('show int Gi 1/0/1'.split()),
+                         ['show interfaces {interface}'])
+
+    def test_single_token_argument(self):
+        self.assertEqual(
+            self.trie.candidates('show ip route vrf A 1.1.1.1'.split()),
+            ['show ip route vrf {vrf} {route}'])
+
+    def test_embedded_argument(self):
+        self.assertEqual(
+            self.trie.candidates(['/dna/intent/api/v1/interface/argument']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+        self.assertEqual(
+            self.trie.candidates(['/dna/intent/api/v1/interface']),
+            ['/dna/intent/api/v1/interface'])
+
+    def test_no_match(self):
+        self.assertEqual(self.trie.candidates('show clock'.split()), [])
+
+    def test_prefix_candidates(self):
+        self.assertEqual(
+            [c for _, c in self.trie.prefix_candidates('sh ip'.split())],
+            ['show ip interface brief', 'show ip route vrf {vrf}',
+             'show ip route vrf {vrf} {route}'])
+        self.assertEqual(
+            [c for _, c in self.trie.prefix_candidates([])],
+            self.commands)
+        self.assertEqual(self.trie.prefix_candidates('show clock'.split()),
+                         [])
+
+    def test_token_index(self):
+        postings, embedded = self.trie.token_index()
+        self.assertEqual(postings['vrf'], {'show vrf',
+                                           'show ip route vrf {vrf}',
+                                           'show ip route vrf {vrf} {route}'})
+        self.assertEqual(embedded,
+                         {'/dna/intent/api/v1/interface/{interface}'})
+
+        # rebuilt when a command is added
+        self.trie.add('show vrf detail')
+        postings, _ = self.trie.token_index()
+        self.assertIn('show vrf detail', postings['detail'])
+
+    def test_same_results_as_linear_scan(self):
+        common.parser_data = None
+        data = common._load_parser_json()
+        trie = common._get_command_index(data)
+        self.assertTrue(trie.is_built_for(data))
+
+        for search in ['sh ver', 'show ip int br', 'show int Gi1/0/1',
+                       'show ip route vrf VRF1', 'show bgp all summary']:
+            tokens = search.split()
+            expected = []
+            for command in data:
+                if command is None:
+                    continue
+                if common._matches_fuzzy(0, 0, tokens.copy(), command, {},
+                                         False):
+                    expected.append(command)
+            candidates = trie.candidates(tokens)
+            for command in expected:
+                self.assertIn(command, candidates, search)
+
+
+class FakeData(object):
+    order = ['os', 'platform']
+
+    def __init__(self, commands):
+        self.nodes = commands
+
+    def items(self):
+        return self.nodes.items()
+
+    def update(self, other):
+        for command, oses in other.items():
+            self.nodes.setdefault(command, []).extend(oses)
+
+
+class TestCommandViews(unittest.TestCase):
+
+    def setUp(self):
+        self.data = FakeData({
+            'show version': ['iosxe', 'nxos'],
+            'show clock': ['iosxe'],
+            'show interfaces {interface}': ['iosxe'],
+            'show ip route vrf {vrf} {route}': ['iosxe'],
+            'tokens': ['iosxe'],
+        })
+        self.resolved = []
+        self.views = CommandViews()
+
+    def resolver(self, command, tokens):
+        self.resolved.append(command)
+        return command.upper()
+
+    def test_view(self):
+        view = self.views.get(self.data, 'iosxe', {'os': 'iosxe'},
+                              self.resolver)
+        self.assertEqual(view.commands, ('show version', 'show clock'))
+        self.assertEqual(view.argument_commands, {
+            'show interfaces {interface}': ('interface',),
+            'show ip route vrf {vrf} {route}': ('vrf', 'route'),
+        })
+        self.assertIs(view, self.views.get(self.data, 'iosxe',
+                                           {'os': 'iosxe'}, self.resolver))
+
+        nxos = self.views.get(self.data, 'nxos', {'os': 'nxos'},
+                              self.resolver)
+        self.assertEqual(nxos.commands, ('show version',))
+
+    def test_parser_classes(self):
+        view = self.views.get(self.data, 'iosxe', {'os': 'iosxe'},
+                              self.resolver)
+        self.assertEqual(view.parser_classes(), {
+            'show version': 'SHOW VERSION',
+            'show clock': 'SHOW CLOCK',
+        })
+        view.parser_class('show clock')
+        self.assertEqual(self.resolved, ['show version', 'show clock'])
+
+    def test_invalidated_when_data_extended(self):
+        view = self.views.get(self.data, 'iosxe', {'os': 'iosxe'},
+                              self.resolver)
+        self.data.nodes['show inventory'] = ['iosxe']
+        new_view = self.views.get(self.data, 'iosxe', {'os': 'iosxe'},
+                                  self.resolver)
+        self.assertIsNot(view, new_view)
+        self.assertIn('show inventory', new_view.commands)
+
+    def test_invalidated_when_data_updated(self):
+        data = track_updates(self.data)
+        view = self.views.get(data, 'nxos', {'os': 'nxos'}, self.resolver)
+        # an os added to an existing command
+        data.update({'show clock': ['nxos']})
+        new_view = self.views.get(data, 'nxos', {'os': 'nxos'},
+                                  self.resolver)
+        self.assertIsNot(view, new_view)
+        self.assertEqual(new_view.commands, ('show version', 'show clock'))
+
+    def test_tokens_before_os(self):
+        data = FakeData({
+            'show version': {None: ['iosxe', 'nxos']},
+            'show clock': {'cisco': ['iosxe']},
+        })
+        data.order = ['origin', 'os', 'platform']
+        view = self.views.get(data, 'iosxe', {'os': 'iosxe'}, self.resolver)
+        self.assertEqual(view.commands, ('show version',))
+
+    def test_partial_device(self):
+        # a device with only os set, its custom attribute is not a dict
+        device = Mock(os='iosxe')
+        with patch.object(common, 'command_views', self.views):
+            view = common.get_command_view(device, self.data)
+            commands = common.get_parser_commands(device, self.data)
+        self.assertEqual(view.tokens, {'os': 'iosxe'})
+        self.assertEqual(commands, ['show version', 'show clock'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.discovery import declared_tokens,\
+                                              discover_module,\
+                                              discover_files,\
+                                              discover_package
+from genie.libs.parser.utils.unittests import files_to_import
+from genie.libs.parser.utils.tests.dummy_parser import package_path
+
+
+class TestStaticDiscovery(unittest.TestCase):
+
+    def test_declared_tokens(self):
+        self.assertEqual(
+            declared_tokens(os.path.join(package_path, 'iosxe',
+                                         '__init__.py')),
+            {'os': 'iosxe'})
+        self.assertEqual(
+            declared_tokens(os.path.join(package_path, '__init__.py')), {})
+
+    def test_discover_module(self):
+        classes = discover_module(
+            os.path.join(package_path, 'iosxe', 'show_clock.py'))
+        schema, parser = classes
+
+        self.assertEqual(schema['class'], 'ShowClockSchema')
+        self.assertIsNone(schema['cli_command'])
+        self.assertFalse(schema['has_cli'])
+
+        self.assertEqual(parser['class'], 'ShowClock')
+        self.assertEqual(parser['bases'], ['ShowClockSchema'])
+        self.assertEqual(parser['cli_command'], ['show clock'])
+        self.assertEqual(parser['doc'], 'Parser for show clock')
+        self.assertEqual(parser['lineno'], 25)
+        self.assertTrue(parser['has_cli'])
+        self.assertEqual(parser['unresolved_bases'], [])
+        self.assertEqual(parser['schema'],
+                         '{\n'
+                         "    'timezone': str,\n"
+                         "    'day': str,\n"
+                         "    'day_of_week': str,\n"
+                         "    'month': str,\n"
+                         "    'year': str,\n"
+                         "    'time': str,\n"
+                         '}')
+
+    def test_discover_files(self):
+        paths = [os.path.join(package_path, 'iosxe', 'show_clock.py'),
+                 os.path.join(package_path, 'iosxr', 'show_clock.py')]
+        self.assertEqual(discover_files(paths, processes=1),
+                         {path: discover_module(path) for path in paths})
+
+    def test_discover_package(self):
+        files = discover_package(package_path,
+                                 ignore_dirs=['__pycache__'],
+                                 ignore_files=['__init__.py'])
+        found = {os.path.relpath(f['path'], package_path):
+                 (f['folders'], f['tokens']) for f in files}
+        self.assertEqual(found, {
+            os.path.join('iosxe', 'show_clock.py'):
+                (['iosxe'], [{'os': 'iosxe'}]),
+            os.path.join('iosxe', 'c9300', 'show_platform.py'):
+                (['iosxe', 'c9300'], [{'os': 'iosxe'}, {'platform': 'c9300'}]),
+            os.path.join('iosxr', 'show_clock.py'):
+                (['iosxr'], [{'os': 'iosxr'}]),
+        })
+
+
+class TestFilesToImport(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.files = {}
+        for name, source in (
+                ('show_clock.py', 'class ShowClock(MetaParser):\n'
+                                  '    def cli(self):\n'
+                                  '        pass\n'),
+                ('show_alias.py', 'from .show_clock import ShowClock\n'
+                                  'ShowTime = ShowClock\n'),
+                ('utils.py', 'import re\n')):
+            path = self.files[name] = os.path.join(self.folder, name)
+            with open(path, 'w') as f:
+                f.write(source)
+        self.paths = sorted(self.files.values())
+
+    def add_unittests(self, name):
+        os.makedirs(os.path.join(self.folder, 'tests', name, 'cli', 'equal'))
+
+    def select(self, name=None):
+        return files_to_import(self.paths, discover_files(self.paths), name)
+
+    def test_defined(self):
+        self.add_unittests('ShowClock')
+        self.assertEqual(self.select(), [self.files['show_clock.py']])
+        self.assertEqual(self.select('ShowClock'),
+                         [self.files['show_clock.py']])
+
+    def test_aliased(self):
+        # ShowTime is defined by no file, all the files of its folder are
+        # imported to find it
+        self.add_unittests('ShowClock')
+        self.add_unittests('ShowTime')
+        self.assertEqual(self.select(), self.paths)
+        self.assertEqual(self.select('ShowTime'), self.paths)
+        self.assertEqual(self.select('ShowClock'),
+                         [self.files['show_clock.py']])
+
+
+if __name__ == '__main__':
+    unittest.main()
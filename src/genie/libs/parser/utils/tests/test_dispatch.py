@@ -0,0 +1,152 @@
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import patterns as patterns_module
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatch import LineDispatcher, literal_prefix
+
+
+class TestLiteralPrefix(unittest.TestCase):
+
+    def prefix(self, pattern, flags=0):
+        return literal_prefix(re.compile(pattern, flags))
+
+    def test_prefix(self):
+        self.assertEqual(self.prefix(r'^Hardware +is +(?P<type>.+)$'),
+                         'Hardware ')
+        self.assertEqual(self.prefix(r'^Input +queue: +(?P<size>\d+)'),
+                         'Input ')
+        self.assertEqual(self.prefix(r'^\(Link +ID\) +Network'), '(Link ')
+        # .match() is anchored even without ^
+        self.assertEqual(self.prefix(r'MTID\s*:'), 'MTID')
+
+    def test_leading_whitespace(self):
+        self.assertEqual(self.prefix(r'^\s*For +address'), 'For ')
+        self.assertEqual(self.prefix(r'^ +LS +age'), 'LS ')
+
+    def test_optional_characters(self):
+        self.assertEqual(self.prefix(r'^Length *: +'), 'Length')
+        self.assertEqual(self.prefix(r'^Metrics?:'), 'Metric')
+        self.assertEqual(self.prefix(r'^Encapsulation(\(s\):)?'),
+                         'Encapsulation')
+        self.assertEqual(self.prefix(r'^ab{2}c'), 'a')
+
+    def test_no_prefix(self):
+        self.assertEqual(self.prefix(r'^(?P<pkts>\d+) +packets'), '')
+        self.assertEqual(self.prefix(r'^\d+ +packets'), '')
+        self.assertEqual(self.prefix(r'^(R|r)outer'), '')
+        self.assertEqual(self.prefix(r'^Router|^Switch'), '')
+        self.assertEqual(self.prefix(r'^router', re.IGNORECASE), '')
+
+    def test_alternation_in_group(self):
+        self.assertEqual(self.prefix(r'^Router +(is|was) +up'), 'Router ')
+        self.assertEqual(self.prefix(r'^Value +[|]'), 'Value ')
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        registry = patch.object(patterns_module, '_registry', [])
+        registry.start()
+        self.addCleanup(registry.stop)
+
+        self.patterns = Patterns(
+            p1=r'^(?P<interface>\S+) +is +(?P<status>\w+)$',
+            p2=r'^Hardware +is +(?P<type>.+)$',
+            p3=r'^MTU +(?P<mtu>\d+) +bytes$',
+            p4=r'^(?P<pkts>\d+) +packets +input$',
+            p5=r'^Members +in +this +channel: +(?P<members>.+)$',
+            p6=r'^Member +(?P<member>\d+) +: +(?P<interface>\S+)$',
+            p7=r'^Mem(?P<rest>.*)$',
+        )
+        self.dispatcher = LineDispatcher(self.patterns)
+
+    def names(self, line):
+        return [name for name, _ in self.dispatcher.candidates(line)]
+
+    def test_candidates(self):
+        self.assertEqual(self.names('Hardware is Loopback'),
+                         ['p1', 'p2', 'p4'])
+        self.assertEqual(self.names('MTU 1500 bytes'), ['p1', 'p3', 'p4'])
+        self.assertEqual(self.names('0 packets input'), ['p1', 'p4'])
+        self.assertEqual(self.names(''), ['p1', 'p4'])
+
+    def test_candidates_prefix(self):
+        # Mem matches the start of the first word, Members the whole word
+        self.assertEqual(self.names('Members in this channel: Gi1/0/2'),
+                         ['p1', 'p4', 'p5', 'p7'])
+        self.assertEqual(self.names('Member 2 : Gi1/0/10'),
+                         ['p1', 'p4', 'p6', 'p7'])
+        self.assertEqual(self.names('   Members in this channel: Gi1'),
+                         ['p1', 'p4', 'p5', 'p7'])
+
+    def test_candidates_cached(self):
+        first = self.dispatcher.candidates('MTU 1500 bytes')
+        self.assertIs(self.dispatcher.candidates('MTU 9000 bytes'), first)
+
+        dispatcher = LineDispatcher(self.patterns, cache_size=1)
+        dispatcher.candidates('MTU 1500 bytes')
+        dispatcher.candidates('Hardware is Loopback')
+        self.assertEqual(list(dispatcher._cache), ['Hardware'])
+
+    def test_match(self):
+        name, m = self.dispatcher.match('Hardware is Loopback interface')
+        self.assertEqual(name, 'p2')
+        self.assertEqual(m.groupdict(), {'type': 'Loopback interface'})
+
+        self.assertEqual(self.dispatcher.match('Loopback0 is up')[0], 'p1')
+        self.assertEqual(self.dispatcher.match('Members in this channel: '
+                                               'Gi1/0/2')[0], 'p5')
+        self.assertEqual(self.dispatcher.match('unknown line'),
+                         (None, None))
+
+    def test_match_same_as_chain(self):
+        lines = ['Hardware is Loopback', 'Hardware is', 'MTU 1500 bytes',
+                 'MTU is 1500', '0 packets input', 'Member 2 : Gi1',
+                 'Memory is low', 'Members in this channel: Gi1', '',
+                 'GigabitEthernet1 is up']
+        for line in lines:
+            expected = (None, None)
+            for name in self.patterns:
+                m = self.patterns[name].match(line)
+                if m:
+                    expected = (name, m.group(0))
+                    break
+            name, m = self.dispatcher.match(line)
+            self.assertEqual((name, m.group(0) if m else None), expected,
+                             line)
+
+    def test_names_order(self):
+        dispatcher = LineDispatcher(self.patterns, ('p7', 'p6'))
+        self.assertEqual(dispatcher.match('Member 2 : Gi1')[0], 'p7')
+        # patterns not in the chain are never tried
+        self.assertEqual(dispatcher.match('MTU 1500 bytes'), (None, None))
+
+    def test_select(self):
+        dispatcher = self.dispatcher.select(['p1', 'p6'])
+        self.assertIs(self.dispatcher.select(['p6', 'p1']), dispatcher)
+        self.assertEqual(dispatcher.match('Member 2 : Gi1')[0], 'p6')
+        self.assertEqual(dispatcher.match('MTU 1500 bytes'), (None, None))
+        # the patterns after the last selected one are not tried
+        self.assertEqual([name for name, _ in
+                          dispatcher.candidates('Memory is low')], ['p1'])
+
+    def test_select_same_as_chain(self):
+        dispatcher = self.dispatcher.select(['p7'])
+        self.assertEqual(dispatcher.match('Memory low')[0], 'p7')
+        # p6 comes before p7 in the chain, the lines it matches are not
+        # matched by p7
+        self.assertEqual([name for name, _ in
+                          dispatcher.candidates('Member 2 : Gi1')],
+                         [None, None, None, 'p7'])
+        self.assertEqual(dispatcher.match('Member 2 : Gi1'), (None, None))
+
+    def test_compiled_patterns(self):
+        dispatcher = LineDispatcher({'p1': re.compile(r'^MTU +(?P<mtu>\d+)')})
+        self.assertEqual(dispatcher.match('MTU 1500')[1].groupdict(),
+                         {'mtu': '1500'})
+
+
+if __name__ == '__main__':
+    unittest.main()
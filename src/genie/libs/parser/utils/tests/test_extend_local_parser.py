@@ -1,7 +1,11 @@
 import os
 import sys
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 from genie.libs.parser.utils.common import _load_parser_json, ExtendParsers
+from genie.libs.parser.utils.extension import MANIFEST_DIR_ENV_VAR
 from genie.libs.parser.utils.tests.dummy_parser import package_path
 
 class TestExtendParser(unittest.TestCase):
@@ -9,6 +13,13 @@ class TestExtendParser(unittest.TestCase):
     def setUp(self):
         if package_path not in sys.path:
             sys.path.append(package_path)
+        # never write to the manifest directory of the user
+        self.manifest_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.manifest_dir)
+        env = patch.dict(os.environ,
+                         {MANIFEST_DIR_ENV_VAR: self.manifest_dir})
+        env.start()
+        self.addCleanup(env.stop)
 
     def test_extend_api(self):
         ext = ExtendParsers('genie.libs.parser.utils.tests.dummy_parser')
@@ -109,5 +120,92 @@ class TestExtendParser(unittest.TestCase):
                 ]
             })
 
+class TestExtendParserManifest(unittest.TestCase):
+
+    package = 'genie.libs.parser.utils.tests.dummy_parser'
+
+    def setUp(self):
+        if package_path not in sys.path:
+            sys.path.append(package_path)
+        self.manifest_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.manifest_dir)
+
+    def test_manifest_reused(self):
+        ext = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        ext.extend()
+        self.assertTrue(os.path.isfile(ext.manifest_path))
+
+        cached = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        with patch.object(ExtendParsers, '_recursive_find') as walk:
+            cached.extend()
+            walk.assert_not_called()
+        self.assertEqual(cached.output, ext.output)
+
+    def test_manifest_outdated(self):
+        ext = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        ext.extend()
+
+        cached = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        self.assertIsNone(cached.load_manifest('outdated'))
+        self.assertEqual(cached.load_manifest(cached.fingerprint()),
+                         ext.output)
+
+    def test_static_discovery(self):
+        ext = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        ext.extend(use_manifest=False)
+        static = ExtendParsers(self.package, manifest_dir=self.manifest_dir,
+                               static=True)
+        with patch.object(ExtendParsers, '_recursive_find') as walk:
+            static.extend(use_manifest=False)
+            walk.assert_not_called()
+
+        static.output.pop('extend_info')
+        ext.output.pop('extend_info')
+        self.assertEqual(static.output, ext.output)
+
+    def test_static_schema(self):
+        ext = ExtendParsers(self.package, static=True)
+        self.assertEqual(ext._static_schema("{Any(): {Optional('a'): int}}"),
+                         "{\n"
+                         "    Any('*'): {\n"
+                         "        Optional('a'): int,\n"
+                         "    },\n"
+                         "}")
+        # a sub-schema of the module cannot be evaluated
+        self.assertEqual(ext._static_schema("{'a': SUB_SCHEMA}"),
+                         "{'a': SUB_SCHEMA}")
+
+    def test_manifest_disabled(self):
+        ext = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        ext.extend(use_manifest=False)
+        self.assertFalse(os.path.isfile(ext.manifest_path))
+
+    def test_manifest_opt_in(self):
+        with patch.dict(os.environ):
+            os.environ.pop(MANIFEST_DIR_ENV_VAR, None)
+            ext = ExtendParsers(self.package)
+            with patch.object(ExtendParsers, 'save_manifest') as save:
+                ext.extend()
+                save.assert_not_called()
+
+        with patch.dict(os.environ,
+                        {MANIFEST_DIR_ENV_VAR: self.manifest_dir}):
+            ext = ExtendParsers(self.package)
+            ext.extend()
+        self.assertTrue(os.path.isfile(ext.manifest_path))
+        self.assertEqual(os.path.dirname(ext.manifest_path),
+                         self.manifest_dir)
+
+    def test_manifest_per_interpreter(self):
+        ext = ExtendParsers(self.package, manifest_dir=self.manifest_dir)
+        path = ext.manifest_path
+        with patch.object(sys, 'executable', '/other/venv/bin/python'):
+            self.assertNotEqual(ext.manifest_path, path)
+        ext.module_loc = '/other/checkout/dummy_parser'
+        self.assertNotEqual(ext.manifest_path, path)
+
+
 if __name__ == '__main__':
     unittest.main()
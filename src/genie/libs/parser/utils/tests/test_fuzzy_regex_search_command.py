@@ -50,6 +50,31 @@ class TestFuzzyRegexSearchCommand(unittest.TestCase):
 
             self.assertTrue(is_found, search)
 
+    def test_search_regex_same_as_linear_scan(self):
+        data = common._load_parser_json()
+
+        for search in ['.* version', 'show .* summary', 'sh.* ip route',
+                       'show ip bgp .*', 'show interfaces .* detail']:
+            tokens = search.split()
+            best_score = None
+            expected = []
+            for command in data:
+                if command is None:
+                    continue
+                match_result = common._matches_fuzzy(0, 0, tokens.copy(),
+                                                     command, {}, True)
+                if not match_result:
+                    continue
+                kwargs, score = match_result
+                if best_score is None or score > best_score:
+                    expected = [(command, None, kwargs)]
+                    best_score = score
+                elif score == best_score:
+                    expected.append((command, None, kwargs))
+
+            self.assertEqual(common._fuzzy_search_command(search, True),
+                             expected, search)
+
     def test_special_command(self):
         results = common._fuzzy_search_command('/dna/intent/api/v1/interface', False)
         self.assertTrue(len(results), 1)
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+
+
+class TestGetParsers(unittest.TestCase):
+
+    def setUp(self):
+        common.parser_data = None
+        common.clear_parser_cache()
+        self.device = Mock(os='iosxe')
+
+    def test_get_parsers(self):
+        commands = ['show version',
+                    'show interfaces GigabitEthernet1',
+                    'show not a real command',
+                    'show version']
+
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}) as tokens:
+            results = common.get_parsers(commands, self.device)
+            tokens.assert_called_once()
+
+            self.assertEqual(list(results), commands[:3])
+            self.assertEqual(results['show version'],
+                             common.get_parser('show version', self.device))
+            self.assertEqual(
+                results['show interfaces GigabitEthernet1'],
+                common.get_parser('show interfaces GigabitEthernet1',
+                                  self.device))
+        self.assertIsInstance(results['show not a real command'],
+                              common.ParserNotFound)
+
+    def test_parser_cls_looked_up_once(self):
+        commands = ['show interfaces GigabitEthernet1',
+                    'show interfaces GigabitEthernet2']
+
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}):
+            common._load_parser_json()
+            with patch.object(common.parser_data, 'iter_lookup',
+                              wraps=common.parser_data.iter_lookup) as lookup:
+                results = common.get_parsers(commands, self.device)
+
+        # each command template is only looked up once
+        tops = [call.kwargs['top'] for call in lookup.call_args_list]
+        self.assertEqual(len(tops), len(set(tops)))
+        (cls1, kwargs1), (cls2, kwargs2) = results.values()
+        self.assertIs(cls1, cls2)
+        self.assertEqual(kwargs1, {'interface': 'GigabitEthernet1'})
+        self.assertEqual(kwargs2, {'interface': 'GigabitEthernet2'})
+
+    def test_lookup_failures(self):
+        commands = ['s p', 'show  version', 'show version']
+
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}):
+            with patch.object(common, '_resolve_parser',
+                              wraps=common._resolve_parser) as resolve:
+                results = common.get_parsers(commands, self.device)
+
+        # both spellings of show version are searched once
+        self.assertEqual(resolve.call_count, 2)
+        self.assertIsInstance(results['s p'], common.AmbiguousParserSearch)
+        self.assertEqual(results['show  version'][0],
+                         results['show version'][0])
+
+    def test_errors_propagate(self):
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}), \
+                patch.object(common, '_resolve_parser',
+                             side_effect=ImportError('broken module')):
+            with self.assertRaises(ImportError):
+                common.get_parsers(['show version'], self.device)
+
+
+if __name__ == '__main__':
+    unittest.main()
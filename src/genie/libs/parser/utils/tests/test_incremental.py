@@ -0,0 +1,110 @@
+import pathlib
+import random
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.incremental import IncrementalParser
+from genie.libs.parser.iosxe.show_routing import ShowIpRouteDistributor, \
+    ShowIpRouteSummary
+from genie.libs.parser.iosxe.show_techsupport import ShowTechSupportIncludeShow
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+
+class FakeDevice(object):
+    '''sends a canned output in chunks of random sizes, as a device
+    connection would'''
+
+    def __init__(self, output, seed=0, max_size=64):
+        self.output = output
+        self.random = random.Random(seed)
+        self.max_size = max_size
+
+    def chunks(self):
+        index = 0
+        while index < len(self.output):
+            size = self.random.randint(1, self.max_size)
+            yield self.output[index:index + size]
+            index += size
+
+
+def golden_output(os, class_name, name):
+    return (PARSERS / os / 'tests' / class_name / 'cli' / 'equal' /
+            '{}_output.txt'.format(name)).read_text()
+
+
+class TestIncrementalParser(unittest.TestCase):
+
+    def feed(self, parser, chunks, **kwargs):
+        incremental = IncrementalParser(parser, **kwargs)
+        for chunk in chunks:
+            incremental.feed(chunk)
+        return incremental.close()
+
+    def test_same_as_parse(self):
+        goldens = [
+            (ShowIpRouteDistributor, 'golden_output1', {}),
+            (ShowIpRouteDistributor, 'golden_output2', {'vrf': 'VRF1'}),
+            (ShowIpRouteDistributor, 'golden_output3', {}),
+            (ShowTechSupportIncludeShow, 'golden_output', {}),
+        ]
+        for parser_class, name, kwargs in goldens:
+            output = golden_output('iosxe', parser_class.__name__, name)
+            expected = parser_class(device=Mock()).parse(output=output,
+                                                         **kwargs)
+            for seed in range(5):
+                device = FakeDevice(output, seed=seed)
+                parsed = self.feed(parser_class(device=Mock()),
+                                   device.chunks(), **kwargs)
+                self.assertEqual(parsed, expected, (name, seed))
+
+    def test_lines_parsed_as_they_arrive(self):
+        parser = ShowTechSupportIncludeShow(device=Mock())
+        incremental = IncrementalParser(parser)
+        incremental.feed('------------------ show version ----')
+        incremental.feed('--------------\n------------------ show ')
+        # the first line is complete, the second one is kept
+        self.assertEqual(incremental._partial, '------------------ show ')
+        incremental.feed('clock ------------------')
+        parsed = incremental.close()
+        self.assertEqual(list(parsed['cli']), ['show_version', 'show_clock'])
+
+    def test_bytes_and_line_endings(self):
+        output = ('------------------ show version ------------------\r\n'
+                  '------------------ show clöck ------------------\r\n')
+        data = output.encode()
+        # split everywhere, including between \r and \n and inside the
+        # encoding of a character
+        parsed = self.feed(ShowTechSupportIncludeShow(device=Mock()),
+                           (data[i:i + 1] for i in range(len(data))))
+        self.assertEqual(
+            parsed, ShowTechSupportIncludeShow(device=Mock()).parse(
+                output=output))
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            self.feed(ShowTechSupportIncludeShow(device=Mock()), ['\n', ''])
+
+    def test_feed_after_close(self):
+        incremental = IncrementalParser(ShowIpRouteDistributor(device=Mock()))
+        incremental.feed(golden_output('iosxe', 'ShowIpRouteDistributor',
+                                       'golden_output1'))
+        parsed = incremental.close()
+        self.assertIs(incremental.close(), parsed)
+        with self.assertRaises(ValueError):
+            incremental.feed('more')
+
+    def test_parser_without_consume(self):
+        output = golden_output('iosxe', 'ShowIpRouteSummary',
+                               'golden_output_1')
+        expected = ShowIpRouteSummary(device=Mock()).parse(output=output,
+                                                           vrf='VRF1')
+        parsed = self.feed(ShowIpRouteSummary(device=Mock()),
+                           FakeDevice(output).chunks(), vrf='VRF1')
+        self.assertEqual(parsed, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
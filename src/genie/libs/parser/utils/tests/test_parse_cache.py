@@ -0,0 +1,146 @@
+import pathlib
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import ParseCache, BlockCache
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+    ShowIpRouteDistributor
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+
+def golden_output(os, class_name, name):
+    return (PARSERS / os / 'tests' / class_name / 'cli' / 'equal' /
+            '{}_output.txt'.format(name)).read_text()
+
+
+class TestParseCache(unittest.TestCase):
+
+    def test_key(self):
+        key = ParseCache.make_key(ShowIpRoute, {'vrf': 'red'}, 'output')
+        self.assertEqual(key[:2], (
+            'genie.libs.parser.iosxe.show_routing.ShowIpRoute',
+            "[('vrf', 'red')]"))
+        self.assertNotEqual(
+            key, ParseCache.make_key(ShowIpRoute, {'vrf': 'red'}, 'outputs'))
+        self.assertNotEqual(
+            key, ParseCache.make_key(ShowIpRoute, {'vrf': 'blue'}, 'output'))
+
+    def test_key_of_literals_only(self):
+        self.assertIsNotNone(ParseCache.make_key(
+            ShowIpRoute, {'fields': ['*.mtu'], 'where': {'vrf': 'red'},
+                          'workers': None}, 'output'))
+        # the repr of an object holds its id, it would never be found
+        self.assertIsNone(ParseCache.make_key(
+            ShowInterfaces, {'block_cache': BlockCache()}, 'output'))
+
+    def test_hit_returns_copy(self):
+        cache = ParseCache()
+        key = cache.make_key(ShowIpRoute, {}, 'output')
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {'vrf': {'default': {}}})
+
+        parsed = cache.get(key)
+        parsed['vrf'].clear()
+        self.assertEqual(cache.get(key), {'vrf': {'default': {}}})
+        info = cache.info()
+        self.assertEqual((info['hits'], info['misses'], info['size']),
+                         (2, 1, 1))
+
+    def test_byte_budget(self):
+        entry = {'a': 'x' * 100}
+        cache = ParseCache(maxbytes=250)
+        keys = [cache.make_key(ShowIpRoute, {}, text) for text in 'abcd']
+        cache.put(keys[0], entry)
+        cache.put(keys[1], entry)
+        cache.get(keys[0])
+        cache.put(keys[2], entry)
+        # the least recently used entry is evicted
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[0]), entry)
+        self.assertLessEqual(cache.info()['bytes'], 250)
+        self.assertEqual(len(cache), 2)
+
+        # too large to be cached at all
+        cache.put(keys[3], {'a': 'x' * 1000})
+        self.assertIsNone(cache.get(keys[3]))
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(cache.info(), {'hits': 0, 'misses': 0, 'size': 0,
+                                        'bytes': 0, 'maxbytes': 250})
+
+
+class TestEnableParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(common.disable_parse_cache)
+        self.output = golden_output('iosxe', 'ShowIpRouteDistributor',
+                                    'golden_output1')
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(common.get_parse_cache_info())
+        self.assertIs(MetaParser.parse, common._metaparser_parse)
+
+    def test_reparse_from_cache(self):
+        expected = ShowIpRoute(device=Mock()).parse(output=self.output)
+        cache = common.enable_parse_cache()
+
+        with patch.object(ShowIpRoute, 'cli', autospec=True,
+                          side_effect=ShowIpRoute.cli) as cli:
+            first = ShowIpRoute(device=Mock()).parse(output=self.output)
+            first.clear()
+            parser = ShowIpRoute(device=Mock())
+            second = parser.parse(output=self.output)
+            # another vrf is another entry
+            ShowIpRoute(device=Mock()).parse(output=self.output, vrf='VRF1')
+
+        self.assertEqual(second, expected)
+        self.assertIs(parser.parsed_output, second)
+        self.assertEqual(cli.call_count, 2)
+        self.assertEqual(common.get_parse_cache_info()['hits'], 1)
+        self.assertEqual(len(cache), 2)
+
+        common.disable_parse_cache()
+        self.assertIs(MetaParser.parse, common._metaparser_parse)
+        self.assertIsNone(common.get_parse_cache_info())
+
+    def test_distributor_delegation(self):
+        common.enable_parse_cache()
+        expected = ShowIpRoute(device=Mock()).parse(output=self.output)
+        # the distributor hands the output to ShowIpRoute, parsed above
+        parsed = ShowIpRouteDistributor(device=Mock()).parse(
+            output=self.output)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(common.get_parse_cache_info()['hits'], 1)
+
+    def test_object_argument_not_cached(self):
+        common.enable_parse_cache()
+        output = golden_output('iosxe', 'ShowInterfaces', 'golden_output')
+        block_cache = BlockCache()
+        with patch.object(ShowInterfaces, 'cli', autospec=True,
+                          side_effect=ShowInterfaces.cli) as cli:
+            first = ShowInterfaces(device=Mock()).parse(
+                output=output, block_cache=block_cache)
+            second = ShowInterfaces(device=Mock()).parse(
+                output=output, block_cache=block_cache)
+        self.assertEqual(first, second)
+        self.assertEqual(cli.call_count, 2)
+        self.assertEqual(common.get_parse_cache_info()['size'], 0)
+
+    def test_device_output_not_cached(self):
+        common.enable_parse_cache()
+        device = Mock()
+        device.execute.return_value = self.output
+        ShowIpRoute(device=device).parse()
+        ShowIpRoute(device=device).parse()
+        self.assertEqual(device.execute.call_count, 2)
+        self.assertEqual(common.get_parse_cache_info()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
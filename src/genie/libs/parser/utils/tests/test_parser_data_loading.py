@@ -0,0 +1,105 @@
+import os
+import time
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+
+
+class TestParserDataLoading(unittest.TestCase):
+
+    threads = 32
+
+    def setUp(self):
+        common.parser_data = None
+
+    def test_loaded_once_by_concurrent_threads(self):
+        read_parser_json = common._read_parser_json
+
+        def slow_read():
+            # widen the race window
+            time.sleep(0.05)
+            return read_parser_json()
+
+        barrier = threading.Barrier(self.threads)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(common.get_parser_data())
+            results.append(common._fuzzy_search_command('show version',
+                                                        False))
+
+        with patch.object(common, '_read_parser_json',
+                          side_effect=slow_read) as read:
+            threads = [threading.Thread(target=worker)
+                       for _ in range(self.threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        read.assert_called_once()
+        data = results[::2]
+        self.assertEqual(len(data), self.threads)
+        self.assertTrue(all(d is common.parser_data for d in data))
+
+    def test_published_once_extended(self):
+        published = []
+
+        class FailingExtend(object):
+            def __init__(self, package):
+                pass
+
+            def extend(self):
+                published.append(common.parser_data)
+                raise RuntimeError('broken external package')
+
+        with patch.dict(os.environ,
+                        {'PYATS_LIBS_EXTERNAL_PARSER': 'external'}), \
+                patch.object(common, 'ExtendParsers', FailingExtend):
+            with self.assertRaises(RuntimeError):
+                common.get_parser_data()
+
+        # neither the tree without the external parsers nor the failed one
+        # are visible
+        self.assertEqual(published, [None])
+        self.assertIsNone(common.parser_data)
+
+    def test_not_published_on_wrong_order(self):
+        tree = Mock(order=['os'])
+        with patch.object(common, 'AbstractTree',
+                          Mock(**{'from_json.return_value': tree})):
+            with self.assertRaises(KeyError):
+                common.get_parser_data()
+        self.assertIsNone(common.parser_data)
+
+    def test_preload(self):
+        data = common.preload()
+        self.assertIs(data, common.parser_data)
+        self.assertTrue(common.command_index.is_built_for(data))
+        with patch.object(common, '_read_parser_json') as read:
+            self.assertIs(common.get_parser_data(), data)
+            read.assert_not_called()
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires fork')
+    def test_preload_before_fork(self):
+        common.preload()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            # the child must not load the data again
+            common._read_parser_json = None
+            loaded = common.get_parser_data() is not None
+            os.write(write, b'1' if loaded else b'0')
+            os._exit(0)
+        os.close(write)
+        self.assertEqual(os.read(read, 1), b'1')
+        os.close(read)
+        os.waitpid(pid, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
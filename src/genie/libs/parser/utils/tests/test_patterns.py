@@ -0,0 +1,82 @@
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import patterns as patterns_module
+from genie.libs.parser.utils.patterns import Patterns, compile_patterns
+
+
+class TestPatterns(unittest.TestCase):
+
+    def setUp(self):
+        # keep the patterns of the tests out of the process registry
+        registry = patch.object(patterns_module, '_registry', [])
+        registry.start()
+        self.addCleanup(registry.stop)
+
+    def test_lazy_compile(self):
+        patterns = Patterns(p1=r'^Interface +(?P<name>\S+)$',
+                            p2=r'^mtu +(?P<mtu>\d+)$')
+        self.assertNotIn('p1', vars(patterns))
+
+        m = patterns.p1.match('Interface Gi1')
+        self.assertEqual(m.groupdict(), {'name': 'Gi1'})
+        # all the patterns are compiled at once and kept as attributes
+        self.assertIsInstance(vars(patterns)['p2'], re.Pattern)
+        self.assertIs(patterns.p2, patterns.p2)
+
+    def test_shared_by_instances(self):
+        class Parser(object):
+            patterns = Patterns(p1=r'^a$')
+
+            def cli(self):
+                return self.patterns.p1
+
+        self.assertIs(Parser().cli(), Parser().cli())
+
+    def test_flags_and_compiled(self):
+        compiled = re.compile(r'^b$')
+        patterns = Patterns(p1=(r'^mtu$', re.IGNORECASE), p2=compiled)
+        self.assertTrue(patterns.p1.match('MTU'))
+        self.assertIs(patterns.p2, compiled)
+
+    def test_mapping(self):
+        patterns = Patterns(p2=r'^b$', p1=r'^a$')
+        self.assertEqual(list(patterns), ['p2', 'p1'])
+        self.assertEqual(len(patterns), 2)
+        self.assertIn('p1', patterns)
+        self.assertNotIn('p3', patterns)
+        self.assertEqual(patterns['p1'].pattern, '^a$')
+        self.assertEqual([(name, pattern.pattern)
+                          for name, pattern in patterns.items()],
+                         [('p2', '^b$'), ('p1', '^a$')])
+
+    def test_unknown(self):
+        patterns = Patterns(p1=r'^a$')
+        with self.assertRaises(AttributeError):
+            patterns.p2
+        with self.assertRaises(KeyError):
+            patterns['p2']
+
+    def test_invalid_pattern(self):
+        patterns = Patterns(p1=r'(')
+        with self.assertRaises(re.error):
+            patterns.p1
+
+    def test_extend(self):
+        patterns = Patterns(p1=r'^a$', p2=r'^b$')
+        extended = patterns.extend(p2=r'^c$', p3=r'^d$')
+        self.assertEqual(list(extended), ['p1', 'p2', 'p3'])
+        self.assertEqual(extended.p2.pattern, '^c$')
+        self.assertEqual(patterns.p2.pattern, '^b$')
+
+    def test_compile_patterns(self):
+        patterns = Patterns(p1=r'^a$')
+        other = Patterns(p1=r'^b$')
+        self.assertEqual(compile_patterns(), 2)
+        self.assertIn('p1', vars(patterns))
+        self.assertIn('p1', vars(other))
+
+
+if __name__ == '__main__':
+    unittest.main()
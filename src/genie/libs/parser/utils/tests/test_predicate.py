@@ -0,0 +1,192 @@
+import pathlib
+import unittest
+from fnmatch import fnmatchcase
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.predicate import Predicate, interface_name
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_ip_bgp import ShowIpBgpNeighbors
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+INTERFACES = '''\
+Port-channel1 is up, line protocol is up
+  Hardware is EtherChannel, address is 0050.56ff.1a0e (bia 0050.56ff.1a0e)
+  MTU 1500 bytes, BW 2000000 Kbit/sec, DLY 10 usec,
+  Members in this channel: Gi1 Gi2
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.1a0c (bia 0050.56ff.1a0c)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+GigabitEthernet2 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.1a0d (bia 0050.56ff.1a0d)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+Loopback0 is up, line protocol is up
+  Hardware is Loopback
+  Interface is unnumbered. Using address of GigabitEthernet1 (10.1.1.1)
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+TenGigabitEthernet1/0/1 is down, line protocol is down
+  Hardware is Ten Gigabit Ethernet, address is 0050.56ff.1a0f (bia 0050.56ff.1a0f)
+  MTU 1500 bytes, BW 10000000 Kbit/sec, DLY 10 usec,
+'''
+
+ROUTES = '''\
+Routing Table: VRF1
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.1.1.0/24 is directly connected, GigabitEthernet2
+L        10.1.1.1/32 is directly connected, GigabitEthernet2
+Routing Table: VRF2
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.2.2.0/24 is directly connected, GigabitEthernet3
+L        10.2.2.2/32 is directly connected, GigabitEthernet3
+'''
+
+
+def golden_outputs(os, class_name):
+    folder = PARSERS / os / 'tests' / class_name / 'cli' / 'equal'
+    return [path.read_text() for path in sorted(folder.glob('*_output.txt'))]
+
+
+class TestInterfaceName(unittest.TestCase):
+
+    def test_interface_name(self):
+        self.assertEqual(interface_name('Te1/0/*'), 'TenGigabitEthernet1/0/*')
+        self.assertEqual(interface_name('Gi[12]'), 'GigabitEthernet[12]')
+        self.assertEqual(interface_name('Gi1/0/1'), 'GigabitEthernet1/0/1')
+        self.assertEqual(interface_name('ucse1/0/1'), 'Ucse1/0/1')
+        self.assertEqual(interface_name('*'), '*')
+        self.assertIsNone(interface_name(None))
+
+
+class TestPredicate(unittest.TestCase):
+
+    def test_match(self):
+        predicate = Predicate({'vrf': 'CUST-*', 'neighbor': ['10.1.*', '::1']},
+                              {'vrf': None, 'neighbor': None})
+        self.assertTrue(predicate.match({'vrf': 'CUST-A',
+                                         'neighbor': '10.1.1.1'}))
+        self.assertTrue(predicate.match({'vrf': 'CUST-B', 'neighbor': '::1'}))
+        self.assertFalse(predicate.match({'vrf': 'CUST-A',
+                                          'neighbor': '10.2.1.1'}))
+        # a key without a value matches no pattern
+        self.assertFalse(predicate.match({'neighbor': '10.1.1.1'}))
+
+    def test_normalize(self):
+        predicate = Predicate({'interface': 'Te1/0/*'},
+                              {'interface': interface_name})
+        self.assertTrue(predicate.match({'interface': 'Te1/0/2'}))
+        self.assertTrue(predicate.match({'interface':
+                                         'TenGigabitEthernet1/0/2'}))
+        self.assertFalse(predicate.match({'interface': 'Te1/1/2'}))
+        # the default VRF has no name in the first line of its blocks
+        predicate = Predicate({'vrf': 'default'},
+                              {'vrf': lambda vrf: vrf or 'default'})
+        self.assertTrue(predicate.match({'vrf': None}))
+
+    def test_unknown_key(self):
+        with self.assertRaises(ValueError):
+            Predicate({'interface': '*', 'vlan': '10'},
+                      {'interface': interface_name})
+
+
+class TestShowInterfacesWhere(unittest.TestCase):
+
+    def parse(self, output=INTERFACES, **kwargs):
+        return ShowInterfaces(device=Mock()).parse(output=output, **kwargs)
+
+    def expected(self, parsed, pattern):
+        return {name: value for name, value in parsed.items()
+                if fnmatchcase(name, interface_name(pattern))}
+
+    def test_where(self):
+        full = self.parse()
+        for pattern in ('Gi*', 'Gi2', 'Lo0', 'Te1/0/*', 'Po1'):
+            self.assertEqual(self.parse(where={'interface': pattern}),
+                             self.expected(full, pattern), pattern)
+
+    def test_borrowed_address(self):
+        # Loopback0 borrows its address from a skipped interface
+        parsed = self.parse(where={'interface': 'Lo0'})
+        self.assertEqual(parsed['Loopback0']['ipv4'],
+                         self.parse()['Loopback0']['ipv4'])
+
+    def test_golden_outputs(self):
+        for output in golden_outputs('iosxe', 'ShowInterfaces'):
+            try:
+                full = self.parse(output)
+            except SchemaEmptyParserError:
+                continue
+            for pattern in ('Gi*', 'Te1/0/*', 'Po*'):
+                expected = self.expected(full, pattern)
+                if not expected:
+                    continue
+                self.assertEqual(self.parse(output,
+                                            where={'interface': pattern}),
+                                 expected)
+
+    def test_where_and_fields(self):
+        self.assertEqual(
+            self.parse(where={'interface': 'Gi*'}, fields='*.mtu'),
+            {'GigabitEthernet1': {'mtu': 1500},
+             'GigabitEthernet2': {'mtu': 1500}})
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            self.parse(where={'interface': 'Vlan*'})
+
+
+class TestShowIpBgpNeighborsWhere(unittest.TestCase):
+
+    def parse(self, output, **kwargs):
+        return ShowIpBgpNeighbors(device=Mock()).parse(output=output,
+                                                       **kwargs)
+
+    def test_golden_outputs(self):
+        checked = 0
+        for output in golden_outputs('iosxe', 'ShowIpBgpNeighbors'):
+            try:
+                full = self.parse(output)
+            except SchemaEmptyParserError:
+                continue
+            for vrf, neighbors in full.get('vrf', {}).items():
+                neighbor = next(iter(neighbors['neighbor']))
+                parsed = self.parse(output, where={'vrf': vrf,
+                                                   'neighbor': neighbor})
+                self.assertEqual(list(parsed['vrf']), [vrf])
+                self.assertEqual(
+                    parsed['vrf'][vrf]['neighbor'],
+                    {neighbor: neighbors['neighbor'][neighbor]})
+                checked += 1
+        self.assertTrue(checked)
+
+
+class TestShowIpRouteWhere(unittest.TestCase):
+
+    def parse(self, **kwargs):
+        return ShowIpRoute(device=Mock()).parse(output=ROUTES, **kwargs)
+
+    def test_where(self):
+        full = self.parse()
+        self.assertEqual(sorted(full['vrf']), ['VRF1', 'VRF2'])
+        self.assertEqual(self.parse(where={'vrf': 'VRF2'}),
+                         {'vrf': {'VRF2': full['vrf']['VRF2']}})
+        self.assertEqual(self.parse(where={'vrf': ['VRF*']}), full)
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            self.parse(where={'vrf': 'default'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Any, Optional
+
+from genie.libs.parser.utils.projection import Projection
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+INTERFACES = '''\
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.1a0c (bia 0050.56ff.1a0c)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Last clearing of "show interface" counters never
+  5 minute input rate 0 bits/sec, 0 packets/sec
+  5 minute output rate 0 bits/sec, 0 packets/sec
+     12 packets input, 1200 bytes, 0 no buffer
+     Received 0 broadcasts (0 IP multicasts)
+     0 runts, 0 giants, 0 throttles
+     3 input errors, 1 CRC, 0 frame, 0 overrun, 0 ignored
+     10 packets output, 1000 bytes, 0 underruns
+Loopback0 is administratively down, line protocol is down
+  Hardware is Loopback
+  Interface is unnumbered. Using address of GigabitEthernet1 (10.1.1.1)
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+'''
+
+SCHEMA = {
+    Any(): {
+        'name': str,
+        Optional('mtu'): int,
+        Optional('counters'): {
+            'in_errors': int,
+            Optional('in_crc_errors'): int,
+        },
+    },
+}
+
+
+class TestProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.parsed = {
+            'Gi1': {'name': 'Gi1', 'mtu': 1500,
+                    'counters': {'in_errors': 3, 'in_crc_errors': 1}},
+            'Lo0': {'name': 'Lo0', 'mtu': 1514},
+        }
+
+    def test_project(self):
+        projection = Projection(['*.counters.in_errors', 'Lo*.mtu'])
+        self.assertEqual(projection.project(self.parsed),
+                         {'Gi1': {'counters': {'in_errors': 3}},
+                          'Lo0': {'mtu': 1514}})
+        self.assertEqual(Projection('*.counters').project(self.parsed),
+                         {'Gi1': {'counters': {'in_errors': 3,
+                                               'in_crc_errors': 1}}})
+        self.assertEqual(Projection('*.missing').project(self.parsed), {})
+
+    def test_dotted_keys(self):
+        parsed = {'ipv4': {'10.1.1.1/24': {'ip': '10.1.1.1'}}}
+        self.assertEqual(Projection([('ipv4', '10.1.1.1/24', 'ip')]).project(
+            parsed), parsed)
+
+    def test_schema(self):
+        schema = Projection('*.counters.in_errors').schema(SCHEMA)
+        (key, interface), = schema.items()
+        self.assertIsInstance(key, Any)
+        (key, counters), = interface.items()
+        self.assertIsInstance(key, Optional)
+        self.assertEqual(counters, {'in_errors': int})
+        # a required key is optional once only part of it is selected
+        schema = Projection('vrf.*.name').schema({'vrf': SCHEMA})
+        key, = schema
+        self.assertIsInstance(key, Optional)
+        # and stays required once selected
+        (_, interface), = Projection('*.name').schema(SCHEMA).items()
+        self.assertEqual(interface, {'name': str})
+
+    def test_needs(self):
+        projection = Projection(['*.counters.in_errors', 'Gi1.mtu'])
+        self.assertTrue(projection.needs('*.counters'))
+        self.assertTrue(projection.needs('*.counters.in_err*'))
+        self.assertTrue(projection.needs('*'))
+        self.assertFalse(projection.needs('*.counters.in_crc_errors'))
+        self.assertFalse(projection.needs('Lo*.mtu'))
+        self.assertEqual(projection.select(
+            ['p1', 'p2', 'p3'], {'p2': ['*.mtu'], 'p3': ['*.queues']}),
+            ('p1', 'p2'))
+
+    def test_no_fields(self):
+        with self.assertRaises(ValueError):
+            Projection([])
+        with self.assertRaises(ValueError):
+            Projection(['*.counters', ''])
+
+
+class TestShowInterfacesFields(unittest.TestCase):
+
+    def parse(self, **kwargs):
+        return ShowInterfaces(device=Mock()).parse(output=INTERFACES,
+                                                   **kwargs)
+
+    def test_fields(self):
+        parsed = self.parse(fields=['*.oper_status', '*.counters.in_errors'])
+        self.assertEqual(parsed, {
+            'GigabitEthernet1': {'oper_status': 'up',
+                                 'counters': {'in_errors': 3}},
+            'Loopback0': {'oper_status': 'down'}})
+
+    def test_same_as_projected_output(self):
+        full = self.parse()
+        for fields in (['*.counters'], ['*.counters.rate'], ['*.ipv4'],
+                       ['*.counters.last_clear'], ['Lo*.ipv4.unnumbered'],
+                       ['*.mtu', '*.bandwidth'], ['*.counters.in_pkts']):
+            self.assertEqual(self.parse(fields=fields),
+                             Projection(fields).project(full), fields)
+
+    def test_workers(self):
+        fields = ['*.enabled', '*.counters.in_crc_errors']
+        self.assertEqual(self.parse(fields=fields, workers=2),
+                         self.parse(fields=fields))
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            self.parse(fields=['*.tunnel_ttl'])
+
+    def test_schema_of_one_call(self):
+        parser = ShowInterfaces(device=Mock())
+        full = parser.parse(output=INTERFACES)
+        self.assertEqual(
+            parser.parse(output=INTERFACES, fields=['*.oper_status']),
+            Projection(['*.oper_status']).project(full))
+        self.assertIs(parser.schema, ShowInterfaces.schema)
+        self.assertEqual(parser.parse(output=INTERFACES), full)
+        self.assertEqual(
+            parser.parse(output=INTERFACES, fields=['*.mtu']),
+            Projection(['*.mtu']).project(full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,324 @@
+import pathlib
+import re
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import patterns as patterns_module
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.predicate import Predicate, interface_name
+from genie.libs.parser.utils.pushdown import DeviceFilter, device_regex, \
+    glob_regex, interface_regex, execute_filtered
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+PARSERS = pathlib.Path(__file__).parents[2]
+
+INTERFACES = '''\
+Port-channel1 is up, line protocol is up
+  Hardware is EtherChannel, address is 0050.56ff.1a0e (bia 0050.56ff.1a0e)
+  MTU 1500 bytes, BW 2000000 Kbit/sec, DLY 10 usec,
+  Members in this channel: Gi1 Gi2
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.1a0c (bia 0050.56ff.1a0c)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     12 packets input, 1200 bytes, 0 no buffer
+     3 input errors, 1 CRC, 0 frame, 0 overrun, 0 ignored
+GigabitEthernet2 is up, line protocol is up
+  Hardware is CSR vNIC, address is 0050.56ff.1a0d (bia 0050.56ff.1a0d)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+Loopback0 is up, line protocol is up
+  Hardware is Loopback
+  Interface is unnumbered. Using address of GigabitEthernet1 (10.1.1.1)
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+pseudowire1 is up
+  MTU 1500 bytes, BW 10000000 Kbit/sec
+TenGigabitEthernet1/0/1 is down, line protocol is down
+  Hardware is Ten Gigabit Ethernet, address is 0050.56ff.1a0f (bia 0050.56ff.1a0f)
+  MTU 1500 bytes, BW 10000000 Kbit/sec, DLY 10 usec,
+'''
+
+ROUTES = '''\
+Routing Table: VRF1
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.1.1.0/24 is directly connected, GigabitEthernet2
+L        10.1.1.1/32 is directly connected, GigabitEthernet2
+Routing Table: VRF2
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.2.2.0/24 is directly connected, GigabitEthernet3
+L        10.2.2.2/32 is directly connected, GigabitEthernet3
+'''
+
+REJECTED = '''\
+                     ^
+% Invalid input detected at '^' marker.
+'''
+
+
+def golden_outputs(os, class_name):
+    folder = PARSERS / os / 'tests' / class_name / 'cli' / 'equal'
+    return [path.read_text() for path in sorted(folder.glob('*_output.txt'))]
+
+
+def include(lines, regex):
+    return [line for line in lines if regex.search(line)]
+
+
+def section(lines, regex):
+    kept = []
+    indent = None
+    for line in lines:
+        depth = len(line) - len(line.lstrip())
+        if indent is not None and line.strip() and depth > indent:
+            kept.append(line)
+            continue
+        indent = None
+        if regex.search(line):
+            kept.append(line)
+            indent = depth
+    return kept
+
+
+def begin(lines, regex):
+    for index, line in enumerate(lines):
+        if regex.search(line):
+            return lines[index:]
+    return []
+
+
+class Device(object):
+    '''a device filtering the outputs of its commands'''
+
+    filters = {'include': include, 'section': section, 'begin': begin}
+
+    def __init__(self, outputs, pipes=True):
+        self.outputs = outputs
+        self.pipes = pipes
+        self.commands = []
+
+    def execute(self, command):
+        self.commands.append(command)
+        command, _, pipe = command.partition(' | ')
+        output = self.outputs[command]
+        if not pipe:
+            return output
+        if not self.pipes:
+            return REJECTED
+        name, _, regex = pipe.partition(' ')
+        return '\n'.join(self.filters[name](output.splitlines(),
+                                            re.compile(regex)))
+
+
+class InterfaceOutputs(dict):
+    '''`show interfaces <interface>` as the block of the interface in the
+    output of `show interfaces`'''
+
+    def __missing__(self, command):
+        name = command.split()[-1]
+        return '\n'.join(ShowInterfaces.blocks.select(
+            self['show interfaces'],
+            lambda groups: interface_name(groups['interface']) == name))
+
+
+class TestRegex(unittest.TestCase):
+
+    def test_device_regex(self):
+        self.assertEqual(device_regex('No. of (PF_JUMBO)'),
+                         r'No\. of \(PF\_JUMBO\)')
+
+    def test_glob_regex(self):
+        self.assertEqual(glob_regex('TenGigabitEthernet1/0/*'),
+                         'TenGigabitEthernet1/0/.*')
+        self.assertEqual(glob_regex('Gi[!12]?.100'), r'Gi[^12].\.100')
+        self.assertEqual(glob_regex('Gi[1'), r'Gi\[1')
+
+    def test_interface_regex(self):
+        self.assertEqual(interface_regex('Pseudowire*'), '[Pp]seudowire.*')
+        self.assertEqual(interface_regex('*1'), '.*1')
+
+
+class TestDeviceFilter(unittest.TestCase):
+
+    def setUp(self):
+        registry = patch.object(patterns_module, '_registry', [])
+        registry.start()
+        self.addCleanup(registry.stop)
+
+        self.device_filter = DeviceFilter(Patterns(
+            p1=r'^(?P<interface>\S+) +is +(?P<status>\w+)$',
+            p2=r'^Hardware +is +(?P<type>.+)$',
+            p3=r'^(?P<pkts>\d+) +packets +input$',
+            p4=r'^(?P<errors>\d+) +input +errors$',
+            p5=r'^No\. +of +members: +(?P<members>\d+)$',
+        ), lines={'p1': '^[^ ]+ +is', 'p3': 'packets +input'},
+            blocks={'interface': '^{} +is'}, context=('^Port-channel',),
+            max_length=80)
+
+    def test_include(self):
+        self.assertEqual(self.device_filter.include(['p1', 'p2', 'p5']),
+                         r'include ^[^ ]+ +is|Hardware|No\.')
+        # p4 has neither a literal text to start with nor a regex
+        self.assertIsNone(self.device_filter.include(['p1', 'p4']))
+        self.assertIsNone(self.device_filter.include(None))
+
+    def test_select(self):
+        predicate = Predicate({'interface': ['Gi1', 'Te1/0/*']},
+                              {'interface': None})
+        self.assertEqual(self.device_filter.select(predicate),
+                         'section ^Port-channel|^Gi1 +is|^Te1/0/.* +is')
+        # a pattern matching any interface keeps all the blocks
+        predicate = Predicate({'interface': ['Gi1', '*']},
+                              {'interface': None})
+        self.assertIsNone(self.device_filter.select(predicate))
+        predicate = Predicate({'vrf': 'CUST-A'}, {'vrf': None})
+        self.assertIsNone(self.device_filter.select(predicate))
+
+    def test_max_length(self):
+        predicate = Predicate({'interface': ['Gi{}'.format(index)
+                                             for index in range(20)]},
+                              {'interface': None})
+        self.assertIsNone(self.device_filter.select(predicate))
+
+
+class TestExecuteFiltered(unittest.TestCase):
+
+    def test_filtered(self):
+        device = Device({'show interfaces': INTERFACES})
+        output = execute_filtered(device, 'show interfaces',
+                                  'include line +protocol')
+        self.assertEqual(len(output.splitlines()), 5)
+        self.assertEqual(device.commands,
+                         ['show interfaces | include line +protocol'])
+
+    def test_rejected(self):
+        device = Device({'show interfaces': INTERFACES}, pipes=False)
+        self.assertEqual(execute_filtered(device, 'show interfaces',
+                                          'include line +protocol'),
+                         INTERFACES)
+        self.assertEqual(device.commands,
+                         ['show interfaces | include line +protocol',
+                          'show interfaces'])
+
+    def test_raised(self):
+        device = Mock()
+        device.execute.side_effect = [Exception('invalid input'), INTERFACES]
+        self.assertEqual(execute_filtered(device, 'show interfaces',
+                                          'include line +protocol'),
+                         INTERFACES)
+
+
+class TestShowInterfacesPushdown(unittest.TestCase):
+
+    def parse(self, device=None, **kwargs):
+        try:
+            return ShowInterfaces(device=device).parse(**kwargs)
+        except SchemaEmptyParserError:
+            return {}
+
+    def test_fields(self):
+        device = Device({'show interfaces': INTERFACES})
+        parsed = self.parse(device, fields=['*.counters.in_errors'])
+        self.assertEqual(parsed, {'GigabitEthernet1':
+                                  {'counters': {'in_errors': 3}}})
+        self.assertEqual(parsed, self.parse(output=INTERFACES,
+                                            fields=['*.counters.in_errors']))
+        command, = device.commands
+        self.assertTrue(command.startswith('show interfaces | include '))
+
+    def test_fields_golden_outputs(self):
+        for output in golden_outputs('iosxe', 'ShowInterfaces'):
+            for fields in (['*.oper_status'], ['*.counters'], ['*.ipv4'],
+                           ['*.counters.rate', '*.mtu'], ['*.port_channel'],
+                           ['*.duplex_mode', '*.flow_control'],
+                           ['*.counters.in_pkts'], ['*.queues']):
+                device = Device({'show interfaces': output})
+                self.assertEqual(self.parse(device, fields=fields),
+                                 self.parse(output=output, fields=fields))
+
+    def test_where(self):
+        for pattern in ('Gi2', 'Te1/0/*', 'pseudowire1', 'Po1'):
+            device = Device({'show interfaces': INTERFACES})
+            where = {'interface': pattern}
+            self.assertEqual(self.parse(device, where=where),
+                             self.parse(output=INTERFACES, where=where))
+            command, = device.commands
+            self.assertTrue(command.startswith('show interfaces | begin '))
+
+    def test_where_golden_outputs(self):
+        for output in golden_outputs('iosxe', 'ShowInterfaces'):
+            names = list(self.parse(output=output))
+            outputs = InterfaceOutputs({'show interfaces': output})
+            # some interfaces of each output, and a glob of each type
+            patterns = set(names[::max(1, len(names) // 8)])
+            patterns.update(re.sub(r'[0-9/.:]+$', '*', name)
+                            for name in names)
+            # a line of its block is not indented, golden_output2
+            if 'Vlan115' in names:
+                patterns.add('Vlan115')
+            for pattern in sorted(patterns):
+                device = Device(outputs)
+                where = {'interface': pattern}
+                self.assertEqual(self.parse(device, where=where),
+                                 self.parse(output=output, where=where),
+                                 pattern)
+
+    def test_borrowed_address(self):
+        # the device begins at Loopback0, after GigabitEthernet1
+        output = '\n'.join(INTERFACES.splitlines()[4:])
+        lender = '\n'.join(INTERFACES.splitlines()[4:10])
+        device = Device({'show interfaces': output,
+                         'show interfaces GigabitEthernet1': lender})
+        where = {'interface': 'Lo0'}
+        self.assertEqual(self.parse(device, where=where),
+                         self.parse(output=output, where=where))
+        self.assertEqual(device.commands[1:],
+                         ['show interfaces GigabitEthernet1'])
+
+    def test_rejected(self):
+        device = Device({'show interfaces': INTERFACES}, pipes=False)
+        where = {'interface': 'Gi*'}
+        self.assertEqual(self.parse(device, where=where),
+                         self.parse(output=INTERFACES, where=where))
+        self.assertEqual(len(device.commands), 2)
+
+    def test_not_filtered(self):
+        device = Device({'show interfaces': INTERFACES})
+        self.parse(device, where={'interface': '*'})
+        self.assertEqual(device.commands, ['show interfaces'])
+
+
+class TestShowIpRoutePushdown(unittest.TestCase):
+
+    def parse(self, device=None, **kwargs):
+        try:
+            return ShowIpRoute(device=device).parse(**kwargs)
+        except SchemaEmptyParserError:
+            return {}
+
+    def test_where(self):
+        device = Device({'show ip route vrf *': ROUTES})
+        where = {'vrf': 'VRF2'}
+        self.assertEqual(self.parse(device, vrf='*', where=where),
+                         self.parse(output=ROUTES, vrf='*', where=where))
+        self.assertEqual(device.commands,
+                         ['show ip route vrf * | begin Routing Table: VRF2'])
+
+    def test_routes_before_first_table(self):
+        # the routes of the default vrf come before any routing table
+        device = Device({'show ip route': ROUTES})
+        self.parse(device, where={'vrf': ['default', 'VRF2']})
+        self.assertEqual(device.commands, ['show ip route'])
+
+
+if __name__ == '__main__':
+    unittest.main()
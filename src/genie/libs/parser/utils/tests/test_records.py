@@ -0,0 +1,183 @@
+import copy
+import json
+import pickle
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+    SchemaError
+
+from genie.libs.parser.utils.records import IndexMap, Record, \
+    record_type, to_dict
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+    ShowIpRouteDistributor, ShowIpv6Route, ShowIpv6RouteDistributor, \
+    IpRouteEntry
+from genie.libs.parser.iosxr.show_routing import ShowRouteIpv4
+from genie.libs.parser.junos.show_route import ShowRoute
+
+Entry = record_type('Entry', ['name', 'metric', '#text', 'next-hop'],
+                    interned=['name'], numbers=['metric'])
+
+IOSXE = '''\
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 3 subnets, 2 masks
+O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+                     [110/2] via 10.186.3.2, 06:46:59, GigabitEthernet0/2
+C        10.4.1.1/32 is directly connected, Loopback0
+S*       0.0.0.0/0 [1/0] via 10.50.15.1
+'''
+
+IOSXE_IPV6 = '''\
+IPv6 Routing Table - default - 3 entries
+Codes: C - Connected, L - Local, S - Static, U - Per-user Static route
+       B - BGP, R - RIP, O - OSPF Intra, OI - OSPF Inter
+C   2001:DB8:1:1::/64 [0/0]
+     via GigabitEthernet0/0, directly connected
+L   2001:DB8:1:1::1/128 [0/0]
+     via GigabitEthernet0/0, receive
+O   2001:DB8:2:2::/64 [110/2]
+     via 2001:DB8:1:1::2
+'''
+
+IOSXR = '''\
+O    10.2.3.0/24 [110/2] via 10.1.2.1, 01:50:49, GigabitEthernet0/0/0/3
+               [110/2] via 10.1.3.1, 01:50:49, GigabitEthernet0/0/0/2
+L    10.16.2.2/32 is directly connected, 3w5d, Loopback0
+'''
+
+JUNOS = '''\
+inet.0: 2 destinations, 2 routes (2 active, 0 holddown, 0 hidden)
+10.169.14.240/32   *[Static/5] 5w2d 15:42:25
+                    >  to 10.169.14.121 via ge-0/0/1.0
+0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
+                    >  to 10.169.14.121 via ge-0/0/1.0
+'''
+
+
+class TestRecord(unittest.TestCase):
+
+    def test_mapping(self):
+        entry = Entry(name='a', metric='10')
+        entry['#text'] = '5w2d'
+        entry['other'] = 1
+        self.assertEqual(entry['metric'], '10')
+        self.assertEqual(entry, {'name': 'a', 'metric': '10',
+                                 '#text': '5w2d', 'other': 1})
+        self.assertEqual(list(entry), ['name', 'metric', '#text', 'other'])
+        self.assertNotIn('next-hop', entry)
+        self.assertEqual(entry.setdefault('next-hop', []), [])
+        del entry['other']
+        with self.assertRaises(KeyError):
+            entry['other']
+        self.assertEqual(entry.get('missing', 'default'), 'default')
+        self.assertFalse(hasattr(entry, '__dict__'))
+
+    def test_compact_values(self):
+        entry = Entry(name=''.join(['Gigabit', 'Ethernet0/1']), metric='010')
+        other = Entry(name=''.join(['Gigabit', 'Ethernet0/1']), metric='10')
+        self.assertIs(entry['name'], other['name'])
+        # kept as int only when it reads the same
+        self.assertEqual(entry['metric'], '010')
+        self.assertEqual(other._metric, 10)
+
+    def test_to_dict(self):
+        entry = Entry(name='a', **{'next-hop': [Entry(metric='1')]})
+        parsed = to_dict({'routes': {'a': entry}})
+        self.assertIs(type(parsed['routes']['a']), dict)
+        self.assertIs(type(parsed['routes']['a']['next-hop'][0]), dict)
+        self.assertEqual(json.loads(json.dumps(parsed)),
+                         {'routes': {'a': {'name': 'a',
+                                           'next-hop': [{'metric': '1'}]}}})
+
+    def test_index_map(self):
+        hops = IndexMap()
+        hops[1] = 'a'
+        hops[2] = 'b'
+        hops[1] = 'c'
+        self.assertEqual(hops, {1: 'c', 2: 'b'})
+        self.assertIsInstance(hops._items, list)
+        self.assertNotIn(3, hops)
+        # any other key turns it into a dict
+        hops[5] = 'd'
+        self.assertEqual(list(hops.items()), [(1, 'c'), (2, 'b'), (5, 'd')])
+        del hops[1]
+        self.assertEqual(hops, {2: 'b', 5: 'd'})
+        self.assertEqual(pickle.loads(pickle.dumps(hops)), hops)
+
+    def test_keys(self):
+        with self.assertRaises(ValueError):
+            record_type('Bad', ['a-b', 'a_b'])
+        with self.assertRaises(ValueError):
+            record_type('Bad', ['extra'])
+
+
+class TestRouteRecords(unittest.TestCase):
+
+    def assertRecords(self, parser, output):
+        parsed = parser(device=Mock()).parse(output=output)
+        records = parser(device=Mock()).parse(output=output,
+                                              format='records')
+        self.assertEqual(records, parsed)
+        self.assertEqual(to_dict(records), parsed)
+        self.assertEqual(pickle.loads(pickle.dumps(records)), parsed)
+        self.assertEqual(copy.deepcopy(records), parsed)
+        return records
+
+    def test_iosxe(self):
+        records = self.assertRecords(ShowIpRoute, IOSXE)
+        route = records['vrf']['default']['address_family']['ipv4'][
+            'routes']['10.2.3.0/24']
+        self.assertIsInstance(route, IpRouteEntry)
+        self.assertEqual(route['metric'], 2)
+        hops = route['next_hop']['next_hop_list']
+        self.assertEqual(hops[2]['outgoing_interface'],
+                         'GigabitEthernet0/2')
+
+    def test_next_call_validated(self):
+        parser = ShowIpRoute(device=Mock())
+        parser.parse(output=IOSXE, format='records')
+        self.assertIs(parser.schema, ShowIpRoute.schema)
+        with patch.object(parser, 'cli', return_value={'bogus': 1}):
+            with self.assertRaises(SchemaError):
+                parser.parse(output=IOSXE)
+
+    def test_iosxe_distributor(self):
+        records = ShowIpRouteDistributor(device=Mock()).parse(
+            output=IOSXE, format='records')
+        self.assertIsInstance(records['vrf']['default']['address_family'][
+            'ipv4']['routes']['10.2.3.0/24'], IpRouteEntry)
+        self.assertEqual(records, ShowIpRoute(device=Mock()).parse(
+            output=IOSXE))
+
+    def test_iosxe_ipv6_distributor(self):
+        parsed = ShowIpv6Route(device=Mock()).parse(output=IOSXE_IPV6)
+        self.assertIn('2001:DB8:2:2::/64', parsed['vrf']['default'][
+            'address_family']['ipv6']['routes'])
+        parser = ShowIpv6RouteDistributor(device=Mock())
+        records = parser.parse(output=IOSXE_IPV6, format='records')
+        self.assertIsInstance(records['vrf']['default']['address_family'][
+            'ipv6']['routes']['2001:DB8:2:2::/64'], IpRouteEntry)
+        self.assertEqual(to_dict(records), parsed)
+        self.assertEqual(parser.parse(output=IOSXE_IPV6), parsed)
+        self.assertEqual(parser.parse(output=IOSXE_IPV6,
+                                      where={'vrf': 'default'}), parsed)
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output=IOSXE_IPV6, where={'vrf': 'red'})
+
+    def test_iosxr(self):
+        records = self.assertRecords(ShowRouteIpv4, IOSXR)
+        route = records['vrf']['default']['address_family']['ipv4'][
+            'routes']['10.16.2.2/32']
+        self.assertIsInstance(route, Record)
+
+    def test_junos(self):
+        records = self.assertRecords(ShowRoute, JUNOS)
+        entry = records['route-information']['route-table'][0]['rt'][1][
+            'rt-entry']
+        self.assertEqual(entry['metric'], '101')
+        self.assertEqual(entry['nh'][0]['via'], 'ge-0/0/1.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
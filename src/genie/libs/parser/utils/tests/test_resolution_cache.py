@@ -0,0 +1,133 @@
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.abstract.package import AbstractTree
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import ResolutionCache, freeze_tokens, \
+    track_updates
+from genie.libs.parser.utils.extension import ExtendParsers
+from genie.libs.parser.utils.tests.dummy_parser import package_path
+
+
+class FakeData(object):
+    def __init__(self, size):
+        self.nodes = dict.fromkeys(range(size))
+
+    def update(self, other):
+        self.nodes.update(other)
+
+
+class TestResolutionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.data = FakeData(2)
+        self.cache = ResolutionCache(maxsize=2)
+
+    def test_key(self):
+        key = self.cache.make_key(' show  version ',
+                                  {'os': 'iosxe', 'revision': ['1']})
+        self.assertEqual(key, ('show version',
+                               (('os', 'iosxe'), ('revision', ('1',)))))
+        self.assertEqual(freeze_tokens({'b': 1, 'a': 2}),
+                         (('a', 2), ('b', 1)))
+
+    def test_hit_returns_copy(self):
+        key = self.cache.make_key('show version', {'os': 'iosxe'})
+        self.assertIsNone(self.cache.get(key, self.data))
+        self.cache.put(key, ('show version', object, {'a': '1'}), self.data)
+
+        _, cls, kwargs = self.cache.get(key, self.data)
+        self.assertIs(cls, object)
+        kwargs['a'] = '2'
+        self.assertEqual(self.cache.get(key, self.data)[2], {'a': '1'})
+        self.assertEqual(self.cache.info(),
+                         {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+    def test_lru_eviction(self):
+        for command in ['show a', 'show b', 'show c']:
+            key = self.cache.make_key(command, {})
+            self.cache.put(key, (command, object, {}), self.data)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get(self.cache.make_key('show a', {}),
+                                         self.data))
+        self.assertIsNotNone(self.cache.get(self.cache.make_key('show c', {}),
+                                            self.data))
+
+    def test_invalidated_when_data_extended(self):
+        key = self.cache.make_key('show version', {})
+        self.cache.put(key, ('show version', object, {}), self.data)
+        self.data.nodes['new'] = None
+        self.assertIsNone(self.cache.get(key, self.data))
+        self.cache.put(key, ('show version', object, {}), self.data)
+        self.assertIsNone(self.cache.get(key, FakeData(3)))
+
+    def test_invalidated_when_data_updated(self):
+        data = track_updates(self.data)
+        key = self.cache.make_key('show version', {})
+        self.cache.put(key, ('show version', object, {}), data)
+        # an os added to a command, the number of commands is the same
+        data.update({0: 'iosxe'})
+        self.assertEqual(len(data.nodes), 2)
+        self.assertIsNone(self.cache.get(key, data))
+
+    def test_disabled(self):
+        cache = ResolutionCache(maxsize=0)
+        key = cache.make_key('show version', {})
+        cache.put(key, ('show version', object, {}), self.data)
+        self.assertEqual(len(cache), 0)
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        common.parser_data = None
+        common.clear_parser_cache()
+
+    def test_get_parser_cached(self):
+        device = Mock(os='iosxe')
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}):
+            cls, kwargs = common.get_parser('show interfaces GigabitEthernet1',
+                                            device)
+            kwargs['interface'] = 'changed'
+            cached_cls, cached_kwargs = common.get_parser(
+                'show  interfaces GigabitEthernet1', device)
+
+        self.assertIs(cls, cached_cls)
+        self.assertEqual(cached_kwargs, {'interface': 'GigabitEthernet1'})
+        info = common.get_parser_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 1)
+
+    def test_parser_overridden_by_update(self):
+        if package_path not in sys.path:
+            sys.path.append(package_path)
+        device = Mock(os='iosxe')
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}):
+            cls, _ = common.get_parser('show clock', device)
+
+            # the external parser of an existing command and os
+            ext = ExtendParsers('genie.libs.parser.utils.tests.dummy_parser')
+            ext.extend()
+            ext.output.pop('extend_info')
+            data = common.get_parser_data()
+            size = len(data.nodes)
+            data.update(AbstractTree.from_json(
+                ext.output, package=common.PARSER_MODULE_NAME,
+                feature='parser'))
+            self.assertEqual(len(data.nodes), size)
+
+            overridden, _ = common.get_parser('show clock', device)
+        common.parser_data = None
+
+        self.assertIsNot(overridden, cls)
+        self.assertEqual(overridden.__module__.split('.')[-2:],
+                         ['iosxe', 'show_clock'])
+        self.assertIn('dummy_parser', overridden.__module__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import patterns as patterns_module
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.scanner import LineScanner
+
+
+class TestLineScanner(unittest.TestCase):
+
+    def setUp(self):
+        registry = patch.object(patterns_module, '_registry', [])
+        registry.start()
+        self.addCleanup(registry.stop)
+
+        self.patterns = Patterns(
+            p1=r'^(?P<interface>\S+) +is +(?P<status>\w+)$',
+            p2=r'^Hardware +is +(?P<type>.+)$',
+            p3=r'^MTU +(?P<mtu>\d+) +bytes(, +BW +(?P<bw>\d+))?$',
+            p4=r'^(?P<pkts>\d+) +packets +input$',
+            p5=r'^(?P<interface>\S+) +has +(?P<count>\d+) +members$',
+        )
+        self.scanner = LineScanner(self.patterns)
+
+    def test_match(self):
+        name, m = self.scanner.match('MTU 1500 bytes, BW 1000')
+        self.assertEqual(name, 'p3')
+        self.assertEqual(m.groupdict(), {'mtu': '1500', 'bw': '1000'})
+        self.assertEqual(m.group(), 'MTU 1500 bytes, BW 1000')
+        self.assertEqual(m.group('mtu'), '1500')
+        self.assertEqual(m.group(1, 'bw'), ('1500', '1000'))
+        self.assertEqual(m['bw'], '1000')
+        self.assertEqual(m.groups(), ('1500', ', BW 1000', '1000'))
+        self.assertEqual(m.span('mtu'), (4, 8))
+        self.assertIs(m.re, self.patterns.p3)
+
+        self.assertEqual(self.scanner.match('unknown line'), (None, None))
+
+    def test_same_group_names(self):
+        name, m = self.scanner.match('Port-channel1 has 2 members')
+        self.assertEqual(name, 'p5')
+        self.assertEqual(m.groupdict(),
+                         {'interface': 'Port-channel1', 'count': '2'})
+
+    def test_groupdict_copy(self):
+        _, m = self.scanner.match('MTU 1500 bytes')
+        group = m.groupdict()
+        group['mtu'] = '9000'
+        self.assertEqual(m.groupdict(), {'mtu': '1500', 'bw': None})
+        self.assertEqual(m.groupdict(''), {'mtu': '1500', 'bw': ''})
+
+    def test_same_as_chain(self):
+        lines = ['Hardware is Loopback', 'Hardware is Loopback interface',
+                 'MTU 1500 bytes', 'MTU 1500 bytes, BW 10', '0 packets input',
+                 'Gi1 has 4 members', 'Gi1 is up', '', 'MTU is 1500']
+        for line in lines:
+            expected = (None, None)
+            for name in self.patterns:
+                m = self.patterns[name].match(line)
+                if m:
+                    expected = (name, m.groupdict())
+                    break
+            name, m = self.scanner.match(line)
+            self.assertEqual((name, m.groupdict() if m else None), expected,
+                             line)
+
+    def test_names_order(self):
+        scanner = LineScanner(self.patterns, ('p2', 'p1'))
+        self.assertEqual(scanner.match('Hardware is Loopback')[0], 'p2')
+        self.assertEqual(scanner.match('MTU 1500 bytes'), (None, None))
+
+    def test_flags_and_backreferences(self):
+        scanner = LineScanner({
+            'p1': re.compile(r'(?i)^mtu +(?P<mtu>\d+)$'),
+            'p2': re.compile(r'^(?P<word>\w+) +(?P=word)$'),
+            'p3': re.compile(r'''^speed  # comment
+                                  \ +(?P<speed>\d+)''', re.VERBOSE),
+        })
+        self.assertEqual(scanner.match('MTU 1500')[1].groupdict(),
+                         {'mtu': '1500'})
+        self.assertEqual(scanner.match('up up')[0], 'p2')
+        self.assertEqual(scanner.match('up down'), (None, None))
+        self.assertEqual(scanner.match('speed 100')[1].group('speed'), '100')
+        # the flags of a pattern do not leak to the others
+        self.assertEqual(scanner.match('SPEED 100'), (None, None))
+
+    def test_numbered_backreference(self):
+        scanner = LineScanner({'p1': re.compile(r'^(\w+) +\1$')})
+        with self.assertRaises(ValueError):
+            scanner.match('up up')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import io
+import mmap
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.streaming import iter_lines, merge_record
+from genie.libs.parser.iosxe.show_ip_bgp import ShowIpBgp
+from genie.libs.parser.iosxe.show_logging import ShowLogging
+from genie.libs.parser.junos.show_route import ShowRoute
+
+OUTPUT = 'line 1\r\nline 2\n\nline 4'
+LINES = ['line 1', 'line 2', '', 'line 4']
+
+ROUTE_TABLE = 'inet.0: 3 destinations, 3 routes (3 active, 0 holddown, 0 hidden)'
+ROUTE = '10.0.{}.0/24      *[Static/5] 1w2d 03:04:05'
+NEXT_HOP = '>  to 10.169.14.121 via ge-0/0/1.0'
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_str_and_bytes(self):
+        self.assertEqual(list(iter_lines(OUTPUT)), LINES)
+        self.assertEqual(list(iter_lines(OUTPUT.encode())), LINES)
+
+    def test_file_objects(self):
+        self.assertEqual(list(iter_lines(io.StringIO(OUTPUT))), LINES)
+        self.assertEqual(list(iter_lines(io.BytesIO(OUTPUT.encode()))), LINES)
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(OUTPUT.encode())
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.assertEqual(list(iter_lines(mm)), LINES)
+
+    def test_iterable(self):
+        self.assertEqual(list(iter_lines(iter(['a\n', b'b\r\n', 'c']))),
+                         ['a', 'b', 'c'])
+
+
+class TestMergeRecord(unittest.TestCase):
+
+    def test_merge_record(self):
+        structure = {}
+        merge_record(structure, ('vrf', 'default'), {'a': 1})
+        merged = merge_record(structure, ('vrf', 'default'), {'b': 2})
+        merge_record(structure, ('vrf', 'red'), {})
+        self.assertEqual(structure, {'vrf': {'default': {'a': 1, 'b': 2},
+                                             'red': {}}})
+        self.assertIs(merged, structure['vrf']['default'])
+
+
+class TestStream(unittest.TestCase):
+
+    def golden_output(self, os, class_name, name='golden_output'):
+        path = pathlib.Path(__file__).parents[2] / os / 'tests' / \
+            class_name / 'cli' / 'equal' / '{}_output.txt'.format(name)
+        return path
+
+    def test_records_from_file(self):
+        path = self.golden_output('junos', 'ShowRoute')
+        parser = ShowRoute(device=Mock())
+        with open(path) as f:
+            records = list(parser.stream(f))
+
+        expected = parser.cli(output=path.read_text())
+        tables = expected['route-information']['route-table']
+        # cli() nests the routes in their table, stream() yields them apart
+        self.assertEqual(
+            [record for record in records if 'table-name' in record],
+            [{key: value for key, value in table.items() if key != 'rt'}
+             for table in tables])
+        self.assertEqual(
+            [record for record in records if 'rt-entry' in record],
+            [rt for table in tables for rt in table.get('rt', [])])
+
+    def test_bgp_records(self):
+        path = self.golden_output('iosxe', 'ShowIpBgp')
+        parser = ShowIpBgp(device=Mock())
+        structure = {}
+        with open(path) as f:
+            for keys, values in parser.stream(f):
+                merge_record(structure, keys, values)
+        self.assertEqual(structure, parser.cli(output=path.read_text()))
+
+    def test_logging_records(self):
+        output = ('Log Buffer (32000 bytes):\n'
+                  '*Jan  1 00:00:01: %SYS-5-CONFIG_I: Configured\n'
+                  '*Jan  1 00:00:02: %LINK-3-UPDOWN: Interface Gi1, up\n')
+        summary = {}
+        records = list(ShowLogging(device=Mock()).stream(
+            io.StringIO(output), summary=summary))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(summary, {'log_buffer_bytes': 32000})
+
+    def test_lazy(self):
+        # the routes come out while the output is still being read
+        read = []
+
+        def lines():
+            yield ROUTE_TABLE
+            for index in range(100000):
+                read.append(index)
+                yield ROUTE.format(index)
+                yield NEXT_HOP
+
+        records = ShowRoute(device=Mock()).stream(lines())
+        self.assertEqual(next(records)['table-name'], 'inet.0')
+        route = next(records)
+        self.assertEqual(route['rt-destination'], '10.0.0.0/24')
+        self.assertEqual(route['rt-entry']['nh'],
+                         [{'to': '10.169.14.121', 'via': 'ge-0/0/1.0'}])
+        self.assertEqual(len(read), 2)
+        self.assertEqual(sum(1 for _ in records), 99999)
+
+
+if __name__ == '__main__':
+    unittest.main()
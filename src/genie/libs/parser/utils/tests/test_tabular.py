@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.tabular import ColumnTable
+from genie.libs.parser.utils.benchmark import synthetic_table
+from genie.libs.parser.iosxe.show_interface import ShowIpInterfaceBrief, \
+    ShowInterfacesStatus
+
+STATUS = '''\
+show interfaces status
+
+Port      Name               Status       Vlan       Duplex  Speed Type
+Gi1/2     TelenlqPOIU        notconnect   125          full    100 10/100/1000-TX
+Gi1/3     SE                 connected    132        a-full a-1000 10/100/1000-TX
+Gi1/7                        notconnect   99           auto   auto 10/100/1000-TX
+Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
+Po10      VSL LINK2          connected    trunk      a-full  a-10G
+Router#'''
+
+
+class TestColumnTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ColumnTable(
+            header=['Port', 'Name', 'Status', 'Vlan', 'Duplex', 'Speed',
+                    'Type'],
+            labels=['port', 'name', 'status', 'vlan', 'duplex', 'speed',
+                    'type'])
+
+    def test_columns(self):
+        self.assertEqual(
+            self.table.columns(STATUS.splitlines()[2]),
+            [(0, 4), (10, 14), (29, 35), (42, 46), (53, 59), (61, 66),
+             (67, 71)])
+        self.assertIsNone(self.table.columns('show interfaces status'))
+
+    def test_rows(self):
+        rows = list(self.table.rows(STATUS))
+        # values aligned on either side of their column, with spaces, empty
+        self.assertEqual(rows[1], {
+            'port': 'Gi1/3', 'name': 'SE', 'status': 'connected',
+            'vlan': '132', 'duplex': 'a-full', 'speed': 'a-1000',
+            'type': '10/100/1000-TX'})
+        self.assertEqual(rows[2]['name'], '')
+        self.assertEqual(rows[3]['name'], 'VSL LINK1')
+        self.assertEqual(rows[3]['type'], 'No XCVR')
+        self.assertEqual(rows[4]['type'], '')
+        # the lines before the header are not rows
+        self.assertEqual([row['port'] for row in rows],
+                         ['Gi1/2', 'Gi1/3', 'Gi1/7', 'Te2/1/21', 'Po10',
+                          'Router#'])
+
+    def test_fallback(self):
+        table = ColumnTable(
+            header=['Interface', 'IP-Address', 'Status'],
+            labels=['interface', 'ip', 'status'],
+            fallback=r'^(?P<interface>\S+) +(?P<ip>\S+) +(?P<status>.+)$')
+        rows = list(table.rows(
+            'Interface              IP-Address      Status\n'
+            '---------              ----------      ------\n'
+            'Gi0/0/0                10.1.1.1        up\n'
+            'GigabitEthernet0/0/0.1000 10.1.1.2 administratively down\n'
+            'Gi0/0/1                unassigned      down\n'))
+        self.assertEqual(rows, [
+            {'interface': 'Gi0/0/0', 'ip': '10.1.1.1', 'status': 'up'},
+            {'interface': 'GigabitEthernet0/0/0.1000', 'ip': '10.1.1.2',
+             'status': 'administratively down'},
+            {'interface': 'Gi0/0/1', 'ip': 'unassigned', 'status': 'down'},
+        ])
+
+    def test_malformed_without_fallback(self):
+        rows = list(self.table.rows(
+            'Port      Name               Status       Vlan\n'
+            'GigabitEthernet1/0/1 UPLINK  connected    1\n'))
+        self.assertEqual(rows, [])
+
+    def test_outside_of_table(self):
+        table = ColumnTable(
+            header=['Interface', 'Status'],
+            labels=['interface', 'status'],
+            fallback=r'^(?P<interface>\S+) +(?P<status>.+)$')
+        rows = list(table.rows(
+            'Load for five secs: 2%/0%; one minute: 1%; five minutes: 1%\n'
+            'Interface              Status\n'
+            '\n'
+            'Gi0/0/0                up\n'
+            'GigabitEthernet0/0/0.1000 down\n'
+            '\n'
+            'Time source is NTP, 10:10:10.123 UTC Mon Jan 1 2024\n'))
+        # a blank line right after the header does not end the table, the
+        # fallback only applies to the rows of the table
+        self.assertEqual(rows, [
+            {'interface': 'Gi0/0/0', 'status': 'up'},
+            {'interface': 'GigabitEthernet0/0/0.1000', 'status': 'down'},
+        ])
+
+    def test_header_again(self):
+        table = ColumnTable(header=['A', 'B'], labels=['a', 'b'])
+        rows = list(table.rows('A    B\n1    2\n  A B\n  3 4\n'))
+        self.assertEqual(rows, [{'a': '1', 'b': '2'}, {'a': '3', 'b': '4'}])
+
+    def test_labels(self):
+        with self.assertRaises(ValueError):
+            ColumnTable(header=['A', 'B'], labels=['a'])
+
+
+class TestTableParsers(unittest.TestCase):
+
+    def test_ip_interface_brief_shifted_row(self):
+        output = (
+            'Interface              IP-Address      OK? Method Status                Protocol\n'
+            'GigabitEthernet0/0/0   10.105.44.23    YES other  up                    up\n'
+            'GigabitEthernet0/0/0.1000 10.1.1.1 YES manual administratively down down\n')
+        parsed = ShowIpInterfaceBrief(device=Mock()).parse(output=output)
+        self.assertEqual(parsed['interface']['GigabitEthernet0/0/0.1000'], {
+            'ip_address': '10.1.1.1', 'interface_is_ok': 'YES',
+            'method': 'manual', 'status': 'administratively down',
+            'protocol': 'down'})
+
+    def test_ip_interface_brief_preamble(self):
+        output = (
+            'Load for five secs: 2%/0%; one minute: 1%; five minutes: 1%\n'
+            'Time source is NTP, 10:10:10.123 UTC Mon Jan 1 2024\n'
+            '\n'
+            'Interface              IP-Address      OK? Method Status                Protocol\n'
+            'GigabitEthernet0/0/0   10.105.44.23    YES other  up                    up\n'
+            'GigabitEthernet0/0/0.1000 10.1.1.1 YES manual administratively down down\n')
+        parsed = ShowIpInterfaceBrief(device=Mock()).parse(output=output)
+        self.assertEqual(list(parsed['interface']), [
+            'GigabitEthernet0/0/0', 'GigabitEthernet0/0/0.1000'])
+
+    def test_interfaces_status_prompt(self):
+        parsed = ShowInterfacesStatus(device=Mock()).parse(output=STATUS)
+        self.assertEqual(list(parsed['interfaces']), [
+            'GigabitEthernet1/2', 'GigabitEthernet1/3', 'GigabitEthernet1/7',
+            'TenGigabitEthernet2/1/21', 'Port-channel10'])
+
+    def test_synthetic_tables(self):
+        # the tables of the benchmark parse to one entry per row
+        for local_class, key in [(ShowIpInterfaceBrief, 'interface'),
+                                 (ShowInterfacesStatus, 'interfaces')]:
+            output = synthetic_table('iosxe', local_class.__name__, 300)
+            parsed = local_class(device=Mock()).parse(output=output)
+            self.assertEqual(len(parsed[key]), 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
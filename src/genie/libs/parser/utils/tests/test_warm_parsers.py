@@ -0,0 +1,119 @@
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+
+
+class TestWarmParsers(unittest.TestCase):
+
+    commands = ['show version', 'show interfaces', 'show ip route']
+
+    def setUp(self):
+        common.parser_data = None
+        common.command_views.clear()
+
+    def test_warm_tokens(self):
+        timings = common.warm_parsers(tokens={'os': 'iosxe'},
+                                      commands=self.commands,
+                                      max_workers=2)
+
+        self.assertIn('genie.libs.parser.iosxe.show_platform', timings)
+        self.assertIn('genie.libs.parser.iosxe.show_interface', timings)
+        for elapsed in timings.values():
+            self.assertGreaterEqual(elapsed, 0)
+
+        # the parser classes are resolved as well
+        view = common.command_views.get(common.get_parser_data(), 'iosxe',
+                                        {'os': 'iosxe'},
+                                        common._get_parser_cls)
+        self.assertEqual(set(view._classes), set(self.commands))
+        self.assertEqual(view.parser_class('show version').__name__,
+                         'ShowVersion')
+        # and their class level patterns are compiled
+        self.assertIn('p0', vars(view.parser_class('show version').patterns))
+
+    def test_warm_device(self):
+        device = Mock(os='iosxe')
+        with patch.object(common.Lookup, 'tokens_from_device',
+                          return_value={'os': 'iosxe'}):
+            timings = common.warm_parsers(device,
+                                          commands=['show version'])
+        self.assertEqual(list(timings),
+                         ['genie.libs.parser.iosxe.show_platform'])
+
+    def test_warm_background(self):
+        future = common.warm_parsers(tokens={'os': 'iosxe'},
+                                     commands=['show version'],
+                                     wait=False)
+        self.assertIsInstance(future, Future)
+        self.assertIn('genie.libs.parser.iosxe.show_platform',
+                      future.result(timeout=60))
+
+    def test_unknown_modules_warmed_in_the_pool(self):
+        submit = ThreadPoolExecutor.submit
+        with patch.object(common, '_get_parser_module', return_value=None), \
+                patch.object(ThreadPoolExecutor, 'submit', autospec=True,
+                             side_effect=submit) as pool_submit:
+            timings = common.warm_parsers(tokens={'os': 'iosxe'},
+                                          commands=self.commands,
+                                          max_workers=2)
+        # one task per command
+        self.assertEqual(pool_submit.call_count, len(self.commands))
+        self.assertIn('genie.libs.parser.iosxe.show_platform', timings)
+
+    def test_import_errors(self):
+        common.get_parser_data()
+        with patch.object(common.importlib, 'import_module',
+                          side_effect=ImportError('broken module')):
+            self.assertEqual(common.warm_parsers(tokens={'os': 'iosxe'},
+                                                 commands=['show version']),
+                             {})
+
+        # any error of a module is logged, the others are warmed up
+        import_module = common.importlib.import_module
+
+        def broken(name, *args):
+            if name == 'genie.libs.parser.iosxe.show_platform':
+                raise RuntimeError('error at import')
+            return import_module(name, *args)
+
+        with patch.object(common.importlib, 'import_module',
+                          side_effect=broken):
+            with self.assertLogs(common.log, 'WARNING'):
+                timings = common.warm_parsers(
+                    tokens={'os': 'iosxe'}, commands=self.commands)
+            future = common.warm_parsers(tokens={'os': 'iosxe'},
+                                         commands=self.commands,
+                                         wait=False)
+            self.assertEqual(future.result(timeout=60).keys(),
+                             timings.keys())
+        self.assertNotIn('genie.libs.parser.iosxe.show_platform', timings)
+        self.assertIn('genie.libs.parser.iosxe.show_interface', timings)
+
+    def test_commands_of_the_device(self):
+        data = common.get_parser_data()
+        view = common.command_views.get(data, 'iosxe', {'os': 'iosxe'},
+                                        common._get_parser_cls)
+        view = Mock(commands=('show version',),
+                    argument_commands={'show interfaces {interface}':
+                                       ('interface',)},
+                    tokens=view.tokens, parser_class=view.parser_class)
+        with patch.object(common.command_views, 'get', return_value=view):
+            timings = common.warm_parsers(tokens={'os': 'iosxe'})
+        self.assertEqual(set(timings),
+                         {'genie.libs.parser.iosxe.show_platform',
+                          'genie.libs.parser.iosxe.show_interface'})
+
+    def test_unknown_command(self):
+        self.assertEqual(common.warm_parsers(tokens={'os': 'iosxe'},
+                                             commands=['show not a command']),
+                         {})
+
+    def test_no_device(self):
+        with self.assertRaises(TypeError):
+            common.warm_parsers()
+
+
+if __name__ == '__main__':
+    unittest.main()
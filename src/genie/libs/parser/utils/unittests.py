@@ -34,6 +34,7 @@ from genie.utils.diff import Diff
 from genie.libs import parser as _parser
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
 from genie.libs.parser.utils.common import format_output
+from genie.libs.parser.utils.discovery import discover_files
 
 log = logging.getLogger(__name__)
 glo_values = AttrDict
@@ -101,6 +102,52 @@ def get_files(folder):
     return files
 
 
+def has_parser_classes(classes, name=None):
+    """Helper to check, from the static discovery of a file, if the file has
+    to be imported to find the parsers to test."""
+    for info in classes:
+        if name and info['class'] != name:
+            continue
+        # has_cli is None when cli may be inherited from an imported class
+        if info['has_cli'] is not False:
+            return True
+    return False
+
+
+def tested_classes(folder, name=None):
+    """Helper to get the names of the classes with unittests in the tests
+    folder of a parser folder."""
+    tests = pathlib.Path(folder) / "tests"
+    if name:
+        return {name} if (tests / name / "cli").is_dir() else set()
+    if not tests.is_dir():
+        return set()
+    return {path.name for path in tests.iterdir()
+            if (path / "cli").is_dir()}
+
+
+def files_to_import(parse_files, static_classes, name=None):
+    """Helper to select, from the static discovery of the files of an os, the
+    files to import to find the parsers to test.
+
+    The static discovery only sees the classes defined in a file. The files
+    of a folder with unittests of a class none of them defines, eg. a class
+    imported or aliased from another module, are all imported, and so are
+    all the files when none of them defines `name`."""
+    defined = {}
+    for parse_file in parse_files:
+        defined.setdefault(os.path.dirname(parse_file), set()).update(
+            info['class'] for info in static_classes[parse_file])
+    if name and not any(name in classes for classes in defined.values()):
+        return list(parse_files)
+
+    imported = {folder for folder, classes in defined.items()
+                if tested_classes(folder, name) - classes}
+    return [parse_file for parse_file in parse_files
+            if os.path.dirname(parse_file) in imported
+            or has_parser_classes(static_classes[parse_file], name)]
+
+
 #===========================================================================
 #                            Final Output
 #===========================================================================
@@ -344,12 +391,27 @@ class SuperFileBasedTesting(aetest.Testcase):
                     f"{pathlib.Path(_parser.__file__).parent}/{operating_system}"
                 )
 
-            parse_files = list(get_files(base_folder))
+            parse_files = [
+                details for details in get_files(base_folder)
+                if not _token or _token in details["tokens"]
+            ]
+            # Read the classes of all files without importing them, only the
+            # files which define parsers to test are imported. All of them
+            # are to report the parsers without unittests
+            parse_file_names = [details["parse_file"] for details in parse_files]
+            if _show_missing_unittests:
+                import_files = set(parse_file_names)
+            else:
+                import_files = set(files_to_import(
+                    parse_file_names, discover_files(parse_file_names),
+                    _class))
             # Get all of the root level files
             for details in parse_files:
                 parse_file = details["parse_file"]
                 base_folder = pathlib.Path(parse_file).parent
                 tokens = details["tokens"]
+                if parse_file not in import_files:
+                    continue
                 # Load all of the classes in each of those files, and search for classes
                 # that have a `cli` method
                 _module = None
@@ -0,0 +1,4 @@
+from genie.libs.parser.utils.benchmark import main
+
+if __name__ == '__main__':
+    main()